@@ -18,6 +18,9 @@ if config.config_file_name is not None:
 
 settings = get_settings()
 config.set_main_option("sqlalchemy.url", settings.database_url)
+# Read by migrations whose behavior is opt-in per deployment.
+config.attributes.setdefault("database_partitioning_enabled", settings.database_partitioning_enabled)
+config.attributes.setdefault("database_partition_months_ahead", settings.database_partition_months_ahead)
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,59 @@
+"""add feed websub subscription fields
+
+Revision ID: 20261019_0017
+Revises: 20260222_0016
+Create Date: 2026-10-19 09:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0017"
+down_revision: str | None = "20260222_0016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_LEASE_EXPIRES_AT = "ix_feeds_websub_lease_expires_at"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {column["name"] for column in inspector.get_columns("feeds")}
+
+    with op.batch_alter_table("feeds", schema=None) as batch_op:
+        if "websub_hub_url" not in columns:
+            batch_op.add_column(sa.Column("websub_hub_url", sa.String(length=1000), nullable=True))
+        if "websub_topic_url" not in columns:
+            batch_op.add_column(sa.Column("websub_topic_url", sa.String(length=1000), nullable=True))
+        if "websub_secret" not in columns:
+            batch_op.add_column(sa.Column("websub_secret", sa.String(length=128), nullable=True))
+        if "websub_lease_expires_at" not in columns:
+            batch_op.add_column(sa.Column("websub_lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+
+    inspector = sa.inspect(bind)
+    existing_indexes = {index["name"] for index in inspector.get_indexes("feeds")}
+    if INDEX_LEASE_EXPIRES_AT not in existing_indexes:
+        op.create_index(INDEX_LEASE_EXPIRES_AT, "feeds", ["websub_lease_expires_at"], unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing_indexes = {index["name"] for index in inspector.get_indexes("feeds")}
+    if INDEX_LEASE_EXPIRES_AT in existing_indexes:
+        op.drop_index(INDEX_LEASE_EXPIRES_AT, table_name="feeds")
+
+    columns = {column["name"] for column in inspector.get_columns("feeds")}
+    with op.batch_alter_table("feeds", schema=None) as batch_op:
+        if "websub_lease_expires_at" in columns:
+            batch_op.drop_column("websub_lease_expires_at")
+        if "websub_secret" in columns:
+            batch_op.drop_column("websub_secret")
+        if "websub_topic_url" in columns:
+            batch_op.drop_column("websub_topic_url")
+        if "websub_hub_url" in columns:
+            batch_op.drop_column("websub_hub_url")
@@ -0,0 +1,39 @@
+"""add feed last body hash
+
+Revision ID: 20261019_0018
+Revises: 20261019_0017
+Create Date: 2026-10-19 10:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0018"
+down_revision: str | None = "20261019_0017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {column["name"] for column in inspector.get_columns("feeds")}
+    if "last_body_hash" in columns:
+        return
+
+    with op.batch_alter_table("feeds", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("last_body_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {column["name"] for column in inspector.get_columns("feeds")}
+    if "last_body_hash" not in columns:
+        return
+
+    with op.batch_alter_table("feeds", schema=None) as batch_op:
+        batch_op.drop_column("last_body_hash")
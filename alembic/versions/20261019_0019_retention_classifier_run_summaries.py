@@ -0,0 +1,81 @@
+"""add classifier run summaries and raw entry retention index
+
+Revision ID: 20261019_0019
+Revises: 20261019_0018
+Create Date: 2026-10-19 11:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0019"
+down_revision: str | None = "20261019_0018"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SUMMARIES_TABLE = "stream_classifier_run_summaries"
+USER_FK_NAME = "fk_stream_classifier_run_summaries_user_id_users"
+STREAM_FK_NAME = "fk_stream_classifier_run_summaries_stream_id_keyword_streams"
+INDEX_USER_ID = "ix_stream_classifier_run_summaries_user_id"
+INDEX_STREAM_DAY = "ix_stream_classifier_run_summaries_stream_day"
+INDEX_RAW_ENTRIES_FEED_CREATED = "ix_raw_entries_feed_id_created_at"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    table_names = set(inspector.get_table_names())
+
+    if SUMMARIES_TABLE not in table_names:
+        op.create_table(
+            SUMMARIES_TABLE,
+            sa.Column("id", sa.UUID(), nullable=False),
+            sa.Column("user_id", sa.UUID(), nullable=False),
+            sa.Column("stream_id", sa.UUID(), nullable=False),
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("classifier_mode", sa.String(length=32), nullable=False),
+            sa.Column("plugin_name", sa.String(length=128), nullable=False),
+            sa.Column("provider", sa.String(length=128), nullable=True),
+            sa.Column("model_name", sa.String(length=255), nullable=True),
+            sa.Column("model_version", sa.String(length=128), nullable=True),
+            sa.Column("run_status", sa.String(length=32), nullable=False),
+            sa.Column("run_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("matched_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("confidence_sum", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("confidence_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("duration_ms_total", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], name=USER_FK_NAME, ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["stream_id"], ["keyword_streams.id"], name=STREAM_FK_NAME, ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(INDEX_USER_ID, SUMMARIES_TABLE, ["user_id"], unique=False)
+        op.create_index(INDEX_STREAM_DAY, SUMMARIES_TABLE, ["stream_id", "day"], unique=False)
+
+    raw_entry_indexes = {index["name"] for index in inspector.get_indexes("raw_entries")}
+    if INDEX_RAW_ENTRIES_FEED_CREATED not in raw_entry_indexes:
+        op.create_index(INDEX_RAW_ENTRIES_FEED_CREATED, "raw_entries", ["feed_id", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    raw_entry_indexes = {index["name"] for index in inspector.get_indexes("raw_entries")}
+    if INDEX_RAW_ENTRIES_FEED_CREATED in raw_entry_indexes:
+        op.drop_index(INDEX_RAW_ENTRIES_FEED_CREATED, table_name="raw_entries")
+
+    table_names = set(inspector.get_table_names())
+    if SUMMARIES_TABLE not in table_names:
+        return
+
+    indexes = {index["name"] for index in inspector.get_indexes(SUMMARIES_TABLE)}
+    if INDEX_STREAM_DAY in indexes:
+        op.drop_index(INDEX_STREAM_DAY, table_name=SUMMARIES_TABLE)
+    if INDEX_USER_ID in indexes:
+        op.drop_index(INDEX_USER_ID, table_name=SUMMARIES_TABLE)
+    op.drop_table(SUMMARIES_TABLE)
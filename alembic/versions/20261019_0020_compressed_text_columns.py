@@ -0,0 +1,111 @@
+"""store raw payloads and fulltext bodies as compressed binary
+
+Revision ID: 20261019_0020
+Revises: 20261019_0019
+Create Date: 2026-10-19 12:00:00
+
+Existing rows keep their plain UTF-8 contents, which the CompressedText type reads as-is;
+scripts/backfill_compressed_text.py compresses them afterwards in small batches.
+"""
+
+import zlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0020"
+down_revision: str | None = "20261019_0019"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COMPRESSED_COLUMNS: tuple[tuple[str, str, bool], ...] = (
+    ("raw_entries", "payload", False),
+    ("article_fulltexts", "content_text", True),
+    ("article_fulltexts", "content_html", True),
+)
+
+_ZSTD_TAG = b"\x00zs"
+_ZLIB_TAG = b"\x00zl"
+_PLAIN_TAG = b"\x00pl"
+_DOWNGRADE_BATCH_SIZE = 500
+
+
+def _is_binary(table_name: str, column_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    for column in inspector.get_columns(table_name):
+        if column["name"] == column_name:
+            return isinstance(column["type"], sa.LargeBinary)
+    return False
+
+
+def _decode(value: bytes | str) -> str:
+    if isinstance(value, str):
+        return value
+    data = bytes(value)
+    tag = data[:3]
+    if tag == _ZLIB_TAG:
+        return zlib.decompress(data[3:]).decode("utf-8")
+    if tag == _ZSTD_TAG:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data[3:]).decode("utf-8")
+    if tag == _PLAIN_TAG:
+        return data[3:].decode("utf-8")
+    return data.decode("utf-8")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table_name, column_name, nullable in COMPRESSED_COLUMNS:
+        if _is_binary(table_name, column_name):
+            continue
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.alter_column(
+                column_name,
+                existing_type=sa.Text(),
+                type_=sa.LargeBinary(),
+                existing_nullable=nullable,
+                postgresql_using=f"convert_to({column_name}, 'UTF8')" if dialect == "postgresql" else None,
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+    for table_name, column_name, nullable in COMPRESSED_COLUMNS:
+        if not _is_binary(table_name, column_name):
+            continue
+
+        # Compressed rows cannot be cast back to text in SQL, so rewrite them as plain UTF-8 first. SQLite keeps the
+        # storage class of copied values, so there they are written back as TEXT rather than BLOB.
+        value_type: sa.types.TypeEngine[object] = sa.LargeBinary() if dialect == "postgresql" else sa.Text()
+        table = sa.table(table_name, sa.column("id", sa.Uuid()), sa.column(column_name, value_type))
+        last_id = None
+        while True:
+            query = sa.select(table.c.id, table.c[column_name]).order_by(table.c.id).limit(_DOWNGRADE_BATCH_SIZE)
+            if last_id is not None:
+                query = query.where(table.c.id > last_id)
+            rows = bind.execute(query).all()
+            if not rows:
+                break
+            for row_id, value in rows:
+                if value is None:
+                    continue
+                decoded = _decode(value)
+                bind.execute(
+                    table.update()
+                    .where(table.c.id == row_id)
+                    .values({column_name: decoded.encode("utf-8") if dialect == "postgresql" else decoded})
+                )
+            last_id = rows[-1][0]
+
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.alter_column(
+                column_name,
+                existing_type=sa.LargeBinary(),
+                type_=sa.Text(),
+                existing_nullable=nullable,
+                postgresql_using=f"convert_from({column_name}, 'UTF8')" if dialect == "postgresql" else None,
+            )
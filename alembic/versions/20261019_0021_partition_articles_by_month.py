@@ -0,0 +1,181 @@
+"""optionally range-partition articles, article states and stream matches by month on postgres
+
+Revision ID: 20261019_0021
+Revises: 20261019_0020
+Create Date: 2026-10-19 13:00:00
+
+Runs only on PostgreSQL with SIFT_DATABASE_PARTITIONING_ENABLED=true; everywhere else it is a no-op. The upgrade
+copies each table into a partitioned replacement inside the migration transaction, so schedule it like any other
+full-table rewrite. Postgres requires the partition key in every primary key and unique constraint and cannot
+point foreign keys at a partitioned table, so the keys gain the timestamp column and the foreign keys into
+articles are dropped; partition maintenance clears dependent rows when it detaches an article partition.
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+
+import sqlalchemy as sa
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0021"
+down_revision: str | None = "20261019_0020"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTITIONED_TABLES: tuple[tuple[str, str], ...] = (
+    ("articles", "created_at"),
+    ("article_states", "created_at"),
+    ("keyword_stream_matches", "matched_at"),
+)
+ARTICLE_REFERENCES: tuple[tuple[str, str, str], ...] = (
+    ("articles", "duplicate_of_id", "SET NULL"),
+    ("article_states", "article_id", "CASCADE"),
+    ("article_fulltexts", "article_id", "CASCADE"),
+    ("keyword_stream_matches", "article_id", "CASCADE"),
+    ("stream_classifier_runs", "article_id", "CASCADE"),
+)
+
+
+def _enabled() -> bool:
+    if op.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(context.config.attributes.get("database_partitioning_enabled", False))
+
+
+def _is_partitioned(table_name: str) -> bool:
+    row = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND c.relnamespace = to_regnamespace(current_schema())::oid"
+        ),
+        {"table": table_name},
+    )
+    return row.first() is not None
+
+
+def _month_start(value: datetime) -> date:
+    value = value.astimezone(UTC) if value.tzinfo is not None else value
+    return date(value.year, value.month, 1)
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def _index_definitions(table_name: str) -> list[tuple[str, str, bool]]:
+    # Indexes backing primary key and unique constraints are rebuilt from the constraints themselves.
+    rows = op.get_bind().execute(
+        sa.text(
+            "SELECT ic.relname, pg_get_indexdef(i.indexrelid), i.indisunique FROM pg_index i "
+            "JOIN pg_class ic ON ic.oid = i.indexrelid "
+            "JOIN pg_class t ON t.oid = i.indrelid "
+            "WHERE t.relname = :table AND t.relnamespace = to_regnamespace(current_schema())::oid "
+            "AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)"
+        ),
+        {"table": table_name},
+    )
+    return [
+        (str(name), str(definition).replace(" ON ONLY ", " ON "), bool(unique)) for name, definition, unique in rows
+    ]
+
+
+def _drop_article_foreign_keys() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table_name, column_name, _ in ARTICLE_REFERENCES:
+        for foreign_key in inspector.get_foreign_keys(table_name):
+            if (
+                foreign_key["referred_table"] == "articles"
+                and foreign_key["constrained_columns"] == [column_name]
+                and foreign_key.get("name")
+            ):
+                op.drop_constraint(foreign_key["name"], table_name, type_="foreignkey")
+
+
+def _rebuild(table_name: str, *, source: str, key: str, partitioned: bool) -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    primary_key = inspector.get_pk_constraint(table_name)
+    unique_constraints = inspector.get_unique_constraints(table_name)
+    foreign_keys = inspector.get_foreign_keys(table_name)
+    indexes = _index_definitions(table_name)
+    for name, _, unique in indexes:
+        if unique:
+            raise RuntimeError(f"Unique index {name} on {table_name} must be a constraint before partitioning")
+
+    op.execute(f'ALTER TABLE "{table_name}" RENAME TO "{source}"')
+    if partitioned:
+        op.execute(f'CREATE TABLE "{table_name}" (LIKE "{source}" INCLUDING DEFAULTS) PARTITION BY RANGE ("{key}")')
+        oldest = bind.execute(sa.text(f'SELECT min("{key}") FROM "{source}"')).scalar()
+        now = datetime.now(UTC)
+        month = _month_start(oldest or now)
+        last = _add_months(_month_start(now), int(context.config.attributes.get("database_partition_months_ahead", 2)))
+        while month <= last:
+            op.execute(
+                f'CREATE TABLE "{table_name}_p{month.year:04d}{month.month:02d}" PARTITION OF "{table_name}" '
+                f"FOR VALUES FROM ({_bound(month)}) TO ({_bound(_add_months(month, 1))})"
+            )
+            month = _add_months(month, 1)
+        # Rows outside the prepared months still insert; partition maintenance moves them out later.
+        op.execute(f'CREATE TABLE "{table_name}_default" PARTITION OF "{table_name}" DEFAULT')
+    else:
+        op.execute(f'CREATE TABLE "{table_name}" (LIKE "{source}" INCLUDING DEFAULTS)')
+    op.execute(f'INSERT INTO "{table_name}" SELECT * FROM "{source}"')
+    op.execute(f'DROP TABLE "{source}"')
+
+    def keyed(columns: list[str]) -> list[str]:
+        if partitioned:
+            return columns if key in columns else [*columns, key]
+        return [column for column in columns if column != key] or columns
+
+    op.create_primary_key(
+        primary_key.get("name") or f"{table_name}_pkey", table_name, keyed(primary_key["constrained_columns"])
+    )
+    for constraint in unique_constraints:
+        op.create_unique_constraint(constraint["name"], table_name, keyed(list(constraint["column_names"])))
+    for _, definition, _ in indexes:
+        op.execute(definition)
+    for foreign_key in foreign_keys:
+        if foreign_key["referred_table"] == "articles":
+            continue
+        op.create_foreign_key(
+            foreign_key["name"],
+            table_name,
+            foreign_key["referred_table"],
+            foreign_key["constrained_columns"],
+            foreign_key["referred_columns"],
+            ondelete=foreign_key.get("options", {}).get("ondelete"),
+        )
+
+
+def upgrade() -> None:
+    if not _enabled():
+        return
+    pending = [(table_name, key) for table_name, key in PARTITIONED_TABLES if not _is_partitioned(table_name)]
+    if not pending:
+        return
+    _drop_article_foreign_keys()
+    for table_name, key in pending:
+        _rebuild(table_name, source=f"{table_name}_unpartitioned", key=key, partitioned=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    restored = False
+    for table_name, key in reversed(PARTITIONED_TABLES):
+        if _is_partitioned(table_name):
+            # Detached partitions are standalone tables by now and are left untouched.
+            _rebuild(table_name, source=f"{table_name}_partitioned", key=key, partitioned=False)
+            restored = True
+    if not restored:
+        return
+    for table_name, column_name, on_delete in ARTICLE_REFERENCES:
+        op.create_foreign_key(
+            f"{table_name}_{column_name}_fkey", table_name, "articles", [column_name], ["id"], ondelete=on_delete
+        )
@@ -0,0 +1,58 @@
+"""add composite indexes for article list, navigation, feed health and stream queries
+
+Revision ID: 20261019_0022
+Revises: 20261019_0021
+Create Date: 2026-10-19 14:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0022"
+down_revision: str | None = "20261019_0021"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COMPOSITE_INDEXES: tuple[tuple[str, str, tuple[str | sa.TextClause, ...]], ...] = (
+    ("ix_feeds_owner_id_is_archived_title", "feeds", ("owner_id", "is_archived", "title")),
+    (
+        "ix_articles_feed_id_published_sort",
+        "articles",
+        ("feed_id", sa.text("coalesce(published_at, created_at)"), "created_at"),
+    ),
+    (
+        "ix_article_states_user_id_article_id_flags",
+        "article_states",
+        ("user_id", "article_id", "is_read", "is_archived", "is_starred", "updated_at"),
+    ),
+    ("ix_keyword_stream_matches_stream_id_matched_at", "keyword_stream_matches", ("stream_id", "matched_at")),
+)
+
+# Left-prefixes of the composite indexes or of existing unique constraints, or booleans never filtered on alone.
+REDUNDANT_INDEXES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("ix_feeds_owner_id", "feeds", ("owner_id",)),
+    ("ix_articles_feed_id", "articles", ("feed_id",)),
+    ("ix_article_states_user_id", "article_states", ("user_id",)),
+    ("ix_article_states_is_read", "article_states", ("is_read",)),
+    ("ix_article_states_is_starred", "article_states", ("is_starred",)),
+    ("ix_article_states_is_archived", "article_states", ("is_archived",)),
+    ("ix_keyword_stream_matches_stream_id", "keyword_stream_matches", ("stream_id",)),
+)
+
+
+# The inspector skips expression indexes on SQLite, so existence is left to IF [NOT] EXISTS.
+def upgrade() -> None:
+    for index_name, table_name, columns in COMPOSITE_INDEXES:
+        op.create_index(index_name, table_name, list(columns), unique=False, if_not_exists=True)
+    for index_name, table_name, _ in REDUNDANT_INDEXES:
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
+
+
+def downgrade() -> None:
+    for index_name, table_name, columns in REDUNDANT_INDEXES:
+        op.create_index(index_name, table_name, list(columns), unique=False, if_not_exists=True)
+    for index_name, table_name, _ in COMPOSITE_INDEXES:
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
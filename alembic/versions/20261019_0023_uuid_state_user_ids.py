@@ -0,0 +1,173 @@
+"""store article state and subscription user ids as uuid foreign keys to users
+
+Revision ID: 20261019_0023
+Revises: 20261019_0022
+Create Date: 2026-10-19 15:00:00
+
+The uuid values are copied into a staging column in keyset batches that commit on their own, so the API and workers
+keep reading and writing while the bulk of the rows is converted. A second pass inside the migration transaction
+catches rows written meanwhile, then the columns are swapped. Rows whose user id is not a uuid of an existing user
+were unreachable and are deleted. The upgrade can be interrupted and rerun.
+"""
+
+import uuid
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0023"
+down_revision: str | None = "20261019_0022"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+STAGING_COLUMN = "user_id_staging"
+BATCH_SIZE = 2000
+
+# (table, indexes over user_id other than the unique constraint, unique constraint name)
+USER_ID_TABLES: tuple[tuple[str, tuple[tuple[str, tuple[str, ...]], ...], str], ...] = (
+    (
+        "article_states",
+        (
+            (
+                "ix_article_states_user_id_article_id_flags",
+                ("user_id", "article_id", "is_read", "is_archived", "is_starred", "updated_at"),
+            ),
+        ),
+        "uq_article_state_user_article",
+    ),
+    ("subscriptions", (("ix_subscriptions_user_id", ("user_id",)),), "uq_subscription_user_feed"),
+)
+
+
+def _columns(table_name: str) -> dict[str, Any]:
+    return {column["name"]: column["type"] for column in sa.inspect(op.get_bind()).get_columns(table_name)}
+
+
+def _is_uuid(column_type: Any) -> bool:
+    # SQLite reflects the non-native uuid type as CHAR(32).
+    return isinstance(column_type, sa.Uuid) or (isinstance(column_type, sa.CHAR) and column_type.length == 32)
+
+
+def _unique_columns(table_name: str, name: str) -> list[str]:
+    # Partitioned article_states carries created_at in its unique constraint; keep whatever the table has.
+    for constraint in sa.inspect(op.get_bind()).get_unique_constraints(table_name):
+        if constraint["name"] == name:
+            return list(constraint["column_names"])
+    return []
+
+
+def _to_uuid(value: Any) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _copy(
+    table_name: str,
+    *,
+    source: tuple[str, sa.types.TypeEngine[Any]],
+    target: tuple[str, sa.types.TypeEngine[Any]],
+    convert: Callable[[Any], Any],
+) -> None:
+    bind = op.get_bind()
+    table = sa.table(table_name, sa.column("id", sa.Uuid()), sa.column(source[0], source[1]), sa.column(*target))
+    update = table.update().where(table.c.id == sa.bindparam("row_id")).values({target[0]: sa.bindparam("converted")})
+    last_id = None
+    while True:
+        query = (
+            sa.select(table.c.id, table.c[source[0]])
+            .where(table.c[target[0]].is_(None))
+            .order_by(table.c.id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            return
+        converted = []
+        for row_id, value in rows:
+            converted_value = convert(value)
+            if converted_value is not None:
+                converted.append({"row_id": row_id, "converted": converted_value})
+        if converted:
+            bind.execute(update, converted)
+        last_id = rows[-1][0]
+
+
+def _swap(table_name: str, *, indexes: tuple[tuple[str, tuple[str, ...]], ...], unique: str, to_uuid: bool) -> None:
+    unique_columns = _unique_columns(table_name, unique)
+    existing_indexes = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+    for index_name, _ in indexes:
+        if index_name in existing_indexes:
+            op.drop_index(index_name, table_name=table_name)
+    foreign_key = f"fk_{table_name}_user_id_users"
+    with op.batch_alter_table(table_name, schema=None) as batch_op:
+        if unique_columns:
+            batch_op.drop_constraint(unique, type_="unique")
+        if not to_uuid:
+            batch_op.drop_constraint(foreign_key, type_="foreignkey")
+        batch_op.drop_column("user_id")
+        batch_op.alter_column(
+            STAGING_COLUMN,
+            new_column_name="user_id",
+            existing_type=sa.Uuid() if to_uuid else sa.String(length=255),
+            nullable=False,
+        )
+    with op.batch_alter_table(table_name, schema=None) as batch_op:
+        if to_uuid:
+            batch_op.create_foreign_key(foreign_key, "users", ["user_id"], ["id"], ondelete="CASCADE")
+        batch_op.create_unique_constraint(unique, unique_columns or ["user_id"])
+    for index_name, columns in indexes:
+        op.create_index(index_name, table_name, list(columns), unique=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table_name, indexes, unique in USER_ID_TABLES:
+        columns = _columns(table_name)
+        if _is_uuid(columns["user_id"]):
+            continue
+        if STAGING_COLUMN not in columns:
+            op.add_column(table_name, sa.Column(STAGING_COLUMN, sa.Uuid(), nullable=True))
+
+        copy: dict[str, Any] = {
+            "source": ("user_id", sa.String(length=255)),
+            "target": (STAGING_COLUMN, sa.Uuid()),
+            "convert": _to_uuid,
+        }
+        with op.get_context().autocommit_block():
+            _copy(table_name, **copy)
+        _copy(table_name, **copy)
+
+        table = sa.table(table_name, sa.column(STAGING_COLUMN, sa.Uuid()))
+        users = sa.table("users", sa.column("id", sa.Uuid()))
+        bind.execute(
+            table.delete().where(
+                sa.or_(
+                    table.c[STAGING_COLUMN].is_(None),
+                    ~sa.exists().where(users.c.id == table.c[STAGING_COLUMN]),
+                )
+            )
+        )
+        _swap(table_name, indexes=indexes, unique=unique, to_uuid=True)
+
+
+def downgrade() -> None:
+    for table_name, indexes, unique in USER_ID_TABLES:
+        columns = _columns(table_name)
+        if not _is_uuid(columns["user_id"]):
+            continue
+        if STAGING_COLUMN not in columns:
+            op.add_column(table_name, sa.Column(STAGING_COLUMN, sa.String(length=255), nullable=True))
+        _copy(
+            table_name,
+            source=("user_id", sa.Uuid()),
+            target=(STAGING_COLUMN, sa.String(length=255)),
+            convert=lambda value: str(value) if value is not None else None,
+        )
+        _swap(table_name, indexes=indexes, unique=unique, to_uuid=False)
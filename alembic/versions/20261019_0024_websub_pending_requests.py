@@ -0,0 +1,47 @@
+"""add pending websub subscription requests
+
+Revision ID: 20261019_0024
+Revises: 20261019_0023
+Create Date: 2026-10-19 16:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0024"
+down_revision: str | None = "20261019_0023"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PENDING_TABLE = "websub_pending_requests"
+FEED_FK_NAME = "fk_websub_pending_requests_feed_id_feeds"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if PENDING_TABLE in set(inspector.get_table_names()):
+        return
+
+    op.create_table(
+        PENDING_TABLE,
+        sa.Column("feed_id", sa.UUID(), nullable=False),
+        sa.Column("mode", sa.String(length=16), nullable=False),
+        sa.Column("nonce", sa.String(length=64), nullable=False),
+        sa.Column("hub_url", sa.String(length=1000), nullable=False),
+        sa.Column("topic_url", sa.String(length=1000), nullable=False),
+        sa.Column("secret", sa.String(length=128), nullable=True),
+        sa.Column("requested_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["feed_id"], ["feeds.id"], name=FEED_FK_NAME, ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("feed_id"),
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if PENDING_TABLE in set(inspector.get_table_names()):
+        op.drop_table(PENDING_TABLE)
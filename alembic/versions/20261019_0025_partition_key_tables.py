@@ -0,0 +1,170 @@
+"""enforce article, state and match uniqueness and article references on partitioned postgres tables
+
+Revision ID: 20261019_0025
+Revises: 20261019_0024
+Create Date: 2026-10-19 17:00:00
+
+Only runs when migration 20261019_0021 partitioned the tables. Partitioned tables can only enforce unique keys that
+include the partition column, and nothing can reference them by id alone. Each partitioned table therefore gets an
+ordinary key table holding its row id and the columns that must be unique. Statement-level triggers on the
+partitioned parent keep the key table in step, so a duplicate insert fails on the key table's unique constraint as it
+did before partitioning. The foreign keys that used to point at articles now point at article_keys and regain their
+ON DELETE actions.
+
+Rows that became duplicates while uniqueness was not enforced are removed first: the oldest article and match and the
+most recently updated state win, and rows that pointed at a removed article are deleted or nulled like the foreign
+key would have done.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0025"
+down_revision: str | None = "20261019_0024"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (partitioned table, key table, row id column, unique columns with their types, survivor order for duplicates)
+KEY_TABLES: tuple[tuple[str, str, str, tuple[tuple[str, str], ...], str], ...] = (
+    (
+        "articles",
+        "article_keys",
+        "article_id",
+        (("feed_id", "uuid"), ("source_id", "varchar(1024)")),
+        "created_at, id",
+    ),
+    (
+        "article_states",
+        "article_state_keys",
+        "state_id",
+        (("user_id", "uuid"), ("article_id", "uuid")),
+        "updated_at DESC, id",
+    ),
+    (
+        "keyword_stream_matches",
+        "keyword_stream_match_keys",
+        "match_id",
+        (("stream_id", "uuid"), ("article_id", "uuid")),
+        "matched_at, id",
+    ),
+)
+ARTICLE_REFERENCES: tuple[tuple[str, str, str], ...] = (
+    ("articles", "duplicate_of_id", "SET NULL"),
+    ("article_states", "article_id", "CASCADE"),
+    ("article_fulltexts", "article_id", "CASCADE"),
+    ("keyword_stream_matches", "article_id", "CASCADE"),
+    ("stream_classifier_runs", "article_id", "CASCADE"),
+)
+TRIGGER_EVENTS: tuple[str, ...] = ("insert", "update", "delete")
+
+
+def _is_partitioned(table_name: str) -> bool:
+    row = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND c.relnamespace = to_regnamespace(current_schema())::oid"
+        ),
+        {"table": table_name},
+    )
+    return row.first() is not None
+
+
+def _foreign_key_name(table_name: str, column_name: str) -> str:
+    return f"fk_{table_name}_{column_name}_article_keys"
+
+
+def _sync_body(event: str, key_table: str, row_column: str, columns: list[str]) -> str:
+    if event == "insert":
+        quoted = ", ".join(f'"{column}"' for column in columns)
+        return f'INSERT INTO "{key_table}" ("{row_column}", {quoted}) SELECT id, {quoted} FROM new_rows'
+    if event == "delete":
+        return f'DELETE FROM "{key_table}" k USING old_rows o WHERE k."{row_column}" = o.id'
+    assignments = ", ".join(f'"{c}" = n."{c}"' for c in columns)
+    changed = " OR ".join(f'k."{c}" IS DISTINCT FROM n."{c}"' for c in columns)
+    return f'UPDATE "{key_table}" k SET {assignments} FROM new_rows n WHERE k."{row_column}" = n.id AND ({changed})'
+
+
+def _create_key_table(
+    table_name: str, key_table: str, row_column: str, columns: tuple[tuple[str, str], ...], survivor_order: str
+) -> None:
+    names = [name for name, _ in columns]
+    column_definitions = ", ".join(f'"{name}" {type_}' for name, type_ in columns)
+    quoted = ", ".join(f'"{name}"' for name in names)
+    op.execute(
+        f'CREATE TABLE "{key_table}" ("{row_column}" uuid PRIMARY KEY, {column_definitions}, '
+        f'CONSTRAINT "uq_{key_table}" UNIQUE ({quoted}))'
+    )
+    op.execute(
+        f'INSERT INTO "{key_table}" ("{row_column}", {quoted}) '
+        f'SELECT id, {quoted} FROM "{table_name}" ORDER BY {survivor_order} ON CONFLICT DO NOTHING'
+    )
+    op.execute(
+        f'DELETE FROM "{table_name}" t WHERE NOT EXISTS (SELECT 1 FROM "{key_table}" k WHERE k."{row_column}" = t.id)'
+    )
+
+    # Statement-level triggers are not cloned onto partitions, so partition maintenance can move rows between
+    # partitions directly without touching the key table.
+    for event in TRIGGER_EVENTS:
+        function_name = f"sift_{key_table}_{event}"
+        transition = {
+            "insert": "NEW TABLE AS new_rows",
+            "update": "NEW TABLE AS new_rows",
+            "delete": "OLD TABLE AS old_rows",
+        }[event]
+        op.execute(
+            f'CREATE OR REPLACE FUNCTION "{function_name}"() RETURNS trigger LANGUAGE plpgsql AS $$\n'
+            f"BEGIN\n    {_sync_body(event, key_table, row_column, names)};\n    RETURN NULL;\nEND\n$$"
+        )
+        op.execute(
+            f'CREATE TRIGGER "{table_name}_keys_{event}" AFTER {event.upper()} ON "{table_name}" '
+            f'REFERENCING {transition} FOR EACH STATEMENT EXECUTE FUNCTION "{function_name}"()'
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql" or not _is_partitioned("articles"):
+        return
+    existing_tables = set(sa.inspect(bind).get_table_names())
+    for table_name, key_table, row_column, columns, survivor_order in KEY_TABLES:
+        if key_table not in existing_tables and _is_partitioned(table_name):
+            _create_key_table(table_name, key_table, row_column, columns, survivor_order)
+
+    inspector = sa.inspect(bind)
+    for table_name, column_name, on_delete in ARTICLE_REFERENCES:
+        name = _foreign_key_name(table_name, column_name)
+        if any(foreign_key.get("name") == name for foreign_key in inspector.get_foreign_keys(table_name)):
+            continue
+        orphaned = (
+            f'"{column_name}" IS NOT NULL AND NOT EXISTS '
+            f'(SELECT 1 FROM "article_keys" k WHERE k.article_id = "{table_name}"."{column_name}")'
+        )
+        if on_delete == "SET NULL":
+            op.execute(f'UPDATE "{table_name}" SET "{column_name}" = NULL WHERE {orphaned}')
+        else:
+            op.execute(f'DELETE FROM "{table_name}" WHERE {orphaned}')
+        op.create_foreign_key(name, table_name, "article_keys", [column_name], ["article_id"], ondelete=on_delete)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    existing_tables = set(sa.inspect(bind).get_table_names())
+    if "article_keys" not in existing_tables:
+        return
+
+    inspector = sa.inspect(bind)
+    for table_name, column_name, _ in ARTICLE_REFERENCES:
+        name = _foreign_key_name(table_name, column_name)
+        if any(foreign_key.get("name") == name for foreign_key in inspector.get_foreign_keys(table_name)):
+            op.drop_constraint(name, table_name, type_="foreignkey")
+    for table_name, key_table, _, _, _ in reversed(KEY_TABLES):
+        for event in TRIGGER_EVENTS:
+            op.execute(f'DROP TRIGGER IF EXISTS "{table_name}_keys_{event}" ON "{table_name}"')
+            op.execute(f'DROP FUNCTION IF EXISTS "sift_{key_table}_{event}"()')
+        if key_table in existing_tables:
+            op.drop_table(key_table)
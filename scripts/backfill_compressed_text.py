@@ -0,0 +1,42 @@
+"""Compress raw entry payloads and fulltext bodies written before compressed storage was enabled.
+
+Run after `alembic upgrade head`; rows are rewritten in small committed batches, so it is safe to run while the
+API and workers are up and to interrupt and restart.
+
+Usage:
+    uv run python scripts/backfill_compressed_text.py --batch-size 500 --pause-ms 50
+"""
+
+import argparse
+import asyncio
+
+from sift.config import get_settings
+from sift.db.session import SessionLocal, dispose_engines
+from sift.services.compression_backfill_service import compression_backfill_service
+
+
+async def main(batch_size: int, pause_ms: float) -> None:
+    settings = get_settings()
+    async with SessionLocal() as session:
+        results = await compression_backfill_service.backfill(
+            session,
+            settings=settings,
+            batch_size=batch_size,
+            batch_pause_seconds=pause_ms / 1000,
+        )
+    await dispose_engines()
+
+    for stats in results:
+        saved = 100 * (1 - stats.bytes_after / stats.bytes_before) if stats.bytes_before else 0.0
+        print(
+            f"{stats.column:<34} scanned={stats.scanned:<8} rewritten={stats.rewritten:<8} "
+            f"{stats.bytes_before / 1024:10.1f} KiB -> {stats.bytes_after / 1024:10.1f} KiB ({saved:.1f}% saved)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause-ms", type=float, default=50.0, help="sleep between batches to limit write pressure")
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size, args.pause_ms))
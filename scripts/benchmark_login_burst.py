@@ -0,0 +1,83 @@
+"""Measure latency of a cheap endpoint while a burst of logins runs against the same event loop.
+
+Usage:
+    uv run python scripts/benchmark_login_burst.py --logins 50 --probes 200
+    SIFT_AUTH_PASSWORD_HASH_MAX_WORKERS=0 uv run python scripts/benchmark_login_burst.py  # argon2 inline on the loop
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+_DB_DIR = tempfile.mkdtemp(prefix="sift-bench-")
+os.environ.setdefault("SIFT_DATABASE_URL", f"sqlite+aiosqlite:///{Path(_DB_DIR) / 'bench.db'}")
+os.environ.setdefault("SIFT_LOG_LEVEL", "WARNING")
+os.environ.setdefault("SIFT_DB_SLOW_QUERY_THRESHOLD_MS", "0")
+
+import httpx  # noqa: E402
+
+from sift.config import get_settings  # noqa: E402
+from sift.db.session import init_models  # noqa: E402
+from sift.main import app  # noqa: E402
+
+_EMAIL = "bench@example.com"
+_PASSWORD = "benchmark-password-1234"
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _probe(client: httpx.AsyncClient, count: int, interval: float) -> list[float]:
+    latencies: list[float] = []
+    for _ in range(count):
+        started = perf_counter()
+        response = await client.get("/api/v1/health")
+        response.raise_for_status()
+        latencies.append((perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def _login(client: httpx.AsyncClient) -> None:
+    response = await client.post("/api/v1/auth/login", json={"email": _EMAIL, "password": _PASSWORD})
+    response.raise_for_status()
+
+
+async def main(logins: int, probes: int, interval: float) -> None:
+    await init_models()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/api/v1/auth/register", json={"email": _EMAIL, "password": _PASSWORD})
+        response.raise_for_status()
+
+        baseline = await _probe(client, probes, interval)
+        burst_started = perf_counter()
+        burst = asyncio.gather(*(_login(client) for _ in range(logins)))
+        during = await _probe(client, probes, interval)
+        await burst
+        burst_seconds = perf_counter() - burst_started
+
+    settings = get_settings()
+    print(f"password hash workers: {settings.auth_password_hash_max_workers} (0 = inline on the event loop)")
+    print(f"logins: {logins} completed in {burst_seconds:.2f}s")
+    for label, samples in (("baseline", baseline), ("during burst", during)):
+        print(
+            f"/health {label:>12}: p50={statistics.median(samples):7.2f}ms "
+            f"p99={_percentile(samples, 99):7.2f}ms max={max(samples):7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--probes", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=0.005, help="seconds between /health probes")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.probes, args.interval))
@@ -0,0 +1,162 @@
+"""Compare SQLite write throughput, lock errors and read latency with and without the SQLite profile.
+
+Worker processes insert article batches (reading before they write, like ingestion) while the main process, like the
+API, runs list queries and small state writes. Each configuration runs against a fresh database file.
+
+Usage:
+    uv run python scripts/benchmark_sqlite_profile.py --seconds 10 --worker-processes 2 --readers 8
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from sift.config import Settings
+from sift.db.base import Base
+from sift.db.models import Article, Feed
+from sift.db.routing import RoutingSession
+from sift.db.sqlite import create_sqlite_engines
+
+
+@dataclass(slots=True)
+class _Stats:
+    rows_written: int = 0
+    write_errors: int = 0
+    read_errors: int = 0
+    read_ms: list[float] = field(default_factory=list)
+
+
+def _session_maker(database_url: str, profile: bool) -> tuple[async_sessionmaker[Any], list[AsyncEngine]]:
+    if not profile:
+        engine = create_async_engine(database_url)
+        return async_sessionmaker(bind=engine, expire_on_commit=False), [engine]
+    writer, reader = create_sqlite_engines(Settings(database_url=database_url))
+    session_maker = async_sessionmaker(
+        bind=writer,
+        sync_session_class=RoutingSession,
+        reader=reader.sync_engine if reader is not None else None,
+        expire_on_commit=False,
+    )
+    return session_maker, [engine for engine in (writer, reader) if engine is not None]
+
+
+async def _writer(session_maker: async_sessionmaker[Any], feed_id: uuid.UUID, deadline: float, batch: int) -> _Stats:
+    stats = _Stats()
+    while perf_counter() < deadline:
+        try:
+            async with session_maker() as session:
+                await session.execute(select(func.count()).select_from(Article).where(Article.feed_id == feed_id))
+                session.add_all(
+                    [
+                        Article(feed_id=feed_id, source_id=uuid.uuid4().hex, title="Entry", content_text="Body " * 40)
+                        for _ in range(batch)
+                    ]
+                )
+                await session.commit()
+            stats.rows_written += batch
+        except OperationalError:
+            stats.write_errors += 1
+    return stats
+
+
+async def _reader(session_maker: async_sessionmaker[Any], feed_id: uuid.UUID, deadline: float) -> _Stats:
+    stats = _Stats()
+    while perf_counter() < deadline:
+        started = perf_counter()
+        try:
+            async with session_maker() as session:
+                # Scoped to the feed the API-side writer fills slowly, so the work per read stays comparable.
+                await session.execute(
+                    select(Article.id, Article.title)
+                    .where(Article.feed_id == feed_id)
+                    .order_by(Article.created_at.desc())
+                    .limit(50)
+                )
+                await session.execute(select(func.count()).select_from(Article).where(Article.feed_id == feed_id))
+            stats.read_ms.append((perf_counter() - started) * 1000)
+        except OperationalError:
+            stats.read_errors += 1
+        await asyncio.sleep(0)
+    return stats
+
+
+async def _worker_main(database_url: str, profile: bool, feed_id: uuid.UUID, seconds: float, batch: int) -> _Stats:
+    session_maker, engines = _session_maker(database_url, profile)
+    stats = await _writer(session_maker, feed_id, perf_counter() + seconds, batch)
+    for engine in engines:
+        await engine.dispose()
+    return stats
+
+
+def _worker_process(
+    database_url: str, profile: bool, feed_id: uuid.UUID, seconds: float, batch: int, queue: Any
+) -> None:
+    queue.put(asyncio.run(_worker_main(database_url, profile, feed_id, seconds, batch)))
+
+
+async def _run(profile: bool, seconds: float, worker_processes: int, readers: int, batch: int) -> None:
+    database_url = f"sqlite+aiosqlite:///{Path(tempfile.mkdtemp(prefix='sift-sqlite-bench-')) / 'bench.db'}"
+    session_maker, engines = _session_maker(database_url, profile)
+    async with engines[0].begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_maker() as session:
+        feeds = [Feed(title=f"Feed {index}", url=f"https://bench.example.com/{index}.xml") for index in range(4)]
+        session.add_all(feeds)
+        await session.commit()
+
+    spawn = multiprocessing.get_context("spawn")
+    queue = spawn.Queue()
+    processes = [
+        spawn.Process(target=_worker_process, args=(database_url, profile, feeds[index % 3].id, seconds, batch, queue))
+        for index in range(worker_processes)
+    ]
+    for process in processes:
+        process.start()
+    deadline = perf_counter() + seconds
+    results = await asyncio.gather(
+        _writer(session_maker, feeds[3].id, deadline, 1),
+        *(_reader(session_maker, feeds[3].id, deadline) for _ in range(readers)),
+    )
+    worker_results = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+    for engine in engines:
+        await engine.dispose()
+
+    written = sum(stats.rows_written for stats in [*results, *worker_results])
+    write_errors = sum(stats.write_errors for stats in [*results, *worker_results])
+    read_ms = [sample for stats in results for sample in stats.read_ms]
+    read_errors = sum(stats.read_errors for stats in results)
+    quantiles = statistics.quantiles(read_ms, n=100) if len(read_ms) > 1 else [0.0] * 99
+    print(
+        f"{'profile' if profile else 'default':<8} rows/s={written / seconds:9.1f}  write lock errors={write_errors:<5} "
+        f"reads={len(read_ms):<6} read p50={quantiles[49]:7.2f}ms p95={quantiles[94]:7.2f}ms "
+        f"p99={quantiles[98]:7.2f}ms  read errors={read_errors}"
+    )
+
+
+async def main(seconds: float, worker_processes: int, readers: int, batch: int) -> None:
+    print(f"{worker_processes} worker processes x {batch}-row batches, {readers} readers, {seconds:.0f}s each\n")
+    for profile in (False, True):
+        await _run(profile, seconds, worker_processes, readers, batch)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--worker-processes", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=50, help="articles per worker transaction")
+    args = parser.parse_args()
+    asyncio.run(main(args.seconds, args.worker_processes, args.readers, args.batch))
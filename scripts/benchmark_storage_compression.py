@@ -0,0 +1,134 @@
+"""Measure storage saved and CPU cost of compressing raw entry payloads and fulltext HTML.
+
+Usage:
+    uv run python scripts/benchmark_storage_compression.py --feeds 20 --entries 50
+    uv run --extra compression python scripts/benchmark_storage_compression.py  # include zstd and trained dictionaries
+"""
+
+import argparse
+import random
+import statistics
+from collections.abc import Callable
+from time import perf_counter
+
+from sift.db.types import compress_text, decompress_text, zstandard
+from sift.services.feed_parse_service import parse_feed_document
+
+_WORDS = (
+    "model release benchmark dataset inference latency gpu training open weights evaluation agent reasoning "
+    "policy research startup funding regulation privacy security cloud pipeline deployment"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _feed_document(rng: random.Random, feed_index: int, entries: int) -> bytes:
+    items = []
+    for entry_index in range(entries):
+        slug = f"post-{feed_index}-{entry_index}"
+        body = "".join(f"<p>{_sentence(rng, rng.randint(12, 30))}</p>" for _ in range(rng.randint(2, 6)))
+        items.append(
+            f"<item><guid isPermaLink='false'>urn:feed-{feed_index}:{slug}</guid>"
+            f"<title>{_sentence(rng, 8)}</title>"
+            f"<link>https://news{feed_index}.example.com/{slug}?utm_source=rss&amp;utm_medium=feed</link>"
+            f"<pubDate>Mon, 19 Oct 2026 {entry_index % 24:02d}:00:00 GMT</pubDate>"
+            f"<category>AI</category><category>Research</category>"
+            f"<description><![CDATA[{body}]]></description></item>"
+        )
+    return (
+        f"<rss version='2.0'><channel><title>Feed {feed_index}</title>"
+        f"<link>https://news{feed_index}.example.com/</link>{''.join(items)}</channel></rss>"
+    ).encode()
+
+
+def _article_html(rng: random.Random) -> str:
+    paragraphs = "".join(f"<p class='article-body__text'>{_sentence(rng, rng.randint(20, 60))}</p>" for _ in range(30))
+    return (
+        "<html><head><meta charset='utf-8'><link rel='stylesheet' href='/static/site.css'></head><body>"
+        "<nav class='site-nav'><a href='/'>Home</a><a href='/ai'>AI</a><a href='/about'>About</a></nav>"
+        f"<article><h1>{_sentence(rng, 10)}</h1>{paragraphs}</article>"
+        "<footer class='site-footer'>Copyright Example News. All rights reserved.</footer></body></html>"
+    )
+
+
+def _measure(
+    label: str,
+    values: list[str],
+    compress: Callable[[str], bytes],
+    decompress: Callable[[bytes], str],
+) -> None:
+    original_bytes = sum(len(value.encode("utf-8")) for value in values)
+    compress_us: list[float] = []
+    decompress_us: list[float] = []
+    stored_bytes = 0
+    for value in values:
+        started = perf_counter()
+        stored = compress(value)
+        compress_us.append((perf_counter() - started) * 1_000_000)
+        stored_bytes += len(stored)
+        started = perf_counter()
+        assert decompress(stored) == value
+        decompress_us.append((perf_counter() - started) * 1_000_000)
+    saved = 100 * (1 - stored_bytes / original_bytes) if original_bytes else 0.0
+    print(
+        f"{label:<32} {original_bytes / 1024:9.1f} KiB -> {stored_bytes / 1024:9.1f} KiB ({saved:5.1f}% saved)  "
+        f"compress p50={statistics.median(compress_us):7.1f}us  decompress p50={statistics.median(decompress_us):6.1f}us"
+    )
+
+
+def _codec_runner(codec: str, level: int) -> Callable[[str], bytes]:
+    def _compress(value: str) -> bytes:
+        return compress_text(value, codec=codec, level=level, min_bytes=256)
+
+    return _compress
+
+
+def main(feeds: int, entries: int, articles: int, seed: int) -> None:
+    rng = random.Random(seed)
+    payloads_by_feed = [
+        [entry.payload for entry in parse_feed_document(_feed_document(rng, index, entries)).entries]
+        for index in range(feeds)
+    ]
+    payloads = [payload for feed_payloads in payloads_by_feed for payload in feed_payloads]
+    html_pages = [_article_html(rng) for _ in range(articles)]
+
+    codecs: list[tuple[str, str, int]] = [
+        ("none", "none", 0),
+        ("zlib level 1", "zlib", 1),
+        ("zlib level 3", "zlib", 3),
+        ("zlib level 6", "zlib", 6),
+    ]
+    if zstandard is not None:
+        codecs.extend([("zstd level 3", "zstd", 3), ("zstd level 9", "zstd", 9)])
+    else:
+        print("zstandard is not installed; install the 'compression' extra to include zstd results.\n")
+
+    for dataset, values in (("raw_entries.payload", payloads), ("article_fulltexts.content_html", html_pages)):
+        print(f"{dataset}: {len(values)} values")
+        for label, codec, level in codecs:
+            _measure(label, values, _codec_runner(codec, level), decompress_text)
+        print()
+
+    if zstandard is not None:
+        # A per-feed trained dictionary only pays off if it beats plain zstd by enough to justify storing it.
+        print("raw_entries.payload with a per-feed trained zstd dictionary (training cost excluded):")
+        original = trained = 0
+        for feed_payloads in payloads_by_feed:
+            samples = [payload.encode("utf-8") for payload in feed_payloads]
+            dictionary = zstandard.train_dictionary(16 * 1024, samples)
+            compressor = zstandard.ZstdCompressor(level=3, dict_data=dictionary)
+            original += sum(len(sample) for sample in samples)
+            trained += sum(len(compressor.compress(sample)) for sample in samples) + len(dictionary.as_bytes())
+        print(f"  {original / 1024:.1f} KiB -> {trained / 1024:.1f} KiB including dictionaries")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--feeds", type=int, default=20)
+    parser.add_argument("--entries", type=int, default=50, help="entries per feed")
+    parser.add_argument("--articles", type=int, default=200, help="fulltext HTML pages")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    main(args.feeds, args.entries, args.articles, args.seed)
@@ -0,0 +1,64 @@
+from collections.abc import AsyncGenerator
+from math import ceil
+from time import time
+from typing import Final
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sift.config import get_settings
+from sift.db.session import get_db_session, open_replica_session
+from sift.observability.metrics import get_observability_metrics
+
+READ_YOUR_WRITES_COOKIE: Final[str] = "sift_read_primary_until"
+SAFE_METHODS: Final[frozenset[str]] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def pinned_to_primary(request: Request, *, now: float | None = None) -> bool:
+    raw_value = request.cookies.get(READ_YOUR_WRITES_COOKIE)
+    if not raw_value:
+        return False
+    try:
+        return float(raw_value) > (now if now is not None else time())
+    except ValueError:
+        return False
+
+
+def mark_read_your_writes(response: Response, *, now: float | None = None) -> None:
+    # The cookie travels with the client, so every API replica keeps its reads on the primary until replicas catch up.
+    settings = get_settings()
+    window = settings.database_read_your_writes_seconds
+    if window <= 0:
+        return
+    response.set_cookie(
+        READ_YOUR_WRITES_COOKIE,
+        f"{(now if now is not None else time()) + window:.3f}",
+        max_age=max(1, ceil(window)),
+        httponly=True,
+        secure=settings.auth_cookie_secure,
+        samesite="lax",
+    )
+
+
+async def get_read_db_session(
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
+) -> AsyncGenerator[AsyncSession]:
+    # The primary session is shared with the auth dependency and only connects if it is actually used.
+    if not get_settings().database_replica_urls:
+        yield session
+        return
+
+    metrics = get_observability_metrics()
+    if pinned_to_primary(request):
+        metrics.record_db_read_session(target="primary", reason="read_your_writes")
+        yield session
+        return
+    replica_session = open_replica_session()
+    if replica_session is None:
+        metrics.record_db_read_session(target="primary", reason="no_replica")
+        yield session
+        return
+    metrics.record_db_read_session(target="replica", reason="replica")
+    async with replica_session:
+        yield replica_session
@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from sift.api.routes.articles import router as articles_router
 from sift.api.routes.auth import router as auth_router
 from sift.api.routes.dashboard import router as dashboard_router
+from sift.api.routes.diagnostics import router as diagnostics_router
 from sift.api.routes.feeds import router as feeds_router
 from sift.api.routes.folders import router as folders_router
 from sift.api.routes.health import router as health_router
@@ -11,6 +12,7 @@ from sift.api.routes.navigation import router as navigation_router
 from sift.api.routes.plugins import router as plugins_router
 from sift.api.routes.rules import router as rules_router
 from sift.api.routes.streams import router as streams_router
+from sift.api.routes.websub import router as websub_router
 
 api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(health_router, tags=["health"])
@@ -24,3 +26,5 @@ api_router.include_router(rules_router, prefix="/rules", tags=["rules"])
 api_router.include_router(streams_router, prefix="/streams", tags=["streams"])
 api_router.include_router(navigation_router, prefix="/navigation", tags=["navigation"])
 api_router.include_router(plugins_router, prefix="/plugins", tags=["plugins"])
+api_router.include_router(websub_router, prefix="/websub", tags=["websub"])
+api_router.include_router(diagnostics_router, prefix="/diagnostics", tags=["diagnostics"])
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.api.deps.auth import get_current_user
+from sift.api.deps.db import get_read_db_session
 from sift.db.models import User
 from sift.db.session import get_db_session
 from sift.domain.schemas import (
@@ -54,7 +55,7 @@ async def list_articles(
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
     sort: Literal["newest", "oldest", "unread_first"] = Query(default="newest"),
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
 ) -> ArticleListResponse:
     try:
@@ -116,7 +117,7 @@ async def mark_scope_as_read(
 @router.get("/{article_id}", response_model=ArticleDetailOut)
 async def get_article(
     article_id: UUID,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
 ) -> ArticleDetailOut:
     try:
@@ -0,0 +1,33 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from sift.api.deps.auth import get_current_admin_user
+from sift.config import get_settings
+from sift.db.models import User
+from sift.observability.profiler import ProfilerBusyError, get_sampling_profiler
+
+router = APIRouter()
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile_process(
+    seconds: float = Query(default=5.0, gt=0),
+    current_user: User = Depends(get_current_admin_user),
+) -> PlainTextResponse:
+    del current_user
+
+    settings = get_settings()
+    if not settings.profiling_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling disabled")
+
+    # Sampling runs on a worker thread so the event loop keeps serving (and shows up in) the profile.
+    try:
+        result = await asyncio.to_thread(get_sampling_profiler().profile, seconds, source="api")
+    except ProfilerBusyError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    return PlainTextResponse(
+        content=result.collapsed,
+        headers={"X-Profile-Samples": str(result.sample_count)},
+    )
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.api.deps.auth import get_current_user
+from sift.api.deps.db import get_read_db_session
 from sift.core.runtime import get_plugin_manager
 from sift.db.models import User
 from sift.db.session import get_db_session
@@ -34,7 +35,7 @@ router = APIRouter()
 @router.get("", response_model=list[FeedOut])
 async def list_feeds(
     include_archived: bool = Query(default=False),
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
 ) -> list[FeedOut]:
     feeds = await feed_service.list_feeds(
@@ -54,7 +55,7 @@ async def list_feed_health(
     all: bool = Query(default=False),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
 ) -> FeedHealthListResponse:
     return await feed_health_service.list_feed_health(
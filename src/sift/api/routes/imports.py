@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+import asyncio
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.api.deps.auth import get_current_user
@@ -6,6 +8,7 @@ from sift.db.models import User
 from sift.db.session import get_db_session
 from sift.domain.schemas import OpmlImportResult
 from sift.services.opml_service import OpmlParseError, opml_service
+from sift.tasks.scheduler import enqueue_feed_probes
 
 router = APIRouter()
 
@@ -13,6 +16,7 @@ router = APIRouter()
 @router.post("/opml", response_model=OpmlImportResult)
 async def import_opml(
     file: UploadFile = File(...),
+    probe: bool = Query(default=False),
     session: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user),
 ) -> OpmlImportResult:
@@ -28,10 +32,12 @@ async def import_opml(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Uploaded file is empty")
 
     try:
-        return await opml_service.import_from_bytes(
-            session=session,
-            user_id=current_user.id,
-            content=content,
-        )
+        report = await opml_service.import_from_bytes(session=session, user_id=current_user.id, content=content)
     except OpmlParseError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    if probe:
+        created_feed_ids = [result.feed_id for result in report.results if result.feed_id is not None]
+        # Each created feed is fetched by its own worker job, so the request only pays for one Redis round trip.
+        report.probe_enqueued_count = await asyncio.to_thread(enqueue_feed_probes, created_feed_ids)
+    return report
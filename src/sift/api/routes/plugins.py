@@ -4,7 +4,12 @@ from sift.api.deps.auth import get_current_admin_user, get_current_user
 from sift.config import get_settings
 from sift.core.runtime import get_plugin_manager
 from sift.db.models import User
-from sift.domain.schemas import PluginAreaOut, PluginCapabilityRuntimeCountersOut, PluginStatusOut
+from sift.domain.schemas import (
+    PluginAreaOut,
+    PluginCapabilityRuntimeCountersOut,
+    PluginCircuitBreakerOut,
+    PluginStatusOut,
+)
 from sift.plugins.registry import load_plugin_registry
 
 router = APIRouter()
@@ -67,6 +72,15 @@ async def list_plugin_status(current_user: User = Depends(get_current_admin_user
                 capability: PluginCapabilityRuntimeCountersOut(**counters)
                 for capability, counters in snapshot.runtime_counters.items()
             },
+            circuit_breakers={
+                capability: PluginCircuitBreakerOut(
+                    state=breaker.state,
+                    consecutive_failures=breaker.consecutive_failures,
+                    short_circuit_count=breaker.short_circuit_count,
+                    opened_at=breaker.opened_at,
+                )
+                for capability, breaker in snapshot.circuit_breakers.items()
+            },
             last_updated_at=snapshot.last_updated_at,
         )
         for snapshot in manager.get_status_snapshots()
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.api.deps.auth import get_current_user
+from sift.api.deps.db import get_read_db_session
 from sift.db.models import User
 from sift.db.session import get_db_session
 from sift.domain.schemas import IngestRuleCreate, IngestRuleOut, IngestRuleUpdate
@@ -14,7 +15,7 @@ router = APIRouter()
 
 @router.get("", response_model=list[IngestRuleOut])
 async def list_rules(
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
 ) -> list[IngestRuleOut]:
     rules = await rule_service.list_rules(session=session, user_id=current_user.id)
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.api.deps.auth import get_current_user
+from sift.api.deps.db import get_read_db_session
 from sift.core.runtime import get_plugin_manager
 from sift.db.models import User
 from sift.db.session import get_db_session
@@ -28,7 +29,7 @@ router = APIRouter()
 
 @router.get("", response_model=list[KeywordStreamOut])
 async def list_streams(
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
 ) -> list[KeywordStreamOut]:
     streams = await stream_service.list_streams(session=session, user_id=current_user.id)
@@ -93,7 +94,7 @@ async def delete_stream(
 async def list_stream_articles(
     stream_id: UUID,
     limit: int = Query(default=100, ge=1, le=500),
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
 ) -> list[StreamArticleOut]:
     try:
@@ -111,7 +112,7 @@ async def list_stream_articles(
 async def list_stream_classifier_runs(
     stream_id: UUID,
     limit: int = Query(default=100, ge=1, le=500),
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
 ) -> list[StreamClassifierRunOut]:
     try:
@@ -0,0 +1,78 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sift.config import get_settings
+from sift.core.runtime import get_plugin_manager
+from sift.db.session import get_db_session
+from sift.services.ingestion_service import ingestion_service
+from sift.services.websub_service import WebSubVerificationError, websub_service
+
+router = APIRouter()
+
+
+async def _read_push_body(request: Request, max_bytes: int) -> bytes:
+    too_large = HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"Push body exceeds the limit of {max_bytes} bytes",
+    )
+    declared_length = request.headers.get("Content-Length")
+    if declared_length and declared_length.isdigit() and int(declared_length) > max_bytes:
+        raise too_large
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            raise too_large
+    return bytes(body)
+
+
+@router.get("/{feed_id}", response_class=PlainTextResponse)
+async def verify_websub_intent(
+    feed_id: UUID,
+    mode: str = Query(alias="hub.mode"),
+    topic: str = Query(default="", alias="hub.topic"),
+    challenge: str = Query(default="", alias="hub.challenge"),
+    lease_seconds: int | None = Query(default=None, alias="hub.lease_seconds"),
+    nonce: str = Query(default=""),
+    session: AsyncSession = Depends(get_db_session),
+) -> PlainTextResponse:
+    try:
+        echoed = await websub_service.verify_intent(
+            session,
+            feed_id=feed_id,
+            mode=mode,
+            topic=topic,
+            challenge=challenge,
+            lease_seconds=lease_seconds,
+            nonce=nonce,
+        )
+    except WebSubVerificationError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return PlainTextResponse(content=echoed)
+
+
+@router.post("/{feed_id}", status_code=status.HTTP_202_ACCEPTED)
+async def receive_websub_push(
+    feed_id: UUID,
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    body = await _read_push_body(request, get_settings().ingest_fetch_max_bytes)
+    feed = await websub_service.authenticate_push(
+        session,
+        feed_id=feed_id,
+        body=body,
+        signature_header=request.headers.get("X-Hub-Signature"),
+    )
+    # Per WebSub, unauthenticated pushes are acknowledged but ignored so the hub does not retry them.
+    if feed is not None:
+        await ingestion_service.ingest_pushed_content(
+            session,
+            feed=feed,
+            content=body,
+            plugin_manager=get_plugin_manager(),
+        )
+    return Response(status_code=status.HTTP_202_ACCEPTED)
@@ -12,12 +12,65 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     database_url: str = "sqlite+aiosqlite:///./sift.db"
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout_seconds: float = 30.0
+    database_pool_recycle_seconds: int = 1800
+    database_pool_pre_ping: str = "idle"
+    database_pool_pre_ping_idle_seconds: float = 60.0
+    database_statement_cache_size: int = 100
+    database_pgbouncer: bool = False
+    database_replica_urls: list[str] = Field(default_factory=list)
+    database_replica_pool_size: int = 5
+    database_replica_max_overflow: int = 10
+    database_read_your_writes_seconds: float = 5.0
+    sqlite_profile_enabled: bool = True
+    sqlite_journal_mode: str = "wal"
+    sqlite_synchronous: str = "normal"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 65536
+    sqlite_mmap_size_bytes: int = 268435456
+    sqlite_reader_pool_size: int = 4
+    sqlite_writer_timeout_seconds: float = 30.0
     redis_url: str = "redis://localhost:6379/0"
     ingest_queue_name: str = "ingest"
     scheduler_poll_interval_seconds: int = 30
     scheduler_batch_size: int = 200
+    storage_compression: str = "auto"
+    storage_compression_level: int = 3
+    storage_compression_min_bytes: int = 256
+    retention_enabled: bool = False
+    retention_interval_seconds: int = 3600
+    retention_raw_entries_days: int = 90
+    retention_raw_entries_per_feed: int = 1000
+    retention_classifier_runs_days: int = 30
+    retention_batch_size: int = 1000
+    retention_batch_pause_ms: float = 50.0
+    database_partitioning_enabled: bool = False
+    database_partition_maintenance_interval_seconds: int = 21600
+    database_partition_months_ahead: int = 2
+    database_partition_detach_after_months: int = 0
+    ingest_fetch_max_bytes: int = 10_000_000
+    ingest_fetch_read_deadline_seconds: float = 60.0
+    ingest_fetch_max_decompression_ratio: int = 100
+    ingest_parse_executor: str = "thread"
+    ingest_parse_max_workers: int = 2
+    ingest_parse_timeout_seconds: float = 30.0
+    ingest_parse_max_body_bytes: int = 10_000_000
+    opml_import_probe_timeout_seconds: float = 15.0
+    websub_enabled: bool = False
+    websub_callback_base_url: str | None = None
+    websub_lease_seconds: int = 864000
+    websub_resubscribe_margin_seconds: int = 86400
+    websub_fallback_poll_interval_minutes: int = 720
     auth_session_cookie_name: str = "sift_session"
     auth_session_ttl_days: int = 30
+    auth_session_cache_ttl_seconds: float = 30.0
+    auth_session_last_seen_interval_seconds: float = 300.0
+    auth_password_hash_max_workers: int = 2
+    auth_argon2_time_cost: int = 3
+    auth_argon2_memory_cost_kib: int = 65536
+    auth_argon2_parallelism: int = 4
     auth_cookie_secure: bool = False
     auto_create_tables: bool = False
     dev_seed_enabled: bool = False
@@ -36,12 +89,26 @@ class Settings(BaseSettings):
     plugin_timeout_discovery_ms: int = 5000
     plugin_timeout_summary_ms: int = 5000
     plugin_diagnostics_enabled: bool = True
+    plugin_ingest_hook_concurrency: int = 8
+    plugin_breaker_failure_threshold: int = 5
+    plugin_breaker_reset_timeout_ms: int = 30000
     observability_enabled: bool = True
     metrics_enabled: bool = True
     metrics_path: str = "/metrics"
     metrics_bind_host: str = "0.0.0.0"
     metrics_scheduler_port: int = 9101
     metrics_worker_port: int = 9102
+    metrics_duration_buckets: str = ""
+    metrics_multiprocess_dir: str = ""
+    db_slow_query_threshold_ms: float = 500.0
+    profiling_enabled: bool = False
+    profiling_max_seconds: float = 30.0
+    profiling_sample_interval_ms: float = 10.0
+    profiling_token: str = ""
+    event_loop_monitor_enabled: bool = True
+    event_loop_monitor_interval_ms: float = 250.0
+    event_loop_block_threshold_ms: float = 100.0
+    event_loop_debug: bool = False
     log_level: str = "INFO"
     log_format: str = "json"
     log_redact_fields: list[str] = Field(
@@ -56,6 +123,8 @@ class Settings(BaseSettings):
             "payload",
         ]
     )
+    log_queue_size: int = 10000
+    log_sample_rates: dict[str, float] = Field(default_factory=dict)
     request_id_header: str = "X-Request-Id"
 
 
@@ -3,6 +3,7 @@ from functools import lru_cache
 from sift.config import get_settings
 from sift.plugins.manager import PluginManager
 from sift.plugins.registry import load_plugin_registry
+from sift.plugins.telemetry import PluginTelemetryCollector
 
 
 @lru_cache
@@ -14,6 +15,10 @@ def get_plugin_manager() -> PluginManager:
         timeout_discovery_ms=settings.plugin_timeout_discovery_ms,
         timeout_summary_ms=settings.plugin_timeout_summary_ms,
         diagnostics_enabled=settings.plugin_diagnostics_enabled,
+        ingest_hook_concurrency=settings.plugin_ingest_hook_concurrency,
+        breaker_failure_threshold=settings.plugin_breaker_failure_threshold,
+        breaker_reset_timeout_ms=settings.plugin_breaker_reset_timeout_ms,
+        telemetry_collector=PluginTelemetryCollector(duration_buckets=settings.metrics_duration_buckets or None),
     )
     registry = load_plugin_registry(settings.plugin_registry_path)
     manager.load_from_registry(registry.plugins)
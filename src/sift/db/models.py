@@ -1,10 +1,24 @@
 import uuid
-from datetime import UTC, datetime
-
-from sqlalchemy import UUID, Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
+from datetime import UTC, date, datetime
+
+from sqlalchemy import (
+    UUID,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sift.db.base import Base
+from sift.db.types import CompressedText, UserUUID
 
 
 def utcnow() -> datetime:
@@ -29,9 +43,10 @@ class FeedFolder(TimestampMixin, Base):
 
 class Feed(TimestampMixin, Base):
     __tablename__ = "feeds"
+    __table_args__ = (Index("ix_feeds_owner_id_is_archived_title", "owner_id", "is_archived", "title"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    owner_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), index=True)
+    owner_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"))
     folder_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("feed_folders.id", ondelete="SET NULL"), index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     url: Mapped[str] = mapped_column(String(1000), nullable=False, unique=True, index=True)
@@ -46,6 +61,23 @@ class Feed(TimestampMixin, Base):
     last_fetch_success_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     last_fetch_error: Mapped[str | None] = mapped_column(String(1000))
     last_fetch_error_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_body_hash: Mapped[str | None] = mapped_column(String(64))
+    websub_hub_url: Mapped[str | None] = mapped_column(String(1000))
+    websub_topic_url: Mapped[str | None] = mapped_column(String(1000))
+    websub_secret: Mapped[str | None] = mapped_column(String(128))
+    websub_lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
+
+
+class WebSubPendingRequest(Base):
+    __tablename__ = "websub_pending_requests"
+
+    feed_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("feeds.id", ondelete="CASCADE"), primary_key=True)
+    mode: Mapped[str] = mapped_column(String(16), nullable=False)
+    nonce: Mapped[str] = mapped_column(String(64), nullable=False)
+    hub_url: Mapped[str] = mapped_column(String(1000), nullable=False)
+    topic_url: Mapped[str] = mapped_column(String(1000), nullable=False)
+    secret: Mapped[str | None] = mapped_column(String(128))
+    requested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
 
 
 class Subscription(TimestampMixin, Base):
@@ -53,28 +85,38 @@ class Subscription(TimestampMixin, Base):
     __table_args__ = (UniqueConstraint("user_id", "feed_id", name="uq_subscription_user_feed"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[str] = mapped_column(String(255), index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UserUUID, ForeignKey("users.id", ondelete="CASCADE"), index=True)
     feed_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("feeds.id", ondelete="CASCADE"), index=True)
 
 
 class RawEntry(TimestampMixin, Base):
     __tablename__ = "raw_entries"
-    __table_args__ = (UniqueConstraint("feed_id", "source_id", name="uq_raw_entry_feed_source"),)
+    __table_args__ = (
+        UniqueConstraint("feed_id", "source_id", name="uq_raw_entry_feed_source"),
+        Index("ix_raw_entries_feed_id_created_at", "feed_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     feed_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("feeds.id", ondelete="CASCADE"), index=True)
     source_id: Mapped[str] = mapped_column(String(1024), nullable=False, index=True)
     source_guid: Mapped[str | None] = mapped_column(String(1024), index=True)
     source_url: Mapped[str | None] = mapped_column(String(2000), index=True)
-    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    # Deferred so listing or pruning raw entries never fetches or decompresses the payload.
+    payload: Mapped[str] = mapped_column(CompressedText, nullable=False, deferred=True)
 
 
 class Article(TimestampMixin, Base):
     __tablename__ = "articles"
-    __table_args__ = (UniqueConstraint("feed_id", "source_id", name="uq_article_feed_source"),)
+    __table_args__ = (
+        UniqueConstraint("feed_id", "source_id", name="uq_article_feed_source"),
+        # Matches the list sort key and the recent-window filters, so per-feed pages read in index order.
+        Index(
+            "ix_articles_feed_id_published_sort", "feed_id", text("coalesce(published_at, created_at)"), "created_at"
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    feed_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("feeds.id", ondelete="SET NULL"), nullable=True, index=True)
+    feed_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("feeds.id", ondelete="SET NULL"), nullable=True)
     source_id: Mapped[str] = mapped_column(String(1024), nullable=False, index=True)
     canonical_url: Mapped[str | None] = mapped_column(String(2000), index=True)
     canonical_url_normalized: Mapped[str | None] = mapped_column(String(2000), index=True)
@@ -91,14 +133,26 @@ class Article(TimestampMixin, Base):
 
 class ArticleState(TimestampMixin, Base):
     __tablename__ = "article_states"
-    __table_args__ = (UniqueConstraint("user_id", "article_id", name="uq_article_state_user_article"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "article_id", name="uq_article_state_user_article"),
+        # Covers the per-user outer join in list, count and navigation queries without touching the table.
+        Index(
+            "ix_article_states_user_id_article_id_flags",
+            "user_id",
+            "article_id",
+            "is_read",
+            "is_archived",
+            "is_starred",
+            "updated_at",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[str] = mapped_column(String(255), index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UserUUID, ForeignKey("users.id", ondelete="CASCADE"))
     article_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("articles.id", ondelete="CASCADE"), index=True)
-    is_read: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
-    is_starred: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
-    is_archived: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    is_read: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_starred: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_archived: Mapped[bool] = mapped_column(Boolean, default=False)
 
 
 class ArticleFulltext(TimestampMixin, Base):
@@ -110,8 +164,8 @@ class ArticleFulltext(TimestampMixin, Base):
     status: Mapped[str] = mapped_column(String(32), default="idle", index=True)
     source_url: Mapped[str | None] = mapped_column(String(2000))
     final_url: Mapped[str | None] = mapped_column(String(2000))
-    content_text: Mapped[str | None] = mapped_column(Text)
-    content_html: Mapped[str | None] = mapped_column(Text)
+    content_text: Mapped[str | None] = mapped_column(CompressedText)
+    content_html: Mapped[str | None] = mapped_column(CompressedText)
     extractor: Mapped[str | None] = mapped_column(String(128))
     error_message: Mapped[str | None] = mapped_column(String(1000))
     fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
@@ -211,10 +265,13 @@ class KeywordStream(TimestampMixin, Base):
 
 class KeywordStreamMatch(Base):
     __tablename__ = "keyword_stream_matches"
-    __table_args__ = (UniqueConstraint("stream_id", "article_id", name="uq_keyword_stream_matches_stream_article"),)
+    __table_args__ = (
+        UniqueConstraint("stream_id", "article_id", name="uq_keyword_stream_matches_stream_article"),
+        Index("ix_keyword_stream_matches_stream_id_matched_at", "stream_id", "matched_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    stream_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("keyword_streams.id", ondelete="CASCADE"), index=True)
+    stream_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("keyword_streams.id", ondelete="CASCADE"))
     article_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("articles.id", ondelete="CASCADE"), index=True)
     matched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, index=True)
     match_reason: Mapped[str | None] = mapped_column(String(500))
@@ -242,3 +299,24 @@ class StreamClassifierRun(Base):
     error_message: Mapped[str | None] = mapped_column(String(1000))
     duration_ms: Mapped[int | None] = mapped_column(Integer)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, index=True)
+
+
+class StreamClassifierRunSummary(TimestampMixin, Base):
+    __tablename__ = "stream_classifier_run_summaries"
+    __table_args__ = (Index("ix_stream_classifier_run_summaries_stream_day", "stream_id", "day"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    stream_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("keyword_streams.id", ondelete="CASCADE"))
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    classifier_mode: Mapped[str] = mapped_column(String(32), nullable=False)
+    plugin_name: Mapped[str] = mapped_column(String(128), nullable=False)
+    provider: Mapped[str | None] = mapped_column(String(128))
+    model_name: Mapped[str | None] = mapped_column(String(255))
+    model_version: Mapped[str | None] = mapped_column(String(128))
+    run_status: Mapped[str] = mapped_column(String(32), nullable=False)
+    run_count: Mapped[int] = mapped_column(Integer, default=0)
+    matched_count: Mapped[int] = mapped_column(Integer, default=0)
+    confidence_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    confidence_count: Mapped[int] = mapped_column(Integer, default=0)
+    duration_ms_total: Mapped[int] = mapped_column(Integer, default=0)
@@ -0,0 +1,89 @@
+import re
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, Final
+
+from sqlalchemy import ColumnElement, and_, func
+
+from sift.db.models import Article
+
+# Tables range-partitioned by month on Postgres when SIFT_DATABASE_PARTITIONING_ENABLED is set, with their keys.
+PARTITIONED_TABLES: Final[dict[str, str]] = {
+    "articles": "created_at",
+    "article_states": "created_at",
+    "keyword_stream_matches": "matched_at",
+}
+
+# Key tables created by migration 20261019_0025 with the row id column they hold. They enforce the uniqueness the
+# partitioned tables cannot, and the former foreign keys into articles point at article_keys instead.
+PARTITION_KEY_TABLES: Final[dict[str, tuple[str, str]]] = {
+    "articles": ("article_keys", "article_id"),
+    "article_states": ("article_state_keys", "state_id"),
+    "keyword_stream_matches": ("keyword_stream_match_keys", "match_id"),
+}
+
+# Entries dated further ahead of their ingestion than this are not treated as inside a recent window. The bound
+# on created_at is what lets Postgres prune article partitions for "fresh" and "last 7 days" queries.
+FUTURE_DATED_SLACK: Final[timedelta] = timedelta(days=30)
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def month_start(value: datetime | date) -> date:
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month.year:04d}{month.month:02d}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def partition_month(table: str, name: str) -> date | None:
+    if not name.startswith(f"{table}_p"):
+        return None
+    match = _PARTITION_SUFFIX.search(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def _bound_literal(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def create_partition_statements(table: str, key: str, month: date) -> list[str]:
+    # Built detached and then attached so rows that already landed in the default partition move across. The key
+    # triggers sit on the partitioned parent only, so moving rows between partitions leaves their keys alone.
+    name = partition_name(table, month)
+    lower = _bound_literal(month)
+    upper = _bound_literal(add_months(month, 1))
+    default = default_partition_name(table)
+    return [
+        f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS)',
+        f'INSERT INTO "{name}" SELECT * FROM "{default}" WHERE "{key}" >= {lower} AND "{key}" < {upper}',
+        f'DELETE FROM "{default}" WHERE "{key}" >= {lower} AND "{key}" < {upper}',
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" FOR VALUES FROM ({lower}) TO ({upper})',
+    ]
+
+
+def release_partition_keys_statements(table: str, partition: str) -> list[str]:
+    # Detaching fires no triggers, so the rows' keys are removed explicitly. For articles this also runs the
+    # ON DELETE actions of the foreign keys into article_keys.
+    key_table, row_column = PARTITION_KEY_TABLES[table]
+    return [f'DELETE FROM "{key_table}" WHERE "{row_column}" IN (SELECT id FROM "{partition}")']
+
+
+def article_published_since(threshold: datetime) -> ColumnElement[Any]:
+    return and_(
+        func.coalesce(Article.published_at, Article.created_at) >= threshold,
+        Article.created_at >= threshold - FUTURE_DATED_SLACK,
+    )
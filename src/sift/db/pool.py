@@ -0,0 +1,134 @@
+from time import monotonic, perf_counter
+from typing import Any, Final
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection
+
+from sift.config import Settings
+from sift.observability.metrics import get_observability_metrics
+
+PRE_PING_STRATEGIES: Final[frozenset[str]] = frozenset({"always", "idle", "never"})
+
+_CHECKED_IN_AT_KEY: Final[str] = "sift_checked_in_at"
+
+_process_type = "api"
+
+
+class PoolConfigError(Exception):
+    pass
+
+
+def set_pool_process_type(process_type: str) -> None:
+    # Pool metrics carry the process type so API, worker and scheduler pools can be sized independently.
+    global _process_type
+    _process_type = process_type.strip().lower() or "unknown"
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    role = "primary"
+
+    def recreate(self) -> "MeteredQueuePool":
+        pool = super().recreate()
+        assert isinstance(pool, MeteredQueuePool)
+        pool.role = self.role
+        return pool
+
+    def connect(self) -> PoolProxiedConnection:
+        # Checkout covers the wait for a connection plus pre-ping and checkout listeners.
+        started = perf_counter()
+        try:
+            return super().connect()
+        finally:
+            get_observability_metrics().record_db_pool_checkout(
+                role=self.role,
+                process=_process_type,
+                seconds=perf_counter() - started,
+            )
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        # The wait includes opening a new connection when the pool still has room to grow.
+        started = perf_counter()
+        metrics = get_observability_metrics()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            metrics.record_db_pool_timeout(role=self.role, process=_process_type)
+            raise
+        finally:
+            metrics.record_db_pool_wait(role=self.role, process=_process_type, seconds=perf_counter() - started)
+
+
+def pre_ping_strategy(settings: Settings) -> str:
+    strategy = settings.database_pool_pre_ping.strip().lower()
+    if strategy not in PRE_PING_STRATEGIES:
+        raise PoolConfigError(f"Unknown pool pre-ping strategy: {settings.database_pool_pre_ping}")
+    return strategy
+
+
+def asyncpg_connect_args(settings: Settings) -> dict[str, Any]:
+    if settings.database_pgbouncer:
+        # Transaction pooling hands each transaction to any server connection, so cached statements
+        # may not exist there and reused names may collide with another client's.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    cache_size = max(0, settings.database_statement_cache_size)
+    return {"statement_cache_size": cache_size, "prepared_statement_cache_size": cache_size}
+
+
+def install_idle_pre_ping(engine: AsyncEngine, *, idle_seconds: float) -> None:
+    sync_engine = engine.sync_engine
+
+    def _on_checkin(_dbapi_connection: Any, connection_record: Any) -> None:
+        connection_record.info[_CHECKED_IN_AT_KEY] = monotonic()
+
+    def _on_checkout(dbapi_connection: Any, connection_record: Any, _connection_proxy: Any) -> None:
+        # Only connections that sat idle long enough to be dropped by a proxy or firewall pay for a ping.
+        checked_in_at = connection_record.info.get(_CHECKED_IN_AT_KEY)
+        if checked_in_at is None or monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as exc:
+            # The pool discards the connection and retries the checkout with a fresh one.
+            raise DisconnectionError("Idle connection failed its pre-ping") from exc
+
+    event.listen(sync_engine, "checkin", _on_checkin)
+    event.listen(sync_engine, "checkout", _on_checkout)
+
+
+def create_database_engine(
+    database_url: str,
+    settings: Settings,
+    *,
+    role: str,
+    pool_size: int,
+    max_overflow: int,
+    **engine_options: Any,
+) -> AsyncEngine:
+    strategy = pre_ping_strategy(settings)
+    options: dict[str, Any] = {
+        "pool_pre_ping": strategy == "always",
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.database_pool_timeout_seconds,
+        "pool_recycle": settings.database_pool_recycle_seconds,
+        **engine_options,
+    }
+    if settings.observability_enabled:
+        options["poolclass"] = MeteredQueuePool
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        options["connect_args"] = {**asyncpg_connect_args(settings), **options.get("connect_args", {})}
+    engine = create_async_engine(database_url, **options)
+    if isinstance(engine.sync_engine.pool, MeteredQueuePool):
+        engine.sync_engine.pool.role = role
+    if strategy == "idle":
+        install_idle_pre_ping(engine, idle_seconds=settings.database_pool_pre_ping_idle_seconds)
+    return engine
@@ -0,0 +1,36 @@
+from typing import Any
+
+from sqlalchemy import TextClause, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.sql import ClauseElement
+
+
+def is_write_clause(clause: ClauseElement | None) -> bool:
+    if clause is None:
+        return False
+    if getattr(clause, "is_dml", False) or isinstance(clause, TextClause):
+        # Raw SQL is not parsed, so it is sent to the writer in case it modifies data.
+        return True
+    return getattr(clause, "_for_update_arg", None) is not None
+
+
+# Sends reads to the reader engine until the transaction writes, then keeps the rest of it on the writer.
+class RoutingSession(Session):
+    def __init__(self, *args: Any, reader: Engine | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.reader = reader
+        self.wrote = False
+
+    def get_bind(self, mapper: Any = None, *, clause: ClauseElement | None = None, **kw: Any) -> Engine | Connection:
+        if self.reader is None or self.wrote or self._flushing or is_write_clause(clause):
+            # Once the transaction has written, later reads must see its uncommitted rows on the same connection.
+            self.wrote = self.reader is not None
+            return super().get_bind(mapper, clause=clause, **kw)
+        return self.reader
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_write_routing(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None and isinstance(session, RoutingSession):
+        session.wrote = False
@@ -1,14 +1,63 @@
 from collections.abc import AsyncGenerator
+from itertools import cycle
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from sift.config import get_settings
 from sift.db.base import Base
+from sift.db.pool import create_database_engine
+from sift.db.routing import RoutingSession
+from sift.db.sqlite import create_sqlite_engines, is_sqlite_url
+from sift.observability.sql import SqlQueryInstrumentation, install_pool_metrics
 
 settings = get_settings()
 
-engine: AsyncEngine = create_async_engine(settings.database_url, echo=False, pool_pre_ping=True)
-SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+read_engine: AsyncEngine | None = None
+if settings.sqlite_profile_enabled and is_sqlite_url(settings.database_url):
+    engine, read_engine = create_sqlite_engines(settings, echo=False)
+elif is_sqlite_url(settings.database_url):
+    engine = create_async_engine(settings.database_url, echo=False, pool_pre_ping=True)
+else:
+    engine = create_database_engine(
+        settings.database_url,
+        settings,
+        role="primary",
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        echo=False,
+    )
+replica_engines: list[AsyncEngine] = [
+    create_database_engine(
+        replica_url,
+        settings,
+        role="replica",
+        pool_size=settings.database_replica_pool_size,
+        max_overflow=settings.database_replica_max_overflow,
+        echo=False,
+    )
+    for replica_url in settings.database_replica_urls
+]
+_replica_rotation = cycle(replica_engines)
+
+_engine_roles: list[tuple[AsyncEngine, str]] = [(engine, "primary")]
+if read_engine is not None:
+    _engine_roles.append((read_engine, "reader"))
+_engine_roles.extend((replica_engine, "replica") for replica_engine in replica_engines)
+if settings.observability_enabled:
+    instrumentation = SqlQueryInstrumentation(
+        slow_query_threshold_ms=settings.db_slow_query_threshold_ms,
+        redact_fields=settings.log_redact_fields,
+    )
+    for instrumented_engine, role in _engine_roles:
+        instrumentation.install(instrumented_engine)
+        install_pool_metrics(instrumented_engine, role=role)
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    sync_session_class=RoutingSession,
+    reader=read_engine.sync_engine if read_engine is not None else None,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession]:
@@ -16,6 +65,18 @@ async def get_db_session() -> AsyncGenerator[AsyncSession]:
         yield session
 
 
+def open_replica_session() -> AsyncSession | None:
+    # Reads go to the next replica in turn; anything the session writes still goes to the primary.
+    if not replica_engines:
+        return None
+    return SessionLocal(reader=next(_replica_rotation).sync_engine)
+
+
 async def init_models() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def dispose_engines() -> None:
+    for disposable_engine, _ in _engine_roles:
+        await disposable_engine.dispose()
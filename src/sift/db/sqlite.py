@@ -0,0 +1,91 @@
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from sift.config import Settings
+
+SQLITE_JOURNAL_MODES: Final[frozenset[str]] = frozenset({"wal", "delete", "truncate", "persist", "memory", "off"})
+SQLITE_SYNCHRONOUS_MODES: Final[frozenset[str]] = frozenset({"off", "normal", "full", "extra"})
+
+
+class SqliteProfileError(Exception):
+    pass
+
+
+def is_sqlite_url(database_url: str) -> bool:
+    return make_url(database_url).get_backend_name() == "sqlite"
+
+
+def is_memory_url(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def sqlite_pragmas(settings: Settings) -> list[str]:
+    journal_mode = settings.sqlite_journal_mode.strip().lower()
+    if journal_mode not in SQLITE_JOURNAL_MODES:
+        raise SqliteProfileError(f"Unknown SQLite journal mode: {settings.sqlite_journal_mode}")
+    synchronous = settings.sqlite_synchronous.strip().lower()
+    if synchronous not in SQLITE_SYNCHRONOUS_MODES:
+        raise SqliteProfileError(f"Unknown SQLite synchronous mode: {settings.sqlite_synchronous}")
+    return [
+        f"PRAGMA journal_mode = {journal_mode}",
+        f"PRAGMA synchronous = {synchronous}",
+        f"PRAGMA busy_timeout = {max(0, settings.sqlite_busy_timeout_ms)}",
+        # A negative cache_size is a budget in KiB rather than a page count.
+        f"PRAGMA cache_size = -{max(0, settings.sqlite_cache_size_kib)}",
+        f"PRAGMA mmap_size = {max(0, settings.sqlite_mmap_size_bytes)}",
+    ]
+
+
+def install_sqlite_profile(engine: AsyncEngine, *, pragmas: list[str], role: str) -> None:
+    read_only = role == "reader"
+
+    def _on_connect(dbapi_connection: Any, _connection_record: Any) -> None:
+        # Take over transaction control from the driver so the writer can open transactions with BEGIN IMMEDIATE.
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            if read_only:
+                cursor.execute("PRAGMA query_only = ON")
+        finally:
+            cursor.close()
+
+    def _on_begin(connection: Connection) -> None:
+        # Taking the write lock up front makes a busy writer wait on busy_timeout instead of failing on upgrade.
+        connection.exec_driver_sql("BEGIN" if read_only else "BEGIN IMMEDIATE")
+
+    event.listen(engine.sync_engine, "connect", _on_connect)
+    event.listen(engine.sync_engine, "begin", _on_begin)
+
+
+def create_sqlite_engines(settings: Settings, **engine_options: Any) -> tuple[AsyncEngine, AsyncEngine | None]:
+    pragmas = sqlite_pragmas(settings)
+    if is_memory_url(settings.database_url):
+        # Every connection to an in-memory database is a separate database, so there is nothing to split.
+        engine = create_async_engine(settings.database_url, **engine_options)
+        install_sqlite_profile(engine, pragmas=pragmas, role="writer")
+        return engine, None
+
+    # SQLite allows one writer at a time, so writes queue on a single pooled connection instead of
+    # contending for the file lock, while readers keep their own pool and read the last committed WAL snapshot.
+    writer = create_async_engine(
+        settings.database_url,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=settings.sqlite_writer_timeout_seconds,
+        **engine_options,
+    )
+    install_sqlite_profile(writer, pragmas=pragmas, role="writer")
+    reader = create_async_engine(
+        settings.database_url,
+        pool_size=max(1, settings.sqlite_reader_pool_size),
+        max_overflow=0,
+        **engine_options,
+    )
+    install_sqlite_profile(reader, pragmas=pragmas, role="reader")
+    return writer, reader
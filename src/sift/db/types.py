@@ -0,0 +1,122 @@
+import uuid
+import zlib
+from functools import lru_cache
+from typing import Any, Final
+
+from sqlalchemy import LargeBinary, Uuid
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+from sift.config import get_settings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the optional "compression" extra
+    zstandard = None
+
+# Stored values start with a NUL-prefixed codec tag; untagged values are plain UTF-8 written before compression.
+_ZSTD_TAG: Final[bytes] = b"\x00zs"
+_ZLIB_TAG: Final[bytes] = b"\x00zl"
+_PLAIN_TAG: Final[bytes] = b"\x00pl"
+_TAG_LENGTH: Final[int] = 3
+
+COMPRESSION_CODECS: Final[frozenset[str]] = frozenset({"auto", "zstd", "zlib", "none"})
+
+
+class CompressionError(Exception):
+    pass
+
+
+def resolve_codec(codec: str) -> str:
+    normalized = codec.strip().lower() or "auto"
+    if normalized not in COMPRESSION_CODECS:
+        raise CompressionError(f"Unknown storage compression codec: {codec}")
+    if normalized == "auto":
+        return "zstd" if zstandard is not None else "zlib"
+    if normalized == "zstd" and zstandard is None:
+        raise CompressionError("zstd storage compression requires the 'zstandard' package")
+    return normalized
+
+
+@lru_cache(maxsize=8)
+def _zstd_compressor(level: int) -> Any:
+    return zstandard.ZstdCompressor(level=level)
+
+
+@lru_cache(maxsize=1)
+def _zstd_decompressor() -> Any:
+    return zstandard.ZstdDecompressor()
+
+
+def compress_text(value: str, *, codec: str, level: int, min_bytes: int) -> bytes:
+    data = value.encode("utf-8")
+    resolved = resolve_codec(codec)
+    if resolved != "none" and len(data) >= min_bytes:
+        if resolved == "zstd":
+            compressed = _ZSTD_TAG + _zstd_compressor(level).compress(data)
+        else:
+            compressed = _ZLIB_TAG + zlib.compress(data, level)
+        # Short or already dense values can grow; keep whichever form is smaller.
+        if len(compressed) < len(data):
+            return compressed
+    if data.startswith(b"\x00"):
+        return _PLAIN_TAG + data
+    return data
+
+
+def decompress_text(value: bytes | memoryview | str) -> str:
+    if isinstance(value, str):
+        # SQLite keeps rows written before the column became binary as TEXT.
+        return value
+    data = bytes(value)
+    tag = data[:_TAG_LENGTH]
+    if tag == _ZSTD_TAG:
+        if zstandard is None:
+            raise CompressionError("Stored value is zstd-compressed but the 'zstandard' package is not installed")
+        return _zstd_decompressor().decompress(data[_TAG_LENGTH:]).decode("utf-8")
+    if tag == _ZLIB_TAG:
+        return zlib.decompress(data[_TAG_LENGTH:]).decode("utf-8")
+    if tag == _PLAIN_TAG:
+        return data[_TAG_LENGTH:].decode("utf-8")
+    return data.decode("utf-8")
+
+
+def is_compressed(value: bytes | memoryview | str | None) -> bool:
+    if value is None or isinstance(value, str):
+        return False
+    return bytes(value[:_TAG_LENGTH]) in {_ZSTD_TAG, _ZLIB_TAG}
+
+
+class CompressedText(TypeDecorator[str]):
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        if value is None:
+            return None
+        settings = get_settings()
+        return compress_text(
+            value,
+            codec=settings.storage_compression,
+            level=settings.storage_compression_level,
+            min_bytes=settings.storage_compression_min_bytes,
+        )
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        return decompress_text(value)
+
+
+class UserUUID(TypeDecorator[uuid.UUID]):
+    # Native UUID column that still accepts the string user ids older call sites pass for article states.
+    impl = Uuid
+    cache_ok = True
+
+    def __init__(self) -> None:
+        super().__init__(as_uuid=True)
+
+    def process_bind_param(self, value: uuid.UUID | str | None, dialect: Dialect) -> uuid.UUID | None:
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(str(value))
@@ -291,6 +291,7 @@ class OpmlImportEntryResult(BaseModel):
     title: str
     status: Literal["created", "skipped_existing", "skipped_conflict", "invalid", "duplicate_in_file"]
     reason: str | None = None
+    feed_id: UUID | None = None
 
 
 class OpmlImportResult(BaseModel):
@@ -301,6 +302,7 @@ class OpmlImportResult(BaseModel):
     skipped_conflict_count: int = 0
     invalid_count: int = 0
     duplicate_in_file_count: int = 0
+    probe_enqueued_count: int = 0
     results: list[OpmlImportEntryResult] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
 
@@ -443,6 +445,13 @@ class PluginCapabilityRuntimeCountersOut(BaseModel):
     timeout_count: int
 
 
+class PluginCircuitBreakerOut(BaseModel):
+    state: str
+    consecutive_failures: int
+    short_circuit_count: int
+    opened_at: datetime | None
+
+
 class PluginStatusOut(BaseModel):
     plugin_id: str
     enabled: bool
@@ -452,6 +461,7 @@ class PluginStatusOut(BaseModel):
     last_error: str | None
     unavailable_reason: str | None
     runtime_counters: dict[str, PluginCapabilityRuntimeCountersOut]
+    circuit_breakers: dict[str, PluginCircuitBreakerOut] = Field(default_factory=dict)
     last_updated_at: datetime
 
 
@@ -9,13 +9,18 @@ from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import PlainTextResponse
 
+from sift.api.deps.db import SAFE_METHODS, mark_read_your_writes
 from sift.api.router import api_router
 from sift.config import get_settings
 from sift.core.runtime import get_plugin_manager
-from sift.db.session import SessionLocal, init_models
+from sift.db.session import SessionLocal, dispose_engines, init_models
 from sift.observability.logging import bind_request_id, configure_logging, reset_request_id
+from sift.observability.loop_monitor import monitor_event_loop
 from sift.observability.metrics import get_observability_metrics
+from sift.observability.sql import QueryStats, bind_query_stats, record_query_stats, reset_query_stats
+from sift.services.auth_service import password_hash_executor
 from sift.services.dev_seed_service import dev_seed_service
+from sift.services.feed_parse_service import feed_parse_service
 
 settings = get_settings()
 configure_logging(
@@ -24,6 +29,8 @@ configure_logging(
     level=settings.log_level,
     log_format=settings.log_format,
     redact_fields=settings.log_redact_fields,
+    queue_size=settings.log_queue_size,
+    sample_rates=settings.log_sample_rates,
 )
 plugin_manager = get_plugin_manager()
 logger = logging.getLogger(__name__)
@@ -36,7 +43,12 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     if settings.env.lower() == "development" and settings.dev_seed_enabled:
         async with SessionLocal() as session:
             await dev_seed_service.run(session=session, settings=settings)
-    yield
+    async with monitor_event_loop(service="sift-api"):
+        yield
+    feed_parse_service.shutdown()
+    password_hash_executor.shutdown()
+    plugin_manager.shutdown()
+    await dispose_engines()
 
 
 app = FastAPI(title=settings.app_name, lifespan=lifespan)
@@ -78,6 +90,8 @@ async def observability_middleware(
     request_id_header = settings.request_id_header
     request_id = request.headers.get(request_id_header) or uuid4().hex
     token = bind_request_id(request_id)
+    query_stats = QueryStats(source="api")
+    query_token = bind_query_stats(query_stats)
     start_time = perf_counter()
     logger.info(
         "api.request.start",
@@ -95,6 +109,8 @@ async def observability_middleware(
         duration_seconds = perf_counter() - start_time
         duration_ms = int(duration_seconds * 1000)
         route = _route_label(request)
+        query_stats.route = route
+        record_query_stats(query_stats)
         get_observability_metrics().record_http_request(
             method=request.method,
             route=route,
@@ -110,6 +126,8 @@ async def observability_middleware(
                 "route": route,
                 "status_code": 500,
                 "duration_ms": duration_ms,
+                "db_query_count": query_stats.query_count,
+                "db_time_ms": int(query_stats.db_seconds * 1000),
                 "error_type": type(exc).__name__,
                 "error_message": str(exc),
             },
@@ -119,6 +137,8 @@ async def observability_middleware(
         duration_seconds = perf_counter() - start_time
         duration_ms = int(duration_seconds * 1000)
         route = _route_label(request)
+        query_stats.route = route
+        record_query_stats(query_stats)
         get_observability_metrics().record_http_request(
             method=request.method,
             route=route,
@@ -135,13 +155,29 @@ async def observability_middleware(
                 "route": route,
                 "status_code": response.status_code,
                 "duration_ms": duration_ms,
+                "db_query_count": query_stats.query_count,
+                "db_time_ms": int(query_stats.db_seconds * 1000),
             },
         )
         return response
     finally:
+        reset_query_stats(query_token)
         reset_request_id(token)
 
 
+if settings.database_replica_urls:
+
+    @app.middleware("http")
+    async def read_your_writes_middleware(
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        response = await call_next(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            mark_read_your_writes(response)
+        return response
+
+
 if settings.observability_enabled and settings.metrics_enabled:
     metrics_path = _metrics_path(settings.metrics_path)
 
@@ -0,0 +1,90 @@
+import math
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Final
+
+DEFAULT_DURATION_BUCKETS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSample:
+    labels: dict[str, str]
+    buckets: tuple[tuple[float, int], ...]
+    sum: float
+    count: int
+
+
+def parse_buckets(raw: str | Sequence[float] | None) -> tuple[float, ...]:
+    if raw is None:
+        return DEFAULT_DURATION_BUCKETS
+    if isinstance(raw, str):
+        items: Iterable[float] = (float(part) for part in raw.split(",") if part.strip())
+    else:
+        items = raw
+    bounds = sorted({float(item) for item in items if math.isfinite(float(item)) and float(item) > 0})
+    return tuple(bounds) or DEFAULT_DURATION_BUCKETS
+
+
+class HistogramSeries:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, bucket_count: int) -> None:
+        # One slot per finite bound plus the implicit +Inf bucket; counts are non-cumulative until rendered.
+        self.counts = [0] * (bucket_count + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+def bucket_index(bounds: tuple[float, ...], value: float) -> int:
+    return bisect_left(bounds, value)
+
+
+def to_sample(labels: dict[str, str], bounds: tuple[float, ...], series: HistogramSeries) -> HistogramSample:
+    cumulative = 0
+    buckets: list[tuple[float, int]] = []
+    for bound, count in zip((*bounds, math.inf), series.counts, strict=True):
+        cumulative += count
+        buckets.append((bound, cumulative))
+    return HistogramSample(labels=labels, buckets=tuple(buckets), sum=series.sum, count=series.count)
+
+
+def _format_bound(bound: float) -> str:
+    if math.isinf(bound):
+        return "+Inf"
+    return repr(float(bound))
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    return ",".join(f'{key}="{escape_label_value(value)}"' for key, value in sorted(labels.items()))
+
+
+def render_histogram_lines(metric_name: str, samples: Sequence[HistogramSample]) -> list[str]:
+    lines: list[str] = []
+    for sample in samples:
+        for bound, cumulative in sample.buckets:
+            bucket_labels = _format_labels({**sample.labels, "le": _format_bound(bound)})
+            lines.append(f"{metric_name}_bucket{{{bucket_labels}}} {cumulative}")
+        labels = _format_labels(sample.labels)
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{metric_name}_sum{suffix} {sample.sum}")
+        lines.append(f"{metric_name}_count{suffix} {sample.count}")
+    return lines
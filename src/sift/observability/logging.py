@@ -1,9 +1,18 @@
+import atexit
+import copy
 import json
 import logging
+import os
+import queue
+import random
+from collections.abc import Iterable, Mapping
 from contextvars import ContextVar, Token
 from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Final
 
+from sift.observability.metrics import get_observability_metrics
+
 _REQUEST_ID_CONTEXT: ContextVar[str | None] = ContextVar("sift_request_id", default=None)
 
 _DEFAULT_REDACT_FIELDS: Final[frozenset[str]] = frozenset(
@@ -61,7 +70,9 @@ _LOG_LEVEL_BY_NAME: Final[dict[str, int]] = {
     "DEBUG": logging.DEBUG,
 }
 
-_APPLIED_LOG_CONFIG: tuple[str, str, str, str, tuple[str, ...]] | None = None
+_APPLIED_LOG_CONFIG: tuple[str, str, str, str, tuple[str, ...], int, tuple[tuple[str, float], ...]] | None = None
+_QUEUE_HANDLER: "BoundedQueueHandler | None" = None
+_QUEUE_LISTENER: "_DrainingQueueListener | None" = None
 
 
 def bind_request_id(request_id: str) -> Token[str | None]:
@@ -76,6 +87,10 @@ def get_request_id() -> str | None:
     return _REQUEST_ID_CONTEXT.get()
 
 
+def resolve_redact_fields(extra_fields: Iterable[str]) -> frozenset[str]:
+    return _DEFAULT_REDACT_FIELDS | {item.strip().lower() for item in extra_fields if item.strip()}
+
+
 def configure_logging(
     *,
     service: str,
@@ -83,34 +98,142 @@ def configure_logging(
     level: str,
     log_format: str,
     redact_fields: list[str],
+    queue_size: int = 0,
+    sample_rates: Mapping[str, float] | None = None,
 ) -> None:
-    global _APPLIED_LOG_CONFIG
+    global _APPLIED_LOG_CONFIG, _QUEUE_HANDLER, _QUEUE_LISTENER
 
     normalized_level = level.strip().upper() if level.strip() else "INFO"
     normalized_format = log_format.strip().lower() if log_format.strip() else "json"
     normalized_redact_fields = tuple(sorted({item.strip().lower() for item in redact_fields if item.strip()}))
-    signature = (service, env, normalized_level, normalized_format, normalized_redact_fields)
+    normalized_queue_size = max(0, queue_size)
+    normalized_sample_rates = tuple(sorted((sample_rates or {}).items()))
+    signature = (
+        service,
+        env,
+        normalized_level,
+        normalized_format,
+        normalized_redact_fields,
+        normalized_queue_size,
+        normalized_sample_rates,
+    )
     if _APPLIED_LOG_CONFIG == signature:
         return
 
+    shutdown_logging()
+    _QUEUE_HANDLER = None
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     root_logger.setLevel(_LOG_LEVEL_BY_NAME.get(normalized_level, logging.INFO))
 
     handler = logging.StreamHandler()
     if normalized_format == "json":
-        redact_set = set(_DEFAULT_REDACT_FIELDS)
-        redact_set.update(normalized_redact_fields)
+        redact_set = set(resolve_redact_fields(normalized_redact_fields))
         handler.setFormatter(JsonLogFormatter(service=service, env=env, redact_fields=redact_set))
     else:
         handler.setFormatter(
             logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s", datefmt="%Y-%m-%dT%H:%M:%SZ")
         )
-    root_logger.addHandler(handler)
+
+    output_handler: logging.Handler = handler
+    if normalized_queue_size > 0:
+        log_queue: queue.Queue[Any] = queue.Queue(maxsize=normalized_queue_size)
+        _QUEUE_HANDLER = BoundedQueueHandler(log_queue, target=handler)
+        _QUEUE_LISTENER = _DrainingQueueListener(log_queue, handler)
+        _QUEUE_LISTENER.start()
+        output_handler = _QUEUE_HANDLER
+    if normalized_sample_rates:
+        output_handler.addFilter(EventSamplingFilter(dict(normalized_sample_rates)))
+    root_logger.addHandler(output_handler)
 
     _APPLIED_LOG_CONFIG = signature
 
 
+def shutdown_logging() -> None:
+    global _QUEUE_LISTENER
+
+    listener, _QUEUE_LISTENER = _QUEUE_LISTENER, None
+    if _QUEUE_HANDLER is not None:
+        _QUEUE_HANDLER.write_directly()
+    if listener is not None:
+        listener.stop()
+
+
+def _write_logs_directly_after_fork() -> None:
+    global _QUEUE_LISTENER
+
+    # The listener thread does not survive fork, and RQ job processes exit via os._exit without running atexit
+    # hooks, so forked children write on the emitting thread instead of buffering records nobody will drain.
+    _QUEUE_LISTENER = None
+    if _QUEUE_HANDLER is not None:
+        _QUEUE_HANDLER.write_directly()
+
+
+atexit.register(shutdown_logging)
+os.register_at_fork(after_in_child=_write_logs_directly_after_fork)
+
+
+class BoundedQueueHandler(QueueHandler):
+    def __init__(self, log_queue: queue.Queue[Any], *, target: logging.Handler) -> None:
+        super().__init__(log_queue)
+        self._target = target
+        self._direct = False
+
+    def write_directly(self) -> None:
+        self._direct = True
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records are formatted on the listener thread, so resolve the message and the context-bound request id
+        # while still on the emitting thread.
+        prepared = copy.copy(record)
+        prepared.msg = prepared.getMessage()
+        prepared.args = None
+        if getattr(prepared, "request_id", None) is None:
+            request_id = get_request_id()
+            if request_id is not None:
+                prepared.request_id = request_id
+        return prepared
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._direct:
+            self._target.handle(record)
+            return
+        try:
+            self.enqueue(self.prepare(record))
+        except queue.Full:
+            if record.levelno >= logging.ERROR:
+                self._target.handle(record)
+                return
+            get_observability_metrics().record_log_dropped(reason="queue_full")
+        except Exception:
+            self.handleError(record)
+
+
+class _DrainingQueueListener(QueueListener):
+    def __init__(self, log_queue: queue.Queue[Any], *handlers: logging.Handler) -> None:
+        super().__init__(log_queue, *handlers)
+        self._log_queue = log_queue
+
+    def enqueue_sentinel(self) -> None:
+        # Block rather than fail when the buffer is full so stop() still drains everything already queued.
+        self._log_queue.put(None)
+
+
+class EventSamplingFilter(logging.Filter):
+    def __init__(self, sample_rates: Mapping[str, float]) -> None:
+        super().__init__()
+        self._sample_rates = {event: min(1.0, max(0.0, rate)) for event, rate in sample_rates.items()}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+        rate = self._sample_rates.get(str(getattr(record, "event", record.msg)))
+        if rate is None or rate >= 1.0 or random.random() < rate:
+            return True
+        get_observability_metrics().record_log_dropped(reason="sampled")
+        return False
+
+
 class JsonLogFormatter(logging.Formatter):
     def __init__(self, *, service: str, env: str, redact_fields: set[str]) -> None:
         super().__init__()
@@ -121,7 +244,7 @@ class JsonLogFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         event = getattr(record, "event", record.getMessage())
         payload: dict[str, Any] = {
-            "ts": datetime.now(UTC).isoformat(),
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(),
             "level": record.levelname.lower(),
             "service": self._service,
             "env": self._env,
@@ -160,4 +283,3 @@ def _extract_record_extras(record: logging.LogRecord) -> dict[str, Any]:
             continue
         extras[key] = value
     return extras
-
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from time import perf_counter
+from typing import Final
+
+from sift.config import get_settings
+from sift.observability.metrics import get_observability_metrics
+
+logger = logging.getLogger(__name__)
+
+_MAX_STACK_FRAMES: Final[int] = 50
+_MIN_WATCHDOG_POLL_SECONDS: Final[float] = 0.005
+_WATCHDOG_JOIN_SECONDS: Final[float] = 1.0
+
+
+class EventLoopLagMonitor:
+    def __init__(
+        self,
+        *,
+        service: str,
+        interval_seconds: float,
+        block_threshold_seconds: float,
+        capture_stacks: bool,
+    ) -> None:
+        self.service = service
+        self.interval_seconds = max(0.001, interval_seconds)
+        self.block_threshold_seconds = max(0.0, block_threshold_seconds)
+        self.capture_stacks = capture_stacks
+        self._last_tick = perf_counter()
+        self._reported_tick: float | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = perf_counter()
+        self._task = asyncio.get_running_loop().create_task(self._run(), name=f"{self.service}-loop-lag")
+        if self.capture_stacks:
+            self._watchdog = threading.Thread(target=self._watch, name=f"{self.service}-loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=_WATCHDOG_JOIN_SECONDS)
+            self._watchdog = None
+
+    async def _run(self) -> None:
+        metrics = get_observability_metrics()
+        while True:
+            scheduled_at = perf_counter()
+            await asyncio.sleep(self.interval_seconds)
+            now = perf_counter()
+            self._last_tick = now
+            # Anything beyond the requested sleep is time the loop spent unable to run ready callbacks.
+            lag = max(0.0, now - scheduled_at - self.interval_seconds)
+            metrics.record_event_loop_lag(lag_seconds=lag, blocked=lag >= self.block_threshold_seconds)
+
+    def _watch(self) -> None:
+        poll_seconds = max(_MIN_WATCHDOG_POLL_SECONDS, self.block_threshold_seconds / 2)
+        while not self._stopped.wait(poll_seconds):
+            last_tick = self._last_tick
+            stalled = perf_counter() - last_tick - self.interval_seconds
+            if stalled < self.block_threshold_seconds or self._reported_tick == last_tick:
+                continue
+            if self._loop_thread_id is None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            # Captured while the stall is still in progress, so the stack shows the blocking callback itself.
+            self._reported_tick = last_tick
+            logger.warning(
+                "event_loop.blocked",
+                extra={
+                    "event": "event_loop.blocked",
+                    "service": self.service,
+                    "blocked_ms": int(stalled * 1000),
+                    "threshold_ms": int(self.block_threshold_seconds * 1000),
+                    "stack": "".join(traceback.format_stack(frame, limit=_MAX_STACK_FRAMES)),
+                },
+            )
+
+
+@asynccontextmanager
+async def monitor_event_loop(*, service: str) -> AsyncIterator[EventLoopLagMonitor | None]:
+    settings = get_settings()
+    if not (settings.observability_enabled and settings.event_loop_monitor_enabled):
+        yield None
+        return
+
+    monitor = EventLoopLagMonitor(
+        service=service,
+        interval_seconds=settings.event_loop_monitor_interval_ms / 1000.0,
+        block_threshold_seconds=settings.event_loop_block_threshold_ms / 1000.0,
+        capture_stacks=settings.event_loop_debug,
+    )
+    monitor.start()
+    try:
+        yield monitor
+    finally:
+        await monitor.stop()
@@ -1,49 +1,105 @@
 from collections import defaultdict
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 from threading import Lock
-from typing import Final
+from typing import Any, Final
+
+from sift.config import get_settings
+from sift.observability.histogram import (
+    HistogramSample,
+    HistogramSeries,
+    bucket_index,
+    escape_label_value,
+    parse_buckets,
+    render_histogram_lines,
+    to_sample,
+)
 
 _METRIC_HELP: Final[dict[str, str]] = {
     "sift_http_requests_total": "Total HTTP requests by method, route, and status class.",
-    "sift_http_request_duration_seconds": "Total HTTP request duration in seconds by method, route, and status class.",
+    "sift_http_request_duration_seconds": "HTTP request duration in seconds by method, route, and status class.",
     "sift_scheduler_loops_total": "Total scheduler loop executions by result.",
-    "sift_scheduler_loop_duration_seconds": "Total scheduler loop duration in seconds.",
+    "sift_scheduler_loop_duration_seconds": "Scheduler loop duration in seconds.",
     "sift_scheduler_due_feeds_total": "Total due feeds seen by scheduler.",
     "sift_scheduler_enqueues_total": "Total scheduler enqueue attempts by result.",
     "sift_scheduler_enqueued_jobs_total": "Total jobs enqueued by scheduler.",
     "sift_queue_depth": "Current queue depth by queue name.",
     "sift_queue_oldest_job_age_seconds": "Current oldest queued job age in seconds by queue name.",
     "sift_worker_jobs_total": "Total worker jobs processed by result.",
-    "sift_worker_job_duration_seconds": "Total worker job duration in seconds by result.",
+    "sift_worker_job_duration_seconds": "Worker job duration in seconds by result.",
     "sift_ingest_runs_total": "Total ingestion runs by result.",
-    "sift_ingest_run_duration_seconds": "Total ingestion run duration in seconds by result.",
+    "sift_ingest_run_duration_seconds": "Ingestion run duration in seconds by result.",
     "sift_ingest_entries_fetched_total": "Total fetched entries observed during ingestion runs.",
     "sift_ingest_entries_inserted_total": "Total inserted entries observed during ingestion runs.",
     "sift_ingest_entries_duplicate_total": "Total duplicate entries observed during ingestion runs.",
     "sift_ingest_entries_filtered_total": "Total filtered entries observed during ingestion runs.",
     "sift_ingest_plugin_processed_total": "Total plugin-processed entries observed during ingestion runs.",
+    "sift_ingest_parses_total": "Total feed parse attempts by executor and result.",
+    "sift_ingest_parse_duration_seconds": "Successful feed parse duration in seconds by executor.",
+    "sift_ingest_parse_queue_wait_seconds": "Feed parse executor queue wait in seconds by executor.",
+    "sift_ingest_stage_duration_seconds": "Time spent in each ingestion pipeline stage per run, in seconds.",
+    "sift_http_download_aborts_total": "Total outbound response downloads aborted by source and reason.",
+    "sift_db_queries_total": "Total SQL statements executed by source and route or job.",
+    "sift_db_time_seconds": "Database time per API request or worker job in seconds by source and route or job.",
+    "sift_db_slow_queries_total": "Total SQL statements slower than the slow-query threshold by source.",
+    "sift_event_loop_lag_seconds": "Event loop scheduling delay in seconds measured by the lag monitor.",
+    "sift_event_loop_blocked_total": "Total lag samples at or above the event loop block threshold.",
+    "sift_log_records_dropped_total": "Total log records dropped by reason (sampled or queue_full).",
+    "sift_retention_runs_total": "Total retention job runs by result.",
+    "sift_retention_run_duration_seconds": "Retention job duration in seconds by result.",
+    "sift_retention_rows_deleted_total": "Total rows removed by retention by table.",
+    "sift_retention_bytes_reclaimed_total": "Estimated bytes reclaimed by retention by table.",
+    "sift_db_partitions_created_total": "Total monthly partitions created by table.",
+    "sift_db_partitions_detached_total": "Total monthly partitions detached for archival by table.",
+    "sift_db_read_sessions_total": "Total read-only API sessions by target database role and routing reason.",
+    "sift_db_pool_checked_out": "Connections currently checked out of the pool by database role.",
+    "sift_db_pool_wait_seconds": "Time spent obtaining a pooled connection by database role and process type.",
+    "sift_db_pool_checkout_seconds": "Total connection checkout latency, including pre-ping, by role and process type.",
+    "sift_db_pool_timeouts_total": "Total pool checkouts that timed out waiting for a connection.",
 }
 
 _METRIC_TYPE: Final[dict[str, str]] = {
     "sift_http_requests_total": "counter",
-    "sift_http_request_duration_seconds": "counter",
+    "sift_http_request_duration_seconds": "histogram",
     "sift_scheduler_loops_total": "counter",
-    "sift_scheduler_loop_duration_seconds": "counter",
+    "sift_scheduler_loop_duration_seconds": "histogram",
     "sift_scheduler_due_feeds_total": "counter",
     "sift_scheduler_enqueues_total": "counter",
     "sift_scheduler_enqueued_jobs_total": "counter",
     "sift_queue_depth": "gauge",
     "sift_queue_oldest_job_age_seconds": "gauge",
     "sift_worker_jobs_total": "counter",
-    "sift_worker_job_duration_seconds": "counter",
+    "sift_worker_job_duration_seconds": "histogram",
     "sift_ingest_runs_total": "counter",
-    "sift_ingest_run_duration_seconds": "counter",
+    "sift_ingest_run_duration_seconds": "histogram",
     "sift_ingest_entries_fetched_total": "counter",
     "sift_ingest_entries_inserted_total": "counter",
     "sift_ingest_entries_duplicate_total": "counter",
     "sift_ingest_entries_filtered_total": "counter",
     "sift_ingest_plugin_processed_total": "counter",
+    "sift_ingest_parses_total": "counter",
+    "sift_ingest_parse_duration_seconds": "histogram",
+    "sift_ingest_parse_queue_wait_seconds": "histogram",
+    "sift_ingest_stage_duration_seconds": "histogram",
+    "sift_http_download_aborts_total": "counter",
+    "sift_db_queries_total": "counter",
+    "sift_db_time_seconds": "histogram",
+    "sift_db_slow_queries_total": "counter",
+    "sift_event_loop_lag_seconds": "histogram",
+    "sift_event_loop_blocked_total": "counter",
+    "sift_log_records_dropped_total": "counter",
+    "sift_retention_runs_total": "counter",
+    "sift_retention_run_duration_seconds": "histogram",
+    "sift_retention_rows_deleted_total": "counter",
+    "sift_retention_bytes_reclaimed_total": "counter",
+    "sift_db_partitions_created_total": "counter",
+    "sift_db_partitions_detached_total": "counter",
+    "sift_db_read_sessions_total": "counter",
+    "sift_db_pool_checked_out": "gauge",
+    "sift_db_pool_wait_seconds": "histogram",
+    "sift_db_pool_checkout_seconds": "histogram",
+    "sift_db_pool_timeouts_total": "counter",
 }
 
 
@@ -82,15 +138,20 @@ def _safe_seconds(value: float) -> float:
 
 
 class ObservabilityMetrics:
-    def __init__(self) -> None:
+    def __init__(self, *, duration_buckets: str | Sequence[float] | None = None) -> None:
         counter_names = [name for name, metric_type in _METRIC_TYPE.items() if metric_type == "counter"]
         gauge_names = [name for name, metric_type in _METRIC_TYPE.items() if metric_type == "gauge"]
+        histogram_names = [name for name, metric_type in _METRIC_TYPE.items() if metric_type == "histogram"]
+        self._bucket_bounds = parse_buckets(duration_buckets)
         self._counter_values: dict[str, dict[tuple[tuple[str, str], ...], float]] = {
             metric_name: defaultdict(float) for metric_name in counter_names
         }
         self._gauge_values: dict[str, dict[tuple[tuple[str, str], ...], float]] = {
             metric_name: {} for metric_name in gauge_names
         }
+        self._histogram_values: dict[str, dict[tuple[tuple[str, str], ...], HistogramSeries]] = {
+            metric_name: {} for metric_name in histogram_names
+        }
         self._lock = Lock()
 
     def _label_key(self, labels: dict[str, str]) -> tuple[tuple[str, str], ...]:
@@ -110,12 +171,86 @@ class ObservabilityMetrics:
         with self._lock:
             self._gauge_values[metric_name][key] = safe_value
 
+    def _observe(self, metric_name: str, *, labels: dict[str, str], value: float) -> None:
+        safe_value = _safe_seconds(value)
+        index = bucket_index(self._bucket_bounds, safe_value)
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._histogram_values[metric_name].get(key)
+            if series is None:
+                series = HistogramSeries(len(self._bucket_bounds))
+                self._histogram_values[metric_name][key] = series
+            series.counts[index] += 1
+            series.sum += safe_value
+            series.count += 1
+
     def reset(self) -> None:
         with self._lock:
-            for metric_name in self._counter_values:
-                self._counter_values[metric_name].clear()
-            for metric_name in self._gauge_values:
-                self._gauge_values[metric_name].clear()
+            self._clear_values()
+
+    def reset_after_fork(self) -> None:
+        # Another thread may have held the lock at fork time; the child gets a fresh one instead of inheriting it.
+        self._lock = Lock()
+        self._clear_values()
+
+    def _clear_values(self) -> None:
+        for metric_name in self._counter_values:
+            self._counter_values[metric_name].clear()
+        for metric_name in self._gauge_values:
+            self._gauge_values[metric_name].clear()
+        for metric_name in self._histogram_values:
+            self._histogram_values[metric_name].clear()
+
+    def drain_state(self) -> dict[str, Any]:
+        # Gauges are left out: they are point-in-time readings of the draining process, and merging them would
+        # overwrite the collecting process's own current values.
+        with self._lock:
+            state: dict[str, Any] = {
+                "bucket_bounds": list(self._bucket_bounds),
+                "counters": {
+                    metric_name: [[dict(key), value] for key, value in values.items()]
+                    for metric_name, values in self._counter_values.items()
+                    if values
+                },
+                "histograms": {
+                    metric_name: [
+                        [dict(key), series.counts, series.sum, series.count] for key, series in values.items()
+                    ]
+                    for metric_name, values in self._histogram_values.items()
+                    if values
+                },
+            }
+            self._clear_values()
+        return state
+
+    def merge_state(self, state: Mapping[str, Any]) -> int:
+        # Bucket counts can only be added when both sides were recorded with the same bounds; the number of histogram
+        # series dropped for that reason is returned so the caller can report it.
+        same_buckets = tuple(float(bound) for bound in state.get("bucket_bounds", ())) == self._bucket_bounds
+        with self._lock:
+            for metric_name, samples in state.get("counters", {}).items():
+                counter_values = self._counter_values.get(metric_name)
+                if counter_values is None:
+                    continue
+                for labels, value in samples:
+                    counter_values[self._label_key(labels)] += float(value)
+            if not same_buckets:
+                return sum(len(samples) for samples in state.get("histograms", {}).values())
+            for metric_name, samples in state.get("histograms", {}).items():
+                histogram_values = self._histogram_values.get(metric_name)
+                if histogram_values is None:
+                    continue
+                for labels, counts, total, count in samples:
+                    key = self._label_key(labels)
+                    series = histogram_values.get(key)
+                    if series is None:
+                        series = HistogramSeries(len(self._bucket_bounds))
+                        histogram_values[key] = series
+                    for index, bucket_count in enumerate(counts):
+                        series.counts[index] += int(bucket_count)
+                    series.sum += float(total)
+                    series.count += int(count)
+        return 0
 
     def record_http_request(
         self,
@@ -131,10 +266,10 @@ class ObservabilityMetrics:
             "status_class": _status_class(status_code),
         }
         self._inc_counter("sift_http_requests_total", labels=labels, amount=1.0)
-        self._inc_counter(
+        self._observe(
             "sift_http_request_duration_seconds",
             labels=labels,
-            amount=_safe_seconds(duration_seconds),
+            value=_safe_seconds(duration_seconds),
         )
 
     def record_scheduler_loop(self, *, result: str, duration_seconds: float) -> None:
@@ -143,10 +278,10 @@ class ObservabilityMetrics:
             labels={"result": _sanitize_result(result)},
             amount=1.0,
         )
-        self._inc_counter(
+        self._observe(
             "sift_scheduler_loop_duration_seconds",
             labels={},
-            amount=_safe_seconds(duration_seconds),
+            value=_safe_seconds(duration_seconds),
         )
 
     def record_scheduler_due_feeds(self, *, count: int) -> None:
@@ -187,10 +322,10 @@ class ObservabilityMetrics:
     def record_worker_job(self, *, result: str, duration_seconds: float) -> None:
         labels = {"result": _sanitize_result(result)}
         self._inc_counter("sift_worker_jobs_total", labels=labels, amount=1.0)
-        self._inc_counter(
+        self._observe(
             "sift_worker_job_duration_seconds",
             labels=labels,
-            amount=_safe_seconds(duration_seconds),
+            value=_safe_seconds(duration_seconds),
         )
 
     def record_ingest_run(
@@ -206,10 +341,10 @@ class ObservabilityMetrics:
     ) -> None:
         labels = {"result": _sanitize_result(result)}
         self._inc_counter("sift_ingest_runs_total", labels=labels, amount=1.0)
-        self._inc_counter(
+        self._observe(
             "sift_ingest_run_duration_seconds",
             labels=labels,
-            amount=_safe_seconds(duration_seconds),
+            value=_safe_seconds(duration_seconds),
         )
         self._inc_counter(
             "sift_ingest_entries_fetched_total",
@@ -237,6 +372,108 @@ class ObservabilityMetrics:
             amount=_safe_count(plugin_processed_count),
         )
 
+    def record_ingest_parse(
+        self,
+        *,
+        result: str,
+        executor: str,
+        parse_seconds: float = 0.0,
+        queue_wait_seconds: float = 0.0,
+    ) -> None:
+        executor_label = executor.strip().lower() or "unknown"
+        result_label = _sanitize_result(result)
+        self._inc_counter(
+            "sift_ingest_parses_total",
+            labels={"executor": executor_label, "result": result_label},
+            amount=1.0,
+        )
+        if result_label != "success":
+            return
+        self._observe(
+            "sift_ingest_parse_duration_seconds",
+            labels={"executor": executor_label},
+            value=_safe_seconds(parse_seconds),
+        )
+        self._observe(
+            "sift_ingest_parse_queue_wait_seconds",
+            labels={"executor": executor_label},
+            value=_safe_seconds(queue_wait_seconds),
+        )
+
+    def record_ingest_stages(self, *, durations: Mapping[str, float]) -> None:
+        for stage, duration_seconds in durations.items():
+            self._observe(
+                "sift_ingest_stage_duration_seconds",
+                labels={"stage": stage},
+                value=duration_seconds,
+            )
+
+    def record_download_abort(self, *, source: str, reason: str) -> None:
+        self._inc_counter(
+            "sift_http_download_aborts_total",
+            labels={"source": source.strip().lower() or "unknown", "reason": _sanitize_result(reason)},
+            amount=1.0,
+        )
+
+    def record_db_usage(self, *, source: str, route: str, query_count: int, db_seconds: float) -> None:
+        labels = {"source": source.strip().lower() or "unknown", "route": _sanitize_route(route)}
+        self._inc_counter("sift_db_queries_total", labels=labels, amount=_safe_count(query_count))
+        self._observe("sift_db_time_seconds", labels=labels, value=db_seconds)
+
+    def record_db_slow_query(self, *, source: str) -> None:
+        self._inc_counter(
+            "sift_db_slow_queries_total",
+            labels={"source": source.strip().lower() or "unknown"},
+            amount=1.0,
+        )
+
+    def record_event_loop_lag(self, *, lag_seconds: float, blocked: bool) -> None:
+        self._observe("sift_event_loop_lag_seconds", labels={}, value=lag_seconds)
+        if blocked:
+            self._inc_counter("sift_event_loop_blocked_total", labels={}, amount=1.0)
+
+    def record_retention_run(self, *, result: str, duration_seconds: float) -> None:
+        labels = {"result": _sanitize_result(result)}
+        self._inc_counter("sift_retention_runs_total", labels=labels, amount=1.0)
+        self._observe("sift_retention_run_duration_seconds", labels=labels, value=duration_seconds)
+
+    def record_retention_reclaimed(self, *, table: str, rows: int, reclaimed_bytes: int) -> None:
+        labels = {"table": table}
+        self._inc_counter("sift_retention_rows_deleted_total", labels=labels, amount=_safe_count(rows))
+        self._inc_counter("sift_retention_bytes_reclaimed_total", labels=labels, amount=_safe_count(reclaimed_bytes))
+
+    def record_partitions_changed(self, *, table: str, created: int, detached: int) -> None:
+        labels = {"table": table}
+        if created > 0:
+            self._inc_counter("sift_db_partitions_created_total", labels=labels, amount=float(created))
+        if detached > 0:
+            self._inc_counter("sift_db_partitions_detached_total", labels=labels, amount=float(detached))
+
+    def record_db_read_session(self, *, target: str, reason: str) -> None:
+        self._inc_counter(
+            "sift_db_read_sessions_total",
+            labels={"target": _sanitize_result(target), "reason": _sanitize_result(reason)},
+            amount=1.0,
+        )
+
+    def set_db_pool_checked_out(self, *, role: str, count: int) -> None:
+        self._set_gauge("sift_db_pool_checked_out", labels={"role": _sanitize_result(role)}, value=_safe_count(count))
+
+    def record_db_pool_wait(self, *, role: str, process: str, seconds: float) -> None:
+        labels = {"role": _sanitize_result(role), "process": _sanitize_result(process)}
+        self._observe("sift_db_pool_wait_seconds", labels=labels, value=_safe_seconds(seconds))
+
+    def record_db_pool_checkout(self, *, role: str, process: str, seconds: float) -> None:
+        labels = {"role": _sanitize_result(role), "process": _sanitize_result(process)}
+        self._observe("sift_db_pool_checkout_seconds", labels=labels, value=_safe_seconds(seconds))
+
+    def record_db_pool_timeout(self, *, role: str, process: str) -> None:
+        labels = {"role": _sanitize_result(role), "process": _sanitize_result(process)}
+        self._inc_counter("sift_db_pool_timeouts_total", labels=labels, amount=1.0)
+
+    def record_log_dropped(self, *, reason: str) -> None:
+        self._inc_counter("sift_log_records_dropped_total", labels={"reason": _sanitize_result(reason)}, amount=1.0)
+
     def snapshot(self) -> dict[str, list[MetricSample]]:
         with self._lock:
             counters = {
@@ -247,26 +484,43 @@ class ObservabilityMetrics:
                 metric_name: sorted(values.items(), key=lambda item: item[0])
                 for metric_name, values in self._gauge_values.items()
             }
+            # Histogram metrics keep their running sum here so sum-based consumers see the same value as before.
+            histogram_sums = {
+                metric_name: sorted(((key, series.sum) for key, series in values.items()), key=lambda item: item[0])
+                for metric_name, values in self._histogram_values.items()
+            }
 
         snapshot: dict[str, list[MetricSample]] = {}
         for metric_name in _METRIC_HELP:
-            counter_items = counters.get(metric_name, [])
-            gauge_items = gauges.get(metric_name, [])
-            source_items = counter_items if counter_items else gauge_items
+            source_items = counters.get(metric_name) or gauges.get(metric_name) or histogram_sums.get(metric_name) or []
             snapshot[metric_name] = [
                 MetricSample(labels=dict(label_key), value=value) for label_key, value in source_items
             ]
         return snapshot
 
+    def histogram_snapshot(self) -> dict[str, list[HistogramSample]]:
+        with self._lock:
+            return {
+                metric_name: [
+                    to_sample(dict(key), self._bucket_bounds, series)
+                    for key, series in sorted(values.items(), key=lambda item: item[0])
+                ]
+                for metric_name, values in self._histogram_values.items()
+            }
+
     def render_prometheus(self) -> str:
         snapshot = self.snapshot()
+        histograms = self.histogram_snapshot()
         lines: list[str] = []
         for metric_name in _METRIC_HELP:
             lines.append(f"# HELP {metric_name} {_METRIC_HELP[metric_name]}")
             lines.append(f"# TYPE {metric_name} {_METRIC_TYPE[metric_name]}")
+            if _METRIC_TYPE[metric_name] == "histogram":
+                lines.extend(render_histogram_lines(metric_name, histograms.get(metric_name, [])))
+                continue
             for sample in snapshot.get(metric_name, []):
                 labels = ",".join(
-                    f'{label_key}="{_escape_label_value(label_value)}"'
+                    f'{label_key}="{escape_label_value(label_value)}"'
                     for label_key, label_value in sorted(sample.labels.items())
                 )
                 if labels:
@@ -276,11 +530,6 @@ class ObservabilityMetrics:
         return "\n".join(lines) + "\n"
 
 
-def _escape_label_value(value: str) -> str:
-    return value.replace("\\", "\\\\").replace('"', '\\"')
-
-
 @lru_cache
 def get_observability_metrics() -> ObservabilityMetrics:
-    return ObservabilityMetrics()
-
+    return ObservabilityMetrics(duration_buckets=get_settings().metrics_duration_buckets or None)
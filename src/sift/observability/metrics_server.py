@@ -1,13 +1,20 @@
+import hmac
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from threading import Thread
+from typing import Final
+from urllib.parse import parse_qs, urlsplit
 
 from sift.observability.metrics import get_observability_metrics
+from sift.observability.profiler import Profiler, ProfilerBusyError
 
 logger = logging.getLogger(__name__)
 
+PROFILE_PATH: Final[str] = "/debug/profile"
+_DEFAULT_PROFILE_SECONDS: Final[float] = 5.0
+
 
 @dataclass(slots=True)
 class MetricsServerHandle:
@@ -40,16 +47,24 @@ def start_metrics_http_server(
     port: int,
     path: str,
     extra_renderers: list[Callable[[], str]] | None = None,
+    profiler: Profiler | None = None,
+    profiling_token: str = "",
 ) -> MetricsServerHandle | None:
     if not enabled:
         return None
 
     normalized_path = _normalize_metrics_path(path)
     renderers = list(extra_renderers or [])
+    # There is no user session here, so profiling additionally requires a shared bearer token.
+    profiling_enabled = profiler is not None and bool(profiling_token)
 
     class MetricsHandler(BaseHTTPRequestHandler):
         def do_GET(self) -> None:  # noqa: N802
-            if self.path != normalized_path:
+            url = urlsplit(self.path)
+            if profiling_enabled and url.path == PROFILE_PATH:
+                self._serve_profile(url.query)
+                return
+            if url.path != normalized_path:
                 self.send_response(404)
                 self.end_headers()
                 return
@@ -64,6 +79,37 @@ def start_metrics_http_server(
             self.end_headers()
             self.wfile.write(body)
 
+        def _serve_profile(self, query: str) -> None:
+            assert profiler is not None
+            authorization = self.headers.get("Authorization", "")
+            if not hmac.compare_digest(authorization.encode("utf-8"), f"Bearer {profiling_token}".encode()):
+                self._send_text(401, "Profiling token required\n")
+                return
+            try:
+                seconds = float(parse_qs(query).get("seconds", [_DEFAULT_PROFILE_SECONDS])[0])
+            except ValueError:
+                self._send_text(400, "Invalid seconds\n")
+                return
+            if not seconds > 0:
+                self._send_text(400, "Invalid seconds\n")
+                return
+            try:
+                result = profiler.profile(seconds, source=service_name)
+            except ProfilerBusyError as exc:
+                self._send_text(409, f"{exc}\n")
+                return
+            self._send_text(200, result.collapsed, headers={"X-Profile-Samples": str(result.sample_count)})
+
+        def _send_text(self, status_code: int, text: str, *, headers: dict[str, str] | None = None) -> None:
+            body = text.encode("utf-8")
+            self.send_response(status_code)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
         def log_message(self, _format: str, *_args: object) -> None:
             # Keep HTTP server internals from writing unstructured stderr lines.
             return
@@ -0,0 +1,109 @@
+import atexit
+import json
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from threading import Lock
+
+from sift.observability.metrics import ObservabilityMetrics, get_observability_metrics
+
+logger = logging.getLogger(__name__)
+
+_ACTIVE_SPOOL: "MetricsSpool | None" = None
+
+
+class MetricsSpool:
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._lock = Lock()
+
+    def write(self, metrics: ObservabilityMetrics) -> Path | None:
+        state = metrics.drain_state()
+        if not (state["counters"] or state["histograms"]):
+            return None
+        path = self.directory / f"{os.getpid()}-{uuid.uuid4().hex}.json"
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(state, separators=(",", ":")), encoding="utf-8")
+        # The rename is atomic, so the collector never reads a partially written file.
+        os.replace(temp_path, path)
+        return path
+
+    def collect(self, metrics: ObservabilityMetrics) -> int:
+        merged = 0
+        with self._lock:
+            for path in sorted(self.directory.glob("*.json")):
+                try:
+                    state = json.loads(path.read_text(encoding="utf-8"))
+                except (OSError, ValueError) as exc:
+                    logger.warning(
+                        "metrics.spool.unreadable",
+                        extra={"event": "metrics.spool.unreadable", "path": str(path), "error_message": str(exc)},
+                    )
+                else:
+                    dropped_series = metrics.merge_state(state)
+                    if dropped_series:
+                        logger.warning(
+                            "metrics.spool.histograms_dropped",
+                            extra={
+                                "event": "metrics.spool.histograms_dropped",
+                                "path": str(path),
+                                "series_count": dropped_series,
+                                "reason": "bucket_bounds_mismatch",
+                            },
+                        )
+                    merged += 1
+                path.unlink(missing_ok=True)
+        return merged
+
+
+def enable_metrics_spool(directory: str = "") -> MetricsSpool:
+    global _ACTIVE_SPOOL
+
+    if directory.strip():
+        spool_dir = Path(directory.strip())
+        spool_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        spool_dir = Path(tempfile.mkdtemp(prefix="sift-worker-metrics-"))
+        atexit.register(shutil.rmtree, spool_dir, ignore_errors=True)
+    _ACTIVE_SPOOL = MetricsSpool(spool_dir)
+    # Pick up anything a previous worker process left behind before it was restarted.
+    collect_metrics_spool()
+    return _ACTIVE_SPOOL
+
+
+def flush_metrics_spool() -> None:
+    spool = _ACTIVE_SPOOL
+    if spool is None:
+        return
+    try:
+        spool.write(get_observability_metrics())
+    except OSError as exc:
+        logger.warning(
+            "metrics.spool.write_failed",
+            extra={"event": "metrics.spool.write_failed", "path": str(spool.directory), "error_message": str(exc)},
+        )
+
+
+def collect_metrics_spool() -> None:
+    spool = _ACTIVE_SPOOL
+    if spool is None:
+        return
+    try:
+        spool.collect(get_observability_metrics())
+    except OSError as exc:
+        logger.warning(
+            "metrics.spool.collect_failed",
+            extra={"event": "metrics.spool.collect_failed", "path": str(spool.directory), "error_message": str(exc)},
+        )
+
+
+def _reset_metrics_after_fork() -> None:
+    # Forked job processes start from the parent's totals; clear them so the child only spools its own increments.
+    if _ACTIVE_SPOOL is not None:
+        get_observability_metrics().reset_after_fork()
+
+
+os.register_at_fork(after_in_child=_reset_metrics_after_fork)
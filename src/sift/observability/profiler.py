@@ -0,0 +1,223 @@
+import json
+import logging
+import os
+import sys
+import threading
+import uuid
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter, sleep, time
+from types import FrameType
+from typing import Final, Protocol
+
+from sift.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_MIN_SAMPLE_INTERVAL_SECONDS: Final[float] = 0.001
+_MAX_STACK_DEPTH: Final[int] = 128
+# Time allowed after a job-process window closes for the last job processes to write their samples.
+_JOB_PROFILE_GRACE_SECONDS: Final[float] = 1.0
+_JOB_PROFILE_SUFFIX: Final[str] = ".profile"
+
+
+class ProfilerBusyError(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileResult:
+    collapsed: str
+    sample_count: int
+    duration_seconds: float
+
+
+class Profiler(Protocol):
+    def profile(self, seconds: float, *, source: str) -> ProfileResult: ...
+
+
+@dataclass(frozen=True, slots=True)
+class _JobProfileWindow:
+    until: float
+    directory: Path
+
+
+# Set in the worker parent while a profile is requested; forked job processes inherit it and sample themselves.
+_job_profile_window: _JobProfileWindow | None = None
+
+
+def _render_collapsed(counts: Counter[str]) -> str:
+    collapsed = "\n".join(f"{stack} {count}" for stack, count in counts.most_common())
+    return f"{collapsed}\n" if collapsed else ""
+
+
+def _frame_label(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}"
+
+
+def collapse_stack(frame: FrameType | None, *, thread_name: str) -> str:
+    labels: list[str] = []
+    while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name.replace(";", ":"))
+    # Collapsed-stack format is root-first, one ';'-separated stack per line followed by its sample count.
+    return ";".join(reversed(labels))
+
+
+class SamplingProfiler:
+    def __init__(self, *, max_seconds: float, sample_interval_seconds: float) -> None:
+        self.max_seconds = max(0.0, max_seconds)
+        self.sample_interval_seconds = max(_MIN_SAMPLE_INTERVAL_SECONDS, sample_interval_seconds)
+        self._lock = threading.Lock()
+
+    def profile(self, seconds: float, *, source: str) -> ProfileResult:
+        duration = min(max(0.0, seconds), self.max_seconds)
+        # One profile per process at a time keeps overhead bounded no matter how many callers ask.
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running in this process")
+        try:
+            started_at = perf_counter()
+            counts, sample_count = self._sample(duration)
+            elapsed = perf_counter() - started_at
+        finally:
+            self._lock.release()
+
+        logger.info(
+            "profiler.run.complete",
+            extra={
+                "event": "profiler.run.complete",
+                "source": source,
+                "duration_ms": int(elapsed * 1000),
+                "sample_count": sample_count,
+                "stack_count": len(counts),
+            },
+        )
+        return ProfileResult(collapsed=_render_collapsed(counts), sample_count=sample_count, duration_seconds=elapsed)
+
+    def _sample(self, duration: float, stop: threading.Event | None = None) -> tuple[Counter[str], int]:
+        counts: Counter[str] = Counter()
+        sample_count = 0
+        own_thread_id = threading.get_ident()
+        deadline = perf_counter() + duration
+        while True:
+            remaining = deadline - perf_counter()
+            if remaining <= 0:
+                break
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread_id:
+                    continue
+                counts[collapse_stack(frame, thread_name=thread_names.get(thread_id, f"thread-{thread_id}"))] += 1
+            sample_count += 1
+            if stop is None:
+                sleep(min(self.sample_interval_seconds, remaining))
+            elif stop.wait(min(self.sample_interval_seconds, remaining)):
+                break
+        return counts, sample_count
+
+
+class JobProcessProfiler:
+    # RQ runs every job in a forked work horse, so sampling the worker parent would only show it waiting on the fork.
+    def __init__(self, sampler: SamplingProfiler, *, directory: Path) -> None:
+        self.sampler = sampler
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def profile(self, seconds: float, *, source: str) -> ProfileResult:
+        global _job_profile_window
+
+        duration = min(max(0.0, seconds), self.sampler.max_seconds)
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running in this process")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for stale in self.directory.glob(f"*{_JOB_PROFILE_SUFFIX}"):
+                stale.unlink(missing_ok=True)
+            started_at = perf_counter()
+            _job_profile_window = _JobProfileWindow(until=time() + duration, directory=self.directory)
+            try:
+                sleep(duration)
+            finally:
+                _job_profile_window = None
+            sleep(_JOB_PROFILE_GRACE_SECONDS)
+            counts, sample_count, job_count = self._collect()
+            elapsed = perf_counter() - started_at
+        finally:
+            self._lock.release()
+
+        logger.info(
+            "profiler.run.complete",
+            extra={
+                "event": "profiler.run.complete",
+                "source": source,
+                "duration_ms": int(elapsed * 1000),
+                "sample_count": sample_count,
+                "stack_count": len(counts),
+                "job_count": job_count,
+            },
+        )
+        return ProfileResult(collapsed=_render_collapsed(counts), sample_count=sample_count, duration_seconds=elapsed)
+
+    def _collect(self) -> tuple[Counter[str], int, int]:
+        counts: Counter[str] = Counter()
+        sample_count = 0
+        job_count = 0
+        for path in self.directory.glob(f"*{_JOB_PROFILE_SUFFIX}"):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            finally:
+                path.unlink(missing_ok=True)
+            counts.update({str(stack): int(count) for stack, count in payload.get("counts", {}).items()})
+            sample_count += int(payload.get("sample_count", 0))
+            job_count += 1
+        return counts, sample_count, job_count
+
+
+@contextmanager
+def sample_job_process() -> Iterator[None]:
+    # Samples the current job process while a JobProcessProfiler window inherited from the worker is open.
+    window = _job_profile_window
+    remaining = window.until - time() if window is not None else 0.0
+    if window is None or remaining <= 0:
+        yield
+        return
+
+    stop = threading.Event()
+
+    def _run() -> None:
+        counts, sample_count = get_sampling_profiler()._sample(remaining, stop)
+        path = window.directory / f"{os.getpid()}-{uuid.uuid4().hex}{_JOB_PROFILE_SUFFIX}"
+        temp_path = path.with_suffix(".tmp")
+        try:
+            temp_path.write_text(json.dumps({"counts": counts, "sample_count": sample_count}), encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logger.warning(
+                "profiler.job.write_failed",
+                extra={"event": "profiler.job.write_failed", "path": str(path), "error_message": str(exc)},
+            )
+
+    thread = threading.Thread(target=_run, name="sift-job-profiler", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+@lru_cache
+def get_sampling_profiler() -> SamplingProfiler:
+    settings = get_settings()
+    return SamplingProfiler(
+        max_seconds=settings.profiling_max_seconds,
+        sample_interval_seconds=settings.profiling_sample_interval_ms / 1000.0,
+    )
@@ -0,0 +1,218 @@
+import logging
+import re
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from hashlib import sha1
+from time import perf_counter
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from sift.observability.logging import resolve_redact_fields
+from sift.observability.metrics import get_observability_metrics
+
+logger = logging.getLogger(__name__)
+
+_QUERY_STATS_CONTEXT: ContextVar["QueryStats | None"] = ContextVar("sift_query_stats", default=None)
+
+# Several engines can share a role (one per replica), so checkouts are summed per role before reporting.
+_POOL_CHECKED_OUT: defaultdict[str, int] = defaultdict(int)
+_POOL_CHECKED_OUT_LOCK = threading.Lock()
+
+_STARTED_AT_KEY: Final[str] = "sift_query_started_at"
+_MAX_STATEMENT_CHARS: Final[int] = 2000
+_MAX_PARAMETER_CHARS: Final[int] = 200
+
+_WHITESPACE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\s+")
+_STRING_LITERAL_PATTERN: Final[re.Pattern[str]] = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_PATTERN: Final[re.Pattern[str]] = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_PATTERN: Final[re.Pattern[str]] = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+")
+_IN_LIST_PATTERN: Final[re.Pattern[str]] = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_BIND_SUFFIX_PATTERN: Final[re.Pattern[str]] = re.compile(r"_\d+$")
+
+
+@dataclass(slots=True)
+class QueryStats:
+    source: str
+    route: str = ""
+    query_count: int = 0
+    db_seconds: float = 0.0
+
+
+def bind_query_stats(stats: QueryStats) -> Token[QueryStats | None]:
+    # The stats object is shared (not copied) with tasks spawned from this context, so their queries count too.
+    return _QUERY_STATS_CONTEXT.set(stats)
+
+
+def reset_query_stats(token: Token[QueryStats | None]) -> None:
+    _QUERY_STATS_CONTEXT.reset(token)
+
+
+def record_query_stats(stats: QueryStats) -> None:
+    get_observability_metrics().record_db_usage(
+        source=stats.source,
+        route=stats.route,
+        query_count=stats.query_count,
+        db_seconds=stats.db_seconds,
+    )
+
+
+def fingerprint_statement(statement: str) -> tuple[str, str]:
+    normalized = _WHITESPACE_PATTERN.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL_PATTERN.sub("?", normalized)
+    normalized = _PLACEHOLDER_PATTERN.sub("?", normalized)
+    normalized = _NUMBER_LITERAL_PATTERN.sub("?", normalized)
+    normalized = _IN_LIST_PATTERN.sub("(?)", normalized)
+    return sha1(normalized.encode("utf-8"), usedforsecurity=False).hexdigest()[:16], normalized
+
+
+def _safe_parameter_value(value: Any) -> Any:
+    if isinstance(value, bytes | bytearray | memoryview):
+        return f"<{len(value)} bytes>"
+    if value is None or isinstance(value, bool | int | float):
+        return value
+    text = value if isinstance(value, str) else str(value)
+    if len(text) > _MAX_PARAMETER_CHARS:
+        return f"{text[:_MAX_PARAMETER_CHARS]}..."
+    return text
+
+
+def redact_parameters(
+    parameters: Any,
+    *,
+    bind_names: Sequence[str] | None,
+    redact_fields: frozenset[str],
+) -> dict[str, Any] | None:
+    if isinstance(parameters, Mapping):
+        items = list(parameters.items())
+    elif isinstance(parameters, Sequence) and bind_names is not None and len(bind_names) == len(parameters):
+        items = list(zip(bind_names, parameters, strict=True))
+    else:
+        # Without bind names there is nothing to match redaction rules against, so values are withheld.
+        return None
+
+    redacted: dict[str, Any] = {}
+    for name, value in items:
+        key = str(name)
+        base_name = _BIND_SUFFIX_PATTERN.sub("", key).lower()
+        if key.lower() in redact_fields or base_name in redact_fields:
+            redacted[key] = "[REDACTED]"
+        else:
+            redacted[key] = _safe_parameter_value(value)
+    return redacted
+
+
+def _bind_names(context: ExecutionContext | None) -> Sequence[str] | None:
+    compiled = getattr(context, "compiled", None)
+    positiontup = getattr(compiled, "positiontup", None)
+    return list(positiontup) if positiontup else None
+
+
+class SqlQueryInstrumentation:
+    def __init__(self, *, slow_query_threshold_ms: float, redact_fields: Iterable[str]) -> None:
+        self.slow_query_threshold_seconds = max(0.0, slow_query_threshold_ms) / 1000.0
+        self.redact_fields = resolve_redact_fields(redact_fields)
+
+    def install(self, engine: AsyncEngine | Engine) -> None:
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        event.listen(sync_engine, "before_cursor_execute", self.before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self.after_cursor_execute)
+
+    def before_cursor_execute(
+        self,
+        conn: Connection,
+        _cursor: Any,
+        _statement: str,
+        _parameters: Any,
+        _context: ExecutionContext | None,
+        _executemany: bool,
+    ) -> None:
+        conn.info.setdefault(_STARTED_AT_KEY, []).append(perf_counter())
+
+    def after_cursor_execute(
+        self,
+        conn: Connection,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        started = conn.info.get(_STARTED_AT_KEY)
+        if not started:
+            return
+        elapsed = perf_counter() - started.pop()
+        stats = _QUERY_STATS_CONTEXT.get()
+        if stats is not None:
+            stats.query_count += 1
+            stats.db_seconds += elapsed
+        if self.slow_query_threshold_seconds <= 0 or elapsed < self.slow_query_threshold_seconds:
+            return
+        self._log_slow_query(
+            statement=statement,
+            parameters=parameters,
+            context=context,
+            executemany=executemany,
+            elapsed=elapsed,
+            stats=stats,
+        )
+
+    def _log_slow_query(
+        self,
+        *,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+        elapsed: float,
+        stats: QueryStats | None,
+    ) -> None:
+        source = stats.source if stats is not None else "unscoped"
+        get_observability_metrics().record_db_slow_query(source=source)
+        fingerprint, normalized = fingerprint_statement(statement)
+        if executemany and isinstance(parameters, Sequence):
+            redacted_parameters: dict[str, Any] | None = {"executemany_rows": len(parameters)}
+        else:
+            redacted_parameters = redact_parameters(
+                parameters,
+                bind_names=_bind_names(context),
+                redact_fields=self.redact_fields,
+            )
+        logger.warning(
+            "db.query.slow",
+            extra={
+                "event": "db.query.slow",
+                "source": source,
+                "route": stats.route if stats is not None else "",
+                "statement_fingerprint": fingerprint,
+                "statement": normalized[:_MAX_STATEMENT_CHARS],
+                "parameters": redacted_parameters,
+                "duration_ms": int(elapsed * 1000),
+                "threshold_ms": int(self.slow_query_threshold_seconds * 1000),
+            },
+        )
+
+
+def _adjust_pool_checked_out(role: str, delta: int) -> None:
+    with _POOL_CHECKED_OUT_LOCK:
+        _POOL_CHECKED_OUT[role] = max(0, _POOL_CHECKED_OUT[role] + delta)
+        count = _POOL_CHECKED_OUT[role]
+    get_observability_metrics().set_db_pool_checked_out(role=role, count=count)
+
+
+def install_pool_metrics(engine: AsyncEngine | Engine, *, role: str) -> None:
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    def _on_checkout(_dbapi_connection: Any, _connection_record: Any, _connection_proxy: Any) -> None:
+        _adjust_pool_checked_out(role, 1)
+
+    def _on_checkin(_dbapi_connection: Any, _connection_record: Any) -> None:
+        _adjust_pool_checked_out(role, -1)
+
+    event.listen(sync_engine, "checkout", _on_checkout)
+    event.listen(sync_engine, "checkin", _on_checkin)
@@ -0,0 +1,322 @@
+import asyncio
+import logging
+import multiprocessing
+import queue
+from collections.abc import Mapping
+from importlib import import_module
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from threading import Lock
+from time import monotonic
+from typing import Any, Final
+
+from sift.plugins.base import ArticleContext, StreamClassificationDecision, StreamClassifierContext
+
+logger = logging.getLogger(__name__)
+
+_SHUTDOWN_JOIN_SECONDS: Final[float] = 2.0
+_STARTUP_TIMEOUT_SECONDS: Final[float] = 30.0
+
+
+class PluginWorkerError(RuntimeError):
+    pass
+
+
+class PluginWorkerCrashedError(PluginWorkerError):
+    pass
+
+
+def resolve_plugin_class(path: str) -> Any:
+    try:
+        module_path, class_name = path.split(":", maxsplit=1)
+    except ValueError as exc:
+        raise ValueError(f"Invalid plugin class path '{path}'. Expected 'module.path:ClassName'.") from exc
+
+    module = import_module(module_path)
+    try:
+        return getattr(module, class_name)
+    except AttributeError as exc:
+        raise ValueError(f"Plugin class '{class_name}' not found in module '{module_path}'.") from exc
+
+
+# Contexts cross the pipe as plain positional tuples of builtins, keeping messages small and class-agnostic.
+def encode_article(article: ArticleContext) -> tuple[str, str, str, dict[str, str]]:
+    return (article.article_id, article.title, article.content_text, dict(article.metadata))
+
+
+def decode_article(payload: tuple[str, str, str, Mapping[str, str]]) -> ArticleContext:
+    article_id, title, content_text, metadata = payload
+    return ArticleContext(article_id=article_id, title=title, content_text=content_text, metadata=dict(metadata))
+
+
+def encode_stream(stream: StreamClassifierContext) -> tuple[Any, ...]:
+    return (
+        stream.stream_id,
+        stream.stream_name,
+        list(stream.include_keywords),
+        list(stream.exclude_keywords),
+        stream.source_contains,
+        stream.language_equals,
+        dict(stream.classifier_config),
+        dict(stream.metadata),
+    )
+
+
+def decode_stream(payload: tuple[Any, ...]) -> StreamClassifierContext:
+    (
+        stream_id,
+        stream_name,
+        include_keywords,
+        exclude_keywords,
+        source_contains,
+        language_equals,
+        classifier_config,
+        metadata,
+    ) = payload
+    return StreamClassifierContext(
+        stream_id=stream_id,
+        stream_name=stream_name,
+        include_keywords=include_keywords,
+        exclude_keywords=exclude_keywords,
+        source_contains=source_contains,
+        language_equals=language_equals,
+        classifier_config=classifier_config,
+        metadata=metadata,
+    )
+
+
+def encode_decision(decision: StreamClassificationDecision | None) -> tuple[Any, ...] | None:
+    if decision is None:
+        return None
+    return (
+        decision.matched,
+        decision.confidence,
+        decision.reason,
+        decision.provider,
+        decision.model_name,
+        decision.model_version,
+        decision.findings,
+    )
+
+
+def decode_decision(payload: tuple[Any, ...] | None) -> StreamClassificationDecision | None:
+    if payload is None:
+        return None
+    matched, confidence, reason, provider, model_name, model_version, findings = payload
+    return StreamClassificationDecision(
+        matched=matched,
+        confidence=confidence,
+        reason=reason,
+        provider=provider,
+        model_name=model_name,
+        model_version=model_version,
+        findings=findings,
+    )
+
+
+def _worker_main(class_path: str, conn: Connection) -> None:
+    try:
+        plugin = resolve_plugin_class(class_path)()
+    except Exception as exc:  # noqa: BLE001
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+        conn.close()
+        return
+    conn.send(("ready", None))
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                return
+            if message is None:
+                return
+            method, args = message
+            try:
+                if method == "on_article_ingested":
+                    article = loop.run_until_complete(plugin.on_article_ingested(decode_article(args[0])))
+                    conn.send(("ok", encode_article(article) if isinstance(article, ArticleContext) else None))
+                elif method == "classify_stream":
+                    decision = loop.run_until_complete(
+                        plugin.classify_stream(decode_article(args[0]), decode_stream(args[1]))
+                    )
+                    conn.send(
+                        (
+                            "ok",
+                            encode_decision(decision if isinstance(decision, StreamClassificationDecision) else None),
+                        )
+                    )
+                else:
+                    conn.send(("error", f"Unsupported plugin method '{method}'"))
+            except Exception as exc:  # noqa: BLE001
+                conn.send(("error", f"{type(exc).__name__}: {exc}"))
+    finally:
+        loop.close()
+        conn.close()
+
+
+class _PluginWorker:
+    def __init__(self, *, plugin_id: str, class_path: str) -> None:
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe(duplex=True)
+        self.conn: Connection = parent_conn
+        self.process: BaseProcess = context.Process(
+            target=_worker_main,
+            args=(class_path, child_conn),
+            name=f"sift-plugin-{plugin_id}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.calls = 0
+
+    def wait_ready(self, timeout_seconds: float) -> None:
+        try:
+            if not self.conn.poll(timeout_seconds):
+                raise PluginWorkerError("Plugin worker did not start within timeout")
+            status, value = self.conn.recv()
+        except (EOFError, OSError) as exc:
+            raise PluginWorkerCrashedError("Plugin worker exited during startup") from exc
+        if status != "ready":
+            raise PluginWorkerError(f"Plugin worker failed to start: {value}")
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=_SHUTDOWN_JOIN_SECONDS)
+        self.conn.close()
+
+    def retire(self) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=_SHUTDOWN_JOIN_SECONDS)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=_SHUTDOWN_JOIN_SECONDS)
+        self.conn.close()
+
+
+class ProcessPluginPool:
+    def __init__(self, *, plugin_id: str, class_path: str, max_workers: int, max_calls_per_worker: int) -> None:
+        self.plugin_id = plugin_id
+        self.class_path = class_path
+        self.max_calls_per_worker = max(1, max_calls_per_worker)
+        # Idle slots: a live worker, or None meaning "spawn on demand".
+        self._slots: queue.Queue[_PluginWorker | None] = queue.Queue()
+        for _ in range(max(1, max_workers)):
+            self._slots.put(None)
+        self._workers: set[_PluginWorker] = set()
+        self._lock = Lock()
+        self._closed = False
+
+    def call(self, method: str, args: tuple[Any, ...], *, timeout_seconds: float) -> Any:
+        # Waiting for a slot and waiting for the reply share one budget, so a call never blocks past its timeout.
+        deadline = monotonic() + timeout_seconds
+        try:
+            worker = self._slots.get(timeout=timeout_seconds)
+        except queue.Empty as exc:
+            raise TimeoutError(f"No plugin worker available for '{self.plugin_id}' within timeout") from exc
+        remaining_seconds = deadline - monotonic()
+        if remaining_seconds <= 0:
+            self._slots.put(worker)
+            raise TimeoutError(f"No plugin worker available for '{self.plugin_id}' within timeout")
+
+        if worker is None:
+            try:
+                worker = self._spawn()
+            except Exception:
+                self._slots.put(None)
+                raise
+
+        try:
+            worker.conn.send((method, args))
+            ready = worker.conn.poll(remaining_seconds)
+            reply = worker.conn.recv() if ready else None
+        except (EOFError, BrokenPipeError, ConnectionResetError) as exc:
+            self._discard(worker, kill=True)
+            raise PluginWorkerCrashedError(f"Plugin worker for '{self.plugin_id}' exited unexpectedly") from exc
+
+        if reply is None:
+            # The plugin is hung or CPU-bound past its budget; only killing the process reclaims it.
+            self._discard(worker, kill=True)
+            logger.warning(
+                "plugin.worker.killed",
+                extra={"event": "plugin.worker.killed", "plugin_id": self.plugin_id, "result": "timeout"},
+            )
+            raise TimeoutError(f"Plugin worker for '{self.plugin_id}' exceeded {timeout_seconds:g}s")
+        status, value = reply
+
+        worker.calls += 1
+        if worker.calls >= self.max_calls_per_worker:
+            self._discard(worker, kill=False)
+        else:
+            self._slots.put(worker)
+
+        if status != "ok":
+            raise PluginWorkerError(str(value))
+        return value
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.kill()
+
+    def _spawn(self) -> _PluginWorker:
+        with self._lock:
+            if self._closed:
+                raise PluginWorkerError(f"Plugin worker pool for '{self.plugin_id}' is shut down")
+        worker = _PluginWorker(plugin_id=self.plugin_id, class_path=self.class_path)
+        try:
+            # Startup (spawn + plugin import) is budgeted separately so it never counts against a call timeout.
+            worker.wait_ready(_STARTUP_TIMEOUT_SECONDS)
+        except PluginWorkerError:
+            worker.kill()
+            raise
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def _discard(self, worker: _PluginWorker, *, kill: bool) -> None:
+        with self._lock:
+            self._workers.discard(worker)
+        if kill:
+            worker.kill()
+        else:
+            worker.retire()
+        self._slots.put(None)
+
+
+class ProcessIsolatedPlugin:
+    def __init__(self, *, pool: ProcessPluginPool, timeouts_ms: Mapping[str, int]) -> None:
+        self._pool = pool
+        self._timeouts_ms = dict(timeouts_ms)
+
+    async def on_article_ingested(self, article: ArticleContext) -> ArticleContext | None:
+        payload = await asyncio.to_thread(
+            self._pool.call,
+            "on_article_ingested",
+            (encode_article(article),),
+            timeout_seconds=self._timeouts_ms.get("ingest_hook", 2000) / 1000.0,
+        )
+        return decode_article(payload) if payload is not None else None
+
+    async def classify_stream(
+        self,
+        article: ArticleContext,
+        stream: StreamClassifierContext,
+    ) -> StreamClassificationDecision | None:
+        payload = await asyncio.to_thread(
+            self._pool.call,
+            "classify_stream",
+            (encode_article(article), encode_stream(stream)),
+            timeout_seconds=self._timeouts_ms.get("stream_classifier", 3000) / 1000.0,
+        )
+        return decode_decision(payload)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown()
@@ -1,13 +1,13 @@
 import asyncio
 import logging
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
-from importlib import import_module
-from time import perf_counter
+from time import monotonic, perf_counter
 from typing import Any, TypeVar
 
 from sift.plugins.base import ArticleContext, StreamClassificationDecision, StreamClassifierContext
+from sift.plugins.isolation import ProcessIsolatedPlugin, ProcessPluginPool, resolve_plugin_class
 from sift.plugins.registry import PluginRegistryEntry
 from sift.plugins.telemetry import PluginMetricSample, PluginTelemetryCollector
 
@@ -40,6 +40,12 @@ class CapabilityRuntimeCounters:
     success_count: int = 0
     failure_count: int = 0
     timeout_count: int = 0
+    short_circuit_count: int = 0
+    consecutive_failures: int = 0
+    breaker_state: str = "closed"
+    breaker_opened_at: datetime | None = None
+    breaker_opened_monotonic: float = 0.0
+    breaker_probe_in_flight: bool = False
 
 
 @dataclass(slots=True)
@@ -55,6 +61,14 @@ class PluginRuntimeState:
     last_updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
+@dataclass(slots=True)
+class CircuitBreakerSnapshot:
+    state: str
+    consecutive_failures: int
+    short_circuit_count: int
+    opened_at: datetime | None
+
+
 @dataclass(slots=True)
 class PluginStatusSnapshot:
     plugin_id: str
@@ -66,21 +80,11 @@ class PluginStatusSnapshot:
     unavailable_reason: str | None
     runtime_counters: dict[str, dict[str, int]]
     last_updated_at: datetime
+    circuit_breakers: dict[str, CircuitBreakerSnapshot] = field(default_factory=dict)
 
 
 def _load_plugin(path: str) -> Any:
-    try:
-        module_path, class_name = path.split(":", maxsplit=1)
-    except ValueError as exc:
-        raise ValueError(f"Invalid plugin class path '{path}'. Expected 'module.path:ClassName'.") from exc
-
-    module = import_module(module_path)
-    try:
-        plugin_class = getattr(module, class_name)
-    except AttributeError as exc:
-        raise ValueError(f"Plugin class '{class_name}' not found in module '{module_path}'.") from exc
-
-    plugin: Any = plugin_class()
+    plugin: Any = resolve_plugin_class(path)()
     return plugin
 
 
@@ -103,6 +107,57 @@ def _new_runtime_state(entry: PluginRegistryEntry) -> PluginRuntimeState:
     )
 
 
+def _build_ingest_hook_layers(
+    plugins: list[LoadedPlugin],
+    declared_dependencies: dict[str, tuple[str, ...] | None],
+) -> list[list[LoadedPlugin]]:
+    hooks = [plugin for plugin in plugins if "ingest_hook" in plugin.capabilities]
+    hook_ids = {plugin.id for plugin in hooks}
+    dependencies_by_id: dict[str, list[str]] = {}
+    for index, plugin in enumerate(hooks):
+        declared = declared_dependencies.get(plugin.id)
+        if declared is None:
+            # Hooks without declared dependencies keep the sequential registry-order chain.
+            dependencies_by_id[plugin.id] = [earlier.id for earlier in hooks[:index]]
+        else:
+            dependencies_by_id[plugin.id] = [dependency for dependency in declared if dependency in hook_ids]
+
+    levels: dict[str, int] = {}
+
+    def level_of(plugin_id: str, visiting: frozenset[str]) -> int:
+        if plugin_id in levels:
+            return levels[plugin_id]
+        next_visiting = visiting | {plugin_id}
+        level = 1 + max(
+            (
+                level_of(dependency, next_visiting)
+                for dependency in dependencies_by_id[plugin_id]
+                if dependency not in next_visiting
+            ),
+            default=-1,
+        )
+        levels[plugin_id] = level
+        return level
+
+    layers: dict[int, list[LoadedPlugin]] = {}
+    for plugin in hooks:
+        layers.setdefault(level_of(plugin.id, frozenset()), []).append(plugin)
+    return [layers[level] for level in sorted(layers)]
+
+
+def _merge_hook_result(*, base: ArticleContext, merged: ArticleContext, result: ArticleContext) -> ArticleContext:
+    metadata = dict(merged.metadata)
+    for key, value in result.metadata.items():
+        if base.metadata.get(key) != value:
+            metadata[key] = value
+    return ArticleContext(
+        article_id=result.article_id if result.article_id != base.article_id else merged.article_id,
+        title=result.title if result.title != base.title else merged.title,
+        content_text=result.content_text if result.content_text != base.content_text else merged.content_text,
+        metadata=metadata,
+    )
+
+
 def _capability_contract_error(plugin: LoadedPlugin) -> str | None:
     for capability in plugin.capabilities:
         required_method = _CAPABILITY_METHODS.get(capability)
@@ -124,9 +179,16 @@ class PluginManager:
         timeout_discovery_ms: int = 5000,
         timeout_summary_ms: int = 5000,
         diagnostics_enabled: bool = True,
+        ingest_hook_concurrency: int = 8,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_timeout_ms: int = 30000,
         telemetry_collector: PluginTelemetryCollector | None = None,
     ) -> None:
         self._plugins: list[LoadedPlugin] = []
+        self._ingest_hook_layers: list[list[LoadedPlugin]] = []
+        self._ingest_hook_concurrency = max(1, ingest_hook_concurrency)
+        self._breaker_failure_threshold = max(0, breaker_failure_threshold)
+        self._breaker_reset_timeout_seconds = max(0, breaker_reset_timeout_ms) / 1000.0
         self._plugins_by_id: dict[str, LoadedPlugin] = {}
         self._runtime_states: dict[str, PluginRuntimeState] = {}
         self._state_order: list[str] = []
@@ -140,11 +202,13 @@ class PluginManager:
         self._telemetry = telemetry_collector or PluginTelemetryCollector()
 
     def load_from_registry(self, plugins: list[PluginRegistryEntry]) -> None:
+        self.shutdown()
         self._plugins = []
         self._plugins_by_id = {}
         self._runtime_states = {}
         self._state_order = []
         self._dispatch_failures_by_capability = {}
+        declared_dependencies: dict[str, tuple[str, ...] | None] = {}
 
         for entry in plugins:
             state = _new_runtime_state(entry)
@@ -157,8 +221,13 @@ class PluginManager:
                 state.last_updated_at = _now_utc()
                 continue
 
+            isolated = entry.backend.isolation == "process"
             try:
-                implementation = _load_plugin(entry.backend.class_path)
+                # Process-isolated plugins are only imported here for contract checks; workers instantiate them.
+                if isolated:
+                    implementation = resolve_plugin_class(entry.backend.class_path)
+                else:
+                    implementation = _load_plugin(entry.backend.class_path)
             except Exception as exc:  # noqa: BLE001
                 reason = str(exc)
                 state.startup_validation_status = "load_error"
@@ -204,16 +273,38 @@ class PluginManager:
                 )
                 continue
 
+            if isolated:
+                plugin.implementation = ProcessIsolatedPlugin(
+                    pool=ProcessPluginPool(
+                        plugin_id=entry.id,
+                        class_path=entry.backend.class_path,
+                        max_workers=entry.backend.workers,
+                        max_calls_per_worker=entry.backend.max_calls_per_worker,
+                    ),
+                    timeouts_ms=self._capability_timeouts_ms,
+                )
+
             state.startup_validation_status = "ok"
             state.loaded = True
             state.unavailable_reason = None
             state.last_updated_at = _now_utc()
             self._plugins.append(plugin)
             self._plugins_by_id[plugin.id] = plugin
+            declared_dependencies[plugin.id] = tuple(entry.depends_on) if entry.depends_on is not None else None
+
+        self._ingest_hook_layers = _build_ingest_hook_layers(self._plugins, declared_dependencies)
 
     def names(self) -> list[str]:
         return [plugin.id for plugin in self._plugins]
 
+    def shutdown(self) -> None:
+        for plugin in self._plugins:
+            if isinstance(plugin.implementation, ProcessIsolatedPlugin):
+                plugin.implementation.shutdown()
+
+    def ingest_hook_layers(self) -> list[list[str]]:
+        return [[plugin.id for plugin in layer] for layer in self._ingest_hook_layers]
+
     @property
     def diagnostics_enabled(self) -> bool:
         return self._diagnostics_enabled
@@ -230,6 +321,10 @@ class PluginManager:
             return
         counters = state.runtime_counters.setdefault(capability, CapabilityRuntimeCounters())
         counters.success_count += 1
+        counters.consecutive_failures = 0
+        counters.breaker_probe_in_flight = False
+        if counters.breaker_state != "closed":
+            self._transition_breaker(plugin_id=plugin_id, capability=capability, counters=counters, state="closed")
         state.last_updated_at = _now_utc()
         self._telemetry.record_invocation(
             plugin_id=plugin_id,
@@ -237,16 +332,17 @@ class PluginManager:
             result="success",
             duration_seconds=duration_ms / 1000.0,
         )
-        logger.info(
-            "plugin.dispatch.complete",
-            extra={
-                "event": "plugin.dispatch.complete",
-                "plugin_id": plugin_id,
-                "capability": capability,
-                "result": "success",
-                "duration_ms": duration_ms,
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "plugin.dispatch.complete",
+                extra={
+                    "event": "plugin.dispatch.complete",
+                    "plugin_id": plugin_id,
+                    "capability": capability,
+                    "result": "success",
+                    "duration_ms": duration_ms,
+                },
+            )
 
     def _record_failure(
         self,
@@ -265,6 +361,14 @@ class PluginManager:
             counters.timeout_count += 1
         else:
             counters.failure_count += 1
+        counters.consecutive_failures += 1
+        counters.breaker_probe_in_flight = False
+        if counters.breaker_state == "half_open" or (
+            counters.breaker_state == "closed"
+            and self._breaker_failure_threshold > 0
+            and counters.consecutive_failures >= self._breaker_failure_threshold
+        ):
+            self._transition_breaker(plugin_id=plugin_id, capability=capability, counters=counters, state="open")
         state.last_error = str(error)
         state.last_updated_at = _now_utc()
         self._dispatch_failures_by_capability[capability] = self._dispatch_failures_by_capability.get(capability, 0) + 1
@@ -292,6 +396,70 @@ class PluginManager:
             },
         )
 
+    def _transition_breaker(
+        self,
+        *,
+        plugin_id: str,
+        capability: str,
+        counters: CapabilityRuntimeCounters,
+        state: str,
+    ) -> None:
+        previous_state = counters.breaker_state
+        counters.breaker_state = state
+        if state == "open":
+            counters.breaker_opened_at = _now_utc()
+            counters.breaker_opened_monotonic = monotonic()
+        elif state == "closed":
+            counters.breaker_opened_at = None
+        self._telemetry.record_breaker_state(plugin_id=plugin_id, capability=capability, state=state)
+        event_name = f"plugin.breaker.{state}"
+        log = logger.warning if state == "open" else logger.info
+        log(
+            event_name,
+            extra={
+                "event": event_name,
+                "plugin_id": plugin_id,
+                "capability": capability,
+                "result": state,
+                "previous_state": previous_state,
+                "consecutive_failures": counters.consecutive_failures,
+            },
+        )
+
+    def _breaker_allows_call(self, *, plugin_id: str, capability: str) -> bool:
+        if self._breaker_failure_threshold <= 0:
+            return True
+        state = self._runtime_states.get(plugin_id)
+        if state is None:
+            return True
+        counters = state.runtime_counters.setdefault(capability, CapabilityRuntimeCounters())
+        if counters.breaker_state == "closed":
+            return True
+        if counters.breaker_state == "open":
+            if monotonic() - counters.breaker_opened_monotonic < self._breaker_reset_timeout_seconds:
+                return False
+            self._transition_breaker(plugin_id=plugin_id, capability=capability, counters=counters, state="half_open")
+        # Half-open admits a single probe; concurrent callers keep failing fast until it settles.
+        if counters.breaker_probe_in_flight:
+            return False
+        counters.breaker_probe_in_flight = True
+        return True
+
+    def _record_short_circuit(self, *, plugin_id: str, capability: str) -> None:
+        state = self._runtime_states.get(plugin_id)
+        if state is not None:
+            counters = state.runtime_counters.setdefault(capability, CapabilityRuntimeCounters())
+            counters.short_circuit_count += 1
+        self._telemetry.record_short_circuit(plugin_id=plugin_id, capability=capability)
+
+    def _release_breaker_probe(self, *, plugin_id: str, capability: str) -> None:
+        state = self._runtime_states.get(plugin_id)
+        if state is None:
+            return
+        counters = state.runtime_counters.get(capability)
+        if counters is not None:
+            counters.breaker_probe_in_flight = False
+
     async def _invoke_plugin(
         self,
         *,
@@ -299,20 +467,33 @@ class PluginManager:
         capability: str,
         callback: Callable[[], Awaitable[_T]],
     ) -> _T | None:
+        if not self._breaker_allows_call(plugin_id=plugin.id, capability=capability):
+            self._record_short_circuit(plugin_id=plugin.id, capability=capability)
+            return None
+
         start_time = perf_counter()
-        logger.info(
-            "plugin.dispatch.start",
-            extra={
-                "event": "plugin.dispatch.start",
-                "plugin_id": plugin.id,
-                "capability": capability,
-                "result": "started",
-                "duration_ms": 0,
-            },
-        )
+        # Success-path dispatch events are DEBUG-only; aggregate counts live in the telemetry collector.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "plugin.dispatch.start",
+                extra={
+                    "event": "plugin.dispatch.start",
+                    "plugin_id": plugin.id,
+                    "capability": capability,
+                    "result": "started",
+                    "duration_ms": 0,
+                },
+            )
         timeout_ms = self._capability_timeouts_ms.get(capability, 1000)
         try:
-            result = await asyncio.wait_for(callback(), timeout=timeout_ms / 1000.0)
+            if isinstance(plugin.implementation, ProcessIsolatedPlugin):
+                # The worker pool enforces the call timeout itself (killing hung workers) and excludes spawn time.
+                result = await callback()
+            else:
+                result = await asyncio.wait_for(callback(), timeout=timeout_ms / 1000.0)
+        except asyncio.CancelledError:
+            self._release_breaker_probe(plugin_id=plugin.id, capability=capability)
+            raise
         except TimeoutError as exc:
             duration_ms = int((perf_counter() - start_time) * 1000)
             self._record_failure(
@@ -351,6 +532,15 @@ class PluginManager:
                 }
                 for capability, counters in state.runtime_counters.items()
             }
+            circuit_breakers = {
+                capability: CircuitBreakerSnapshot(
+                    state=counters.breaker_state,
+                    consecutive_failures=counters.consecutive_failures,
+                    short_circuit_count=counters.short_circuit_count,
+                    opened_at=counters.breaker_opened_at,
+                )
+                for capability, counters in state.runtime_counters.items()
+            }
             snapshots.append(
                 PluginStatusSnapshot(
                     plugin_id=state.plugin_id,
@@ -362,35 +552,63 @@ class PluginManager:
                     unavailable_reason=state.unavailable_reason,
                     runtime_counters=runtime_counters,
                     last_updated_at=state.last_updated_at,
+                    circuit_breakers=circuit_breakers,
                 )
             )
         return snapshots
 
     async def run_ingested_hooks(self, article: ArticleContext) -> ArticleContext:
         current = article
-        for plugin in self._plugins:
-            if "ingest_hook" not in plugin.capabilities:
+        for layer in self._ingest_hook_layers:
+            if len(layer) == 1:
+                next_context = await self._invoke_ingest_hook(layer[0], current)
+                if isinstance(next_context, ArticleContext):
+                    current = next_context
                 continue
-            on_article_ingested = getattr(plugin.implementation, "on_article_ingested", None)
-            if callable(on_article_ingested):
-                handler = on_article_ingested
-                context = current
-
-                async def ingest_callback(
-                    handler: Callable[[ArticleContext], Awaitable[ArticleContext]] = handler,
-                    context: ArticleContext = context,
-                ) -> ArticleContext:
-                    return await handler(context)
-
-                next_context = await self._invoke_plugin(
-                    plugin=plugin,
-                    capability="ingest_hook",
-                    callback=ingest_callback,
+
+            # Each hook gets its own copy so in-place edits neither leak to its siblings nor change the base the
+            # results are diffed against.
+            results = await asyncio.gather(
+                *(
+                    self._invoke_ingest_hook(plugin, replace(current, metadata=dict(current.metadata)))
+                    for plugin in layer
                 )
+            )
+            merged = current
+            for next_context in results:
                 if isinstance(next_context, ArticleContext):
-                    current = next_context
+                    merged = _merge_hook_result(base=current, merged=merged, result=next_context)
+            current = merged
         return current
 
+    async def run_ingested_hooks_batch(self, articles: list[ArticleContext]) -> list[ArticleContext]:
+        if not self._ingest_hook_layers:
+            return list(articles)
+        semaphore = asyncio.Semaphore(self._ingest_hook_concurrency)
+
+        async def run_one(article: ArticleContext) -> ArticleContext:
+            async with semaphore:
+                return await self.run_ingested_hooks(article)
+
+        return list(await asyncio.gather(*(run_one(article) for article in articles)))
+
+    async def _invoke_ingest_hook(self, plugin: LoadedPlugin, context: ArticleContext) -> ArticleContext | None:
+        on_article_ingested = getattr(plugin.implementation, "on_article_ingested", None)
+        if not callable(on_article_ingested):
+            return None
+        handler = on_article_ingested
+
+        async def ingest_callback(
+            handler: Callable[[ArticleContext], Awaitable[ArticleContext]] = handler,
+        ) -> ArticleContext:
+            return await handler(context)
+
+        return await self._invoke_plugin(
+            plugin=plugin,
+            capability="ingest_hook",
+            callback=ingest_callback,
+        )
+
     async def classify_stream(
         self,
         *,
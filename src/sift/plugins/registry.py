@@ -1,7 +1,7 @@
 import logging
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml  # type: ignore[import-untyped]
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
@@ -46,6 +46,9 @@ class PluginBackendConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     class_path: str = Field(min_length=3)
+    isolation: Literal["inline", "process"] = "inline"
+    workers: int = Field(default=1, ge=1, le=64)
+    max_calls_per_worker: int = Field(default=1000, ge=1)
 
 
 class PluginUIAreaConfig(BaseModel):
@@ -70,6 +73,7 @@ class PluginRegistryEntry(BaseModel):
     enabled: bool = True
     backend: PluginBackendConfig
     capabilities: list[str] = Field(default_factory=list)
+    depends_on: list[str] | None = None
     ui: PluginUIConfig | None = None
     settings: dict[str, Any] = Field(default_factory=dict)
 
@@ -113,12 +117,54 @@ class PluginRegistry(BaseModel):
             if entry.id in seen:
                 raise ValueError(f"Duplicate plugin id '{entry.id}'")
             seen.add(entry.id)
+        dependency_errors = _collect_dependency_errors(self.plugins)
+        if dependency_errors:
+            raise ValueError("; ".join(dependency_errors))
         return self
 
     def enabled_plugins(self) -> list[PluginRegistryEntry]:
         return [entry for entry in self.plugins if entry.enabled]
 
 
+def _collect_dependency_errors(plugins: list[PluginRegistryEntry]) -> list[str]:
+    known_ids = {entry.id for entry in plugins}
+    graph: dict[str, list[str]] = {}
+    errors: list[str] = []
+    for entry in plugins:
+        dependencies = entry.depends_on or []
+        for dependency in dependencies:
+            if dependency == entry.id:
+                errors.append(f"plugin '{entry.id}' cannot depend on itself")
+            elif dependency not in known_ids:
+                errors.append(f"plugin '{entry.id}' depends on unknown plugin '{dependency}'")
+        graph[entry.id] = [dependency for dependency in dependencies if dependency in known_ids]
+    if errors:
+        return errors
+
+    visiting: set[str] = set()
+    visited: set[str] = set()
+
+    def visit(plugin_id: str, path: list[str]) -> str | None:
+        if plugin_id in visited:
+            return None
+        if plugin_id in visiting:
+            return " -> ".join([*path[path.index(plugin_id) :], plugin_id])
+        visiting.add(plugin_id)
+        for dependency in graph.get(plugin_id, []):
+            found = visit(dependency, [*path, plugin_id])
+            if found:
+                return found
+        visiting.discard(plugin_id)
+        visited.add(plugin_id)
+        return None
+
+    for entry in plugins:
+        cycle = visit(entry.id, [])
+        if cycle:
+            return [f"plugin dependency cycle detected: {cycle}"]
+    return []
+
+
 def _collect_sensitive_settings_errors(*, settings: dict[str, Any], path: str) -> list[str]:
     errors: list[str] = []
     for key, value in settings.items():
@@ -1,24 +1,41 @@
 from collections import defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from threading import Lock
 from typing import Final
 
+from sift.observability.histogram import (
+    HistogramSample,
+    HistogramSeries,
+    bucket_index,
+    escape_label_value,
+    parse_buckets,
+    render_histogram_lines,
+    to_sample,
+)
+
 _ALLOWED_RESULTS: Final[frozenset[str]] = frozenset({"success", "failure", "timeout"})
 
 _METRIC_HELP: Final[dict[str, str]] = {
     "sift_plugin_invocations_total": "Total plugin invocations by plugin, capability, and result.",
-    "sift_plugin_invocation_duration_seconds": "Total plugin invocation duration in seconds by result.",
+    "sift_plugin_invocation_duration_seconds": "Plugin invocation duration in seconds by plugin, capability, and result.",
     "sift_plugin_timeouts_total": "Total plugin timeouts by plugin and capability.",
     "sift_plugin_dispatch_failures_total": "Total plugin dispatch failures by capability.",
+    "sift_plugin_short_circuits_total": "Total plugin calls skipped by an open circuit breaker.",
+    "sift_plugin_breaker_state": "Plugin circuit breaker state (0=closed, 1=half_open, 2=open).",
 }
 
 _METRIC_TYPE: Final[dict[str, str]] = {
     "sift_plugin_invocations_total": "counter",
-    "sift_plugin_invocation_duration_seconds": "counter",
+    "sift_plugin_invocation_duration_seconds": "histogram",
     "sift_plugin_timeouts_total": "counter",
     "sift_plugin_dispatch_failures_total": "counter",
+    "sift_plugin_short_circuits_total": "counter",
+    "sift_plugin_breaker_state": "gauge",
 }
 
+_BREAKER_STATE_VALUES: Final[dict[str, int]] = {"closed": 0, "half_open": 1, "open": 2}
+
 
 @dataclass(frozen=True, slots=True)
 class PluginMetricSample:
@@ -27,11 +44,14 @@ class PluginMetricSample:
 
 
 class PluginTelemetryCollector:
-    def __init__(self) -> None:
+    def __init__(self, *, duration_buckets: str | Sequence[float] | None = None) -> None:
+        self._bucket_bounds = parse_buckets(duration_buckets)
         self._invocations_total: dict[tuple[str, str, str], int] = defaultdict(int)
-        self._invocation_duration_seconds: dict[tuple[str, str, str], float] = defaultdict(float)
+        self._invocation_duration_seconds: dict[tuple[str, str, str], HistogramSeries] = {}
         self._timeouts_total: dict[tuple[str, str], int] = defaultdict(int)
         self._dispatch_failures_total: dict[str, int] = defaultdict(int)
+        self._short_circuits_total: dict[tuple[str, str], int] = defaultdict(int)
+        self._breaker_state: dict[tuple[str, str], int] = {}
         self._lock = Lock()
 
     def record_invocation(self, *, plugin_id: str, capability: str, result: str, duration_seconds: float) -> None:
@@ -40,10 +60,17 @@ class PluginTelemetryCollector:
             raise ValueError(f"Unsupported plugin telemetry result '{result}'")
 
         safe_duration = max(0.0, duration_seconds)
+        index = bucket_index(self._bucket_bounds, safe_duration)
         key = (plugin_id, capability, normalized_result)
         with self._lock:
             self._invocations_total[key] += 1
-            self._invocation_duration_seconds[key] += safe_duration
+            series = self._invocation_duration_seconds.get(key)
+            if series is None:
+                series = HistogramSeries(len(self._bucket_bounds))
+                self._invocation_duration_seconds[key] = series
+            series.counts[index] += 1
+            series.sum += safe_duration
+            series.count += 1
 
     def record_timeout(self, *, plugin_id: str, capability: str) -> None:
         key = (plugin_id, capability)
@@ -54,12 +81,29 @@ class PluginTelemetryCollector:
         with self._lock:
             self._dispatch_failures_total[capability] += 1
 
+    def record_short_circuit(self, *, plugin_id: str, capability: str) -> None:
+        key = (plugin_id, capability)
+        with self._lock:
+            self._short_circuits_total[key] += 1
+
+    def record_breaker_state(self, *, plugin_id: str, capability: str, state: str) -> None:
+        value = _BREAKER_STATE_VALUES.get(state)
+        if value is None:
+            raise ValueError(f"Unsupported plugin breaker state '{state}'")
+        with self._lock:
+            self._breaker_state[(plugin_id, capability)] = value
+
     def snapshot(self) -> dict[str, list[PluginMetricSample]]:
         with self._lock:
             invocations = sorted(self._invocations_total.items(), key=lambda item: item[0])
-            durations = sorted(self._invocation_duration_seconds.items(), key=lambda item: item[0])
+            durations = sorted(
+                ((key, series.sum) for key, series in self._invocation_duration_seconds.items()),
+                key=lambda item: item[0],
+            )
             timeouts = sorted(self._timeouts_total.items(), key=lambda item: item[0])
             failures = sorted(self._dispatch_failures_total.items(), key=lambda item: item[0])
+            short_circuits = sorted(self._short_circuits_total.items(), key=lambda item: item[0])
+            breaker_states = sorted(self._breaker_state.items(), key=lambda item: item[0])
 
         return {
             "sift_plugin_invocations_total": [
@@ -90,17 +134,50 @@ class PluginTelemetryCollector:
                 )
                 for capability, value in failures
             ],
+            "sift_plugin_short_circuits_total": [
+                PluginMetricSample(
+                    labels={"plugin_id": plugin_id, "capability": capability},
+                    value=float(value),
+                )
+                for (plugin_id, capability), value in short_circuits
+            ],
+            "sift_plugin_breaker_state": [
+                PluginMetricSample(
+                    labels={"plugin_id": plugin_id, "capability": capability},
+                    value=float(value),
+                )
+                for (plugin_id, capability), value in breaker_states
+            ],
         }
 
+    def histogram_snapshot(self) -> dict[str, list[HistogramSample]]:
+        with self._lock:
+            return {
+                "sift_plugin_invocation_duration_seconds": [
+                    to_sample(
+                        {"plugin_id": plugin_id, "capability": capability, "result": result},
+                        self._bucket_bounds,
+                        series,
+                    )
+                    for (plugin_id, capability, result), series in sorted(
+                        self._invocation_duration_seconds.items(), key=lambda item: item[0]
+                    )
+                ]
+            }
+
     def render_prometheus(self) -> str:
         snapshot = self.snapshot()
+        histograms = self.histogram_snapshot()
         lines: list[str] = []
         for metric_name in _METRIC_HELP:
             lines.append(f"# HELP {metric_name} {_METRIC_HELP[metric_name]}")
             lines.append(f"# TYPE {metric_name} {_METRIC_TYPE[metric_name]}")
+            if _METRIC_TYPE[metric_name] == "histogram":
+                lines.extend(render_histogram_lines(metric_name, histograms.get(metric_name, [])))
+                continue
             for sample in snapshot.get(metric_name, []):
                 labels = ",".join(
-                    f'{label_key}="{_escape_label_value(label_value)}"'
+                    f'{label_key}="{escape_label_value(label_value)}"'
                     for label_key, label_value in sorted(sample.labels.items())
                 )
                 if labels:
@@ -108,7 +185,3 @@ class PluginTelemetryCollector:
                 else:
                     lines.append(f"{metric_name} {sample.value}")
         return "\n".join(lines) + "\n"
-
-
-def _escape_label_value(value: str) -> str:
-    return value.replace("\\", "\\\\").replace('"', '\\"')
@@ -14,10 +14,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sift.db.models import Article, ArticleFulltext, Feed
 from sift.domain.schemas import ArticleFulltextFetchOut
 from sift.services.article_service import ArticleNotFoundError
+from sift.services.download_service import DownloadAbortedError, download_limited
 
 _ALLOWED_SCHEMES: Final[frozenset[str]] = frozenset({"http", "https"})
 _FETCH_TIMEOUT_SECONDS: Final[float] = 20.0
 _MAX_RESPONSE_BYTES: Final[int] = 2_000_000
+_READ_DEADLINE_SECONDS: Final[float] = 30.0
 _EXTRACTOR_NAME: Final[str] = "builtin_simple_html_v1"
 FulltextStatus = Literal["idle", "pending", "succeeded", "failed"]
 
@@ -91,28 +93,35 @@ class ArticleFulltextService:
         return result.scalar_one_or_none()
 
     async def _fetch_source_page(self, url: str) -> tuple[str, str]:
-        async with httpx.AsyncClient(timeout=_FETCH_TIMEOUT_SECONDS, follow_redirects=True) as client:
-            response = await client.get(url, headers={"User-Agent": "sift-fulltext-fetch/1.0"})
+        try:
+            async with httpx.AsyncClient(timeout=_FETCH_TIMEOUT_SECONDS, follow_redirects=True) as client:
+                response = await download_limited(
+                    client,
+                    url,
+                    source="fulltext",
+                    headers={"User-Agent": "sift-fulltext-fetch/1.0"},
+                    max_bytes=_MAX_RESPONSE_BYTES,
+                    read_deadline_seconds=_READ_DEADLINE_SECONDS,
+                    allowed_content_types=("text/html",),
+                )
+        except DownloadAbortedError as exc:
+            if exc.reason == "content_type":
+                raise ArticleFulltextValidationError("Source response is not HTML content.") from exc
+            if exc.reason == "deadline":
+                raise ArticleFulltextValidationError("Source response exceeded read deadline.") from exc
+            raise ArticleFulltextValidationError("Source response exceeded size limit.") from exc
 
         if response.status_code != 200:
             raise ArticleFulltextValidationError(
                 f"Unexpected status {response.status_code} while fetching source page."
             )
 
-        content_type = (response.headers.get("Content-Type") or "").lower()
-        if content_type and "text/html" not in content_type:
-            raise ArticleFulltextValidationError("Source response is not HTML content.")
-
-        body = response.content
-        if len(body) > _MAX_RESPONSE_BYTES:
-            raise ArticleFulltextValidationError("Source response exceeded size limit.")
-
         try:
-            payload = body.decode(response.encoding or "utf-8", errors="replace")
+            payload = response.content.decode(response.charset_encoding or "utf-8", errors="replace")
         except LookupError as exc:
             raise ArticleFulltextValidationError(f"Unsupported response encoding: {exc}") from exc
 
-        return str(response.url), payload
+        return response.url, payload
 
     async def _get_visible_article(self, *, session: AsyncSession, user_id: UUID, article_id: UUID) -> Article:
         query = (
@@ -8,6 +8,7 @@ from sqlalchemy import Select, and_, exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.db.models import Article, ArticleFulltext, ArticleState, Feed, KeywordStream, KeywordStreamMatch
+from sift.db.partitioning import article_published_since
 from sift.domain.schemas import ArticleDetailOut, ArticleListItemOut, ArticleListResponse, ArticleStateOut
 from sift.search.query_language import SearchQuerySyntaxError, parse_search_query, requires_advanced_search
 
@@ -82,7 +83,7 @@ def _state_filter(
         return and_(
             read_expr.is_(False),
             archived_expr.is_(False),
-            func.coalesce(Article.published_at, Article.created_at) >= threshold,
+            article_published_since(threshold),
         )
     if state == "recent":
         threshold = now - timedelta(days=7)
@@ -119,7 +120,6 @@ class ArticleService:
         *,
         user_id: UUID,
     ) -> tuple[Select[tuple[Article, str, bool, bool, bool]], _ListContext]:
-        state_user_key = str(user_id)
         read_expr = func.coalesce(ArticleState.is_read, False)
         starred_expr = func.coalesce(ArticleState.is_starred, False)
         archived_expr = func.coalesce(ArticleState.is_archived, False)
@@ -134,7 +134,7 @@ class ArticleService:
             .join(Feed, Feed.id == Article.feed_id)
             .outerjoin(
                 ArticleState,
-                and_(ArticleState.article_id == Article.id, ArticleState.user_id == state_user_key),
+                and_(ArticleState.article_id == Article.id, ArticleState.user_id == user_id),
             )
             .where(Feed.owner_id == user_id)
         )
@@ -195,7 +195,7 @@ class ArticleService:
                 .join(Feed, Feed.id == Article.feed_id)
                 .outerjoin(
                     ArticleState,
-                    and_(ArticleState.article_id == Article.id, ArticleState.user_id == str(user_id)),
+                    and_(ArticleState.article_id == Article.id, ArticleState.user_id == user_id),
                 )
                 .where(Feed.owner_id == user_id, *filters)
             )
@@ -354,7 +354,7 @@ class ArticleService:
             return 0
 
         existing_query = select(ArticleState).where(
-            ArticleState.user_id == str(user_id),
+            ArticleState.user_id == user_id,
             ArticleState.article_id.in_(visible_ids),
         )
         existing_rows = await session.execute(existing_query)
@@ -364,7 +364,7 @@ class ArticleService:
             state = state_by_article_id.get(article_id)
             if state is None:
                 state = ArticleState(
-                    user_id=str(user_id),
+                    user_id=user_id,
                     article_id=article_id,
                     is_read=False,
                     is_starred=False,
@@ -434,7 +434,7 @@ class ArticleService:
                 .join(Feed, Feed.id == Article.feed_id)
                 .outerjoin(
                     ArticleState,
-                    and_(ArticleState.article_id == Article.id, ArticleState.user_id == str(user_id)),
+                    and_(ArticleState.article_id == Article.id, ArticleState.user_id == user_id),
                 )
                 .where(Feed.owner_id == user_id, *filters)
             )
@@ -523,7 +523,7 @@ class ArticleService:
         article_id: UUID,
     ) -> ArticleState:
         query = select(ArticleState).where(
-            ArticleState.user_id == str(user_id),
+            ArticleState.user_id == user_id,
             ArticleState.article_id == article_id,
         )
         result = await session.execute(query)
@@ -532,7 +532,7 @@ class ArticleService:
             return state
 
         state = ArticleState(
-            user_id=str(user_id),
+            user_id=user_id,
             article_id=article_id,
             is_read=False,
             is_starred=False,
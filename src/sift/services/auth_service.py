@@ -1,18 +1,33 @@
+import asyncio
 import hashlib
+import logging
 import secrets
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from threading import Lock
+from time import monotonic
+from typing import Final, TypeVar
+from uuid import UUID
 
 from argon2 import PasswordHasher
 from argon2.exceptions import InvalidHashError, VerifyMismatchError
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.config import get_settings
 from sift.db.models import AuthIdentity, User, UserSession
 
+logger = logging.getLogger(__name__)
+
 LOCAL_PROVIDER = "local"
-_password_hasher = PasswordHasher()
+
+_SESSION_CACHE_MAX_ENTRIES: Final[int] = 10_000
+
+_T = TypeVar("_T")
 
 
 class AuthError(Exception):
@@ -35,18 +50,134 @@ def hash_session_token(raw_token: str) -> str:
     return hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
 
 
+@lru_cache(maxsize=4)
+def _build_password_hasher(time_cost: int, memory_cost: int, parallelism: int) -> PasswordHasher:
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+def _password_hasher() -> PasswordHasher:
+    settings = get_settings()
+    return _build_password_hasher(
+        settings.auth_argon2_time_cost,
+        settings.auth_argon2_memory_cost_kib,
+        settings.auth_argon2_parallelism,
+    )
+
+
 def hash_password(password: str) -> str:
-    return _password_hasher.hash(password)
+    return _password_hasher().hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     try:
-        return _password_hasher.verify(password_hash, password)
+        return _password_hasher().verify(password_hash, password)
     except (VerifyMismatchError, InvalidHashError):
         return False
 
 
+def password_needs_rehash(password_hash: str) -> bool:
+    try:
+        return _password_hasher().check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return True
+
+
+def _normalize_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+@dataclass(slots=True)
+class _CachedSession:
+    session_id: UUID
+    user_id: UUID
+    expires_at: datetime
+    cached_at: float
+    last_seen_written_at: float
+
+
+class SessionLookupCache:
+    def __init__(self, *, max_entries: int = _SESSION_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: dict[str, _CachedSession] = {}
+
+    def get(self, token_hash: str, *, ttl_seconds: float, now: datetime) -> _CachedSession | None:
+        entry = self._entries.get(token_hash)
+        if entry is None:
+            return None
+        if monotonic() - entry.cached_at >= ttl_seconds or entry.expires_at <= now:
+            self._entries.pop(token_hash, None)
+            return None
+        return entry
+
+    def put(self, token_hash: str, entry: _CachedSession) -> None:
+        self._entries.pop(token_hash, None)
+        while len(self._entries) >= self._max_entries:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[token_hash] = entry
+
+    def invalidate(self, token_hash: str) -> None:
+        self._entries.pop(token_hash, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _verify_password_and_rehash(password: str, password_hash: str) -> tuple[bool, bool]:
+    if not verify_password(password, password_hash):
+        return False, False
+    return True, password_needs_rehash(password_hash)
+
+
+class PasswordHashExecutor:
+    def __init__(self) -> None:
+        self._executor: ThreadPoolExecutor | None = None
+        self._max_workers: int | None = None
+        self._lock = Lock()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, password_hash: str) -> tuple[bool, bool]:
+        return await self._run(_verify_password_and_rehash, password, password_hash)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._max_workers = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., _T], *args: str) -> _T:
+        max_workers = get_settings().auth_password_hash_max_workers
+        if max_workers <= 0:
+            return func(*args)
+        # argon2 releases the GIL, so a small pool keeps CPU-heavy hashing off the event loop and caps its concurrency.
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(max_workers), func, *args)
+
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is not None and self._max_workers == max_workers:
+                return self._executor
+            stale = self._executor
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sift-password-hash")
+            self._max_workers = max_workers
+            executor = self._executor
+        if stale is not None:
+            stale.shutdown(wait=False)
+        return executor
+
+
+password_hash_executor = PasswordHashExecutor()
+
+
 class AuthService:
+    def __init__(self) -> None:
+        self.session_cache = SessionLookupCache()
+
     async def register_local_user(
         self,
         session: AsyncSession,
@@ -70,7 +201,7 @@ class AuthService:
             provider=LOCAL_PROVIDER,
             provider_user_id=normalized_email,
             provider_email=normalized_email,
-            password_hash=hash_password(password),
+            password_hash=await password_hash_executor.hash(password),
         )
         session.add(identity)
         await session.commit()
@@ -95,10 +226,28 @@ class AuthService:
         user, identity = row
         if not user.is_active:
             raise AuthenticationError("Account is disabled")
-        if not identity.password_hash or not verify_password(password, identity.password_hash):
+        if not identity.password_hash:
+            raise AuthenticationError("Invalid credentials")
+        valid, needs_rehash = await password_hash_executor.verify(password, identity.password_hash)
+        if not valid:
             raise AuthenticationError("Invalid credentials")
+        if needs_rehash:
+            await self._rehash_password(session, identity=identity, password=password)
         return user
 
+    async def _rehash_password(self, session: AsyncSession, *, identity: AuthIdentity, password: str) -> None:
+        # Upgrading the stored hash to the current argon2 parameters is best effort; login proceeds regardless.
+        identity.password_hash = await password_hash_executor.hash(password)
+        try:
+            await session.commit()
+        except SQLAlchemyError:
+            await session.rollback()
+            return
+        logger.info(
+            "auth.password.rehashed",
+            extra={"event": "auth.password.rehashed", "user_id": str(identity.user_id)},
+        )
+
     async def create_session(
         self,
         session: AsyncSession,
@@ -124,8 +273,30 @@ class AuthService:
         return raw_token
 
     async def get_user_by_session_token(self, session: AsyncSession, raw_token: str) -> User | None:
+        settings = get_settings()
         token_hash = hash_session_token(raw_token)
         now = datetime.now(UTC)
+        cache_ttl_seconds = settings.auth_session_cache_ttl_seconds
+        last_seen_interval_seconds = settings.auth_session_last_seen_interval_seconds
+
+        if cache_ttl_seconds > 0:
+            cached = self.session_cache.get(token_hash, ttl_seconds=cache_ttl_seconds, now=now)
+            if cached is not None:
+                # Only the session's validity is cached; the user row is loaded so callers get a persistent
+                # instance with current flags.
+                try:
+                    cached_user = await session.get(User, cached.user_id)
+                except SQLAlchemyError:
+                    await session.rollback()
+                    return None
+                if cached_user is None or not cached_user.is_active:
+                    self.session_cache.invalidate(token_hash)
+                    return None
+                if monotonic() - cached.last_seen_written_at >= last_seen_interval_seconds:
+                    # Claim the write before awaiting so concurrent hits on this session do not repeat it.
+                    cached.last_seen_written_at = monotonic()
+                    await self._touch_session(session, session_id=cached.session_id, now=now)
+                return cached_user
 
         query = (
             select(User, UserSession)
@@ -147,15 +318,39 @@ class AuthService:
             return None
 
         user, user_session = row
-        user_session.last_seen_at = now
+        last_seen_age = (now - _normalize_utc(user_session.last_seen_at)).total_seconds()
+        if last_seen_age >= last_seen_interval_seconds:
+            user_session.last_seen_at = now
+            last_seen_age = 0.0
+            try:
+                await session.commit()
+            except SQLAlchemyError:
+                await session.rollback()
+                return None
+
+        if cache_ttl_seconds > 0:
+            self.session_cache.put(
+                token_hash,
+                _CachedSession(
+                    session_id=user_session.id,
+                    user_id=user.id,
+                    expires_at=_normalize_utc(user_session.expires_at),
+                    cached_at=monotonic(),
+                    last_seen_written_at=monotonic() - last_seen_age,
+                ),
+            )
+        return user
+
+    async def _touch_session(self, session: AsyncSession, *, session_id: UUID, now: datetime) -> None:
         try:
+            await session.execute(update(UserSession).where(UserSession.id == session_id).values(last_seen_at=now))
             await session.commit()
         except SQLAlchemyError:
             await session.rollback()
-        return user
 
     async def revoke_session(self, session: AsyncSession, raw_token: str) -> None:
         token_hash = hash_session_token(raw_token)
+        self.session_cache.invalidate(token_hash)
         query = select(UserSession).where(
             UserSession.session_token_hash == token_hash,
             UserSession.revoked_at.is_(None),
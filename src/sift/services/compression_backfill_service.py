@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import LargeBinary, select, type_coerce, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from sift.config import Settings
+from sift.db.models import ArticleFulltext, RawEntry
+from sift.db.types import compress_text, decompress_text, is_compressed
+
+logger = logging.getLogger(__name__)
+
+_BACKFILL_COLUMNS: tuple[tuple[Any, InstrumentedAttribute[Any]], ...] = (
+    (RawEntry, RawEntry.payload),
+    (ArticleFulltext, ArticleFulltext.content_text),
+    (ArticleFulltext, ArticleFulltext.content_html),
+)
+
+
+@dataclass(slots=True)
+class CompressionBackfillStats:
+    column: str
+    scanned: int = 0
+    rewritten: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+
+def _stored_size(value: bytes | memoryview | str) -> int:
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return len(value)
+
+
+class CompressionBackfillService:
+    async def backfill(
+        self,
+        session: AsyncSession,
+        *,
+        settings: Settings,
+        batch_size: int = 500,
+        batch_pause_seconds: float = 0.05,
+    ) -> list[CompressionBackfillStats]:
+        return [
+            await self._backfill_column(
+                session,
+                model=model,
+                column=column,
+                settings=settings,
+                batch_size=max(1, batch_size),
+                batch_pause_seconds=max(0.0, batch_pause_seconds),
+            )
+            for model, column in _BACKFILL_COLUMNS
+        ]
+
+    async def _backfill_column(
+        self,
+        session: AsyncSession,
+        *,
+        model: Any,
+        column: InstrumentedAttribute[Any],
+        settings: Settings,
+        batch_size: int,
+        batch_pause_seconds: float,
+    ) -> CompressionBackfillStats:
+        stats = CompressionBackfillStats(column=f"{model.__tablename__}.{column.key}")
+        # Read the stored bytes directly so rows already compressed are skipped without a decompress round trip.
+        raw_value = type_coerce(column, LargeBinary)
+        last_id = None
+        while True:
+            query = select(model.id, raw_value).where(column.is_not(None)).order_by(model.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(model.id > last_id)
+            rows = (await session.execute(query)).all()
+            if not rows:
+                return stats
+
+            for row_id, stored in rows:
+                stats.scanned += 1
+                if is_compressed(stored):
+                    continue
+                text = decompress_text(stored)
+                encoded = compress_text(
+                    text,
+                    codec=settings.storage_compression,
+                    level=settings.storage_compression_level,
+                    min_bytes=settings.storage_compression_min_bytes,
+                )
+                # SQLite rows still stored as TEXT are rewritten even when too small to compress.
+                if not is_compressed(encoded) and not isinstance(stored, str):
+                    continue
+                await session.execute(
+                    update(model)
+                    .where(model.id == row_id)
+                    .values({column.key: text})
+                    .execution_options(synchronize_session=False)
+                )
+                stats.rewritten += 1
+                stats.bytes_before += _stored_size(stored)
+                stats.bytes_after += len(encoded)
+
+            await session.commit()
+            last_id = rows[-1][0]
+            logger.info(
+                "storage.compression.backfill.batch",
+                extra={
+                    "event": "storage.compression.backfill.batch",
+                    "column": stats.column,
+                    "scanned": stats.scanned,
+                    "rewritten": stats.rewritten,
+                    "bytes_before": stats.bytes_before,
+                    "bytes_after": stats.bytes_after,
+                },
+            )
+            if len(rows) < batch_size:
+                return stats
+            await asyncio.sleep(batch_pause_seconds)
+
+
+compression_backfill_service = CompressionBackfillService()
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Final
+
+import httpx
+
+from sift.observability.metrics import get_observability_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DECOMPRESSION_RATIO: Final[int] = 100
+# Small compressed bodies legitimately expand a lot; only apply the ratio guard past this decoded size.
+_RATIO_GUARD_MIN_BYTES: Final[int] = 1_000_000
+
+
+class DownloadAbortedError(Exception):
+    def __init__(self, message: str, *, reason: str) -> None:
+        super().__init__(message)
+        self.reason = reason
+
+
+@dataclass(slots=True)
+class LimitedResponse:
+    status_code: int
+    url: str
+    headers: Mapping[str, str] = field(default_factory=dict)
+    content: bytes = b""
+    charset_encoding: str | None = None
+    redirect_statuses: tuple[int, ...] = ()
+
+
+def _abort(*, source: str, url: str, reason: str, message: str) -> DownloadAbortedError:
+    get_observability_metrics().record_download_abort(source=source, reason=reason)
+    logger.warning(
+        "http.download.aborted",
+        extra={"event": "http.download.aborted", "source": source, "url": url, "reason": reason},
+    )
+    return DownloadAbortedError(message, reason=reason)
+
+
+async def download_limited(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    source: str,
+    max_bytes: int,
+    read_deadline_seconds: float,
+    headers: Mapping[str, str] | None = None,
+    max_decompression_ratio: int = DEFAULT_MAX_DECOMPRESSION_RATIO,
+    read_body_statuses: frozenset[int] = frozenset({200}),
+    allowed_content_types: tuple[str, ...] = (),
+) -> LimitedResponse:
+    try:
+        async with asyncio.timeout(read_deadline_seconds):
+            async with client.stream("GET", url, headers=dict(headers or {})) as response:
+                limited = LimitedResponse(
+                    status_code=response.status_code,
+                    url=str(response.url),
+                    headers=response.headers,
+                    charset_encoding=response.charset_encoding,
+                    redirect_statuses=tuple(redirect.status_code for redirect in response.history),
+                )
+                if response.status_code not in read_body_statuses:
+                    return limited
+
+                content_type = (response.headers.get("Content-Type") or "").lower()
+                if (
+                    allowed_content_types
+                    and content_type
+                    and not any(allowed in content_type for allowed in allowed_content_types)
+                ):
+                    raise _abort(
+                        source=source,
+                        url=url,
+                        reason="content_type",
+                        message=f"Response content type {content_type!r} is not accepted",
+                    )
+
+                declared_length = response.headers.get("Content-Length")
+                if declared_length and declared_length.isdigit() and int(declared_length) > max_bytes:
+                    raise _abort(
+                        source=source,
+                        url=url,
+                        reason="oversize",
+                        message=f"Response declared {declared_length} bytes, exceeding limit of {max_bytes}",
+                    )
+
+                chunks: list[bytes] = []
+                decoded_total = 0
+                async for chunk in response.aiter_bytes():
+                    decoded_total += len(chunk)
+                    if decoded_total > max_bytes:
+                        raise _abort(
+                            source=source,
+                            url=url,
+                            reason="oversize",
+                            message=f"Response exceeded size limit of {max_bytes} bytes",
+                        )
+                    raw_total = max(1, response.num_bytes_downloaded)
+                    if decoded_total > _RATIO_GUARD_MIN_BYTES and decoded_total > raw_total * max_decompression_ratio:
+                        raise _abort(
+                            source=source,
+                            url=url,
+                            reason="decompression_ratio",
+                            message="Response decompression ratio exceeded safety limit",
+                        )
+                    chunks.append(chunk)
+                limited.content = b"".join(chunks)
+                return limited
+    except TimeoutError as exc:
+        raise _abort(
+            source=source,
+            url=url,
+            reason="deadline",
+            message=f"Response read exceeded deadline of {read_deadline_seconds:g}s",
+        ) from exc
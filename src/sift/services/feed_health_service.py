@@ -6,6 +6,7 @@ from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.db.models import Article, ArticleState, Feed
+from sift.db.partitioning import article_published_since
 from sift.domain.schemas import FeedHealthItemOut, FeedHealthListResponse, FeedHealthSummaryOut
 
 FeedLifecycleFilter = Literal["all", "active", "paused", "archived"]
@@ -180,7 +181,7 @@ class FeedHealthService:
             .where(
                 Feed.owner_id == user_id,
                 Article.feed_id.in_(feed_ids),
-                func.coalesce(Article.published_at, Article.created_at) >= threshold,
+                article_published_since(threshold),
             )
             .group_by(Article.feed_id)
         )
@@ -208,7 +209,7 @@ class FeedHealthService:
             .join(Feed, Feed.id == Article.feed_id)
             .outerjoin(
                 ArticleState,
-                and_(ArticleState.article_id == Article.id, ArticleState.user_id == str(user_id)),
+                and_(ArticleState.article_id == Article.id, ArticleState.user_id == user_id),
             )
             .where(
                 Feed.owner_id == user_id,
@@ -0,0 +1,242 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+from collections.abc import Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter, time
+from typing import Any, Final
+from weakref import WeakSet
+
+import feedparser
+
+from sift.config import get_settings
+from sift.observability.metrics import get_observability_metrics
+
+logger = logging.getLogger(__name__)
+
+PARSE_EXECUTOR_KINDS: Final[frozenset[str]] = frozenset({"process", "thread", "inline"})
+
+# Only the fields the ingestion pipeline reads are shipped back to the event loop.
+_ENTRY_FIELDS: Final[tuple[str, ...]] = (
+    "id",
+    "guid",
+    "link",
+    "title",
+    "summary",
+    "language",
+    "published",
+    "updated",
+    "published_parsed",
+    "updated_parsed",
+)
+
+
+class FeedParseError(Exception):
+    pass
+
+
+class FeedBodyTooLargeError(FeedParseError):
+    pass
+
+
+class FeedParseTimeoutError(FeedParseError):
+    pass
+
+
+@dataclass(slots=True)
+class ParsedEntry:
+    fields: dict[str, Any]
+    payload: str
+
+
+@dataclass(slots=True)
+class ParsedFeed:
+    entries: list[ParsedEntry] = field(default_factory=list)
+    feed_meta: dict[str, Any] = field(default_factory=dict)
+    parse_started_at: float = 0.0
+    parse_seconds: float = 0.0
+
+
+def _compact_entry(entry: Mapping[str, Any]) -> ParsedEntry:
+    fields: dict[str, Any] = {}
+    for key in _ENTRY_FIELDS:
+        value = entry.get(key)
+        if value is not None:
+            fields[key] = value
+
+    content = entry.get("content")
+    if isinstance(content, list):
+        fields["content"] = [{"value": part.get("value")} for part in content if isinstance(part, Mapping)]
+
+    return ParsedEntry(fields=fields, payload=json.dumps(dict(entry), default=str))
+
+
+def parse_feed_document(content: bytes) -> ParsedFeed:
+    started_at = time()
+    started = perf_counter()
+    parsed = feedparser.parse(content)
+    raw_entries = parsed.entries if hasattr(parsed, "entries") else []
+    raw_feed = getattr(parsed, "feed", None) or {}
+    if not isinstance(raw_feed, Mapping):
+        raw_feed = {}
+    feed_meta = {
+        "title": str(raw_feed.get("title") or "").strip(),
+        "link": str(raw_feed.get("link") or "").strip(),
+        "links": [
+            {"rel": str(link.get("rel") or ""), "href": str(link.get("href") or "")}
+            for link in raw_feed.get("links", [])
+            if isinstance(link, Mapping)
+        ],
+    }
+    return ParsedFeed(
+        entries=[_compact_entry(entry) for entry in raw_entries],
+        feed_meta=feed_meta,
+        parse_started_at=started_at,
+        parse_seconds=perf_counter() - started,
+    )
+
+
+def _normalize_executor_kind(value: str) -> str:
+    normalized = value.strip().lower()
+    if normalized not in PARSE_EXECUTOR_KINDS:
+        return "thread"
+    return normalized
+
+
+class FeedParseService:
+    def __init__(self) -> None:
+        self._executor: Executor | None = None
+        self._executor_signature: tuple[str, int] | None = None
+        self._lock = Lock()
+        # Thread parses that outlived their timeout; Python cannot stop them, so they still hold a worker.
+        self._hung: set[Future[ParsedFeed]] = set()
+        # Process pools torn down to stop a timed-out parse; other parses lost with them are resubmitted.
+        self._reset_executors: WeakSet[Executor] = WeakSet()
+
+    async def parse(self, content: bytes) -> ParsedFeed:
+        settings = get_settings()
+        metrics = get_observability_metrics()
+        kind = _normalize_executor_kind(settings.ingest_parse_executor)
+
+        max_body_bytes = settings.ingest_parse_max_body_bytes
+        if max_body_bytes > 0 and len(content) > max_body_bytes:
+            metrics.record_ingest_parse(result="too_large", executor=kind)
+            raise FeedBodyTooLargeError(f"Feed body of {len(content)} bytes exceeds parse limit of {max_body_bytes}")
+
+        submitted_at = time()
+        if kind == "inline":
+            parsed = parse_feed_document(content)
+        else:
+            parsed = await self._parse_in_executor(
+                kind,
+                content,
+                max_workers=max(1, settings.ingest_parse_max_workers),
+                timeout_seconds=settings.ingest_parse_timeout_seconds,
+            )
+
+        metrics.record_ingest_parse(
+            result="success",
+            executor=kind,
+            parse_seconds=parsed.parse_seconds,
+            queue_wait_seconds=max(0.0, parsed.parse_started_at - submitted_at),
+        )
+        return parsed
+
+    async def _parse_in_executor(
+        self, kind: str, content: bytes, *, max_workers: int, timeout_seconds: float
+    ) -> ParsedFeed:
+        metrics = get_observability_metrics()
+        retried = False
+        while True:
+            executor = self._get_executor(kind, max_workers)
+            if kind == "thread" and self.hung_workers >= max_workers:
+                # Every worker is stuck in a parse that already timed out; queueing would only time out too.
+                metrics.record_ingest_parse(result="saturated", executor=kind)
+                raise FeedParseError(f"All {max_workers} parse workers are busy with timed-out feeds")
+            try:
+                future = executor.submit(parse_feed_document, content)
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout_seconds)
+            except TimeoutError as exc:
+                self._handle_timeout(executor, future)
+                metrics.record_ingest_parse(result="timeout", executor=kind)
+                raise FeedParseTimeoutError(f"Feed parse exceeded {timeout_seconds:g}s timeout") from exc
+            except BrokenProcessPool as exc:
+                if not retried and executor in self._reset_executors:
+                    # Another caller's timeout tore the pool down under this parse.
+                    retried = True
+                    continue
+                self._discard_executor(executor)
+                metrics.record_ingest_parse(result="error", executor=kind)
+                raise FeedParseError(f"Feed parse worker crashed: {exc}") from exc
+
+    @property
+    def hung_workers(self) -> int:
+        with self._lock:
+            return len(self._hung)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._executor_signature = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self, kind: str, max_workers: int) -> Executor:
+        signature = (kind, max_workers)
+        with self._lock:
+            if self._executor is not None and self._executor_signature == signature:
+                return self._executor
+            stale = self._executor
+            if kind == "process":
+                # Spawned workers avoid inheriting event-loop and DB driver threads from the parent.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sift-feed-parse")
+            self._executor_signature = signature
+            executor = self._executor
+        if stale is not None:
+            # Parses already submitted to the old pool finish there.
+            stale.shutdown(wait=False)
+        return executor
+
+    def _handle_timeout(self, executor: Executor, future: Future[ParsedFeed]) -> None:
+        if future.cancel():
+            return
+        if isinstance(executor, ProcessPoolExecutor):
+            # Only killing the worker stops a running parse.
+            self._discard_executor(executor)
+            return
+        with self._lock:
+            self._hung.add(future)
+            hung = len(self._hung)
+        future.add_done_callback(self._release_hung)
+        logger.warning("ingest.parse.worker_hung", extra={"event": "ingest.parse.worker_hung", "hung_workers": hung})
+
+    def _release_hung(self, future: Future[ParsedFeed]) -> None:
+        with self._lock:
+            self._hung.discard(future)
+
+    def _discard_executor(self, executor: Executor) -> None:
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._executor_signature = None
+            self._reset_executors.add(executor)
+
+        if isinstance(executor, ProcessPoolExecutor):
+            for process in list(getattr(executor, "_processes", {}).values()):
+                process.terminate()
+        executor.shutdown(wait=False)
+        logger.warning("ingest.parse.executor_reset", extra={"event": "ingest.parse.executor_reset"})
+
+
+feed_parse_service = FeedParseService()
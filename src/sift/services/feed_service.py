@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.db.models import Article, ArticleState, Feed, FeedFolder
 from sift.domain.schemas import FeedCreate, FeedLifecycleUpdate, FeedSettingsUpdate
+from sift.services.websub_service import websub_service
 
 
 class FeedService:
@@ -115,6 +116,9 @@ class FeedService:
             raise FeedLifecycleError(f"Unsupported lifecycle action: {action}")
 
         await session.commit()
+        if action == "archive" and feed.websub_hub_url:
+            # Archived feeds ignore pushes, so ask the hub to stop sending them.
+            await websub_service.request_unsubscribe(session, feed=feed)
         await session.refresh(feed)
         return feed, marked_read_count
 
@@ -154,7 +158,7 @@ class FeedService:
             .where(Article.feed_id == feed_id)
             .outerjoin(
                 ArticleState,
-                and_(ArticleState.article_id == Article.id, ArticleState.user_id == str(user_id)),
+                and_(ArticleState.article_id == Article.id, ArticleState.user_id == user_id),
             )
             .where(
                 func.coalesce(ArticleState.is_read, False).is_(False),
@@ -167,7 +171,7 @@ class FeedService:
             return 0
 
         states_query = select(ArticleState).where(
-            ArticleState.user_id == str(user_id),
+            ArticleState.user_id == user_id,
             ArticleState.article_id.in_(unread_article_ids),
         )
         existing_states_result = await session.execute(states_query)
@@ -178,7 +182,7 @@ class FeedService:
             if state is None:
                 session.add(
                     ArticleState(
-                        user_id=str(user_id),
+                        user_id=user_id,
                         article_id=article_id,
                         is_read=True,
                         is_starred=False,
@@ -1,24 +1,28 @@
 import hashlib
-import json
 import logging
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 from time import perf_counter
+from typing import Any
 from uuid import UUID
 
-import feedparser
 import httpx
-from sqlalchemy import select
+from sqlalchemy import select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sift.config import get_settings
 from sift.db.models import Article, Feed, RawEntry
 from sift.domain.schemas import FeedIngestResult
 from sift.observability.metrics import get_observability_metrics
 from sift.plugins.base import ArticleContext
 from sift.plugins.manager import PluginManager
 from sift.services.dedup_service import build_content_fingerprint, dedup_service, normalize_canonical_url
+from sift.services.download_service import DownloadAbortedError, download_limited
+from sift.services.feed_parse_service import FeedParseError, ParsedEntry, ParsedFeed, feed_parse_service
 from sift.services.rule_service import rule_service
 from sift.services.stream_service import stream_service
+from sift.services.websub_service import discover_websub_links, websub_service
 
 logger = logging.getLogger(__name__)
 
@@ -27,13 +31,29 @@ class FeedNotFoundError(Exception):
     pass
 
 
+class _StageTimings:
+    __slots__ = ("durations",)
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.durations[stage] = self.durations.get(stage, 0.0) + max(0.0, seconds)
+
+    def lap(self, stage: str, started_at: float) -> float:
+        # Returns the new mark so consecutive stages can be timed without nesting.
+        now = perf_counter()
+        self.add(stage, now - started_at)
+        return now
+
+
 def _safe_text(value: object) -> str:
     if value is None:
         return ""
     return str(value).strip()
 
 
-def _make_source_id(entry: feedparser.FeedParserDict) -> str:
+def _make_source_id(entry: Mapping[str, Any]) -> str:
     candidate = _safe_text(entry.get("id")) or _safe_text(entry.get("guid")) or _safe_text(entry.get("link"))
     if candidate:
         return candidate[:1024]
@@ -42,7 +62,11 @@ def _make_source_id(entry: feedparser.FeedParserDict) -> str:
     return f"hash:{hashlib.sha1(seed.encode('utf-8')).hexdigest()}"
 
 
-def _extract_text(entry: feedparser.FeedParserDict) -> str:
+def _body_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _extract_text(entry: Mapping[str, Any]) -> str:
     parts: list[str] = []
 
     content = entry.get("content", [])
@@ -60,7 +84,7 @@ def _extract_text(entry: feedparser.FeedParserDict) -> str:
     return "\n\n".join(parts)
 
 
-def _parse_published_at(entry: feedparser.FeedParserDict) -> datetime | None:
+def _parse_published_at(entry: Mapping[str, Any]) -> datetime | None:
     parsed_struct = entry.get("published_parsed") or entry.get("updated_parsed")
     if parsed_struct:
         return datetime(
@@ -87,7 +111,7 @@ def _parse_published_at(entry: feedparser.FeedParserDict) -> datetime | None:
     return parsed.astimezone(UTC)
 
 
-def _normalize_article(entry: feedparser.FeedParserDict) -> tuple[str, str | None, str, str | None, datetime | None]:
+def _normalize_article(entry: Mapping[str, Any]) -> tuple[str, str | None, str, str | None, datetime | None]:
     title = _safe_text(entry.get("title")) or "(untitled)"
     canonical_url = _safe_text(entry.get("link")) or None
     content_text = _extract_text(entry)
@@ -96,7 +120,9 @@ def _normalize_article(entry: feedparser.FeedParserDict) -> tuple[str, str | Non
     return title, canonical_url, content_text, language, published_at
 
 
-def _ingest_result_from_http_error(error: httpx.HTTPError) -> str:
+def _ingest_result_from_http_error(error: httpx.HTTPError | DownloadAbortedError) -> str:
+    if isinstance(error, DownloadAbortedError):
+        return "download_aborted"
     if isinstance(error, httpx.NetworkError):
         return "network_error"
     return "http_error"
@@ -108,11 +134,14 @@ def _record_ingest_observability(
     result_label: str,
     result: FeedIngestResult,
     started_at: float,
+    stages: _StageTimings,
     error: Exception | None = None,
 ) -> None:
     duration_seconds = perf_counter() - started_at
     duration_ms = int(duration_seconds * 1000)
-    get_observability_metrics().record_ingest_run(
+    metrics = get_observability_metrics()
+    metrics.record_ingest_stages(durations=stages.durations)
+    metrics.record_ingest_run(
         result=result_label,
         duration_seconds=duration_seconds,
         fetched_count=result.fetched_count,
@@ -131,7 +160,10 @@ def _record_ingest_observability(
         "filtered_count": result.filtered_count,
         "plugin_processed_count": result.plugin_processed_count,
         "error_count": len(result.errors),
+        **{f"stage_{stage}_ms": int(seconds * 1000) for stage, seconds in stages.durations.items()},
     }
+    if stages.durations:
+        log_extra["slowest_stage"] = max(stages.durations.items(), key=lambda item: item[1])[0]
     if error is None:
         logger.info("ingest.run.complete", extra={"event": "ingest.run.complete", **log_extra})
         return
@@ -151,6 +183,7 @@ class IngestionService:
         self, session: AsyncSession, feed_id: UUID, plugin_manager: PluginManager
     ) -> FeedIngestResult:
         started_at = perf_counter()
+        stages = _StageTimings()
         logger.info("ingest.run.start", extra={"event": "ingest.run.start", "feed_id": str(feed_id)})
 
         query = select(Feed).where(Feed.id == feed_id)
@@ -164,6 +197,7 @@ class IngestionService:
                 result_label="missing",
                 result=result,
                 started_at=started_at,
+                stages=stages,
                 error=error,
             )
             raise error
@@ -174,25 +208,39 @@ class IngestionService:
         if feed.last_modified:
             headers["If-Modified-Since"] = feed.last_modified
 
+        settings = get_settings()
+        mark = perf_counter()
         try:
             async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
-                response = await client.get(feed.url, headers=headers)
-        except httpx.HTTPError as exc:
+                response = await download_limited(
+                    client,
+                    feed.url,
+                    source="feed",
+                    headers=headers,
+                    max_bytes=settings.ingest_fetch_max_bytes,
+                    read_deadline_seconds=settings.ingest_fetch_read_deadline_seconds,
+                    max_decompression_ratio=settings.ingest_fetch_max_decompression_ratio,
+                )
+        except (httpx.HTTPError, DownloadAbortedError) as exc:
+            mark = stages.lap("fetch", mark)
             fetched_at = datetime.now(UTC)
             feed.last_fetch_error = str(exc)
             feed.last_fetched_at = fetched_at
             feed.last_fetch_error_at = fetched_at
             await session.commit()
+            stages.lap("commit", mark)
             result.errors.append(str(exc))
             _record_ingest_observability(
                 feed_id=feed.id,
                 result_label=_ingest_result_from_http_error(exc),
                 result=result,
                 started_at=started_at,
+                stages=stages,
                 error=exc,
             )
             return result
 
+        stages.lap("fetch", mark)
         fetched_at = datetime.now(UTC)
         feed.last_fetched_at = fetched_at
         feed.etag = response.headers.get("ETag", feed.etag)
@@ -201,12 +249,15 @@ class IngestionService:
         if response.status_code == 304:
             feed.last_fetch_error = None
             feed.last_fetch_success_at = fetched_at
+            mark = perf_counter()
             await session.commit()
+            stages.lap("commit", mark)
             _record_ingest_observability(
                 feed_id=feed.id,
                 result_label="not_modified",
                 result=result,
                 started_at=started_at,
+                stages=stages,
             )
             return result
 
@@ -214,20 +265,208 @@ class IngestionService:
             message = f"Unexpected status {response.status_code} while fetching {feed.url}"
             feed.last_fetch_error = message
             feed.last_fetch_error_at = fetched_at
+            mark = perf_counter()
             await session.commit()
+            stages.lap("commit", mark)
             result.errors.append(message)
             _record_ingest_observability(
                 feed_id=feed.id,
                 result_label="http_status_error",
                 result=result,
                 started_at=started_at,
+                stages=stages,
                 error=RuntimeError(message),
             )
             return result
 
-        parsed = feedparser.parse(response.content)
-        entries = parsed.entries if hasattr(parsed, "entries") else []
+        body_hash = _body_hash(response.content)
+        if feed.last_body_hash is not None and body_hash == feed.last_body_hash:
+            feed.last_fetch_error = None
+            feed.last_fetch_success_at = fetched_at
+            mark = perf_counter()
+            await session.commit()
+            stages.lap("commit", mark)
+            if feed.websub_hub_url:
+                await self._ensure_websub_subscription(
+                    session,
+                    feed=feed,
+                    hub_url=feed.websub_hub_url,
+                    topic_url=feed.websub_topic_url,
+                )
+            _record_ingest_observability(
+                feed_id=feed.id,
+                result_label="not_modified_body",
+                result=result,
+                started_at=started_at,
+                stages=stages,
+            )
+            return result
+
+        mark = perf_counter()
+        try:
+            parsed = await feed_parse_service.parse(response.content)
+        except FeedParseError as exc:
+            mark = stages.lap("parse", mark)
+            message = str(exc)
+            feed.last_fetch_error = message
+            feed.last_fetch_error_at = fetched_at
+            await session.commit()
+            stages.lap("commit", mark)
+            result.errors.append(message)
+            _record_ingest_observability(
+                feed_id=feed.id,
+                result_label="parse_error",
+                result=result,
+                started_at=started_at,
+                stages=stages,
+                error=exc,
+            )
+            return result
+
+        stages.lap("parse", mark)
+
+        await self._ingest_entries(
+            session,
+            feed=feed,
+            entries=parsed.entries,
+            plugin_manager=plugin_manager,
+            result=result,
+            stages=stages,
+        )
+
+        feed.last_fetch_error = None
+        feed.last_fetch_success_at = fetched_at
+        feed.last_body_hash = body_hash
+        mark = perf_counter()
+        await session.commit()
+        stages.lap("commit", mark)
+        hub_url, topic_url = discover_websub_links(parsed.feed_meta, response.headers)
+        if hub_url:
+            await self._ensure_websub_subscription(session, feed=feed, hub_url=hub_url, topic_url=topic_url)
+        _record_ingest_observability(
+            feed_id=feed.id,
+            result_label="success",
+            result=result,
+            started_at=started_at,
+            stages=stages,
+        )
+        return result
+
+    async def ingest_pushed_content(
+        self,
+        session: AsyncSession,
+        *,
+        feed: Feed,
+        content: bytes,
+        plugin_manager: PluginManager,
+    ) -> FeedIngestResult:
+        started_at = perf_counter()
+        stages = _StageTimings()
+        result = FeedIngestResult(feed_id=feed.id)
+        try:
+            parsed = await feed_parse_service.parse(content)
+        except FeedParseError as exc:
+            stages.lap("parse", started_at)
+            result.errors.append(str(exc))
+            _record_ingest_observability(
+                feed_id=feed.id,
+                result_label="parse_error",
+                result=result,
+                started_at=started_at,
+                stages=stages,
+                error=exc,
+            )
+            return result
+        stages.lap("parse", started_at)
+        return await self._ingest_parsed(
+            session,
+            feed=feed,
+            parsed=parsed,
+            plugin_manager=plugin_manager,
+            result_label="websub_push",
+            started_at=started_at,
+            stages=stages,
+        )
+
+    async def ingest_parsed_feed(
+        self,
+        session: AsyncSession,
+        *,
+        feed: Feed,
+        parsed: ParsedFeed,
+        plugin_manager: PluginManager,
+        result_label: str,
+    ) -> FeedIngestResult:
+        # For documents fetched and parsed elsewhere, such as the OPML import probe.
+        stages = _StageTimings()
+        stages.add("parse", parsed.parse_seconds)
+        return await self._ingest_parsed(
+            session,
+            feed=feed,
+            parsed=parsed,
+            plugin_manager=plugin_manager,
+            result_label=result_label,
+            started_at=perf_counter(),
+            stages=stages,
+        )
+
+    async def _ingest_parsed(
+        self,
+        session: AsyncSession,
+        *,
+        feed: Feed,
+        parsed: ParsedFeed,
+        plugin_manager: PluginManager,
+        result_label: str,
+        started_at: float,
+        stages: _StageTimings,
+    ) -> FeedIngestResult:
+        result = FeedIngestResult(feed_id=feed.id)
+        await self._ingest_entries(
+            session,
+            feed=feed,
+            entries=parsed.entries,
+            plugin_manager=plugin_manager,
+            result=result,
+            stages=stages,
+        )
+        mark = perf_counter()
+        await session.commit()
+        stages.lap("commit", mark)
+        _record_ingest_observability(
+            feed_id=feed.id,
+            result_label=result_label,
+            result=result,
+            started_at=started_at,
+            stages=stages,
+        )
+        return result
+
+    async def _ensure_websub_subscription(
+        self,
+        session: AsyncSession,
+        *,
+        feed: Feed,
+        hub_url: str,
+        topic_url: str | None,
+    ) -> None:
+        # Subscribing commits its pending request, so it only runs after the fetch and its entries are committed;
+        # committing the new etag and body hash before the entries would make the next poll skip them.
+        if await websub_service.ensure_subscription(session, feed=feed, hub_url=hub_url, topic_url=topic_url):
+            await session.commit()
+
+    async def _ingest_entries(
+        self,
+        session: AsyncSession,
+        *,
+        feed: Feed,
+        entries: list[ParsedEntry],
+        plugin_manager: PluginManager,
+        result: FeedIngestResult,
+        stages: _StageTimings,
+    ) -> None:
         result.fetched_count = len(entries)
+        mark = perf_counter()
         active_rules = (
             await rule_service.list_active_compiled_rules(session=session, user_id=feed.owner_id)
             if feed.owner_id
@@ -238,30 +477,40 @@ class IngestionService:
             if feed.owner_id
             else []
         )
+        mark = stages.lap("load", mark)
 
-        source_ids = [_make_source_id(entry) for entry in entries]
+        source_ids = [_make_source_id(entry.fields) for entry in entries]
         if source_ids:
-            existing_raw_query = select(RawEntry.source_id).where(
-                RawEntry.feed_id == feed.id,
-                RawEntry.source_id.in_(source_ids),
+            # Retention may prune raw entries whose articles are kept, so existing articles also count as seen.
+            existing_raw_query = union(
+                select(RawEntry.source_id).where(
+                    RawEntry.feed_id == feed.id,
+                    RawEntry.source_id.in_(source_ids),
+                ),
+                select(Article.source_id).where(
+                    Article.feed_id == feed.id,
+                    Article.source_id.in_(source_ids),
+                ),
             )
             existing_raw_rows = await session.execute(existing_raw_query)
             existing_source_ids = set(existing_raw_rows.scalars().all())
         else:
             existing_source_ids = set()
+        mark = stages.lap("source_lookup", mark)
 
-        for entry, source_id in zip(entries, source_ids, strict=False):
+        candidates: list[tuple[str, str, str | None, str, str | None, datetime | None]] = []
+        for parsed_entry, source_id in zip(entries, source_ids, strict=False):
             if source_id in existing_source_ids:
                 result.duplicate_count += 1
                 continue
 
-            payload = json.dumps(dict(entry), default=str)
+            entry = parsed_entry.fields
             raw_entry = RawEntry(
                 feed_id=feed.id,
                 source_id=source_id,
                 source_guid=_safe_text(entry.get("id")) or None,
                 source_url=_safe_text(entry.get("link")) or None,
-                payload=payload,
+                payload=parsed_entry.payload,
             )
             session.add(raw_entry)
 
@@ -275,16 +524,26 @@ class IngestionService:
             ):
                 result.filtered_count += 1
                 continue
+            candidates.append((source_id, title, canonical_url, content_text, language, published_at))
+        mark = stages.lap("rule_filter", mark)
+
+        article_contexts = await plugin_manager.run_ingested_hooks_batch(
+            [
+                ArticleContext(
+                    article_id=source_id,
+                    title=title,
+                    content_text=content_text,
+                    metadata={"feed_id": str(feed.id), "source_id": source_id},
+                )
+                for source_id, title, _canonical_url, content_text, _language, _published_at in candidates
+            ]
+        )
+        result.plugin_processed_count += len(article_contexts)
+        mark = stages.lap("hooks", mark)
 
-            article_context = ArticleContext(
-                article_id=source_id,
-                title=title,
-                content_text=content_text,
-                metadata={"feed_id": str(feed.id), "source_id": source_id},
-            )
-            article_context = await plugin_manager.run_ingested_hooks(article_context)
-            result.plugin_processed_count += 1
-
+        for (source_id, title, canonical_url, content_text, language, published_at), article_context in zip(
+            candidates, article_contexts, strict=True
+        ):
             final_title = article_context.title or title
             final_content = article_context.content_text or content_text
             canonical_url_normalized = normalize_canonical_url(canonical_url)
@@ -294,6 +553,7 @@ class IngestionService:
                 canonical_url_normalized=canonical_url_normalized,
                 content_fingerprint=content_fingerprint,
             )
+            mark = stages.lap("dedup", mark)
 
             article = Article(
                 feed_id=feed.id,
@@ -310,6 +570,7 @@ class IngestionService:
             )
             session.add(article)
             await session.flush()
+            mark = stages.lap("flush", mark)
 
             if dedup_decision.duplicate_of_id:
                 result.canonical_duplicate_count += 1
@@ -337,19 +598,14 @@ class IngestionService:
                         feed_id=feed.id,
                     )
                 )
+            # Classifier calls run inside stream matching; split their recorded time out into their own stage.
+            now = perf_counter()
+            classifier_seconds = min(now - mark, sum(run.duration_ms or 0 for run in classifier_runs) / 1000)
+            stages.add("classifier", classifier_seconds)
+            stages.add("stream_match", now - mark - classifier_seconds)
+            mark = now
 
             result.inserted_count += 1
 
-        feed.last_fetch_error = None
-        feed.last_fetch_success_at = fetched_at
-        await session.commit()
-        _record_ingest_observability(
-            feed_id=feed.id,
-            result_label="success",
-            result=result,
-            started_at=started_at,
-        )
-        return result
-
 
 ingestion_service = IngestionService()
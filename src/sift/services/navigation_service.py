@@ -5,6 +5,7 @@ from sqlalchemy import and_, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sift.db.models import Article, ArticleState, Feed, FeedFolder, KeywordStream, KeywordStreamMatch
+from sift.db.partitioning import article_published_since
 from sift.domain.schemas import (
     NavigationFeedNodeOut,
     NavigationFolderNodeOut,
@@ -32,7 +33,7 @@ class NavigationService:
         )
         fresh_expr = and_(
             unread_expr,
-            func.coalesce(Article.published_at, Article.created_at) >= now - timedelta(days=3),
+            article_published_since(now - timedelta(days=3)),
         )
 
         systems_count_query = (
@@ -48,7 +49,7 @@ class NavigationService:
             .join(Feed, Feed.id == Article.feed_id)
             .outerjoin(
                 ArticleState,
-                and_(ArticleState.article_id == Article.id, ArticleState.user_id == str(user_id)),
+                and_(ArticleState.article_id == Article.id, ArticleState.user_id == user_id),
             )
             .where(Feed.owner_id == user_id)
         )
@@ -78,7 +79,7 @@ class NavigationService:
                 .join(Feed, Feed.id == Article.feed_id)
                 .outerjoin(
                     ArticleState,
-                    and_(ArticleState.article_id == Article.id, ArticleState.user_id == str(user_id)),
+                    and_(ArticleState.article_id == Article.id, ArticleState.user_id == user_id),
                 )
                 .where(Feed.owner_id == user_id)
                 .where(Feed.is_archived.is_(False))
@@ -143,7 +144,7 @@ class NavigationService:
                 .outerjoin(Article, Article.id == KeywordStreamMatch.article_id)
                 .outerjoin(
                     ArticleState,
-                    and_(ArticleState.article_id == Article.id, ArticleState.user_id == str(user_id)),
+                    and_(ArticleState.article_id == Article.id, ArticleState.user_id == user_id),
                 )
                 .where(KeywordStream.user_id == user_id)
                 .group_by(
@@ -1,14 +1,28 @@
+import logging
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from time import perf_counter
+from typing import Any, Literal
 from urllib.parse import urlsplit, urlunsplit
-from uuid import UUID
+from uuid import UUID, uuid4
 from xml.etree import ElementTree
 
+import httpx
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sift.config import get_settings
 from sift.db.models import Feed
 from sift.domain.schemas import OpmlImportEntryResult, OpmlImportResult
+from sift.plugins.manager import PluginManager
+from sift.services.download_service import DownloadAbortedError, download_limited
+from sift.services.feed_parse_service import FeedParseError, ParsedFeed, feed_parse_service
+from sift.services.ingestion_service import ingestion_service
+
+logger = logging.getLogger(__name__)
+
+_PERMANENT_REDIRECT_STATUSES = frozenset({301, 308})
 
 
 class OpmlParseError(Exception):
@@ -21,6 +35,18 @@ class ParsedOpmlEntry:
     title: str
 
 
+@dataclass(slots=True)
+class FeedProbe:
+    status: Literal["ok", "redirected", "dead"]
+    fetched_at: datetime
+    resolved_url: str | None = None
+    error: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    parsed: ParsedFeed | None = None
+    inserted_count: int = 0
+
+
 def _is_outline_tag(tag: str) -> bool:
     return tag == "outline" or tag.endswith("}outline")
 
@@ -90,6 +116,54 @@ def parse_opml(content: bytes) -> list[ParsedOpmlEntry]:
     return entries
 
 
+async def _probe_feed(client: httpx.AsyncClient, url: str) -> FeedProbe:
+    settings = get_settings()
+    try:
+        response = await download_limited(
+            client,
+            url,
+            source="opml_probe",
+            max_bytes=settings.ingest_fetch_max_bytes,
+            read_deadline_seconds=settings.opml_import_probe_timeout_seconds,
+            max_decompression_ratio=settings.ingest_fetch_max_decompression_ratio,
+        )
+    except (httpx.HTTPError, DownloadAbortedError) as exc:
+        return FeedProbe(status="dead", fetched_at=datetime.now(UTC), error=str(exc) or type(exc).__name__)
+
+    fetched_at = datetime.now(UTC)
+    if response.status_code != 200:
+        return FeedProbe(status="dead", fetched_at=fetched_at, error=f"Unexpected status {response.status_code}")
+    try:
+        parsed = await feed_parse_service.parse(response.content)
+    except FeedParseError as exc:
+        return FeedProbe(status="dead", fetched_at=fetched_at, error=str(exc))
+    if not parsed.entries and not parsed.feed_meta.get("title"):
+        return FeedProbe(status="dead", fetched_at=fetched_at, error="No feed found at URL")
+
+    # Only permanent redirects move the subscription; temporary ones keep the URL from the file.
+    resolved_url = None
+    if response.redirect_statuses and all(code in _PERMANENT_REDIRECT_STATUSES for code in response.redirect_statuses):
+        resolved_url = _normalize_feed_url(response.url)
+    return FeedProbe(
+        status="redirected" if resolved_url and resolved_url != url else "ok",
+        fetched_at=fetched_at,
+        resolved_url=resolved_url if resolved_url != url else None,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        parsed=parsed,
+    )
+
+
+def _insert_ignoring_url_conflicts(dialect_name: str) -> Any:
+    if dialect_name == "postgresql":
+        return postgresql.insert(Feed).on_conflict_do_nothing(index_elements=[Feed.url])
+    return sqlite.insert(Feed).on_conflict_do_nothing(index_elements=[Feed.url])
+
+
+def _feed_row(user_id: UUID, entry: ParsedOpmlEntry) -> dict[str, Any]:
+    return {"id": uuid4(), "owner_id": user_id, "title": (entry.title or entry.url)[:255], "url": entry.url}
+
+
 class OpmlService:
     async def import_from_bytes(
         self,
@@ -97,6 +171,7 @@ class OpmlService:
         user_id: UUID,
         content: bytes,
     ) -> OpmlImportResult:
+        started_at = perf_counter()
         parsed_entries = parse_opml(content)
         report = OpmlImportResult(total_entries=len(parsed_entries))
 
@@ -135,14 +210,22 @@ class OpmlService:
         if not candidates:
             return report
 
-        existing_query = select(Feed).where(Feed.url.in_([entry.url for entry in candidates]))
-        existing_result = await session.execute(existing_query)
-        existing_by_url = {feed.url: feed for feed in existing_result.scalars().all()}
+        existing_query = select(Feed.url, Feed.owner_id).where(Feed.url.in_([entry.url for entry in candidates]))
+        existing_owner_by_url = {url: owner_id for url, owner_id in (await session.execute(existing_query)).all()}
+        pending = [entry for entry in candidates if entry.url not in existing_owner_by_url]
+
+        feed_id_by_url: dict[str, UUID] = {}
+        if pending:
+            rows = [_feed_row(user_id, entry) for entry in pending]
+            # One statement (paged by the driver) and one transaction for the whole file; rows that lose a race
+            # with another import are skipped by the unique URL constraint instead of failing the batch.
+            statement = _insert_ignoring_url_conflicts(session.get_bind().dialect.name).returning(Feed.url, Feed.id)
+            feed_id_by_url = {url: feed_id for url, feed_id in (await session.execute(statement, rows)).all()}
+            await session.commit()
 
         for entry in candidates:
-            existing = existing_by_url.get(entry.url)
-            if existing is not None:
-                if existing.owner_id == user_id:
+            if entry.url in existing_owner_by_url:
+                if existing_owner_by_url[entry.url] == user_id:
                     report.skipped_existing_count += 1
                     report.results.append(
                         OpmlImportEntryResult(
@@ -164,16 +247,8 @@ class OpmlService:
                     )
                 continue
 
-            feed = Feed(
-                owner_id=user_id,
-                title=(entry.title or entry.url)[:255],
-                url=entry.url,
-            )
-            session.add(feed)
-            try:
-                await session.commit()
-            except IntegrityError:
-                await session.rollback()
+            feed_id = feed_id_by_url.get(entry.url)
+            if feed_id is None:
                 report.skipped_conflict_count += 1
                 report.results.append(
                     OpmlImportEntryResult(
@@ -187,15 +262,73 @@ class OpmlService:
 
             report.created_count += 1
             report.results.append(
-                OpmlImportEntryResult(
-                    url=entry.url,
-                    title=entry.title,
-                    status="created",
-                    reason=None,
-                )
+                OpmlImportEntryResult(url=entry.url, title=entry.title, status="created", feed_id=feed_id)
             )
 
+        logger.info(
+            "opml.import.complete",
+            extra={
+                "event": "opml.import.complete",
+                "user_id": str(user_id),
+                "total_entries": report.total_entries,
+                "created_count": report.created_count,
+                "duration_ms": int((perf_counter() - started_at) * 1000),
+            },
+        )
         return report
 
+    async def probe_imported_feed(
+        self,
+        session: AsyncSession,
+        *,
+        feed_id: UUID,
+        plugin_manager: PluginManager,
+    ) -> FeedProbe | None:
+        feed = await session.get(Feed, feed_id)
+        if feed is None:
+            return None
+        imported_url = feed.url
+        async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
+            probe = await _probe_feed(client, imported_url)
+
+        # The parsed document is handed to ingestion below and not kept on the returned probe.
+        parsed, probe.parsed = probe.parsed, None
+        feed.last_fetched_at = probe.fetched_at
+        if probe.status == "dead" or parsed is None:
+            feed.last_fetch_error = (probe.error or "Feed unreachable")[:1000]
+            feed.last_fetch_error_at = probe.fetched_at
+            await session.commit()
+            return probe
+
+        if probe.resolved_url is not None:
+            # A redirect target that is already subscribed keeps the imported URL.
+            taken = await session.scalar(select(Feed.id).where(Feed.url == probe.resolved_url))
+            if taken is None:
+                feed.url = probe.resolved_url
+            else:
+                probe.status = "ok"
+                probe.resolved_url = None
+        # The OPML title wins unless the file only repeated the feed URL.
+        feed_title = str(parsed.feed_meta.get("title") or "")
+        if feed_title and _normalize_feed_url(feed.title) == imported_url:
+            feed.title = feed_title[:255]
+        feed.site_url = str(parsed.feed_meta.get("link") or "")[:1000] or None
+        feed.etag = probe.etag[:512] if probe.etag else None
+        feed.last_modified = probe.last_modified[:512] if probe.last_modified else None
+        feed.last_fetch_success_at = probe.fetched_at
+        feed.last_fetch_error = None
+
+        # The probe already fetched and parsed the document, so its entries become the first articles
+        # and the scheduler's next fetch can be a conditional request.
+        result = await ingestion_service.ingest_parsed_feed(
+            session,
+            feed=feed,
+            parsed=parsed,
+            plugin_manager=plugin_manager,
+            result_label="opml_probe",
+        )
+        probe.inserted_count = result.inserted_count
+        return probe
+
 
 opml_service = OpmlService()
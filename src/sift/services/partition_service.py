@@ -0,0 +1,123 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sift.config import Settings
+from sift.db.partitioning import (
+    PARTITIONED_TABLES,
+    add_months,
+    create_partition_statements,
+    month_start,
+    partition_month,
+    partition_name,
+    release_partition_keys_statements,
+)
+from sift.observability.metrics import get_observability_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PartitionMaintenanceResult:
+    created: list[str] = field(default_factory=list)
+    detached: list[str] = field(default_factory=list)
+
+
+class PartitionService:
+    async def partitioned_tables(self, session: AsyncSession) -> set[str]:
+        if session.get_bind().dialect.name != "postgresql":
+            return set()
+        rows = await session.execute(
+            text(
+                "SELECT c.relname FROM pg_partitioned_table p "
+                "JOIN pg_class c ON c.oid = p.partrelid "
+                "WHERE c.relnamespace = to_regnamespace(current_schema())::oid"
+            )
+        )
+        return {str(name) for name in rows.scalars().all()} & set(PARTITIONED_TABLES)
+
+    async def list_partitions(self, session: AsyncSession, table: str) -> list[str]:
+        rows = await session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table AND p.relnamespace = to_regnamespace(current_schema())::oid"
+            ),
+            {"table": table},
+        )
+        return sorted(str(name) for name in rows.scalars().all())
+
+    async def ensure_partitions(
+        self, session: AsyncSession, *, table: str, now: datetime, months_ahead: int
+    ) -> list[str]:
+        existing = set(await self.list_partitions(session, table))
+        current = month_start(now)
+        created: list[str] = []
+        for offset in range(max(0, months_ahead) + 1):
+            month = add_months(current, offset)
+            name = partition_name(table, month)
+            if name in existing:
+                continue
+            for statement in create_partition_statements(table, PARTITIONED_TABLES[table], month):
+                await session.execute(text(statement))
+            created.append(name)
+        return created
+
+    async def detach_expired_partitions(
+        self, session: AsyncSession, *, table: str, now: datetime, detach_after_months: int
+    ) -> list[str]:
+        cutoff = add_months(month_start(now), -detach_after_months)
+        detached: list[str] = []
+        for name in await self.list_partitions(session, table):
+            month = partition_month(table, name)
+            if month is None or add_months(month, 1) > cutoff:
+                continue
+            for statement in release_partition_keys_statements(table, name):
+                await session.execute(text(statement))
+            # The detached table keeps its rows for archival; dump and drop it once it is no longer needed.
+            await session.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+            detached.append(name)
+        return detached
+
+    async def run(
+        self, session: AsyncSession, *, settings: Settings, now: datetime | None = None
+    ) -> PartitionMaintenanceResult:
+        result = PartitionMaintenanceResult()
+        if not settings.database_partitioning_enabled:
+            return result
+
+        current_time = now or datetime.now(UTC)
+        metrics = get_observability_metrics()
+        for table in sorted(await self.partitioned_tables(session)):
+            created = await self.ensure_partitions(
+                session,
+                table=table,
+                now=current_time,
+                months_ahead=settings.database_partition_months_ahead,
+            )
+            detached: list[str] = []
+            if settings.database_partition_detach_after_months > 0:
+                detached = await self.detach_expired_partitions(
+                    session,
+                    table=table,
+                    now=current_time,
+                    detach_after_months=settings.database_partition_detach_after_months,
+                )
+            await session.commit()
+
+            metrics.record_partitions_changed(table=table, created=len(created), detached=len(detached))
+            result.created.extend(created)
+            result.detached.extend(detached)
+            for name in detached:
+                logger.info(
+                    "partitions.detached",
+                    extra={"event": "partitions.detached", "table": table, "partition": name},
+                )
+        return result
+
+
+partition_service = PartitionService()
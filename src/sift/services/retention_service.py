@@ -0,0 +1,310 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, Final
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sift.config import Settings
+from sift.db.models import RawEntry, StreamClassifierRun, StreamClassifierRunSummary
+from sift.observability.metrics import get_observability_metrics
+
+# Rough per-row cost of the fixed-width columns (ids, timestamps, numbers) added to the measured text lengths.
+_RAW_ENTRY_FIXED_BYTES: Final[int] = 96
+_CLASSIFIER_RUN_FIXED_BYTES: Final[int] = 128
+
+_SummaryKey = tuple[UUID, UUID, date, str, str, str | None, str | None, str | None, str]
+
+
+@dataclass(slots=True)
+class RetentionRunResult:
+    raw_entries_deleted: int = 0
+    raw_entries_bytes: int = 0
+    classifier_runs_compacted: int = 0
+    classifier_runs_bytes: int = 0
+    classifier_summaries_written: int = 0
+
+
+@dataclass(slots=True)
+class _SummaryTotals:
+    run_count: int = 0
+    matched_count: int = 0
+    confidence_sum: float = 0.0
+    confidence_count: int = 0
+    duration_ms_total: int = 0
+
+
+def _raw_entry_size() -> ColumnElement[Any]:
+    return (
+        func.coalesce(func.length(RawEntry.payload), 0)
+        + func.coalesce(func.length(RawEntry.source_id), 0)
+        + func.coalesce(func.length(RawEntry.source_guid), 0)
+        + func.coalesce(func.length(RawEntry.source_url), 0)
+        + _RAW_ENTRY_FIXED_BYTES
+    )
+
+
+def _classifier_run_size(run: StreamClassifierRun) -> int:
+    text_values = (
+        run.classifier_mode,
+        run.plugin_name,
+        run.provider,
+        run.model_name,
+        run.model_version,
+        run.reason,
+        run.run_status,
+        run.error_message,
+    )
+    return _CLASSIFIER_RUN_FIXED_BYTES + sum(len(value.encode("utf-8")) for value in text_values if value)
+
+
+def _summary_day(value: datetime) -> date:
+    if value.tzinfo is None:
+        return value.date()
+    return value.astimezone(UTC).date()
+
+
+def _matches(column: Any, value: object) -> ColumnElement[bool]:
+    if value is None:
+        return column.is_(None)
+    return column == value
+
+
+class RetentionService:
+    async def run(
+        self, session: AsyncSession, *, settings: Settings, now: datetime | None = None
+    ) -> RetentionRunResult:
+        current_time = now or datetime.now(UTC)
+        batch_size = max(1, settings.retention_batch_size)
+        batch_pause_seconds = max(0.0, settings.retention_batch_pause_ms / 1000.0)
+        result = RetentionRunResult()
+
+        if settings.retention_raw_entries_days > 0:
+            cutoff = current_time - timedelta(days=settings.retention_raw_entries_days)
+            await self._delete_raw_entries(
+                session,
+                RawEntry.created_at < cutoff,
+                result=result,
+                batch_size=batch_size,
+                batch_pause_seconds=batch_pause_seconds,
+            )
+
+        if settings.retention_raw_entries_per_feed > 0:
+            await self._cap_raw_entries_per_feed(
+                session,
+                keep=settings.retention_raw_entries_per_feed,
+                result=result,
+                batch_size=batch_size,
+                batch_pause_seconds=batch_pause_seconds,
+            )
+
+        if settings.retention_classifier_runs_days > 0:
+            # Align to midnight UTC so each summary day is compacted in one pass.
+            cutoff = (current_time - timedelta(days=settings.retention_classifier_runs_days)).astimezone(UTC)
+            cutoff = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+            await self._compact_classifier_runs(
+                session,
+                cutoff=cutoff,
+                result=result,
+                batch_size=batch_size,
+                batch_pause_seconds=batch_pause_seconds,
+            )
+
+        return result
+
+    async def _cap_raw_entries_per_feed(
+        self,
+        session: AsyncSession,
+        *,
+        keep: int,
+        result: RetentionRunResult,
+        batch_size: int,
+        batch_pause_seconds: float,
+    ) -> None:
+        feed_rows = await session.execute(
+            select(RawEntry.feed_id).group_by(RawEntry.feed_id).having(func.count(RawEntry.id) > keep)
+        )
+        for feed_id in feed_rows.scalars().all():
+            # The id breaks created_at ties so exactly the rows past the newest `keep` are deleted.
+            boundary = (
+                await session.execute(
+                    select(RawEntry.created_at, RawEntry.id)
+                    .where(RawEntry.feed_id == feed_id)
+                    .order_by(RawEntry.created_at.desc(), RawEntry.id.desc())
+                    .offset(keep)
+                    .limit(1)
+                )
+            ).first()
+            if boundary is None:
+                continue
+            boundary_created_at, boundary_id = boundary
+            await self._delete_raw_entries(
+                session,
+                and_(
+                    RawEntry.feed_id == feed_id,
+                    or_(
+                        RawEntry.created_at < boundary_created_at,
+                        and_(RawEntry.created_at == boundary_created_at, RawEntry.id <= boundary_id),
+                    ),
+                ),
+                result=result,
+                batch_size=batch_size,
+                batch_pause_seconds=batch_pause_seconds,
+            )
+
+    async def _delete_raw_entries(
+        self,
+        session: AsyncSession,
+        condition: ColumnElement[bool],
+        *,
+        result: RetentionRunResult,
+        batch_size: int,
+        batch_pause_seconds: float,
+    ) -> None:
+        metrics = get_observability_metrics()
+        while True:
+            rows = (
+                await session.execute(
+                    select(RawEntry.id, _raw_entry_size())
+                    .where(condition)
+                    .order_by(RawEntry.created_at)
+                    .limit(batch_size)
+                )
+            ).all()
+            if not rows:
+                return
+
+            # Small committed batches keep each delete transaction short so ingestion writers are not held up.
+            await session.execute(
+                delete(RawEntry)
+                .where(RawEntry.id.in_([row[0] for row in rows]))
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+            reclaimed_bytes = sum(int(row[1] or 0) for row in rows)
+            result.raw_entries_deleted += len(rows)
+            result.raw_entries_bytes += reclaimed_bytes
+            metrics.record_retention_reclaimed(table="raw_entries", rows=len(rows), reclaimed_bytes=reclaimed_bytes)
+            if len(rows) < batch_size:
+                return
+            await asyncio.sleep(batch_pause_seconds)
+
+    async def _compact_classifier_runs(
+        self,
+        session: AsyncSession,
+        *,
+        cutoff: datetime,
+        result: RetentionRunResult,
+        batch_size: int,
+        batch_pause_seconds: float,
+    ) -> None:
+        metrics = get_observability_metrics()
+        while True:
+            runs = (
+                (
+                    await session.execute(
+                        select(StreamClassifierRun)
+                        .where(StreamClassifierRun.created_at < cutoff)
+                        .order_by(StreamClassifierRun.created_at)
+                        .limit(batch_size)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            if not runs:
+                return
+
+            totals_by_key: dict[_SummaryKey, _SummaryTotals] = {}
+            for run in runs:
+                key: _SummaryKey = (
+                    run.user_id,
+                    run.stream_id,
+                    _summary_day(run.created_at),
+                    run.classifier_mode,
+                    run.plugin_name,
+                    run.provider,
+                    run.model_name,
+                    run.model_version,
+                    run.run_status,
+                )
+                totals = totals_by_key.setdefault(key, _SummaryTotals())
+                totals.run_count += 1
+                totals.matched_count += int(run.matched)
+                if run.confidence is not None:
+                    totals.confidence_sum += run.confidence
+                    totals.confidence_count += 1
+                totals.duration_ms_total += run.duration_ms or 0
+
+            summaries_written = await self._merge_summaries(session, totals_by_key)
+            reclaimed_bytes = sum(_classifier_run_size(run) for run in runs)
+            run_ids = [run.id for run in runs]
+            await session.execute(
+                delete(StreamClassifierRun)
+                .where(StreamClassifierRun.id.in_(run_ids))
+                .execution_options(synchronize_session=False)
+            )
+            # Summaries and deletes commit together so a failed batch never loses or double-counts runs.
+            await session.commit()
+            result.classifier_runs_compacted += len(run_ids)
+            result.classifier_runs_bytes += reclaimed_bytes
+            result.classifier_summaries_written += summaries_written
+            metrics.record_retention_reclaimed(
+                table="stream_classifier_runs", rows=len(run_ids), reclaimed_bytes=reclaimed_bytes
+            )
+            if len(run_ids) < batch_size:
+                return
+            await asyncio.sleep(batch_pause_seconds)
+
+    async def _merge_summaries(
+        self,
+        session: AsyncSession,
+        totals_by_key: dict[_SummaryKey, _SummaryTotals],
+    ) -> int:
+        written = 0
+        for key, totals in totals_by_key.items():
+            user_id, stream_id, day, classifier_mode, plugin_name, provider, model_name, model_version, run_status = key
+            summary = await session.scalar(
+                select(StreamClassifierRunSummary).where(
+                    StreamClassifierRunSummary.stream_id == stream_id,
+                    StreamClassifierRunSummary.day == day,
+                    StreamClassifierRunSummary.user_id == user_id,
+                    StreamClassifierRunSummary.classifier_mode == classifier_mode,
+                    StreamClassifierRunSummary.plugin_name == plugin_name,
+                    _matches(StreamClassifierRunSummary.provider, provider),
+                    _matches(StreamClassifierRunSummary.model_name, model_name),
+                    _matches(StreamClassifierRunSummary.model_version, model_version),
+                    StreamClassifierRunSummary.run_status == run_status,
+                )
+            )
+            if summary is None:
+                summary = StreamClassifierRunSummary(
+                    user_id=user_id,
+                    stream_id=stream_id,
+                    day=day,
+                    classifier_mode=classifier_mode,
+                    plugin_name=plugin_name,
+                    provider=provider,
+                    model_name=model_name,
+                    model_version=model_version,
+                    run_status=run_status,
+                    run_count=0,
+                    matched_count=0,
+                    confidence_sum=0.0,
+                    confidence_count=0,
+                    duration_ms_total=0,
+                )
+                session.add(summary)
+            summary.run_count += totals.run_count
+            summary.matched_count += totals.matched_count
+            summary.confidence_sum += totals.confidence_sum
+            summary.confidence_count += totals.confidence_count
+            summary.duration_ms_total += totals.duration_ms_total
+            written += 1
+        await session.flush()
+        return written
+
+
+retention_service = RetentionService()
@@ -7,11 +7,11 @@ from time import perf_counter
 from typing import Any, Literal, cast
 from uuid import UUID
 
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from sift.db.models import Article, Feed, FeedFolder, KeywordStream, KeywordStreamMatch, RawEntry, StreamClassifierRun
+from sift.db.models import Article, Feed, FeedFolder, KeywordStream, KeywordStreamMatch, StreamClassifierRun
 from sift.domain.schemas import (
     ArticleOut,
     KeywordStreamCreate,
@@ -847,13 +847,9 @@ class StreamService:
                 Article.title,
                 Article.content_text,
                 Article.language,
-                RawEntry.source_url,
+                Article.canonical_url,
             )
             .join(Feed, Feed.id == Article.feed_id)
-            .outerjoin(
-                RawEntry,
-                and_(RawEntry.feed_id == Article.feed_id, RawEntry.source_id == Article.source_id),
-            )
             .where(Feed.owner_id == user_id)
         )
         article_rows = article_rows_result.all()
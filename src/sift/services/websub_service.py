@@ -0,0 +1,318 @@
+import hmac
+import logging
+import re
+import secrets
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any, Final
+from uuid import UUID
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sift.config import get_settings
+from sift.db.models import Feed, WebSubPendingRequest
+
+logger = logging.getLogger(__name__)
+
+_SUBSCRIBE_TIMEOUT_SECONDS: Final[float] = 10.0
+# Hubs may grant any lease; anything longer is cut down and simply renewed earlier.
+_MAX_LEASE_SECONDS: Final[int] = 365 * 86400
+_SIGNATURE_ALGORITHMS: Final[frozenset[str]] = frozenset({"sha1", "sha256", "sha384", "sha512"})
+_LINK_HEADER_RE = re.compile(r'<([^>]+)>\s*;\s*rel\s*=\s*"?([^";,]+)"?', re.IGNORECASE)
+
+
+class WebSubVerificationError(Exception):
+    pass
+
+
+def _normalize_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def discover_websub_links(
+    feed_meta: Mapping[str, Any] | None,
+    headers: Mapping[str, str],
+) -> tuple[str | None, str | None]:
+    hub_url: str | None = None
+    topic_url: str | None = None
+
+    raw_link_header = headers.get("Link") or headers.get("link") or ""
+    for href, rels in _LINK_HEADER_RE.findall(raw_link_header):
+        rel_tokens = {token.strip().lower() for token in rels.split()}
+        if "hub" in rel_tokens and hub_url is None:
+            hub_url = href.strip()
+        if "self" in rel_tokens and topic_url is None:
+            topic_url = href.strip()
+
+    links = feed_meta.get("links", []) if feed_meta else []
+    if isinstance(links, list):
+        for link in links:
+            if not isinstance(link, Mapping):
+                continue
+            rel = str(link.get("rel") or "").strip().lower()
+            href = str(link.get("href") or "").strip()
+            if not href:
+                continue
+            if rel == "hub" and hub_url is None:
+                hub_url = href
+            elif rel == "self" and topic_url is None:
+                topic_url = href
+
+    return hub_url, topic_url
+
+
+def build_callback_url(base_url: str, feed_id: UUID, nonce: str | None = None) -> str:
+    callback_url = f"{base_url.rstrip('/')}/api/v1/websub/{feed_id}"
+    if nonce:
+        # Hubs keep the callback query string when they verify, which ties the verification to this request.
+        callback_url = f"{callback_url}?nonce={nonce}"
+    return callback_url
+
+
+def compute_signature(secret: str, body: bytes, algorithm: str = "sha256") -> str:
+    digest = hmac.new(secret.encode("utf-8"), body, algorithm).hexdigest()
+    return f"{algorithm}={digest}"
+
+
+def verify_signature(secret: str, body: bytes, signature_header: str | None) -> bool:
+    if not signature_header or "=" not in signature_header:
+        return False
+    algorithm, _, provided = signature_header.strip().partition("=")
+    normalized_algorithm = algorithm.strip().lower()
+    if normalized_algorithm not in _SIGNATURE_ALGORITHMS:
+        return False
+    expected = compute_signature(secret, body, normalized_algorithm).partition("=")[2]
+    return hmac.compare_digest(expected, provided.strip().lower())
+
+
+def is_push_active(feed: Feed, now: datetime) -> bool:
+    lease_expires_at = _normalize_utc(feed.websub_lease_expires_at)
+    return lease_expires_at is not None and lease_expires_at > now
+
+
+class WebSubService:
+    async def ensure_subscription(
+        self,
+        session: AsyncSession,
+        *,
+        feed: Feed,
+        hub_url: str,
+        topic_url: str | None,
+    ) -> bool:
+        settings = get_settings()
+        if not settings.websub_enabled or not settings.websub_callback_base_url:
+            return False
+
+        topic = topic_url or feed.url
+        now = datetime.now(UTC)
+        lease_expires_at = _normalize_utc(feed.websub_lease_expires_at)
+        hub_unchanged = feed.websub_hub_url == hub_url and feed.websub_topic_url == topic
+        resubscribe_at = now + timedelta(seconds=settings.websub_resubscribe_margin_seconds)
+        if hub_unchanged and lease_expires_at is not None and lease_expires_at > resubscribe_at:
+            return False
+
+        secret = feed.websub_secret if hub_unchanged and feed.websub_secret else secrets.token_hex(32)
+        if not await self._request(
+            session,
+            feed=feed,
+            mode="subscribe",
+            hub_url=hub_url,
+            topic=topic,
+            secret=secret,
+            callback_base_url=settings.websub_callback_base_url,
+        ):
+            return False
+
+        # The hub confirms asynchronously through the callback endpoint, which activates the secret and lease.
+        if not hub_unchanged:
+            feed.websub_lease_expires_at = None
+        feed.websub_hub_url = hub_url
+        feed.websub_topic_url = topic
+        logger.info(
+            "websub.subscribe.requested",
+            extra={"event": "websub.subscribe.requested", "feed_id": str(feed.id), "hub_url": hub_url},
+        )
+        return True
+
+    async def request_unsubscribe(self, session: AsyncSession, *, feed: Feed) -> bool:
+        settings = get_settings()
+        if not settings.websub_enabled or not settings.websub_callback_base_url or not feed.websub_hub_url:
+            return False
+
+        topic = feed.websub_topic_url or feed.url
+        if not await self._request(
+            session,
+            feed=feed,
+            mode="unsubscribe",
+            hub_url=feed.websub_hub_url,
+            topic=topic,
+            secret=None,
+            callback_base_url=settings.websub_callback_base_url,
+        ):
+            return False
+        logger.info(
+            "websub.unsubscribe.requested",
+            extra={"event": "websub.unsubscribe.requested", "feed_id": str(feed.id), "hub_url": feed.websub_hub_url},
+        )
+        return True
+
+    async def verify_intent(
+        self,
+        session: AsyncSession,
+        *,
+        feed_id: UUID,
+        mode: str,
+        topic: str,
+        challenge: str,
+        lease_seconds: int | None,
+        nonce: str,
+    ) -> str:
+        pending = await session.get(WebSubPendingRequest, feed_id)
+        if pending is None or not nonce or not hmac.compare_digest(pending.nonce, nonce):
+            raise WebSubVerificationError(f"No pending WebSub request for feed {feed_id}")
+        if topic != pending.topic_url:
+            raise WebSubVerificationError("Topic does not match the pending request")
+        feed = await session.scalar(select(Feed).where(Feed.id == feed_id))
+        if feed is None:
+            raise WebSubVerificationError(f"No pending WebSub request for feed {feed_id}")
+
+        normalized_mode = mode.strip().lower()
+        if normalized_mode == "denied" and pending.mode == "subscribe":
+            self._clear_subscription(feed)
+            await session.delete(pending)
+            await session.commit()
+            logger.info("websub.subscribe.denied", extra={"event": "websub.subscribe.denied", "feed_id": str(feed_id)})
+            return challenge
+        if normalized_mode != pending.mode:
+            raise WebSubVerificationError(f"Unexpected hub.mode '{mode}' for the pending {pending.mode} request")
+
+        granted_seconds: int | None = None
+        if normalized_mode == "subscribe":
+            if not feed.is_active or feed.is_archived:
+                raise WebSubVerificationError("Feed is not active")
+            settings = get_settings()
+            granted_seconds = lease_seconds if lease_seconds and lease_seconds > 0 else settings.websub_lease_seconds
+            granted_seconds = min(granted_seconds, _MAX_LEASE_SECONDS)
+            feed.websub_hub_url = pending.hub_url
+            feed.websub_topic_url = pending.topic_url
+            feed.websub_secret = pending.secret
+            feed.websub_lease_expires_at = datetime.now(UTC) + timedelta(seconds=granted_seconds)
+        else:
+            self._clear_subscription(feed)
+
+        await session.delete(pending)
+        await session.commit()
+        logger.info(
+            "websub.subscribe.verified",
+            extra={
+                "event": "websub.subscribe.verified",
+                "feed_id": str(feed_id),
+                "mode": normalized_mode,
+                "lease_seconds": granted_seconds,
+            },
+        )
+        return challenge
+
+    async def authenticate_push(
+        self,
+        session: AsyncSession,
+        *,
+        feed_id: UUID,
+        body: bytes,
+        signature_header: str | None,
+    ) -> Feed | None:
+        feed = await session.scalar(select(Feed).where(Feed.id == feed_id))
+        if feed is None or not feed.websub_secret or not feed.is_active or feed.is_archived:
+            return None
+        if not verify_signature(feed.websub_secret, body, signature_header):
+            logger.warning(
+                "websub.push.rejected",
+                extra={"event": "websub.push.rejected", "feed_id": str(feed_id), "reason": "invalid_signature"},
+            )
+            return None
+        return feed
+
+    async def _request(
+        self,
+        session: AsyncSession,
+        *,
+        feed: Feed,
+        mode: str,
+        hub_url: str,
+        topic: str,
+        secret: str | None,
+        callback_base_url: str,
+    ) -> bool:
+        settings = get_settings()
+        nonce = secrets.token_urlsafe(32)
+        pending = await session.get(WebSubPendingRequest, feed.id)
+        if pending is None:
+            pending = WebSubPendingRequest(feed_id=feed.id)
+            session.add(pending)
+        pending.mode = mode
+        pending.nonce = nonce
+        pending.hub_url = hub_url
+        pending.topic_url = topic
+        pending.secret = secret
+        pending.requested_at = datetime.now(UTC)
+        # Hubs may verify before answering the request, so the pending record has to be visible first.
+        await session.commit()
+
+        form = {
+            "hub.mode": mode,
+            "hub.topic": topic,
+            "hub.callback": build_callback_url(callback_base_url, feed.id, nonce),
+        }
+        if mode == "subscribe":
+            form["hub.lease_seconds"] = str(settings.websub_lease_seconds)
+        if secret is not None:
+            form["hub.secret"] = secret
+        try:
+            status_code = await self._post_subscription(hub_url, form)
+        except httpx.HTTPError as exc:
+            logger.error(
+                "websub.subscribe.error",
+                extra={
+                    "event": "websub.subscribe.error",
+                    "feed_id": str(feed.id),
+                    "hub_url": hub_url,
+                    "mode": mode,
+                    "error_type": type(exc).__name__,
+                    "error_message": str(exc),
+                },
+            )
+            return False
+
+        if status_code not in {202, 204}:
+            logger.error(
+                "websub.subscribe.error",
+                extra={
+                    "event": "websub.subscribe.error",
+                    "feed_id": str(feed.id),
+                    "hub_url": hub_url,
+                    "mode": mode,
+                    "status_code": status_code,
+                },
+            )
+            return False
+        return True
+
+    async def _post_subscription(self, hub_url: str, form: Mapping[str, str]) -> int:
+        async with httpx.AsyncClient(timeout=_SUBSCRIBE_TIMEOUT_SECONDS, follow_redirects=True) as client:
+            response = await client.post(hub_url, data=dict(form))
+        return response.status_code
+
+    def _clear_subscription(self, feed: Feed) -> None:
+        feed.websub_hub_url = None
+        feed.websub_topic_url = None
+        feed.websub_secret = None
+        feed.websub_lease_expires_at = None
+
+
+websub_service = WebSubService()
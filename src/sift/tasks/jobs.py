@@ -7,19 +7,35 @@ from uuid import UUID
 from sift.config import get_settings
 from sift.core.runtime import get_plugin_manager
 from sift.db.session import SessionLocal
+from sift.observability.loop_monitor import monitor_event_loop
 from sift.observability.metrics import get_observability_metrics
+from sift.observability.multiprocess import flush_metrics_spool
+from sift.observability.profiler import sample_job_process
+from sift.observability.sql import QueryStats, bind_query_stats, record_query_stats, reset_query_stats
 from sift.services.ingestion_service import FeedNotFoundError, ingestion_service
+from sift.services.opml_service import FeedProbe, opml_service
+from sift.services.partition_service import PartitionMaintenanceResult, partition_service
+from sift.services.retention_service import RetentionRunResult, retention_service
 
 logger = logging.getLogger(__name__)
 
 
 async def _run_ingest(feed_id: UUID) -> dict[str, object]:
-    async with SessionLocal() as session:
+    async with monitor_event_loop(service="sift-worker"), SessionLocal() as session:
         result = await ingestion_service.ingest_feed(session, feed_id=feed_id, plugin_manager=get_plugin_manager())
     return result.model_dump(mode="json")
 
 
 def ingest_feed_job(feed_id: str) -> dict[str, object]:
+    try:
+        with sample_job_process():
+            return _ingest_feed_job(feed_id)
+    finally:
+        # RQ runs each job in a forked process; hand its metrics to the worker parent before the process exits.
+        flush_metrics_spool()
+
+
+def _ingest_feed_job(feed_id: str) -> dict[str, object]:
     settings = get_settings()
     started_at = perf_counter()
     logger.info(
@@ -32,22 +48,29 @@ def ingest_feed_job(feed_id: str) -> dict[str, object]:
         },
     )
 
+    query_stats = QueryStats(source="worker", route="ingest_feed")
     try:
         parsed_id = UUID(feed_id)
     except ValueError as exc:
         payload: dict[str, object] = {"feed_id": feed_id, "status": "invalid", "errors": [str(exc)]}
-        _record_worker_job_observability(feed_id=feed_id, payload=payload, started_at=started_at)
+        _record_worker_job_observability(
+            feed_id=feed_id, payload=payload, started_at=started_at, query_stats=query_stats
+        )
         return payload
 
+    query_token = bind_query_stats(query_stats)
     try:
         payload = dict(asyncio.run(_run_ingest(parsed_id)))
     except FeedNotFoundError as exc:
         payload = {"feed_id": feed_id, "status": "missing", "errors": [str(exc)]}
-        _record_worker_job_observability(feed_id=feed_id, payload=payload, started_at=started_at)
+        _record_worker_job_observability(
+            feed_id=feed_id, payload=payload, started_at=started_at, query_stats=query_stats
+        )
         return payload
     except Exception as exc:  # noqa: BLE001
         duration_seconds = perf_counter() - started_at
         get_observability_metrics().record_worker_job(result="failure", duration_seconds=duration_seconds)
+        record_query_stats(query_stats)
         logger.error(
             "worker.job.error",
             extra={
@@ -56,24 +79,178 @@ def ingest_feed_job(feed_id: str) -> dict[str, object]:
                 "job_id": f"ingest-{feed_id}",
                 "queue_name": settings.ingest_queue_name,
                 "duration_ms": int(duration_seconds * 1000),
+                "db_query_count": query_stats.query_count,
+                "db_time_ms": int(query_stats.db_seconds * 1000),
                 "error_type": type(exc).__name__,
                 "error_message": str(exc),
             },
         )
         raise
+    finally:
+        reset_query_stats(query_token)
 
     payload["status"] = "ok"
-    _record_worker_job_observability(feed_id=feed_id, payload=payload, started_at=started_at)
+    _record_worker_job_observability(feed_id=feed_id, payload=payload, started_at=started_at, query_stats=query_stats)
+    return payload
+
+
+async def _run_probe(feed_id: UUID) -> FeedProbe | None:
+    async with monitor_event_loop(service="sift-worker"), SessionLocal() as session:
+        return await opml_service.probe_imported_feed(session, feed_id=feed_id, plugin_manager=get_plugin_manager())
+
+
+def probe_feed_job(feed_id: str) -> dict[str, object]:
+    try:
+        with sample_job_process():
+            return _probe_feed_job(feed_id)
+    finally:
+        flush_metrics_spool()
+
+
+def _probe_feed_job(feed_id: str) -> dict[str, object]:
+    started_at = perf_counter()
+    try:
+        probe = asyncio.run(_run_probe(UUID(feed_id)))
+    except Exception as exc:  # noqa: BLE001
+        logger.error(
+            "opml.probe.error",
+            extra={
+                "event": "opml.probe.error",
+                "feed_id": feed_id,
+                "duration_ms": int((perf_counter() - started_at) * 1000),
+                "error_type": type(exc).__name__,
+                "error_message": str(exc),
+            },
+        )
+        raise
+
+    payload: dict[str, object] = {"feed_id": feed_id, "status": "missing" if probe is None else probe.status}
+    if probe is not None:
+        payload.update(resolved_url=probe.resolved_url, error=probe.error, inserted_count=probe.inserted_count)
+    logger.info(
+        "opml.probe.complete",
+        extra={
+            "event": "opml.probe.complete",
+            "duration_ms": int((perf_counter() - started_at) * 1000),
+            **payload,
+        },
+    )
+    return payload
+
+
+async def _run_retention() -> RetentionRunResult:
+    async with monitor_event_loop(service="sift-worker"), SessionLocal() as session:
+        return await retention_service.run(session, settings=get_settings())
+
+
+def retention_job() -> dict[str, object]:
+    try:
+        with sample_job_process():
+            return _retention_job()
+    finally:
+        flush_metrics_spool()
+
+
+def _retention_job() -> dict[str, object]:
+    started_at = perf_counter()
+    query_stats = QueryStats(source="worker", route="retention")
+    query_token = bind_query_stats(query_stats)
+    try:
+        result = asyncio.run(_run_retention())
+    except Exception as exc:  # noqa: BLE001
+        duration_seconds = perf_counter() - started_at
+        get_observability_metrics().record_retention_run(result="failure", duration_seconds=duration_seconds)
+        logger.error(
+            "retention.run.error",
+            extra={
+                "event": "retention.run.error",
+                "duration_ms": int(duration_seconds * 1000),
+                "error_type": type(exc).__name__,
+                "error_message": str(exc),
+            },
+        )
+        raise
+    finally:
+        reset_query_stats(query_token)
+        record_query_stats(query_stats)
+
+    duration_seconds = perf_counter() - started_at
+    get_observability_metrics().record_retention_run(result="success", duration_seconds=duration_seconds)
+    payload: dict[str, object] = {
+        "raw_entries_deleted": result.raw_entries_deleted,
+        "raw_entries_bytes": result.raw_entries_bytes,
+        "classifier_runs_compacted": result.classifier_runs_compacted,
+        "classifier_runs_bytes": result.classifier_runs_bytes,
+        "classifier_summaries_written": result.classifier_summaries_written,
+    }
+    logger.info(
+        "retention.run.complete",
+        extra={
+            "event": "retention.run.complete",
+            "duration_ms": int(duration_seconds * 1000),
+            "db_query_count": query_stats.query_count,
+            "db_time_ms": int(query_stats.db_seconds * 1000),
+            **payload,
+        },
+    )
+    return payload
+
+
+async def _run_partition_maintenance() -> PartitionMaintenanceResult:
+    async with monitor_event_loop(service="sift-worker"), SessionLocal() as session:
+        return await partition_service.run(session, settings=get_settings())
+
+
+def partition_maintenance_job() -> dict[str, object]:
+    try:
+        with sample_job_process():
+            return _partition_maintenance_job()
+    finally:
+        flush_metrics_spool()
+
+
+def _partition_maintenance_job() -> dict[str, object]:
+    started_at = perf_counter()
+    try:
+        result = asyncio.run(_run_partition_maintenance())
+    except Exception as exc:  # noqa: BLE001
+        logger.error(
+            "partitions.maintenance.error",
+            extra={
+                "event": "partitions.maintenance.error",
+                "duration_ms": int((perf_counter() - started_at) * 1000),
+                "error_type": type(exc).__name__,
+                "error_message": str(exc),
+            },
+        )
+        raise
+
+    payload: dict[str, object] = {"created": result.created, "detached": result.detached}
+    logger.info(
+        "partitions.maintenance.complete",
+        extra={
+            "event": "partitions.maintenance.complete",
+            "duration_ms": int((perf_counter() - started_at) * 1000),
+            **payload,
+        },
+    )
     return payload
 
 
-def _record_worker_job_observability(*, feed_id: str, payload: Mapping[str, object], started_at: float) -> None:
+def _record_worker_job_observability(
+    *,
+    feed_id: str,
+    payload: Mapping[str, object],
+    started_at: float,
+    query_stats: QueryStats,
+) -> None:
     settings = get_settings()
     errors = payload.get("errors")
     has_errors = isinstance(errors, list) and bool(errors)
     result = "success" if payload.get("status") == "ok" and not has_errors else "failure"
     duration_seconds = perf_counter() - started_at
     get_observability_metrics().record_worker_job(result=result, duration_seconds=duration_seconds)
+    record_query_stats(query_stats)
     logger.info(
         "worker.job.complete",
         extra={
@@ -84,5 +261,7 @@ def _record_worker_job_observability(*, feed_id: str, payload: Mapping[str, obje
             "result": result,
             "status": payload.get("status"),
             "duration_ms": int(duration_seconds * 1000),
+            "db_query_count": query_stats.query_count,
+            "db_time_ms": int(query_stats.db_seconds * 1000),
         },
     )
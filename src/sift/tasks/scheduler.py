@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from time import perf_counter
@@ -8,12 +9,16 @@ from uuid import UUID
 
 from sift.config import get_settings
 from sift.db.models import Feed
+from sift.db.pool import set_pool_process_type
 from sift.db.session import SessionLocal
 from sift.observability.logging import configure_logging
+from sift.observability.loop_monitor import monitor_event_loop
 from sift.observability.metrics import get_observability_metrics
 from sift.observability.metrics_server import start_metrics_http_server
+from sift.observability.profiler import get_sampling_profiler
 from sift.services.feed_service import feed_service
-from sift.tasks.jobs import ingest_feed_job
+from sift.services.websub_service import is_push_active
+from sift.tasks.jobs import ingest_feed_job, partition_maintenance_job, probe_feed_job, retention_job
 from sift.tasks.queueing import get_ingest_queue
 
 if TYPE_CHECKING:
@@ -21,6 +26,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+RETENTION_JOB_ID = "retention"
+PARTITION_MAINTENANCE_JOB_ID = "partition-maintenance"
+
 
 @dataclass(slots=True)
 class SchedulerEnqueueStats:
@@ -36,17 +44,22 @@ def _normalize_last_fetched_at(value: datetime | None) -> datetime | None:
     return value.astimezone(UTC)
 
 
-def _is_feed_due(feed: Feed, now: datetime) -> bool:
+def _is_feed_due(feed: Feed, now: datetime, *, push_fallback_interval_minutes: int = 0) -> bool:
     if not feed.is_active:
         return False
-    if feed.fetch_interval_minutes <= 0:
+
+    interval_minutes = feed.fetch_interval_minutes
+    if is_push_active(feed, now):
+        # WebSub-pushed feeds only need a long safety poll to catch missed notifications.
+        interval_minutes = max(interval_minutes, push_fallback_interval_minutes)
+    if interval_minutes <= 0:
         return True
 
     last_fetched_at = _normalize_last_fetched_at(feed.last_fetched_at)
     if last_fetched_at is None:
         return True
 
-    due_at = last_fetched_at + timedelta(minutes=feed.fetch_interval_minutes)
+    due_at = last_fetched_at + timedelta(minutes=interval_minutes)
     return due_at <= now
 
 
@@ -134,7 +147,11 @@ async def enqueue_due_feeds() -> SchedulerEnqueueStats:
     async with SessionLocal() as session:
         feeds = await feed_service.list_active_feeds(session, limit=settings.scheduler_batch_size)
         for feed in feeds:
-            if not _is_feed_due(feed, now):
+            if not _is_feed_due(
+                feed,
+                now,
+                push_fallback_interval_minutes=settings.websub_fallback_poll_interval_minutes,
+            ):
                 metrics.record_scheduler_enqueue(result="skip_due")
                 logger.debug(
                     "scheduler.enqueue.skip_due",
@@ -200,6 +217,109 @@ async def enqueue_due_feeds() -> SchedulerEnqueueStats:
     return stats
 
 
+def _enqueue_periodic_job(
+    queue: "Queue | None", *, job: Callable[[], object], job_id: str, interval_seconds: int, event_prefix: str
+) -> bool:
+    settings = get_settings()
+    active_queue = queue or get_ingest_queue()
+    # Finished and failed runs are kept for one interval, so an existing job record doubles as the schedule.
+    if active_queue.fetch_job(job_id) is not None:
+        return False
+
+    interval_seconds = max(60, interval_seconds)
+    try:
+        active_queue.enqueue(
+            job,
+            job_id=job_id,
+            job_timeout=max(600, interval_seconds),
+            result_ttl=interval_seconds,
+            failure_ttl=interval_seconds,
+        )
+    except Exception as exc:
+        logger.error(
+            f"{event_prefix}.enqueue_error",
+            extra={
+                "event": f"{event_prefix}.enqueue_error",
+                "job_id": job_id,
+                "queue_name": settings.ingest_queue_name,
+                "error_type": type(exc).__name__,
+                "error_message": str(exc),
+            },
+        )
+        return False
+
+    logger.info(
+        f"{event_prefix}.enqueued",
+        extra={
+            "event": f"{event_prefix}.enqueued",
+            "job_id": job_id,
+            "queue_name": settings.ingest_queue_name,
+        },
+    )
+    return True
+
+
+def enqueue_retention_job(queue: "Queue | None" = None) -> bool:
+    settings = get_settings()
+    if not settings.retention_enabled:
+        return False
+    return _enqueue_periodic_job(
+        queue,
+        job=retention_job,
+        job_id=RETENTION_JOB_ID,
+        interval_seconds=settings.retention_interval_seconds,
+        event_prefix="scheduler.retention",
+    )
+
+
+def enqueue_partition_maintenance_job(queue: "Queue | None" = None) -> bool:
+    settings = get_settings()
+    if not settings.database_partitioning_enabled:
+        return False
+    return _enqueue_periodic_job(
+        queue,
+        job=partition_maintenance_job,
+        job_id=PARTITION_MAINTENANCE_JOB_ID,
+        interval_seconds=settings.database_partition_maintenance_interval_seconds,
+        event_prefix="scheduler.partitions",
+    )
+
+
+def enqueue_feed_probes(feed_ids: Sequence[UUID], queue: "Queue | None" = None) -> int:
+    if not feed_ids:
+        return 0
+    settings = get_settings()
+    active_queue = queue or get_ingest_queue()
+    # Probes share the ingest job id, so the scheduler does not also fetch a feed while its probe is queued.
+    jobs = [
+        active_queue.prepare_data(
+            probe_feed_job,
+            (str(feed_id),),
+            job_id=_ingest_job_id(feed_id),
+            timeout=600,
+            result_ttl=3600,
+            failure_ttl=86400,
+        )
+        for feed_id in feed_ids
+    ]
+    try:
+        active_queue.enqueue_many(jobs)
+    except Exception as exc:
+        # The feeds exist either way; the scheduler fetches them on its next pass.
+        logger.error(
+            "opml.probe.enqueue_error",
+            extra={
+                "event": "opml.probe.enqueue_error",
+                "feed_count": len(feed_ids),
+                "queue_name": settings.ingest_queue_name,
+                "error_type": type(exc).__name__,
+                "error_message": str(exc),
+            },
+        )
+        return 0
+    return len(jobs)
+
+
 async def run_scheduler_loop() -> None:
     settings = get_settings()
     metrics = get_observability_metrics()
@@ -223,6 +343,8 @@ async def run_scheduler_loop() -> None:
         )
         try:
             stats = await enqueue_due_feeds()
+            enqueue_retention_job()
+            enqueue_partition_maintenance_job()
         except Exception as exc:
             loop_result = "error"
             logger.error(
@@ -250,14 +372,22 @@ async def run_scheduler_loop() -> None:
         await asyncio.sleep(settings.scheduler_poll_interval_seconds)
 
 
+async def _run_monitored_scheduler_loop() -> None:
+    async with monitor_event_loop(service="sift-scheduler"):
+        await run_scheduler_loop()
+
+
 def main() -> None:
     settings = get_settings()
+    set_pool_process_type("scheduler")
     configure_logging(
         service="sift-scheduler",
         env=settings.env,
         level=settings.log_level,
         log_format=settings.log_format,
         redact_fields=settings.log_redact_fields,
+        queue_size=settings.log_queue_size,
+        sample_rates=settings.log_sample_rates,
     )
     metrics_server = start_metrics_http_server(
         service_name="sift-scheduler",
@@ -265,6 +395,8 @@ def main() -> None:
         host=settings.metrics_bind_host,
         port=settings.metrics_scheduler_port,
         path=settings.metrics_path,
+        profiler=get_sampling_profiler() if settings.profiling_enabled else None,
+        profiling_token=settings.profiling_token,
     )
     logger.info(
         "scheduler.process.metrics",
@@ -275,7 +407,7 @@ def main() -> None:
             "metrics_path": metrics_server.path if metrics_server else None,
         },
     )
-    asyncio.run(run_scheduler_loop())
+    asyncio.run(_run_monitored_scheduler_loop())
 
 
 if __name__ == "__main__":
@@ -1,30 +1,55 @@
 import logging
 
-from rq import Worker
+from rq import Queue, Worker
+from rq.job import Job
 
 from sift.config import get_settings
+from sift.db.pool import set_pool_process_type
 from sift.observability.logging import configure_logging
 from sift.observability.metrics_server import start_metrics_http_server
+from sift.observability.multiprocess import collect_metrics_spool, enable_metrics_spool
+from sift.observability.profiler import JobProcessProfiler, get_sampling_profiler
 from sift.tasks.queueing import get_ingest_queue, get_redis_connection
 
 logger = logging.getLogger(__name__)
 
 
+class MetricsSpoolWorker(Worker):
+    def execute_job(self, job: Job, queue: Queue) -> None:
+        try:
+            super().execute_job(job, queue)
+        finally:
+            # The work horse has exited by now, so its spooled metrics are complete.
+            collect_metrics_spool()
+
+
 def main() -> None:
     settings = get_settings()
+    set_pool_process_type("worker")
     configure_logging(
         service="sift-worker",
         env=settings.env,
         level=settings.log_level,
         log_format=settings.log_format,
         redact_fields=settings.log_redact_fields,
+        queue_size=settings.log_queue_size,
+        sample_rates=settings.log_sample_rates,
     )
+    metrics_enabled = settings.observability_enabled and settings.metrics_enabled
+    profiler: JobProcessProfiler | None = None
+    if metrics_enabled:
+        spool = enable_metrics_spool(settings.metrics_multiprocess_dir)
+        if settings.profiling_enabled:
+            # Job code runs in forked work horses; they sample themselves and hand stacks back through the spool.
+            profiler = JobProcessProfiler(get_sampling_profiler(), directory=spool.directory / "profiles")
     metrics_server = start_metrics_http_server(
         service_name="sift-worker",
-        enabled=settings.observability_enabled and settings.metrics_enabled,
+        enabled=metrics_enabled,
         host=settings.metrics_bind_host,
         port=settings.metrics_worker_port,
         path=settings.metrics_path,
+        profiler=profiler,
+        profiling_token=settings.profiling_token,
     )
     logger.info(
         "worker.process.start",
@@ -38,7 +63,7 @@ def main() -> None:
         },
     )
     queue = get_ingest_queue()
-    worker = Worker([queue], connection=get_redis_connection())
+    worker = MetricsSpoolWorker([queue], connection=get_redis_connection())
     worker.work(with_scheduler=False)
 
 
@@ -211,6 +211,41 @@ async def test_patch_and_bulk_patch_state() -> None:
     await engine.dispose()
 
 
+@pytest.mark.asyncio
+async def test_state_user_ids_are_stored_as_uuids_and_accept_legacy_strings() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async with session_maker() as session:
+        user = User(email="article-state-uuid@example.com")
+        session.add(user)
+        await session.flush()
+        feed = Feed(owner_id=user.id, title="Feed U", url="https://state-uuid.example.com/rss")
+        session.add(feed)
+        await session.flush()
+        article = Article(feed_id=feed.id, source_id="u1", title="One", content_text="Body")
+        session.add(article)
+        await session.commit()
+
+        await article_service.patch_state(
+            session=session,
+            user_id=user.id,
+            article_id=article.id,
+            is_read=True,
+            is_starred=None,
+            is_archived=None,
+        )
+        stored = (await session.execute(select(ArticleState.user_id))).scalars().all()
+        assert stored == [user.id]
+
+        legacy = await session.execute(select(ArticleState.id).where(ArticleState.user_id == str(user.id)))
+        assert len(legacy.scalars().all()) == 1
+
+    await engine.dispose()
+
+
 @pytest.mark.asyncio
 async def test_list_articles_supports_advanced_query_language() -> None:
     engine = create_async_engine("sqlite+aiosqlite:///:memory:")
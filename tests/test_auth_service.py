@@ -1,8 +1,24 @@
+import threading
+from datetime import UTC, datetime, timedelta
+from time import monotonic
+from uuid import uuid4
+
 import pytest
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from sift.config import get_settings
 from sift.db.base import Base
-from sift.services.auth_service import AuthenticationError, ConflictError, auth_service
+from sift.db.models import AuthIdentity, User
+from sift.services.auth_service import (
+    AuthenticationError,
+    ConflictError,
+    PasswordHashExecutor,
+    SessionLookupCache,
+    _CachedSession,
+    auth_service,
+    password_needs_rehash,
+)
 
 
 @pytest.mark.asyncio
@@ -115,3 +131,177 @@ async def test_authenticate_invalid_password_raises() -> None:
             )
 
     await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_authenticate_rehashes_password_when_argon2_parameters_change(monkeypatch) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "auth_argon2_time_cost", 1)
+    monkeypatch.setattr(settings, "auth_argon2_memory_cost_kib", 8192)
+    monkeypatch.setattr(settings, "auth_argon2_parallelism", 1)
+
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        user = await auth_service.register_local_user(
+            session=session,
+            email="rehash@example.com",
+            password="password-1234",
+        )
+        identity = await session.scalar(select(AuthIdentity).where(AuthIdentity.user_id == user.id))
+        assert identity is not None
+        original_hash = identity.password_hash
+        assert original_hash is not None
+        assert "m=8192,t=1,p=1" in original_hash
+
+        monkeypatch.setattr(settings, "auth_argon2_time_cost", 2)
+        await auth_service.authenticate_local(session=session, email="rehash@example.com", password="password-1234")
+
+        await session.refresh(identity)
+        assert identity.password_hash != original_hash
+        assert identity.password_hash is not None
+        assert "m=8192,t=2,p=1" in identity.password_hash
+        assert password_needs_rehash(identity.password_hash) is False
+
+        await auth_service.authenticate_local(session=session, email="rehash@example.com", password="password-1234")
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_runs_off_the_event_loop_thread(monkeypatch) -> None:
+    loop_thread = threading.get_ident()
+    calls: list[int] = []
+
+    def _recording_verify(password: str, password_hash: str) -> tuple[bool, bool]:
+        calls.append(threading.get_ident())
+        return True, False
+
+    monkeypatch.setattr("sift.services.auth_service._verify_password_and_rehash", _recording_verify)
+    executor = PasswordHashExecutor()
+    try:
+        assert await executor.verify("password-1234", "hash") == (True, False)
+        monkeypatch.setattr(get_settings(), "auth_password_hash_max_workers", 0)
+        assert await executor.verify("password-1234", "hash") == (True, False)
+    finally:
+        executor.shutdown()
+
+    assert calls[0] != loop_thread
+    assert calls[1] == loop_thread
+
+
+@pytest.mark.asyncio
+async def test_session_lookup_is_cached_and_last_seen_writes_are_coalesced(monkeypatch) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "auth_session_cache_ttl_seconds", 60.0)
+    monkeypatch.setattr(settings, "auth_session_last_seen_interval_seconds", 300.0)
+    statements: list[str] = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        user = await auth_service.register_local_user(
+            session=session,
+            email="cached@example.com",
+            password="password-1234",
+            display_name="Cached",
+        )
+        raw_token = await auth_service.create_session(session=session, user=user, ip_address=None, user_agent=None)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", _record_statement)
+        first = await auth_service.get_user_by_session_token(session=session, raw_token=raw_token)
+        assert first is not None
+        assert len(statements) == 1
+        assert statements[0].lstrip().startswith("SELECT")
+
+        for _ in range(5):
+            cached = await auth_service.get_user_by_session_token(session=session, raw_token=raw_token)
+            assert cached is not None
+            assert cached.id == user.id
+            assert cached.email == "cached@example.com"
+            assert cached.is_admin is False
+        assert len(statements) == 1
+
+        # Once the interval has elapsed the next hit refreshes last_seen_at without re-reading the session.
+        monkeypatch.setattr(settings, "auth_session_last_seen_interval_seconds", 0.0)
+        await auth_service.get_user_by_session_token(session=session, raw_token=raw_token)
+        assert len(statements) == 2
+        assert statements[1].lstrip().startswith("UPDATE user_sessions")
+        event.remove(engine.sync_engine, "before_cursor_execute", _record_statement)
+
+        await auth_service.revoke_session(session=session, raw_token=raw_token)
+        assert await auth_service.get_user_by_session_token(session=session, raw_token=raw_token) is None
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_cached_session_returns_persistent_user_and_rejects_disabled_users(monkeypatch) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "auth_session_cache_ttl_seconds", 60.0)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        user = await auth_service.register_local_user(
+            session=session,
+            email="cached-disable@example.com",
+            password="password-1234",
+        )
+        raw_token = await auth_service.create_session(session=session, user=user, ip_address=None, user_agent=None)
+
+    async with session_maker() as session:
+        assert await auth_service.get_user_by_session_token(session=session, raw_token=raw_token) is not None
+
+    async with session_maker() as session:
+        cached = await auth_service.get_user_by_session_token(session=session, raw_token=raw_token)
+        assert cached is not None
+        assert cached in session
+        cached.display_name = "Renamed"
+        await session.commit()
+
+    # Another process disabling the user is seen on the next cache hit.
+    async with session_maker() as session:
+        stored = await session.get(User, user.id)
+        assert stored is not None
+        assert stored.display_name == "Renamed"
+        stored.is_active = False
+        await session.commit()
+    async with session_maker() as session:
+        assert await auth_service.get_user_by_session_token(session=session, raw_token=raw_token) is None
+
+    await engine.dispose()
+
+
+def test_session_lookup_cache_expires_and_evicts_oldest_entries() -> None:
+    cache = SessionLookupCache(max_entries=2)
+    now = datetime.now(UTC)
+
+    def _entry(expires_at: datetime) -> _CachedSession:
+        return _CachedSession(
+            session_id=uuid4(),
+            user_id=uuid4(),
+            expires_at=expires_at,
+            cached_at=monotonic(),
+            last_seen_written_at=monotonic(),
+        )
+
+    cache.put("a", _entry(now + timedelta(days=1)))
+    cache.put("b", _entry(now - timedelta(seconds=1)))
+    cache.put("c", _entry(now + timedelta(days=1)))
+
+    assert cache.get("a", ttl_seconds=60.0, now=now) is None
+    assert cache.get("b", ttl_seconds=60.0, now=now) is None
+    assert cache.get("c", ttl_seconds=60.0, now=now) is not None
+    assert cache.get("c", ttl_seconds=0.0, now=now) is None
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from sift.config import Settings
+from sift.db.pool import (
+    MeteredQueuePool,
+    PoolConfigError,
+    asyncpg_connect_args,
+    create_database_engine,
+    pre_ping_strategy,
+    set_pool_process_type,
+)
+from sift.observability.metrics import get_observability_metrics
+
+
+def test_asyncpg_connect_args_disable_statement_caching_behind_pgbouncer() -> None:
+    assert asyncpg_connect_args(Settings(database_statement_cache_size=250)) == {
+        "statement_cache_size": 250,
+        "prepared_statement_cache_size": 250,
+    }
+
+    pgbouncer_args = asyncpg_connect_args(Settings(database_pgbouncer=True))
+    assert pgbouncer_args["statement_cache_size"] == 0
+    assert pgbouncer_args["prepared_statement_cache_size"] == 0
+    name_func = pgbouncer_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+    engine = create_database_engine(
+        "postgresql+asyncpg://sift:sift@db:5432/sift",
+        Settings(database_pgbouncer=True, database_pool_pre_ping="always", database_pool_recycle_seconds=600),
+        role="primary",
+        pool_size=3,
+        max_overflow=1,
+    )
+    pool = engine.sync_engine.pool
+    assert isinstance(pool, MeteredQueuePool)
+    assert pool.size() == 3
+    assert pool._recycle == 600
+    assert pool._pre_ping is True
+
+    with pytest.raises(PoolConfigError):
+        pre_ping_strategy(Settings(database_pool_pre_ping="sometimes"))
+
+
+@pytest.mark.asyncio
+async def test_metered_pool_records_wait_checkout_and_timeouts_per_process(tmp_path) -> None:
+    metrics = get_observability_metrics()
+    metrics.reset()
+    set_pool_process_type("worker")
+    engine = create_database_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        Settings(database_pool_timeout_seconds=0.05, database_pool_pre_ping="never"),
+        role="replica",
+        pool_size=1,
+        max_overflow=0,
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+    finally:
+        set_pool_process_type("api")
+        await engine.dispose()
+
+    labels = {"role": "replica", "process": "worker"}
+    timeouts = metrics.snapshot()["sift_db_pool_timeouts_total"]
+    assert [sample.value for sample in timeouts if sample.labels == labels] == [1.0]
+    histograms = metrics.histogram_snapshot()
+    (wait,) = [sample for sample in histograms["sift_db_pool_wait_seconds"] if sample.labels == labels]
+    assert wait.count == 2
+    assert wait.sum >= 0.05
+    (checkout,) = [sample for sample in histograms["sift_db_pool_checkout_seconds"] if sample.labels == labels]
+    assert checkout.count == 2
+
+    # Disposing recreates the pool, which keeps reporting under the same role.
+    assert isinstance(engine.sync_engine.pool, MeteredQueuePool)
+    assert engine.sync_engine.pool.role == "replica"
+
+
+@pytest.mark.asyncio
+async def test_idle_pre_ping_only_pings_idle_connections_and_replaces_dead_ones(tmp_path, monkeypatch) -> None:
+    engine = create_database_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'ping.db'}",
+        Settings(database_pool_pre_ping="idle", database_pool_pre_ping_idle_seconds=0.05),
+        role="primary",
+        pool_size=1,
+        max_overflow=0,
+    )
+    pings: list[bool] = []
+    connects: list[object] = []
+    event.listen(engine.sync_engine, "connect", lambda dbapi_connection, _record: connects.append(dbapi_connection))
+
+    def _fail_ping(_dbapi_connection: object) -> bool:
+        pings.append(True)
+        raise ConnectionError("server closed the connection")
+
+    monkeypatch.setattr(engine.sync_engine.dialect, "do_ping", _fail_ping)
+
+    for _ in range(2):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    assert pings == []
+    assert len(connects) == 1
+
+    await asyncio.sleep(0.1)
+    async with engine.connect() as conn:
+        assert (await conn.execute(text("SELECT 1"))).scalar_one() == 1
+    assert pings == [True]
+    assert len(connects) == 2
+    await engine.dispose()
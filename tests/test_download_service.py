@@ -0,0 +1,154 @@
+import asyncio
+import gzip
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from sift.observability.metrics import MetricSample, get_observability_metrics
+from sift.services.download_service import DownloadAbortedError, download_limited
+
+
+def _sample_map(samples: list[MetricSample], *, label_keys: tuple[str, ...]) -> dict[tuple[str, ...], float]:
+    mapped: dict[tuple[str, ...], float] = {}
+    for sample in samples:
+        key = tuple(sample.labels[key] for key in label_keys)
+        mapped[key] = sample.value
+    return mapped
+
+
+def _abort_counts() -> dict[tuple[str, ...], float]:
+    snapshot = get_observability_metrics().snapshot()
+    return _sample_map(snapshot.get("sift_http_download_aborts_total", []), label_keys=("source", "reason"))
+
+
+class _ChunkStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes], *, delay_seconds: float = 0.0) -> None:
+        self.chunks = chunks
+        self.delay_seconds = delay_seconds
+        self.yielded = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            if self.delay_seconds:
+                await asyncio.sleep(self.delay_seconds)
+            self.yielded += 1
+            yield chunk
+
+
+def _client(handler) -> httpx.AsyncClient:  # type: ignore[no-untyped-def]
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_download_limited_returns_body_within_limit() -> None:
+    async with _client(lambda _request: httpx.Response(200, content=b"<rss/>")) as client:
+        response = await download_limited(
+            client, "https://download.example.com/feed.xml", source="feed", max_bytes=1024, read_deadline_seconds=5
+        )
+
+    assert response.status_code == 200
+    assert response.content == b"<rss/>"
+    assert response.url == "https://download.example.com/feed.xml"
+
+
+@pytest.mark.asyncio
+async def test_download_limited_skips_body_for_unread_statuses() -> None:
+    stream = _ChunkStream([b"x" * 10])
+    async with _client(lambda _request: httpx.Response(304, stream=stream)) as client:
+        response = await download_limited(
+            client, "https://download.example.com/feed.xml", source="feed", max_bytes=1024, read_deadline_seconds=5
+        )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert stream.yielded == 0
+
+
+@pytest.mark.asyncio
+async def test_download_limited_aborts_streamed_body_over_cap_early() -> None:
+    get_observability_metrics().reset()
+    stream = _ChunkStream([b"x" * 100] * 50)
+    async with _client(lambda _request: httpx.Response(200, stream=stream)) as client:
+        with pytest.raises(DownloadAbortedError) as exc_info:
+            await download_limited(
+                client, "https://download.example.com/big.xml", source="feed", max_bytes=250, read_deadline_seconds=5
+            )
+
+    assert exc_info.value.reason == "oversize"
+    assert stream.yielded == 3
+    assert _abort_counts()[("feed", "oversize")] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_download_limited_rejects_declared_length_over_cap_without_reading() -> None:
+    stream = _ChunkStream([b"x" * 10])
+    async with _client(
+        lambda _request: httpx.Response(200, headers={"Content-Length": "5000"}, stream=stream)
+    ) as client:
+        with pytest.raises(DownloadAbortedError) as exc_info:
+            await download_limited(
+                client, "https://download.example.com/big.xml", source="feed", max_bytes=1000, read_deadline_seconds=5
+            )
+
+    assert exc_info.value.reason == "oversize"
+    assert stream.yielded == 0
+
+
+@pytest.mark.asyncio
+async def test_download_limited_guards_against_decompression_bombs() -> None:
+    get_observability_metrics().reset()
+    bomb = gzip.compress(b"\0" * 8_000_000)
+    async with _client(
+        lambda _request: httpx.Response(200, headers={"Content-Encoding": "gzip"}, content=bomb)
+    ) as client:
+        with pytest.raises(DownloadAbortedError) as exc_info:
+            await download_limited(
+                client,
+                "https://download.example.com/bomb.xml",
+                source="feed",
+                max_bytes=50_000_000,
+                read_deadline_seconds=5,
+            )
+
+    assert exc_info.value.reason == "decompression_ratio"
+    assert _abort_counts()[("feed", "decompression_ratio")] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_download_limited_enforces_read_deadline() -> None:
+    get_observability_metrics().reset()
+    stream = _ChunkStream([b"x"] * 20, delay_seconds=0.05)
+    async with _client(lambda _request: httpx.Response(200, stream=stream)) as client:
+        with pytest.raises(DownloadAbortedError) as exc_info:
+            await download_limited(
+                client,
+                "https://download.example.com/slow.html",
+                source="fulltext",
+                max_bytes=1024,
+                read_deadline_seconds=0.2,
+            )
+
+    assert exc_info.value.reason == "deadline"
+    assert stream.yielded < 20
+    assert _abort_counts()[("fulltext", "deadline")] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_download_limited_rejects_unexpected_content_type() -> None:
+    stream = _ChunkStream([b"%PDF"])
+    async with _client(
+        lambda _request: httpx.Response(200, headers={"Content-Type": "application/pdf"}, stream=stream)
+    ) as client:
+        with pytest.raises(DownloadAbortedError) as exc_info:
+            await download_limited(
+                client,
+                "https://download.example.com/doc.pdf",
+                source="fulltext",
+                max_bytes=1024,
+                read_deadline_seconds=5,
+                allowed_content_types=("text/html",),
+            )
+
+    assert exc_info.value.reason == "content_type"
+    assert stream.yielded == 0
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+
+import pytest
+
+import sift.services.feed_parse_service as feed_parse_module
+from sift.config import get_settings
+from sift.observability.metrics import MetricSample, get_observability_metrics
+from sift.services.feed_parse_service import (
+    FeedBodyTooLargeError,
+    FeedParseError,
+    FeedParseService,
+    FeedParseTimeoutError,
+    ParsedFeed,
+    parse_feed_document,
+)
+
+_FEED_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>Parse feed</title>
+    <atom:link rel="hub" href="https://hub.example.com/" />
+    <item>
+      <guid>entry-1</guid>
+      <title>First</title>
+      <link>https://example.com/posts/1</link>
+      <description>Summary body</description>
+      <pubDate>Fri, 14 Feb 2026 10:00:00 GMT</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+def _sample_map(samples: list[MetricSample], *, label_keys: tuple[str, ...]) -> dict[tuple[str, ...], float]:
+    return {tuple(sample.labels[key] for key in label_keys): sample.value for sample in samples}
+
+
+def test_parse_feed_document_returns_compact_entries_and_feed_links() -> None:
+    parsed = parse_feed_document(_FEED_XML)
+
+    assert len(parsed.entries) == 1
+    entry = parsed.entries[0]
+    assert entry.fields["id"] == "entry-1"
+    assert entry.fields["link"] == "https://example.com/posts/1"
+    assert entry.fields["published_parsed"].tm_year == 2026
+    assert "title_detail" not in entry.fields
+    assert '"title_detail"' in entry.payload
+    assert {"rel": "hub", "href": "https://hub.example.com/"} in parsed.feed_meta["links"]
+    assert parsed.feed_meta["title"] == "Parse feed"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_kind", ["inline", "thread", "process"])
+async def test_parse_service_dispatches_to_configured_executor(monkeypatch, executor_kind: str) -> None:
+    monkeypatch.setattr(get_settings(), "ingest_parse_executor", executor_kind)
+    metrics = get_observability_metrics()
+    metrics.reset()
+    service = FeedParseService()
+
+    try:
+        parsed = await service.parse(_FEED_XML)
+    finally:
+        service.shutdown()
+
+    assert [entry.fields["title"] for entry in parsed.entries] == ["First"]
+    parses = _sample_map(metrics.snapshot()["sift_ingest_parses_total"], label_keys=("executor", "result"))
+    assert parses[(executor_kind, "success")] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_parse_service_rejects_oversized_body(monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "ingest_parse_max_body_bytes", 16)
+    metrics = get_observability_metrics()
+    metrics.reset()
+
+    with pytest.raises(FeedBodyTooLargeError):
+        await FeedParseService().parse(_FEED_XML)
+
+    parses = _sample_map(metrics.snapshot()["sift_ingest_parses_total"], label_keys=("executor", "result"))
+    assert parses[("thread", "too_large")] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_thread_parse_timeouts_keep_one_bounded_pool_and_spare_other_callers(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "ingest_parse_executor", "thread")
+    monkeypatch.setattr(settings, "ingest_parse_max_workers", 2)
+    monkeypatch.setattr(settings, "ingest_parse_timeout_seconds", 0.2)
+    release = threading.Event()
+
+    def _parse(content: bytes) -> ParsedFeed:
+        if content == b"hang":
+            release.wait(5)
+        return parse_feed_document(_FEED_XML)
+
+    monkeypatch.setattr(feed_parse_module, "parse_feed_document", _parse)
+    metrics = get_observability_metrics()
+    metrics.reset()
+    service = FeedParseService()
+
+    try:
+        hung, parsed = await asyncio.gather(service.parse(b"hang"), service.parse(_FEED_XML), return_exceptions=True)
+        assert isinstance(hung, FeedParseTimeoutError)
+        # The parse that shared the pool with the timed-out one is neither cancelled nor failed.
+        assert isinstance(parsed, ParsedFeed)
+        executor = service._executor
+        assert service.hung_workers == 1
+
+        with pytest.raises(FeedParseTimeoutError):
+            await service.parse(b"hang")
+        assert service.hung_workers == 2
+        # With every worker stuck, new parses fail fast instead of adding threads.
+        with pytest.raises(FeedParseError, match="busy with timed-out feeds"):
+            await service.parse(_FEED_XML)
+        assert service._executor is executor
+
+        release.set()
+        for _ in range(50):
+            if service.hung_workers == 0:
+                break
+            await asyncio.sleep(0.02)
+        assert service.hung_workers == 0
+        assert [entry.fields["title"] for entry in (await service.parse(_FEED_XML)).entries] == ["First"]
+        assert service._executor is executor
+    finally:
+        release.set()
+        service.shutdown()
+
+    parses = _sample_map(metrics.snapshot()["sift_ingest_parses_total"], label_keys=("executor", "result"))
+    assert parses[("thread", "timeout")] == 2.0
+    assert parses[("thread", "saturated")] == 1.0
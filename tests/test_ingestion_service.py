@@ -1,13 +1,16 @@
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC
 
 import httpx
 import pytest
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+import sift.services.ingestion_service as ingestion_module
 from sift.db.base import Base
-from sift.db.models import Article, Feed
+from sift.db.models import Article, Feed, RawEntry
 from sift.observability.metrics import MetricSample, get_observability_metrics
 from sift.services.dedup_service import build_content_fingerprint, dedup_service, normalize_canonical_url
 from sift.services.ingestion_service import _make_source_id, _parse_published_at, ingestion_service
@@ -86,12 +89,22 @@ class _PluginManagerStub:
     async def run_ingested_hooks(self, article_context):  # type: ignore[no-untyped-def]
         return article_context
 
+    async def run_ingested_hooks_batch(self, article_contexts):  # type: ignore[no-untyped-def]
+        return list(article_contexts)
+
 
 class _ResponseStub:
     def __init__(self, status_code: int, content: bytes = b"", headers: dict[str, str] | None = None) -> None:
         self.status_code = status_code
         self.content = content
         self.headers = headers or {}
+        self.url = "https://ingestion.example.com/feed.xml"
+        self.charset_encoding = None
+        self.history: list[_ResponseStub] = []
+        self.num_bytes_downloaded = len(content)
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        yield self.content
 
 
 def _sample_map(samples: list[MetricSample], *, label_keys: tuple[str, ...]) -> dict[tuple[str, ...], float]:
@@ -120,9 +133,12 @@ async def test_ingest_feed_sets_last_fetch_success_at_on_304(monkeypatch) -> Non
         async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
             return None
 
-        async def get(self, _url: str, headers: dict[str, str] | None = None) -> _ResponseStub:
+        @asynccontextmanager
+        async def stream(
+            self, _method: str, _url: str, headers: dict[str, str] | None = None
+        ) -> AsyncIterator[_ResponseStub]:
             assert headers is not None
-            return _ResponseStub(status_code=304)
+            yield _ResponseStub(status_code=304)
 
     monkeypatch.setattr(httpx, "AsyncClient", _ClientStub)
 
@@ -167,9 +183,12 @@ async def test_ingest_feed_sets_last_fetch_success_at_on_success_and_error_times
         async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
             return None
 
-        async def get(self, _url: str, headers: dict[str, str] | None = None) -> _ResponseStub:
+        @asynccontextmanager
+        async def stream(
+            self, _method: str, _url: str, headers: dict[str, str] | None = None
+        ) -> AsyncIterator[_ResponseStub]:
             assert headers is not None
-            return _ResponseStub(
+            yield _ResponseStub(
                 status_code=200,
                 content=b"<rss><channel><title>test</title></channel></rss>",
             )
@@ -184,7 +203,7 @@ async def test_ingest_feed_sets_last_fetch_success_at_on_success_and_error_times
         async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
             return None
 
-        async def get(self, _url: str, headers: dict[str, str] | None = None) -> _ResponseStub:
+        def stream(self, _method: str, _url: str, headers: dict[str, str] | None = None) -> None:
             raise httpx.ConnectError("network down")
 
     async with session_maker() as session:
@@ -225,3 +244,207 @@ async def test_ingest_feed_sets_last_fetch_success_at_on_success_and_error_times
         assert run_totals[("network_error",)] == 1.0
 
     await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_ingest_feed_skips_parse_when_body_is_byte_identical(monkeypatch) -> None:
+    metrics = get_observability_metrics()
+    metrics.reset()
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    body = (
+        b"<rss><channel><title>test</title>"
+        b"<item><guid>entry-1</guid><title>First</title><description>Body</description></item>"
+        b"</channel></rss>"
+    )
+
+    class _SameBodyClientStub:
+        def __init__(self, **_kwargs) -> None:
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+            return None
+
+        @asynccontextmanager
+        async def stream(
+            self, _method: str, _url: str, headers: dict[str, str] | None = None
+        ) -> AsyncIterator[_ResponseStub]:
+            yield _ResponseStub(status_code=200, content=body)
+
+    async def _fail_parse(*_args, **_kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("feed parsing must not run for an unchanged body")
+
+    monkeypatch.setattr(httpx, "AsyncClient", _SameBodyClientStub)
+
+    async with session_maker() as session:
+        feed = Feed(title="Same Body Feed", url="https://ingestion.example.com/same.xml")
+        session.add(feed)
+        await session.commit()
+
+        first = await ingestion_service.ingest_feed(
+            session=session,
+            feed_id=feed.id,
+            plugin_manager=_PluginManagerStub(),  # type: ignore[arg-type]
+        )
+        assert first.inserted_count == 1
+        assert feed.last_body_hash is not None
+
+        monkeypatch.setattr(ingestion_module.feed_parse_service, "parse", _fail_parse)
+        second = await ingestion_service.ingest_feed(
+            session=session,
+            feed_id=feed.id,
+            plugin_manager=_PluginManagerStub(),  # type: ignore[arg-type]
+        )
+        assert second.fetched_count == 0
+        assert second.errors == []
+
+        refreshed = await session.scalar(select(Feed).where(Feed.id == feed.id))
+        assert refreshed is not None
+        assert refreshed.last_fetch_success_at is not None
+
+        run_totals = _sample_map(metrics.snapshot()["sift_ingest_runs_total"], label_keys=("result",))
+        assert run_totals[("success",)] == 1.0
+        assert run_totals[("not_modified_body",)] == 1.0
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_ingest_feed_reports_per_stage_timings(monkeypatch, caplog: pytest.LogCaptureFixture) -> None:
+    metrics = get_observability_metrics()
+    metrics.reset()
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    body = (
+        b"<rss><channel><title>test</title>"
+        b"<item><guid>entry-1</guid><title>First</title><description>Body</description></item>"
+        b"<item><guid>entry-2</guid><title>Second</title><description>Body</description></item>"
+        b"</channel></rss>"
+    )
+
+    class _ClientStub:
+        def __init__(self, **_kwargs) -> None:
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+            return None
+
+        @asynccontextmanager
+        async def stream(
+            self, _method: str, _url: str, headers: dict[str, str] | None = None
+        ) -> AsyncIterator[_ResponseStub]:
+            yield _ResponseStub(status_code=200, content=body)
+
+    monkeypatch.setattr(httpx, "AsyncClient", _ClientStub)
+    caplog.set_level("INFO", logger="sift.services.ingestion_service")
+
+    async with session_maker() as session:
+        feed = Feed(title="Stage Feed", url="https://ingestion.example.com/stages.xml")
+        session.add(feed)
+        await session.commit()
+
+        result = await ingestion_service.ingest_feed(
+            session=session,
+            feed_id=feed.id,
+            plugin_manager=_PluginManagerStub(),  # type: ignore[arg-type]
+        )
+        assert result.inserted_count == 2
+
+    await engine.dispose()
+
+    expected_stages = {
+        "fetch",
+        "parse",
+        "load",
+        "source_lookup",
+        "rule_filter",
+        "hooks",
+        "dedup",
+        "stream_match",
+        "classifier",
+        "flush",
+        "commit",
+    }
+    complete = next(record for record in caplog.records if record.getMessage() == "ingest.run.complete")
+    for stage in expected_stages:
+        assert getattr(complete, f"stage_{stage}_ms") >= 0
+    assert complete.slowest_stage in expected_stages
+
+    stage_samples = {
+        sample.labels["stage"]: sample for sample in metrics.histogram_snapshot()["sift_ingest_stage_duration_seconds"]
+    }
+    assert set(stage_samples) == expected_stages
+    assert all(sample.count == 1 for sample in stage_samples.values())
+
+
+@pytest.mark.asyncio
+async def test_ingest_feed_treats_entries_with_pruned_raw_rows_as_seen(monkeypatch) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    body = (
+        b"<rss><channel><title>test</title>"
+        b"<item><guid>entry-1</guid><title>First</title><description>Body</description></item>"
+        b"</channel></rss>"
+    )
+
+    class _ClientStub:
+        def __init__(self, **_kwargs) -> None:
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+            return None
+
+        @asynccontextmanager
+        async def stream(
+            self, _method: str, _url: str, headers: dict[str, str] | None = None
+        ) -> AsyncIterator[_ResponseStub]:
+            yield _ResponseStub(status_code=200, content=body)
+
+    monkeypatch.setattr(httpx, "AsyncClient", _ClientStub)
+
+    async with session_maker() as session:
+        feed = Feed(title="Pruned Feed", url="https://ingestion.example.com/pruned.xml")
+        session.add(feed)
+        await session.commit()
+
+        first = await ingestion_service.ingest_feed(
+            session=session,
+            feed_id=feed.id,
+            plugin_manager=_PluginManagerStub(),  # type: ignore[arg-type]
+        )
+        assert first.inserted_count == 1
+
+        await session.execute(delete(RawEntry))
+        feed.last_body_hash = None
+        await session.commit()
+
+        second = await ingestion_service.ingest_feed(
+            session=session,
+            feed_id=feed.id,
+            plugin_manager=_PluginManagerStub(),  # type: ignore[arg-type]
+        )
+        assert second.errors == []
+        assert second.inserted_count == 0
+        assert second.duplicate_count == 1
+
+    await engine.dispose()
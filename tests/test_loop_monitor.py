@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from sift.observability.loop_monitor import EventLoopLagMonitor
+from sift.observability.metrics import ObservabilityMetrics
+
+
+def _blocking_section_for_monitor() -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_records_lag_and_captures_blocking_stack(
+    monkeypatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    metrics = ObservabilityMetrics()
+    monkeypatch.setattr("sift.observability.loop_monitor.get_observability_metrics", lambda: metrics)
+    caplog.set_level(logging.WARNING, logger="sift.observability.loop_monitor")
+
+    monitor = EventLoopLagMonitor(
+        service="test",
+        interval_seconds=0.01,
+        block_threshold_seconds=0.1,
+        capture_stacks=True,
+    )
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        _blocking_section_for_monitor()
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    lag = metrics.histogram_snapshot()["sift_event_loop_lag_seconds"][0]
+    assert lag.count >= 2
+    assert lag.sum >= 0.2
+    blocked = metrics.snapshot()["sift_event_loop_blocked_total"]
+    assert blocked[0].value == 1.0
+
+    blocked_records = [record for record in caplog.records if record.getMessage() == "event_loop.blocked"]
+    assert len(blocked_records) == 1
+    assert blocked_records[0].blocked_ms >= 100
+    assert "_blocking_section_for_monitor" in blocked_records[0].stack
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_without_debug_does_not_capture_stacks(
+    monkeypatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    metrics = ObservabilityMetrics()
+    monkeypatch.setattr("sift.observability.loop_monitor.get_observability_metrics", lambda: metrics)
+    caplog.set_level(logging.WARNING, logger="sift.observability.loop_monitor")
+
+    monitor = EventLoopLagMonitor(
+        service="test",
+        interval_seconds=0.01,
+        block_threshold_seconds=0.05,
+        capture_stacks=False,
+    )
+    monitor.start()
+    try:
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)
+        await asyncio.sleep(0.02)
+    finally:
+        await monitor.stop()
+
+    assert metrics.snapshot()["sift_event_loop_blocked_total"][0].value == 1.0
+    assert not [record for record in caplog.records if record.getMessage() == "event_loop.blocked"]
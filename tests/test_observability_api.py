@@ -1,4 +1,5 @@
 import logging
+import math
 from collections.abc import Awaitable, Callable
 from typing import cast
 
@@ -8,8 +9,9 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from sift.main import app, observability_middleware
+from sift.observability.histogram import DEFAULT_DURATION_BUCKETS, parse_buckets
 from sift.observability.logging import get_request_id
-from sift.observability.metrics import MetricSample, get_observability_metrics
+from sift.observability.metrics import MetricSample, ObservabilityMetrics, get_observability_metrics
 
 
 def _sample_map(
@@ -123,3 +125,33 @@ async def test_request_id_is_logged_and_metrics_recorded_on_exception(caplog: py
     snapshot = metrics.snapshot()
     totals = _sample_map(snapshot["sift_http_requests_total"], label_keys=("method", "route", "status_class"))
     assert totals[("GET", "/boom", "5xx")] == 1.0
+
+
+def test_duration_metrics_render_cumulative_histogram_buckets() -> None:
+    metrics = ObservabilityMetrics(duration_buckets="0.1,1,0.5")
+    metrics.record_worker_job(result="success", duration_seconds=0.05)
+    metrics.record_worker_job(result="success", duration_seconds=0.3)
+    metrics.record_worker_job(result="success", duration_seconds=0.5)
+    metrics.record_worker_job(result="success", duration_seconds=4.0)
+
+    sample = metrics.histogram_snapshot()["sift_worker_job_duration_seconds"][0]
+    assert sample.labels == {"result": "success"}
+    assert sample.buckets == ((0.1, 1), (0.5, 3), (1.0, 3), (math.inf, 4))
+    assert sample.count == 4
+    assert sample.sum == pytest.approx(4.85)
+
+    rendered = metrics.render_prometheus()
+    assert "# TYPE sift_worker_job_duration_seconds histogram" in rendered
+    assert 'sift_worker_job_duration_seconds_bucket{le="0.5",result="success"} 3' in rendered
+    assert 'sift_worker_job_duration_seconds_bucket{le="+Inf",result="success"} 4' in rendered
+    assert 'sift_worker_job_duration_seconds_count{result="success"} 4' in rendered
+    snapshot = metrics.snapshot()
+    assert _sample_map(snapshot["sift_worker_job_duration_seconds"], label_keys=("result",)) == {
+        ("success",): pytest.approx(4.85)
+    }
+
+
+def test_parse_buckets_ignores_invalid_bounds_and_falls_back_to_defaults() -> None:
+    assert parse_buckets("2, 0.5,,-1,inf,0.5") == (0.5, 2.0)
+    assert parse_buckets("") == DEFAULT_DURATION_BUCKETS
+    assert parse_buckets(None) == DEFAULT_DURATION_BUCKETS
@@ -1,7 +1,25 @@
 import json
 import logging
+import queue
+from logging.handlers import QueueListener
 
-from sift.observability.logging import JsonLogFormatter, bind_request_id, reset_request_id
+from sift.observability.logging import (
+    BoundedQueueHandler,
+    EventSamplingFilter,
+    JsonLogFormatter,
+    bind_request_id,
+    reset_request_id,
+)
+from sift.observability.metrics import ObservabilityMetrics
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
 
 
 def test_json_log_formatter_redacts_sensitive_fields() -> None:
@@ -67,3 +85,54 @@ def test_json_log_formatter_redaction_is_case_insensitive() -> None:
     payload = json.loads(formatter.format(record))
     assert payload["Session_Token"] == "[REDACTED]"
 
+
+def test_bounded_queue_handler_carries_request_id_and_counts_drops(monkeypatch) -> None:
+    metrics = ObservabilityMetrics()
+    monkeypatch.setattr("sift.observability.logging.get_observability_metrics", lambda: metrics)
+    target = _ListHandler()
+    target.setFormatter(JsonLogFormatter(service="sift-api", env="test", redact_fields=set()))
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=1)
+    handler = BoundedQueueHandler(log_queue, target=target)
+
+    def _record(level: int, msg: str) -> logging.LogRecord:
+        return logging.makeLogRecord(
+            {"name": "test.logger", "levelno": level, "levelname": logging.getLevelName(level), "msg": msg}
+        )
+
+    token = bind_request_id("req-queued-1")
+    try:
+        handler.handle(_record(logging.INFO, "queued %s"))
+        handler.handle(_record(logging.INFO, "dropped"))
+        handler.handle(_record(logging.ERROR, "kept"))
+    finally:
+        reset_request_id(token)
+
+    # The error bypassed the full queue and was written on the emitting thread.
+    assert [record.getMessage() for record in target.records] == ["kept"]
+
+    listener = QueueListener(log_queue, target)
+    listener.start()
+    listener.stop()
+
+    messages = [json.loads(target.format(record)) for record in target.records]
+    assert [payload["message"] for payload in messages] == ["kept", "queued %s"]
+    assert messages[1]["request_id"] == "req-queued-1"
+    dropped = {sample.labels["reason"]: sample.value for sample in metrics.snapshot()["sift_log_records_dropped_total"]}
+    assert dropped == {"queue_full": 1.0}
+
+
+def test_event_sampling_filter_keeps_errors_and_unsampled_events(monkeypatch) -> None:
+    metrics = ObservabilityMetrics()
+    monkeypatch.setattr("sift.observability.logging.get_observability_metrics", lambda: metrics)
+    sampling = EventSamplingFilter({"plugin.dispatch.start": 0.0, "ingest.run.complete": 1.0})
+
+    def _record(level: int, event: str) -> logging.LogRecord:
+        return logging.makeLogRecord({"name": "test.logger", "levelno": level, "msg": event, "event": event})
+
+    assert not sampling.filter(_record(logging.INFO, "plugin.dispatch.start"))
+    assert not sampling.filter(_record(logging.WARNING, "plugin.dispatch.start"))
+    assert sampling.filter(_record(logging.ERROR, "plugin.dispatch.start"))
+    assert sampling.filter(_record(logging.INFO, "ingest.run.complete"))
+    assert sampling.filter(_record(logging.INFO, "plugin.dispatch.complete"))
+    dropped = {sample.labels["reason"]: sample.value for sample in metrics.snapshot()["sift_log_records_dropped_total"]}
+    assert dropped == {"sampled": 2.0}
@@ -1,8 +1,13 @@
+from uuid import uuid4
+
+import httpx
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from sift.db.base import Base
-from sift.db.models import Feed, User
+from sift.db.models import Article, Feed, User
+from sift.plugins.manager import PluginManager
 from sift.services.opml_service import OpmlParseError, opml_service, parse_opml
 
 
@@ -79,3 +84,107 @@ async def test_import_from_bytes_reports_created_skipped_invalid() -> None:
         assert report.duplicate_in_file_count == 1
 
     await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_probe_imported_feed_prefills_metadata_and_first_articles(monkeypatch) -> None:
+    feed_xml = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Live Feed</title>
+    <link>https://live.example.com/</link>
+    <item><guid>live-1</guid><title>First post</title><description>Hello</description></item>
+    <item><guid>live-2</guid><title>Second post</title><description>World</description></item>
+  </channel>
+</rss>
+"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "live.example.com":
+            return httpx.Response(200, content=feed_xml, headers={"ETag": '"v1"', "Content-Type": "application/xml"})
+        if request.url.host == "moved.example.com":
+            return httpx.Response(301, headers={"Location": "https://live.example.com/new.xml"})
+        if request.url.host == "taken-redirect.example.com":
+            return httpx.Response(308, headers={"Location": "https://taken.example.com/rss.xml"})
+        if request.url.host == "taken.example.com":
+            return httpx.Response(200, content=feed_xml)
+        if request.url.host == "gone.example.com":
+            return httpx.Response(404)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient", lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        user = User(email="probe@example.com")
+        session.add(user)
+        await session.commit()
+
+        content = b"""<?xml version="1.0" encoding="UTF-8"?>
+<opml version="2.0">
+  <body>
+    <outline xmlUrl="https://live.example.com/rss.xml"/>
+    <outline text="Moved" xmlUrl="https://moved.example.com/rss.xml"/>
+    <outline text="Gone" xmlUrl="https://gone.example.com/rss.xml"/>
+    <outline text="Down" xmlUrl="https://down.example.com/rss.xml"/>
+    <outline text="Taken" xmlUrl="https://taken-redirect.example.com/rss.xml"/>
+  </body>
+</opml>
+"""
+        report = await opml_service.import_from_bytes(session=session, user_id=user.id, content=content)
+        assert report.created_count == 5
+        feed_ids = {result.url: result.feed_id for result in report.results}
+        assert all(feed_ids.values())
+        # Another feed already uses this redirect target, so the probe keeps the imported URL.
+        session.add(Feed(owner_id=user.id, title="Taken", url="https://taken.example.com/rss.xml"))
+        await session.commit()
+
+    probes = {}
+    for url, feed_id in feed_ids.items():
+        async with session_maker() as session:
+            probes[url] = await opml_service.probe_imported_feed(
+                session, feed_id=feed_id, plugin_manager=PluginManager()
+            )
+
+    assert {url: probe.status for url, probe in probes.items()} == {
+        "https://live.example.com/rss.xml": "ok",
+        "https://moved.example.com/rss.xml": "redirected",
+        "https://gone.example.com/rss.xml": "dead",
+        "https://down.example.com/rss.xml": "dead",
+        "https://taken-redirect.example.com/rss.xml": "ok",
+    }
+    assert all(probe.parsed is None for probe in probes.values())
+    assert probes["https://moved.example.com/rss.xml"].resolved_url == "https://live.example.com/new.xml"
+    assert probes["https://gone.example.com/rss.xml"].error == "Unexpected status 404"
+    assert probes["https://live.example.com/rss.xml"].inserted_count == 2
+
+    async with session_maker() as session:
+        feeds = {feed.url: feed for feed in (await session.execute(select(Feed))).scalars().all()}
+        assert set(feeds) == {
+            "https://live.example.com/rss.xml",
+            "https://live.example.com/new.xml",
+            "https://gone.example.com/rss.xml",
+            "https://down.example.com/rss.xml",
+            "https://taken-redirect.example.com/rss.xml",
+            "https://taken.example.com/rss.xml",
+        }
+        live = feeds["https://live.example.com/rss.xml"]
+        assert live.title == "Live Feed"
+        assert live.site_url == "https://live.example.com/"
+        assert live.etag == '"v1"'
+        assert live.last_fetch_success_at is not None
+        assert feeds["https://live.example.com/new.xml"].title == "Moved"
+        assert feeds["https://gone.example.com/rss.xml"].last_fetch_error == "Unexpected status 404"
+        assert feeds["https://down.example.com/rss.xml"].last_fetch_error_at is not None
+
+        article_count = (await session.execute(select(func.count()).select_from(Article))).scalar_one()
+        assert article_count == 6
+        assert await opml_service.probe_imported_feed(session, feed_id=uuid4(), plugin_manager=PluginManager()) is None
+
+    await engine.dispose()
@@ -0,0 +1,102 @@
+from datetime import UTC, date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from sift.config import get_settings
+from sift.db.base import Base
+from sift.db.models import Article
+from sift.db.partitioning import (
+    add_months,
+    article_published_since,
+    create_partition_statements,
+    month_start,
+    partition_month,
+    partition_name,
+    release_partition_keys_statements,
+)
+from sift.services.partition_service import partition_service
+
+
+def test_month_helpers_and_partition_names() -> None:
+    assert month_start(datetime(2026, 10, 31, 23, 30, tzinfo=UTC)) == date(2026, 10, 1)
+    # Partitions are bounded in UTC, so local times just after midnight belong to the previous UTC month.
+    assert month_start(datetime(2026, 11, 1, 0, 30, tzinfo=timezone(timedelta(hours=2)))) == date(2026, 10, 1)
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    assert partition_name("articles", date(2026, 3, 1)) == "articles_p202603"
+    assert partition_month("articles", "articles_p202603") == date(2026, 3, 1)
+    assert partition_month("articles", "article_states_p202603") is None
+    assert partition_month("articles", "articles_default") is None
+
+
+def test_create_partition_statements_move_rows_out_of_the_default_partition() -> None:
+    statements = create_partition_statements("keyword_stream_matches", "matched_at", date(2026, 12, 1))
+    assert statements[0].startswith('CREATE TABLE "keyword_stream_matches_p202612"')
+    assert '"keyword_stream_matches_default"' in statements[1]
+    assert statements[2].startswith('DELETE FROM "keyword_stream_matches_default"')
+    assert statements[3].endswith("FOR VALUES FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')")
+
+    assert release_partition_keys_statements("articles", "articles_p202601") == [
+        'DELETE FROM "article_keys" WHERE "article_id" IN (SELECT id FROM "articles_p202601")'
+    ]
+    assert release_partition_keys_statements("article_states", "article_states_p202601") == [
+        'DELETE FROM "article_state_keys" WHERE "state_id" IN (SELECT id FROM "article_states_p202601")'
+    ]
+
+
+def test_article_window_predicate_bounds_the_partition_key() -> None:
+    threshold = datetime(2026, 10, 16, tzinfo=UTC)
+    query = select(Article.id).where(article_published_since(threshold))
+    compiled = str(query.compile(dialect=postgresql.dialect()))
+    assert "coalesce(articles.published_at, articles.created_at) >=" in compiled
+    assert "articles.created_at >=" in compiled
+
+
+@pytest.mark.asyncio
+async def test_article_window_predicate_excludes_only_far_future_dated_entries() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        session.add_all(
+            [
+                Article(source_id="recent", title="Recent", published_at=now - timedelta(days=1), created_at=now),
+                Article(source_id="old", title="Old", published_at=now - timedelta(days=9), created_at=now),
+                Article(source_id="undated", title="Undated", created_at=now - timedelta(days=2)),
+                Article(
+                    source_id="future-dated",
+                    title="Future dated",
+                    published_at=now - timedelta(days=1),
+                    created_at=now - timedelta(days=60),
+                ),
+            ]
+        )
+        await session.commit()
+
+        rows = await session.execute(select(Article.source_id).where(article_published_since(now - timedelta(days=3))))
+        assert set(rows.scalars().all()) == {"recent", "undated"}
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_partition_maintenance_is_a_no_op_outside_postgres(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "database_partitioning_enabled", True)
+    monkeypatch.setattr(settings, "database_partition_detach_after_months", 6)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        result = await partition_service.run(session, settings=settings)
+    await engine.dispose()
+
+    assert result.created == []
+    assert result.detached == []
@@ -0,0 +1,224 @@
+import os
+import threading
+import time
+
+import pytest
+
+from sift.plugins.base import ArticleContext, StreamClassificationDecision, StreamClassifierContext
+from sift.plugins.isolation import (
+    ProcessPluginPool,
+    decode_article,
+    decode_decision,
+    decode_stream,
+    encode_article,
+    encode_decision,
+    encode_stream,
+)
+from sift.plugins.manager import PluginManager
+from sift.plugins.registry import PluginRegistryEntry
+
+
+class PidClassifierPlugin:
+    async def classify_stream(
+        self,
+        article: ArticleContext,
+        stream: StreamClassifierContext,
+    ) -> StreamClassificationDecision:
+        return StreamClassificationDecision(
+            matched=stream.stream_name in article.title,
+            confidence=0.5,
+            reason=str(os.getpid()),
+            findings=[{"field": "title", "value": article.title}],
+        )
+
+
+class SpinClassifierPlugin:
+    async def classify_stream(
+        self,
+        article: ArticleContext,
+        stream: StreamClassifierContext,
+    ) -> StreamClassificationDecision:
+        if article.title == "spin":
+            while True:
+                time.sleep(0.01)
+        return StreamClassificationDecision(matched=True, confidence=1.0, reason=str(os.getpid()))
+
+
+class SlowClassifierPlugin:
+    async def classify_stream(
+        self,
+        article: ArticleContext,
+        stream: StreamClassifierContext,
+    ) -> StreamClassificationDecision:
+        if article.title == "slow":
+            time.sleep(0.8)
+        return StreamClassificationDecision(matched=True, confidence=1.0, reason=str(os.getpid()))
+
+
+class MetadataIngestPlugin:
+    async def on_article_ingested(self, article: ArticleContext) -> ArticleContext:
+        return ArticleContext(
+            article_id=article.article_id,
+            title=article.title.upper(),
+            content_text=article.content_text,
+            metadata={**article.metadata, "worker_pid": str(os.getpid())},
+        )
+
+
+def _entry(*, plugin_id: str, class_name: str, capabilities: list[str], **backend: object) -> PluginRegistryEntry:
+    return PluginRegistryEntry.model_validate(
+        {
+            "id": plugin_id,
+            "backend": {"class_path": f"{__name__}:{class_name}", "isolation": "process", **backend},
+            "capabilities": capabilities,
+        }
+    )
+
+
+def _stream(name: str = "news") -> StreamClassifierContext:
+    return StreamClassifierContext(
+        stream_id="s1",
+        stream_name=name,
+        include_keywords=["a"],
+        exclude_keywords=[],
+        source_contains=None,
+        language_equals="en",
+        classifier_config={"threshold": 0.5},
+        metadata={"k": "v"},
+    )
+
+
+def _article(title: str) -> ArticleContext:
+    return ArticleContext(article_id="a1", title=title, content_text="body", metadata={"feed_id": "f1"})
+
+
+def test_ipc_codec_round_trips_contexts_and_decisions() -> None:
+    article = _article("hello")
+    stream = _stream()
+    decision = StreamClassificationDecision(matched=True, confidence=0.7, reason="r", findings=[{"field": "title"}])
+
+    assert decode_article(encode_article(article)) == article
+    assert decode_stream(encode_stream(stream)) == stream
+    assert decode_decision(encode_decision(decision)) == decision
+    assert decode_decision(encode_decision(None)) is None
+
+
+@pytest.mark.asyncio
+async def test_process_isolated_plugins_run_outside_host_process() -> None:
+    manager = PluginManager()
+    manager.load_from_registry(
+        [
+            _entry(plugin_id="pid_classifier", class_name="PidClassifierPlugin", capabilities=["stream_classifier"]),
+            _entry(plugin_id="upper_ingest", class_name="MetadataIngestPlugin", capabilities=["ingest_hook"]),
+        ]
+    )
+    try:
+        assert manager.names() == ["pid_classifier", "upper_ingest"]
+
+        processed = await manager.run_ingested_hooks(_article("hello"))
+        assert processed.title == "HELLO"
+        assert processed.metadata["feed_id"] == "f1"
+        assert processed.metadata["worker_pid"] != str(os.getpid())
+
+        decision = await manager.classify_stream(
+            plugin_name="pid_classifier", article=_article("daily news"), stream=_stream()
+        )
+        assert decision is not None
+        assert decision.matched is True
+        assert decision.reason != str(os.getpid())
+        assert decision.findings == [{"field": "title", "value": "daily news"}]
+    finally:
+        manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_isolated_timeout_kills_hung_worker_and_recovers() -> None:
+    manager = PluginManager(timeout_classifier_ms=300)
+    manager.load_from_registry(
+        [_entry(plugin_id="spin", class_name="SpinClassifierPlugin", capabilities=["stream_classifier"])]
+    )
+    try:
+        warm = await manager.classify_stream(plugin_name="spin", article=_article("warm"), stream=_stream())
+        assert warm is not None
+        first_pid = warm.reason
+
+        started = time.perf_counter()
+        hung = await manager.classify_stream(plugin_name="spin", article=_article("spin"), stream=_stream())
+        assert hung is None
+        assert time.perf_counter() - started < 2.0
+
+        snapshot = {item.plugin_id: item for item in manager.get_status_snapshots()}["spin"]
+        assert snapshot.runtime_counters["stream_classifier"]["timeout_count"] == 1
+
+        recovered = None
+        for _ in range(20):
+            recovered = await manager.classify_stream(plugin_name="spin", article=_article("ok"), stream=_stream())
+            if recovered is not None:
+                break
+        assert recovered is not None
+        assert recovered.reason != first_pid
+    finally:
+        manager.shutdown()
+
+
+def test_process_pool_call_waits_for_a_slot_and_a_reply_within_one_timeout() -> None:
+    pool = ProcessPluginPool(
+        plugin_id="slow",
+        class_path=f"{__name__}:SlowClassifierPlugin",
+        max_workers=1,
+        max_calls_per_worker=100,
+    )
+    args = (encode_article(_article("slow")), encode_stream(_stream()))
+    try:
+        # Warm the only worker so spawning does not count against the slot wait below.
+        pool.call("classify_stream", (encode_article(_article("warm")), encode_stream(_stream())), timeout_seconds=5.0)
+        holder = threading.Thread(target=pool.call, args=("classify_stream", args), kwargs={"timeout_seconds": 5.0})
+        holder.start()
+        time.sleep(0.1)
+
+        # About 0.7s goes to waiting for the slot, which leaves too little of the 1s budget for the 0.8s call.
+        started = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            pool.call("classify_stream", args, timeout_seconds=1.0)
+        assert time.perf_counter() - started < 1.4
+        holder.join()
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_isolated_workers_recycle_after_max_calls() -> None:
+    manager = PluginManager()
+    manager.load_from_registry(
+        [
+            _entry(
+                plugin_id="pid_classifier",
+                class_name="PidClassifierPlugin",
+                capabilities=["stream_classifier"],
+                max_calls_per_worker=2,
+            )
+        ]
+    )
+    try:
+        pids = []
+        for _ in range(3):
+            decision = await manager.classify_stream(
+                plugin_name="pid_classifier", article=_article("news"), stream=_stream()
+            )
+            assert decision is not None
+            pids.append(decision.reason)
+        assert pids[0] == pids[1]
+        assert pids[2] != pids[0]
+    finally:
+        manager.shutdown()
+
+
+def test_process_isolation_still_enforces_capability_contract() -> None:
+    manager = PluginManager()
+    manager.load_from_registry(
+        [_entry(plugin_id="wrong", class_name="MetadataIngestPlugin", capabilities=["stream_classifier"])]
+    )
+    snapshot = manager.get_status_snapshots()[0]
+    assert snapshot.loaded is False
+    assert snapshot.startup_validation_status == "invalid_capability_impl"
+    assert manager.names() == []
@@ -90,6 +90,51 @@ plugins:
     assert "Duplicate plugin id 'noop'" in str(exc_info.value)
 
 
+def test_load_plugin_registry_rejects_dependency_cycles_and_unknown_ids(tmp_path: Path) -> None:
+    cycle_path = _write_registry(
+        tmp_path / "cycle.yaml",
+        """
+version: 1
+plugins:
+  - id: first
+    backend:
+      class_path: sift.plugins.builtin.noop:NoopPlugin
+    capabilities:
+      - ingest_hook
+    depends_on:
+      - second
+  - id: second
+    backend:
+      class_path: sift.plugins.builtin.noop:NoopPlugin
+    capabilities:
+      - ingest_hook
+    depends_on:
+      - first
+""".strip(),
+    )
+    with pytest.raises(PluginRegistryError) as exc_info:
+        load_plugin_registry(str(cycle_path))
+    assert "plugin dependency cycle detected: first -> second -> first" in str(exc_info.value)
+
+    unknown_path = _write_registry(
+        tmp_path / "unknown.yaml",
+        """
+version: 1
+plugins:
+  - id: first
+    backend:
+      class_path: sift.plugins.builtin.noop:NoopPlugin
+    capabilities:
+      - ingest_hook
+    depends_on:
+      - missing
+""".strip(),
+    )
+    with pytest.raises(PluginRegistryError) as exc_info:
+        load_plugin_registry(str(unknown_path))
+    assert "plugin 'first' depends on unknown plugin 'missing'" in str(exc_info.value)
+
+
 def test_load_plugin_registry_rejects_plaintext_sensitive_settings(tmp_path: Path) -> None:
     registry_path = _write_registry(
         tmp_path / "plugins.yaml",
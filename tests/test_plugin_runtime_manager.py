@@ -43,13 +43,75 @@ class _NoClassifierMethodPlugin:
     pass
 
 
-def _entry(*, plugin_id: str, class_path: str, capabilities: list[str], enabled: bool = True) -> PluginRegistryEntry:
+class _FlakyClassifierPlugin:
+    def __init__(self) -> None:
+        self.healthy = False
+        self.calls = 0
+
+    async def classify_stream(
+        self,
+        article: ArticleContext,
+        stream: StreamClassifierContext,
+    ) -> StreamClassificationDecision:
+        del article
+        del stream
+        self.calls += 1
+        if not self.healthy:
+            raise RuntimeError("backend down")
+        return StreamClassificationDecision(matched=True, confidence=1.0, reason="ok")
+
+
+class _MetadataIngestPlugin:
+    def __init__(self, key: str, *, delay_seconds: float = 0.0) -> None:
+        self.key = key
+        self.delay_seconds = delay_seconds
+        self.active = 0
+        self.max_active = 0
+        self.seen_metadata: list[dict[str, str]] = []
+
+    async def on_article_ingested(self, article: ArticleContext) -> ArticleContext:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.seen_metadata.append(dict(article.metadata))
+        await asyncio.sleep(self.delay_seconds)
+        self.active -= 1
+        return ArticleContext(
+            article_id=article.article_id,
+            title=article.title,
+            content_text=article.content_text,
+            metadata={**article.metadata, self.key: "done"},
+        )
+
+
+class _InPlaceMetadataIngestPlugin:
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.seen_metadata: list[dict[str, str]] = []
+
+    async def on_article_ingested(self, article: ArticleContext) -> ArticleContext:
+        self.seen_metadata.append(dict(article.metadata))
+        article.metadata[self.key] = "done"  # type: ignore[index]
+        article.title = f"{article.title} [{self.key}]"
+        # Yield with the edit applied so a sibling hook sharing the context would see it.
+        await asyncio.sleep(0)
+        return article
+
+
+def _entry(
+    *,
+    plugin_id: str,
+    class_path: str,
+    capabilities: list[str],
+    enabled: bool = True,
+    depends_on: list[str] | None = None,
+) -> PluginRegistryEntry:
     return PluginRegistryEntry.model_validate(
         {
             "id": plugin_id,
             "enabled": enabled,
             "backend": {"class_path": class_path},
             "capabilities": capabilities,
+            "depends_on": depends_on,
             "settings": {},
         }
     )
@@ -163,6 +225,8 @@ async def test_plugin_telemetry_metrics_contract(monkeypatch: pytest.MonkeyPatch
         "sift_plugin_invocation_duration_seconds",
         "sift_plugin_timeouts_total",
         "sift_plugin_dispatch_failures_total",
+        "sift_plugin_short_circuits_total",
+        "sift_plugin_breaker_state",
     }
 
     invocations = _sample_map(
@@ -219,8 +283,16 @@ async def test_plugin_dispatch_logging_contract(
         ]
     )
 
-    caplog.set_level(logging.INFO, logger="sift.plugins.manager")
     article = ArticleContext(article_id="a1", title="hello", content_text="body", metadata={"k": "v"})
+    caplog.set_level(logging.INFO, logger="sift.plugins.manager")
+    await manager.run_ingested_hooks(article)
+    info_events = {str(getattr(record, "event", "")) for record in caplog.records}
+    assert "plugin.dispatch.start" not in info_events
+    assert "plugin.dispatch.complete" not in info_events
+    assert "plugin.dispatch.error" in info_events
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="sift.plugins.manager")
     await manager.run_ingested_hooks(article)
 
     dispatch_events = {
@@ -291,3 +363,146 @@ def test_load_from_registry_marks_load_and_contract_failures(monkeypatch: pytest
     assert snapshots["ok_ingest"].startup_validation_status == "ok"
 
     assert snapshots["ok_ingest"].last_updated_at <= datetime.now(UTC)
+
+
+@pytest.mark.asyncio
+async def test_ingest_hooks_with_declared_dependencies_run_in_concurrent_layers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    plugins_by_path = {
+        "test.plugins:lang": _MetadataIngestPlugin("lang", delay_seconds=0.05),
+        "test.plugins:tags": _MetadataIngestPlugin("tags", delay_seconds=0.05),
+        "test.plugins:score": _MetadataIngestPlugin("score"),
+        "test.plugins:append": _AppendTitleIngestPlugin(),
+    }
+    monkeypatch.setattr(plugin_manager_module, "_load_plugin", lambda path: plugins_by_path[path])
+
+    manager = PluginManager(timeout_ingest_ms=1000)
+    manager.load_from_registry(
+        [
+            _entry(plugin_id="lang", class_path="test.plugins:lang", capabilities=["ingest_hook"], depends_on=[]),
+            _entry(plugin_id="tags", class_path="test.plugins:tags", capabilities=["ingest_hook"], depends_on=[]),
+            _entry(
+                plugin_id="score",
+                class_path="test.plugins:score",
+                capabilities=["ingest_hook"],
+                depends_on=["lang", "tags"],
+            ),
+            _entry(plugin_id="append", class_path="test.plugins:append", capabilities=["ingest_hook"]),
+        ]
+    )
+    assert manager.ingest_hook_layers() == [["lang", "tags"], ["score"], ["append"]]
+
+    article = ArticleContext(article_id="a1", title="hello", content_text="body", metadata={"k": "v"})
+    started = asyncio.get_running_loop().time()
+    processed = await manager.run_ingested_hooks(article)
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert elapsed < 0.095
+    assert processed.title == "hello [processed]"
+    assert processed.metadata == {"k": "v", "lang": "done", "tags": "done", "score": "done"}
+    assert plugins_by_path["test.plugins:score"].seen_metadata == [{"k": "v", "lang": "done", "tags": "done"}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_ingest_hooks_that_mutate_the_context_in_place_keep_their_edits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    plugins_by_path = {
+        "test.plugins:lang": _InPlaceMetadataIngestPlugin("lang"),
+        "test.plugins:tags": _MetadataIngestPlugin("tags"),
+    }
+    monkeypatch.setattr(plugin_manager_module, "_load_plugin", lambda path: plugins_by_path[path])
+
+    manager = PluginManager(timeout_ingest_ms=1000)
+    manager.load_from_registry(
+        [
+            _entry(plugin_id="lang", class_path="test.plugins:lang", capabilities=["ingest_hook"], depends_on=[]),
+            _entry(plugin_id="tags", class_path="test.plugins:tags", capabilities=["ingest_hook"], depends_on=[]),
+        ]
+    )
+    assert manager.ingest_hook_layers() == [["lang", "tags"]]
+
+    article = ArticleContext(article_id="a1", title="hello", content_text="body", metadata={"k": "v"})
+    processed = await manager.run_ingested_hooks(article)
+
+    assert processed.title == "hello [lang]"
+    assert processed.metadata == {"k": "v", "lang": "done", "tags": "done"}
+    assert plugins_by_path["test.plugins:tags"].seen_metadata == [{"k": "v"}]
+    assert article.metadata == {"k": "v"}
+
+
+@pytest.mark.asyncio
+async def test_ingest_hook_batch_respects_concurrency_bound(monkeypatch: pytest.MonkeyPatch) -> None:
+    plugin = _MetadataIngestPlugin("lang", delay_seconds=0.01)
+    monkeypatch.setattr(plugin_manager_module, "_load_plugin", lambda path: plugin)
+
+    manager = PluginManager(timeout_ingest_ms=1000, ingest_hook_concurrency=3)
+    manager.load_from_registry([_entry(plugin_id="lang", class_path="test.plugins:lang", capabilities=["ingest_hook"])])
+
+    articles = [
+        ArticleContext(article_id=f"a{index}", title=f"t{index}", content_text="c", metadata={}) for index in range(10)
+    ]
+    processed = await manager.run_ingested_hooks_batch(articles)
+
+    assert [item.article_id for item in processed] == [f"a{index}" for index in range(10)]
+    assert all(item.metadata == {"lang": "done"} for item in processed)
+    assert plugin.max_active == 3
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_fails_fast_and_recovers_through_half_open_probe(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    plugin = _FlakyClassifierPlugin()
+    monkeypatch.setattr(plugin_manager_module, "_load_plugin", lambda path: plugin)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(plugin_manager_module, "monotonic", lambda: clock["now"])
+
+    manager = PluginManager(breaker_failure_threshold=2, breaker_reset_timeout_ms=5000)
+    manager.load_from_registry(
+        [_entry(plugin_id="flaky", class_path="test.plugins:flaky", capabilities=["stream_classifier"])]
+    )
+    article = ArticleContext(article_id="a1", title="t", content_text="c", metadata={})
+    stream = StreamClassifierContext(
+        stream_id="s1",
+        stream_name="s",
+        include_keywords=[],
+        exclude_keywords=[],
+        source_contains=None,
+        language_equals=None,
+        classifier_config={},
+        metadata={},
+    )
+
+    def breaker():  # type: ignore[no-untyped-def]
+        snapshot = {item.plugin_id: item for item in manager.get_status_snapshots()}["flaky"]
+        return snapshot.circuit_breakers["stream_classifier"]
+
+    for _ in range(2):
+        assert await manager.classify_stream(plugin_name="flaky", article=article, stream=stream) is None
+    assert breaker().state == "open"
+    assert breaker().opened_at is not None
+
+    for _ in range(3):
+        assert await manager.classify_stream(plugin_name="flaky", article=article, stream=stream) is None
+    assert plugin.calls == 2
+    assert breaker().short_circuit_count == 3
+
+    clock["now"] += 5.0
+    assert await manager.classify_stream(plugin_name="flaky", article=article, stream=stream) is None
+    assert plugin.calls == 3
+    assert breaker().state == "open"
+
+    clock["now"] += 5.0
+    plugin.healthy = True
+    decision = await manager.classify_stream(plugin_name="flaky", article=article, stream=stream)
+    assert decision is not None and decision.matched is True
+    assert breaker().state == "closed"
+    assert breaker().consecutive_failures == 0
+
+    telemetry = manager.get_telemetry_snapshot()
+    short_circuits = _sample_map(telemetry["sift_plugin_short_circuits_total"], label_keys=("plugin_id", "capability"))
+    assert short_circuits[("flaky", "stream_classifier")] == 3.0
+    states = _sample_map(telemetry["sift_plugin_breaker_state"], label_keys=("plugin_id", "capability"))
+    assert states[("flaky", "stream_classifier")] == 0.0
@@ -10,7 +10,7 @@ from sift.db.base import Base
 from sift.db.models import User
 from sift.db.session import get_db_session
 from sift.main import app
-from sift.plugins.manager import PluginStatusSnapshot
+from sift.plugins.manager import CircuitBreakerSnapshot, PluginStatusSnapshot
 
 
 class _PluginManagerStub:
@@ -32,6 +32,14 @@ class _PluginManagerStub:
                     }
                 },
                 last_updated_at=datetime.now(UTC),
+                circuit_breakers={
+                    "ingest_hook": CircuitBreakerSnapshot(
+                        state="open",
+                        consecutive_failures=5,
+                        short_circuit_count=3,
+                        opened_at=datetime.now(UTC),
+                    )
+                },
             )
         ]
 
@@ -113,6 +121,8 @@ def test_plugins_status_requires_admin_and_returns_shape(monkeypatch) -> None:
             assert payload[0]["plugin_id"] == "noop"
             assert payload[0]["loaded"] is True
             assert payload[0]["runtime_counters"]["ingest_hook"]["success_count"] == 2
+            assert payload[0]["circuit_breakers"]["ingest_hook"]["state"] == "open"
+            assert payload[0]["circuit_breakers"]["ingest_hook"]["short_circuit_count"] == 3
 
         app.dependency_overrides[get_current_user] = override_non_admin_user
         with TestClient(app) as client:
@@ -0,0 +1,169 @@
+import multiprocessing
+import threading
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import sift.observability.profiler as profiler_module
+from sift.api.deps.auth import get_current_user
+from sift.config import get_settings
+from sift.db.models import User
+from sift.main import app
+from sift.observability.metrics_server import PROFILE_PATH, start_metrics_http_server
+from sift.observability.profiler import JobProcessProfiler, ProfilerBusyError, SamplingProfiler, sample_job_process
+
+
+def _busy_loop_for_profile(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def _busy_job_for_profile() -> None:
+    deadline = time.perf_counter() + 0.3
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+def _profiled_job() -> None:
+    with sample_job_process():
+        _busy_job_for_profile()
+
+
+def test_sampling_profiler_returns_collapsed_stacks_for_other_threads() -> None:
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop_for_profile, args=(stop,), name="busy-worker")
+    worker.start()
+    try:
+        result = SamplingProfiler(max_seconds=5.0, sample_interval_seconds=0.005).profile(0.2, source="test")
+    finally:
+        stop.set()
+        worker.join()
+
+    assert result.sample_count > 0
+    lines = result.collapsed.splitlines()
+    busy = [line for line in lines if line.startswith("busy-worker;")]
+    assert busy
+    stack, count = busy[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert f"{__name__}:_busy_loop_for_profile" in stack.split(";")
+
+
+def test_sampling_profiler_caps_duration_and_rejects_concurrent_runs() -> None:
+    profiler = SamplingProfiler(max_seconds=0.05, sample_interval_seconds=0.01)
+    started = time.perf_counter()
+    profiler.profile(10.0, source="test")
+    assert time.perf_counter() - started < 1.0
+
+    profiler._lock.acquire()
+    try:
+        with pytest.raises(ProfilerBusyError):
+            profiler.profile(0.01, source="test")
+    finally:
+        profiler._lock.release()
+
+
+def test_metrics_server_profile_requires_token() -> None:
+    server = start_metrics_http_server(
+        service_name="test-service",
+        enabled=True,
+        host="127.0.0.1",
+        port=0,
+        path="/metrics",
+        profiler=SamplingProfiler(max_seconds=1.0, sample_interval_seconds=0.01),
+        profiling_token="secret-token",
+    )
+    assert server is not None
+
+    try:
+        base_url = f"http://127.0.0.1:{server.port}{PROFILE_PATH}"
+        unauthorized = httpx.get(f"{base_url}?seconds=0.05", timeout=5.0)
+        wrong_token = httpx.get(f"{base_url}?seconds=0.05", headers={"Authorization": "Bearer nope"}, timeout=5.0)
+        authorized = httpx.get(
+            f"{base_url}?seconds=0.05", headers={"Authorization": "Bearer secret-token"}, timeout=5.0
+        )
+    finally:
+        server.close()
+
+    assert unauthorized.status_code == 401
+    assert wrong_token.status_code == 401
+    assert authorized.status_code == 200
+    assert int(authorized.headers["X-Profile-Samples"]) > 0
+    assert "test-service-metrics;" in authorized.text
+
+
+def test_metrics_server_profile_path_not_served_without_token() -> None:
+    server = start_metrics_http_server(
+        service_name="test-service",
+        enabled=True,
+        host="127.0.0.1",
+        port=0,
+        path="/metrics",
+        profiler=SamplingProfiler(max_seconds=1.0, sample_interval_seconds=0.01),
+    )
+    assert server is not None
+
+    try:
+        response = httpx.get(f"http://127.0.0.1:{server.port}{PROFILE_PATH}", timeout=2.0)
+    finally:
+        server.close()
+
+    assert response.status_code == 404
+
+
+def test_profile_api_requires_admin_and_enabled_flag(monkeypatch) -> None:
+    admin = User(email="profile-admin@example.com", is_admin=True)
+    non_admin = User(email="profile-user@example.com", is_admin=False)
+    settings = get_settings()
+
+    async def override_admin_user() -> User:
+        return admin
+
+    async def override_non_admin_user() -> User:
+        return non_admin
+
+    try:
+        app.dependency_overrides[get_current_user] = override_admin_user
+        with TestClient(app) as client:
+            monkeypatch.setattr(settings, "profiling_enabled", False)
+            assert client.get("/api/v1/diagnostics/profile?seconds=0.05").status_code == 404
+
+            monkeypatch.setattr(settings, "profiling_enabled", True)
+            response = client.get("/api/v1/diagnostics/profile?seconds=0.05")
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/plain")
+            assert int(response.headers["X-Profile-Samples"]) > 0
+
+        app.dependency_overrides[get_current_user] = override_non_admin_user
+        with TestClient(app) as client:
+            assert client.get("/api/v1/diagnostics/profile?seconds=0.05").status_code == 403
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_job_process_profiler_collects_stacks_from_forked_job_processes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(profiler_module, "_JOB_PROFILE_GRACE_SECONDS", 0.2)
+    profiler = JobProcessProfiler(
+        SamplingProfiler(max_seconds=5.0, sample_interval_seconds=0.005), directory=tmp_path / "profiles"
+    )
+    results: list[profiler_module.ProfileResult] = []
+    request = threading.Thread(target=lambda: results.append(profiler.profile(1.0, source="test")))
+    request.start()
+    while profiler_module._job_profile_window is None:
+        time.sleep(0.005)
+
+    # Like an RQ work horse, the job process is forked from the worker while the window is open.
+    job = multiprocessing.get_context("fork").Process(target=_profiled_job)
+    job.start()
+    job.join()
+    request.join()
+
+    (result,) = results
+    assert result.sample_count > 0
+    assert any(f"{__name__}:_busy_job_for_profile" in line for line in result.collapsed.splitlines())
+    assert list((tmp_path / "profiles").iterdir()) == []
+
+    # Outside a window the job wrapper does not sample at all.
+    with sample_job_process():
+        assert not any(thread.name == "sift-job-profiler" for thread in threading.enumerate())
@@ -0,0 +1,99 @@
+import pytest
+from fastapi import Request, Response
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import sift.api.deps.db as db_deps
+from sift.api.deps.db import READ_YOUR_WRITES_COOKIE, get_read_db_session, mark_read_your_writes, pinned_to_primary
+from sift.config import get_settings
+from sift.db.base import Base
+from sift.db.models import User
+from sift.db.routing import RoutingSession
+from sift.observability.metrics import get_observability_metrics
+from sift.observability.sql import install_pool_metrics
+
+
+def _request(cookie: str | None = None) -> Request:
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_read_your_writes_cookie_pins_reads_to_the_primary_for_the_window(monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "database_read_your_writes_seconds", 5.0)
+    response = Response()
+    mark_read_your_writes(response, now=1000.0)
+    set_cookie = response.headers["set-cookie"]
+    assert set_cookie.startswith(f"{READ_YOUR_WRITES_COOKIE}=1005.000;")
+    assert "Max-Age=5" in set_cookie
+
+    request = _request(f"{READ_YOUR_WRITES_COOKIE}=1005.000")
+    assert pinned_to_primary(request, now=1004.0)
+    assert not pinned_to_primary(request, now=1006.0)
+    assert not pinned_to_primary(_request(f"{READ_YOUR_WRITES_COOKIE}=garbage"), now=0.0)
+    assert not pinned_to_primary(_request(), now=0.0)
+
+
+@pytest.mark.asyncio
+async def test_read_sessions_use_a_replica_unless_pinned(tmp_path, monkeypatch) -> None:
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    for engine, email in ((primary, "primary@example.com"), (replica, "replica@example.com")):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(User(email=email))
+            await session.commit()
+
+    session_maker = async_sessionmaker(bind=primary, sync_session_class=RoutingSession, expire_on_commit=False)
+    monkeypatch.setattr(get_settings(), "database_replica_urls", ["postgresql+asyncpg://replica/sift"])
+    monkeypatch.setattr(db_deps, "open_replica_session", lambda: session_maker(reader=replica.sync_engine))
+    metrics = get_observability_metrics()
+    metrics.reset()
+
+    async def emails(request: Request) -> list[str]:
+        async with session_maker() as primary_session:
+            dependency = get_read_db_session(request, primary_session)
+            session = await anext(dependency)
+            result = (await session.execute(select(User.email))).scalars().all()
+            await dependency.aclose()
+        return list(result)
+
+    assert await emails(_request()) == ["replica@example.com"]
+    assert await emails(_request(f"{READ_YOUR_WRITES_COOKIE}=99999999999")) == ["primary@example.com"]
+
+    # Writes made through a replica-routed session land on the primary, and the transaction then reads from it.
+    async with session_maker(reader=replica.sync_engine) as session:
+        session.add(User(email="written@example.com"))
+        await session.flush()
+        emails_in_transaction = (await session.execute(select(User.email))).scalars().all()
+        assert sorted(emails_in_transaction) == ["primary@example.com", "written@example.com"]
+        await session.commit()
+    async with primary.connect() as conn:
+        assert (await conn.execute(text("SELECT count(*) FROM users"))).scalar_one() == 2
+
+    routed = {
+        (sample.labels["target"], sample.labels["reason"]): sample.value
+        for sample in metrics.snapshot()["sift_db_read_sessions_total"]
+    }
+    assert routed == {("replica", "replica"): 1.0, ("primary", "read_your_writes"): 1.0}
+
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_track_checked_out_connections_per_role(tmp_path) -> None:
+    metrics = get_observability_metrics()
+    metrics.reset()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+    install_pool_metrics(engine, role="replica")
+
+    def checked_out() -> float:
+        samples = metrics.snapshot()["sift_db_pool_checked_out"]
+        return next(sample.value for sample in samples if sample.labels == {"role": "replica"})
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert checked_out() == 1.0
+    assert checked_out() == 0.0
+    await engine.dispose()
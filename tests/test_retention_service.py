@@ -0,0 +1,243 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from sift.config import get_settings
+from sift.db.base import Base
+from sift.db.models import (
+    Article,
+    Feed,
+    KeywordStream,
+    RawEntry,
+    StreamClassifierRun,
+    StreamClassifierRunSummary,
+    User,
+)
+from sift.domain.schemas import KeywordStreamCreate
+from sift.observability.metrics import get_observability_metrics
+from sift.plugins.manager import PluginManager
+from sift.services.retention_service import retention_service
+from sift.services.stream_service import stream_service
+
+
+def _classifier_run(
+    *, user: User, stream: KeywordStream, article: Article, created_at: datetime, matched: bool, confidence: float
+) -> StreamClassifierRun:
+    return StreamClassifierRun(
+        user_id=user.id,
+        stream_id=stream.id,
+        article_id=article.id,
+        feed_id=article.feed_id,
+        classifier_mode="hybrid",
+        plugin_name="keyword_heuristic_classifier",
+        matched=matched,
+        confidence=confidence,
+        threshold=0.5,
+        reason="matched keywords",
+        run_status="ok",
+        duration_ms=10,
+        created_at=created_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_retention_prunes_raw_entries_by_age_and_count_and_compacts_classifier_runs(monkeypatch) -> None:
+    metrics = get_observability_metrics()
+    metrics.reset()
+    settings = get_settings()
+    monkeypatch.setattr(settings, "retention_raw_entries_days", 30)
+    monkeypatch.setattr(settings, "retention_raw_entries_per_feed", 3)
+    monkeypatch.setattr(settings, "retention_classifier_runs_days", 7)
+    monkeypatch.setattr(settings, "retention_batch_size", 2)
+    monkeypatch.setattr(settings, "retention_batch_pause_ms", 0.0)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        user = User(email="retention@example.com")
+        session.add(user)
+        await session.flush()
+        busy_feed = Feed(owner_id=user.id, title="Busy", url="https://retention.example.com/busy.xml")
+        quiet_feed = Feed(owner_id=user.id, title="Quiet", url="https://retention.example.com/quiet.xml")
+        stream = KeywordStream(user_id=user.id, name="Retention Stream")
+        session.add_all([busy_feed, quiet_feed, stream])
+        await session.flush()
+
+        # Busy feed: five recent entries, two of which fall outside the per-feed cap of three.
+        for index in range(5):
+            session.add(
+                RawEntry(
+                    feed_id=busy_feed.id,
+                    source_id=f"busy-{index}",
+                    payload="x" * 100,
+                    created_at=now - timedelta(days=5 - index),
+                )
+            )
+        # Quiet feed: one entry past the age limit and one recent entry.
+        session.add_all(
+            [
+                RawEntry(feed_id=quiet_feed.id, source_id="old", payload="y" * 50, created_at=now - timedelta(days=45)),
+                RawEntry(feed_id=quiet_feed.id, source_id="new", payload="y" * 50, created_at=now - timedelta(days=1)),
+            ]
+        )
+
+        article = Article(feed_id=busy_feed.id, source_id="busy-0", title="Article", content_text="Body")
+        session.add(article)
+        await session.flush()
+        old_day = now - timedelta(days=10)
+        session.add_all(
+            [
+                _classifier_run(
+                    user=user, stream=stream, article=article, created_at=old_day, matched=True, confidence=0.9
+                ),
+                _classifier_run(
+                    user=user,
+                    stream=stream,
+                    article=article,
+                    created_at=old_day + timedelta(hours=1),
+                    matched=False,
+                    confidence=0.3,
+                ),
+                _classifier_run(
+                    user=user,
+                    stream=stream,
+                    article=article,
+                    created_at=old_day + timedelta(hours=2),
+                    matched=True,
+                    confidence=0.6,
+                ),
+                _classifier_run(
+                    user=user,
+                    stream=stream,
+                    article=article,
+                    created_at=now - timedelta(days=1),
+                    matched=True,
+                    confidence=0.8,
+                ),
+            ]
+        )
+        await session.commit()
+
+        result = await retention_service.run(session, settings=settings, now=now)
+
+        remaining = set((await session.execute(select(RawEntry.source_id))).scalars().all())
+        assert remaining == {"busy-2", "busy-3", "busy-4", "new"}
+        assert result.raw_entries_deleted == 3
+        assert result.raw_entries_bytes > 250
+
+        assert result.classifier_runs_compacted == 3
+        assert await session.scalar(select(func.count(StreamClassifierRun.id))) == 1
+        summary = await session.scalar(select(StreamClassifierRunSummary))
+        assert summary is not None
+        assert summary.day == old_day.date()
+        assert summary.run_count == 3
+        assert summary.matched_count == 2
+        assert summary.confidence_count == 3
+        assert summary.confidence_sum == pytest.approx(1.8)
+        assert summary.duration_ms_total == 30
+        # The first batch of two runs and the trailing batch of one merged into the same summary row.
+        assert await session.scalar(select(func.count(StreamClassifierRunSummary.id))) == 1
+
+        # Running again is a no-op once everything past the policy is gone.
+        second = await retention_service.run(session, settings=settings, now=now)
+        assert second.raw_entries_deleted == 0
+        assert second.classifier_runs_compacted == 0
+
+    await engine.dispose()
+
+    snapshot = metrics.snapshot()
+    deleted = {sample.labels["table"]: sample.value for sample in snapshot["sift_retention_rows_deleted_total"]}
+    assert deleted == {"raw_entries": 3.0, "stream_classifier_runs": 3.0}
+    reclaimed = {sample.labels["table"]: sample.value for sample in snapshot["sift_retention_bytes_reclaimed_total"]}
+    assert reclaimed["raw_entries"] == float(result.raw_entries_bytes)
+    assert reclaimed["stream_classifier_runs"] == float(result.classifier_runs_bytes)
+
+
+@pytest.mark.asyncio
+async def test_stream_backfill_matches_source_after_raw_entries_are_pruned(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "retention_raw_entries_days", 30)
+    monkeypatch.setattr(settings, "retention_raw_entries_per_feed", 0)
+    monkeypatch.setattr(settings, "retention_classifier_runs_days", 0)
+    monkeypatch.setattr(settings, "retention_batch_pause_ms", 0.0)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        user = User(email="retention-backfill@example.com")
+        session.add(user)
+        await session.flush()
+        feed = Feed(owner_id=user.id, title="Vendor", url="https://retention.example.com/vendor.xml")
+        session.add(feed)
+        await session.flush()
+        link = "https://blog.vendor.example.com/posts/old"
+        session.add_all(
+            [
+                RawEntry(
+                    feed_id=feed.id, source_id="old", source_url=link, payload="{}", created_at=now - timedelta(days=90)
+                ),
+                Article(feed_id=feed.id, source_id="old", title="Old post", content_text="Body", canonical_url=link),
+            ]
+        )
+        await session.commit()
+
+        result = await retention_service.run(session, settings=settings, now=now)
+        assert result.raw_entries_deleted == 1
+
+        stream = await stream_service.create_stream(
+            session=session,
+            user_id=user.id,
+            payload=KeywordStreamCreate(name="vendor blog", source_contains="blog.vendor.example.com"),
+        )
+        backfill = await stream_service.run_stream_backfill(
+            session=session, user_id=user.id, stream_id=stream.id, plugin_manager=PluginManager()
+        )
+        assert backfill.scanned_count == 1
+        assert backfill.matched_count == 1
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_retention_per_feed_cap_keeps_exactly_keep_rows_when_timestamps_tie(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "retention_raw_entries_days", 0)
+    monkeypatch.setattr(settings, "retention_raw_entries_per_feed", 2)
+    monkeypatch.setattr(settings, "retention_classifier_runs_days", 0)
+    monkeypatch.setattr(settings, "retention_batch_pause_ms", 0.0)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        user = User(email="retention-ties@example.com")
+        session.add(user)
+        await session.flush()
+        feed = Feed(owner_id=user.id, title="Batch", url="https://retention.example.com/batch.xml")
+        session.add(feed)
+        await session.flush()
+        # One fetch stores a whole batch of entries with the same timestamp.
+        session.add_all(
+            [RawEntry(feed_id=feed.id, source_id=f"tie-{index}", payload="z", created_at=now) for index in range(4)]
+        )
+        await session.commit()
+
+        result = await retention_service.run(session, settings=settings, now=now)
+
+        assert result.raw_entries_deleted == 2
+        assert await session.scalar(select(func.count(RawEntry.id))) == 2
+
+    await engine.dispose()
@@ -3,8 +3,19 @@ from datetime import UTC, datetime, timedelta
 from typing import cast
 from uuid import uuid4
 
+from rq import Queue
+
+from sift.config import get_settings
 from sift.db.models import Feed
-from sift.tasks.scheduler import _has_active_job, _ingest_job_id, _is_feed_due
+from sift.tasks.jobs import partition_maintenance_job, probe_feed_job
+from sift.tasks.scheduler import (
+    PARTITION_MAINTENANCE_JOB_ID,
+    _has_active_job,
+    _ingest_job_id,
+    _is_feed_due,
+    enqueue_feed_probes,
+    enqueue_partition_maintenance_job,
+)
 
 
 @dataclass
@@ -12,6 +23,7 @@ class FeedStub:
     is_active: bool
     fetch_interval_minutes: int
     last_fetched_at: datetime | None
+    websub_lease_expires_at: datetime | None = None
 
 
 def _feed(
@@ -19,6 +31,7 @@ def _feed(
     is_active: bool = True,
     fetch_interval_minutes: int = 15,
     last_fetched_at: datetime | None = None,
+    websub_lease_expires_at: datetime | None = None,
 ) -> Feed:
     return cast(
         Feed,
@@ -26,6 +39,7 @@ def _feed(
             is_active=is_active,
             fetch_interval_minutes=fetch_interval_minutes,
             last_fetched_at=last_fetched_at,
+            websub_lease_expires_at=websub_lease_expires_at,
         ),
     )
 
@@ -52,6 +66,23 @@ def test_is_feed_due_false_when_inactive() -> None:
     assert _is_feed_due(_feed(is_active=False, last_fetched_at=None), now) is False
 
 
+def test_is_feed_due_backs_off_while_websub_lease_is_active() -> None:
+    now = datetime.now(UTC)
+    pushed = _feed(
+        last_fetched_at=now - timedelta(minutes=60),
+        fetch_interval_minutes=15,
+        websub_lease_expires_at=now + timedelta(days=1),
+    )
+    expired = _feed(
+        last_fetched_at=now - timedelta(minutes=60),
+        fetch_interval_minutes=15,
+        websub_lease_expires_at=now - timedelta(minutes=1),
+    )
+
+    assert _is_feed_due(pushed, now, push_fallback_interval_minutes=720) is False
+    assert _is_feed_due(expired, now, push_fallback_interval_minutes=720) is True
+
+
 def test_ingest_job_id_uses_rq_compatible_delimiter() -> None:
     job_id = _ingest_job_id(uuid4())
     assert ":" not in job_id
@@ -92,3 +123,65 @@ def test_has_active_job_deletes_stale_legacy_jobs() -> None:
 
     assert _has_active_job(feed_id, queue=queue) is False
     assert legacy_job.deleted is True
+
+
+@dataclass
+class EnqueueQueueStub:
+    jobs: dict[str, JobStub]
+    enqueued: list[dict[str, object]]
+
+    def fetch_job(self, job_id: str) -> JobStub | None:
+        return self.jobs.get(job_id)
+
+    def enqueue(self, func: object, **kwargs: object) -> None:
+        self.enqueued.append({"func": func, **kwargs})
+
+
+def test_enqueue_partition_maintenance_job_only_when_enabled_and_not_pending(monkeypatch) -> None:
+    settings = get_settings()
+    queue = EnqueueQueueStub(jobs={}, enqueued=[])
+
+    monkeypatch.setattr(settings, "database_partitioning_enabled", False)
+    assert enqueue_partition_maintenance_job(queue=cast(Queue, queue)) is False
+    assert queue.enqueued == []
+
+    monkeypatch.setattr(settings, "database_partitioning_enabled", True)
+    monkeypatch.setattr(settings, "database_partition_maintenance_interval_seconds", 7200)
+    assert enqueue_partition_maintenance_job(queue=cast(Queue, queue)) is True
+    assert queue.enqueued[0]["func"] is partition_maintenance_job
+    assert queue.enqueued[0]["job_id"] == PARTITION_MAINTENANCE_JOB_ID
+    assert queue.enqueued[0]["result_ttl"] == 7200
+
+    # The finished job record stands in for the schedule until its TTL lapses.
+    queue.jobs[PARTITION_MAINTENANCE_JOB_ID] = JobStub(status="finished")
+    assert enqueue_partition_maintenance_job(queue=cast(Queue, queue)) is False
+    assert len(queue.enqueued) == 1
+
+
+class BatchQueueStub:
+    prepare_data = staticmethod(Queue.prepare_data)
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches: list[list[object]] = []
+
+    def enqueue_many(self, job_datas: list[object]) -> None:
+        if self.fail:
+            raise ConnectionError("redis unavailable")
+        self.batches.append(job_datas)
+
+
+def test_enqueue_feed_probes_queues_one_job_per_feed_in_one_batch() -> None:
+    feed_ids = [uuid4(), uuid4()]
+    queue = BatchQueueStub()
+
+    assert enqueue_feed_probes([], queue=cast(Queue, queue)) == 0
+    assert queue.batches == []
+
+    assert enqueue_feed_probes(feed_ids, queue=cast(Queue, queue)) == 2
+    (batch,) = queue.batches
+    assert [job.func for job in batch] == [probe_feed_job, probe_feed_job]  # type: ignore[attr-defined]
+    assert [job.args for job in batch] == [(str(feed_id),) for feed_id in feed_ids]  # type: ignore[attr-defined]
+    assert [job.job_id for job in batch] == [_ingest_job_id(feed_id) for feed_id in feed_ids]  # type: ignore[attr-defined]
+
+    assert enqueue_feed_probes(feed_ids, queue=cast(Queue, BatchQueueStub(fail=True))) == 0
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from sift.db.base import Base
+from sift.db.models import User
+from sift.observability.metrics import ObservabilityMetrics
+from sift.observability.sql import (
+    QueryStats,
+    SqlQueryInstrumentation,
+    bind_query_stats,
+    fingerprint_statement,
+    redact_parameters,
+    reset_query_stats,
+)
+
+
+def test_fingerprint_statement_normalizes_literals_placeholders_and_in_lists() -> None:
+    first_hash, first = fingerprint_statement("SELECT *\n  FROM articles WHERE id IN (?, ?, ?) AND title = 'x'")
+    second_hash, second = fingerprint_statement("SELECT * FROM articles WHERE id IN ($1, $2) AND title = 'other'")
+
+    assert first == "SELECT * FROM articles WHERE id IN (?) AND title = ?"
+    assert second == first
+    assert first_hash == second_hash
+    assert fingerprint_statement("SELECT name_1 FROM t WHERE x = 10")[1] == "SELECT name_1 FROM t WHERE x = ?"
+
+
+def test_redact_parameters_matches_bind_names_against_redact_fields() -> None:
+    redact_fields = frozenset({"password_hash", "email"})
+
+    assert redact_parameters(
+        ("a@example.com", "secret-hash", "x" * 500, "short", b"raw"),
+        bind_names=["email_1", "password_hash", "display_name", "title_1", "body"],
+        redact_fields=redact_fields,
+    ) == {
+        "email_1": "[REDACTED]",
+        "password_hash": "[REDACTED]",
+        "display_name": "x" * 200 + "...",
+        "title_1": "short",
+        "body": "<3 bytes>",
+    }
+    assert redact_parameters({"token": "t", "limit": 5}, bind_names=None, redact_fields=frozenset({"token"})) == {
+        "token": "[REDACTED]",
+        "limit": 5,
+    }
+    assert redact_parameters(("secret",), bind_names=None, redact_fields=redact_fields) is None
+
+
+@pytest.mark.asyncio
+async def test_queries_are_attributed_to_bound_stats_and_slow_queries_logged(
+    monkeypatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    metrics = ObservabilityMetrics()
+    monkeypatch.setattr("sift.observability.sql.get_observability_metrics", lambda: metrics)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    SqlQueryInstrumentation(slow_query_threshold_ms=0.000001, redact_fields=["email"]).install(engine)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    caplog.set_level(logging.WARNING, logger="sift.observability.sql")
+
+    stats = QueryStats(source="api", route="/api/v1/articles")
+    token = bind_query_stats(stats)
+    try:
+
+        async def _lookup() -> None:
+            async with session_maker() as session:
+                await session.execute(select(User).where(User.email == "someone@example.com"))
+
+        # Work spawned into child tasks shares the bound stats object.
+        await asyncio.gather(_lookup(), _lookup())
+        async with session_maker() as session:
+            await session.execute(text("SELECT 1"))
+    finally:
+        reset_query_stats(token)
+
+    async with session_maker() as session:
+        await session.execute(text("SELECT 2"))
+    await engine.dispose()
+
+    assert stats.query_count == 3
+    assert stats.db_seconds > 0
+
+    slow_records = [record for record in caplog.records if record.getMessage() == "db.query.slow"]
+    assert len(slow_records) == 4
+    user_lookup = next(record for record in slow_records if "FROM users" in record.statement)
+    assert user_lookup.source == "api"
+    assert user_lookup.parameters["email_1"] == "[REDACTED]"
+    assert "someone@example.com" not in user_lookup.statement
+    assert len(user_lookup.statement_fingerprint) == 16
+    assert slow_records[-1].source == "unscoped"
+
+    slow_totals = {sample.labels["source"]: sample.value for sample in metrics.snapshot()["sift_db_slow_queries_total"]}
+    assert slow_totals == {"api": 3.0, "unscoped": 1.0}
+
+
+def test_record_db_usage_exports_per_route_counts_and_time() -> None:
+    metrics = ObservabilityMetrics()
+    metrics.record_db_usage(source="api", route="/api/v1/articles", query_count=4, db_seconds=0.02)
+    metrics.record_db_usage(source="api", route="/api/v1/articles", query_count=2, db_seconds=0.01)
+
+    queries = metrics.snapshot()["sift_db_queries_total"]
+    assert [(sample.labels, sample.value) for sample in queries] == [
+        ({"route": "/api/v1/articles", "source": "api"}, 6.0)
+    ]
+    db_time = metrics.histogram_snapshot()["sift_db_time_seconds"][0]
+    assert db_time.count == 2
+    assert db_time.sum == pytest.approx(0.03)
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from sift.config import Settings
+from sift.db.base import Base
+from sift.db.models import User
+from sift.db.routing import RoutingSession
+from sift.db.sqlite import SqliteProfileError, create_sqlite_engines, is_memory_url, sqlite_pragmas
+
+
+def test_sqlite_pragmas_reject_unknown_modes() -> None:
+    pragmas = sqlite_pragmas(Settings(sqlite_cache_size_kib=32768))
+    assert "PRAGMA journal_mode = wal" in pragmas
+    assert "PRAGMA cache_size = -32768" in pragmas
+
+    with pytest.raises(SqliteProfileError):
+        sqlite_pragmas(Settings(sqlite_synchronous="sometimes"))
+
+    assert is_memory_url("sqlite+aiosqlite:///:memory:")
+    assert is_memory_url("sqlite+aiosqlite://")
+    assert not is_memory_url("sqlite+aiosqlite:///./sift.db")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_profile_applies_pragmas_and_routes_reads_and_writes(tmp_path) -> None:
+    settings = Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}", sqlite_busy_timeout_ms=2000)
+    writer, reader = create_sqlite_engines(settings)
+    assert reader is not None
+    async with writer.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with reader.connect() as conn:
+        assert (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar_one() == "wal"
+        assert (await conn.exec_driver_sql("PRAGMA synchronous")).scalar_one() == 1
+        assert (await conn.exec_driver_sql("PRAGMA busy_timeout")).scalar_one() == 2000
+        with pytest.raises(OperationalError, match="readonly"):
+            await conn.execute(text("DELETE FROM users"))
+
+    session_maker = async_sessionmaker(
+        bind=writer, sync_session_class=RoutingSession, reader=reader.sync_engine, expire_on_commit=False
+    )
+    async with session_maker() as session:
+        assert session.get_bind() is reader.sync_engine
+        session.add(User(email="writer@example.com"))
+        await session.flush()
+        # Reads after a write in the same transaction stay on the writer and see the pending row.
+        assert session.sync_session.wrote is True
+        assert (await session.execute(select(User.email))).scalars().all() == ["writer@example.com"]
+        await session.commit()
+
+        assert session.sync_session.wrote is False
+        assert session.get_bind() is reader.sync_engine
+        assert (await session.execute(select(User.email))).scalars().all() == ["writer@example.com"]
+
+    async def _write(index: int) -> None:
+        async with session_maker() as session:
+            await session.execute(select(User.id))
+            session.add(User(email=f"concurrent-{index}@example.com"))
+            await session.commit()
+
+    # Concurrent read-then-write transactions queue for the single writer connection instead of failing as locked.
+    await asyncio.gather(*(_write(index) for index in range(20)))
+    async with session_maker() as session:
+        count = (await session.execute(text("SELECT count(*) FROM users"))).scalar_one()
+    assert count == 21
+
+    await writer.dispose()
+    await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_profile_keeps_a_single_engine_for_memory_databases() -> None:
+    writer, reader = create_sqlite_engines(Settings(database_url="sqlite+aiosqlite:///:memory:"))
+    assert reader is None
+    async with writer.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        assert (await conn.exec_driver_sql("PRAGMA cache_size")).scalar_one() == -65536
+    await writer.dispose()
@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy import LargeBinary, select, text, type_coerce
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from sift.config import get_settings
+from sift.db.base import Base
+from sift.db.models import Article, ArticleFulltext, Feed, RawEntry, User
+from sift.db.types import CompressionError, compress_text, decompress_text, is_compressed, resolve_codec
+from sift.services.compression_backfill_service import compression_backfill_service
+
+
+def test_compress_text_round_trips_and_keeps_small_values_plain() -> None:
+    body = "<p>model release benchmark</p>" * 50
+    stored = compress_text(body, codec="zlib", level=3, min_bytes=256)
+    assert is_compressed(stored)
+    assert len(stored) < len(body)
+    assert decompress_text(stored) == body
+
+    assert compress_text("short", codec="zlib", level=3, min_bytes=256) == b"short"
+    assert compress_text(body, codec="none", level=3, min_bytes=256) == body.encode()
+
+    # Plain values that happen to start with NUL are escaped so they are never mistaken for a codec tag.
+    nul_prefixed = "\x00zlnot compressed"
+    escaped = compress_text(nul_prefixed, codec="zlib", level=3, min_bytes=256)
+    assert not is_compressed(escaped)
+    assert decompress_text(escaped) == nul_prefixed
+
+    # Rows written before the column became binary come back as plain UTF-8 bytes or, on SQLite, as str.
+    assert decompress_text("legacy text") == "legacy text"
+    assert decompress_text(memoryview(b"legacy bytes")) == "legacy bytes"
+
+
+def test_resolve_codec_validates_names() -> None:
+    assert resolve_codec("auto") in {"zstd", "zlib"}
+    assert resolve_codec(" ZLIB ") == "zlib"
+    with pytest.raises(CompressionError):
+        resolve_codec("brotli")
+
+
+@pytest.mark.asyncio
+async def test_compressed_columns_store_compressed_bytes_and_backfill_legacy_rows(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "storage_compression", "zlib")
+    monkeypatch.setattr(settings, "storage_compression_min_bytes", 64)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    payload = '{"title": "Model release", "summary": "' + "benchmark " * 100 + '"}'
+    html = "<article>" + "<p>open weights evaluation</p>" * 40 + "</article>"
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_maker() as session:
+        user = User(email="compression@example.com")
+        session.add(user)
+        await session.flush()
+        feed = Feed(owner_id=user.id, title="Compressed", url="https://compression.example.com/feed.xml")
+        session.add(feed)
+        await session.flush()
+        article = Article(feed_id=feed.id, source_id="entry-1", title="Article", content_text="Body")
+        session.add_all([RawEntry(feed_id=feed.id, source_id="entry-1", payload=payload), article])
+        await session.flush()
+        session.add(ArticleFulltext(article_id=article.id, status="succeeded", content_text="Body", content_html=html))
+        await session.commit()
+
+        stored_payload = await session.scalar(select(type_coerce(RawEntry.payload, LargeBinary)))
+        assert is_compressed(stored_payload)
+        assert len(stored_payload) < len(payload)
+        assert await session.scalar(select(RawEntry.payload)) == payload
+        fulltext = await session.scalar(select(ArticleFulltext))
+        assert fulltext is not None
+        assert fulltext.content_html == html
+        assert fulltext.content_text == "Body"
+
+        # Simulate rows written before compression: SQLite keeps them with TEXT storage.
+        await session.execute(text("UPDATE raw_entries SET payload = :payload"), {"payload": payload})
+        await session.execute(text("UPDATE article_fulltexts SET content_html = :html"), {"html": html})
+        await session.commit()
+        assert not is_compressed(await session.scalar(select(type_coerce(RawEntry.payload, LargeBinary))))
+        assert await session.scalar(select(RawEntry.payload)) == payload
+
+        results = await compression_backfill_service.backfill(
+            session, settings=settings, batch_size=1, batch_pause_seconds=0.0
+        )
+        by_column = {stats.column: stats for stats in results}
+        assert by_column["raw_entries.payload"].rewritten == 1
+        assert by_column["article_fulltexts.content_html"].rewritten == 1
+        assert (
+            by_column["article_fulltexts.content_html"].bytes_after
+            < by_column["article_fulltexts.content_html"].bytes_before
+        )
+
+        assert is_compressed(await session.scalar(select(type_coerce(RawEntry.payload, LargeBinary))))
+        assert is_compressed(await session.scalar(select(type_coerce(ArticleFulltext.content_html, LargeBinary))))
+        assert await session.scalar(select(RawEntry.payload)) == payload
+        assert await session.scalar(select(ArticleFulltext.content_html)) == html
+
+        # A second pass finds nothing left to rewrite.
+        again = await compression_backfill_service.backfill(session, settings=settings, batch_pause_seconds=0.0)
+        assert all(stats.rewritten == 0 for stats in again)
+
+    await engine.dispose()
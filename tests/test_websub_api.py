@@ -0,0 +1,316 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from sift.config import get_settings
+from sift.core.runtime import get_plugin_manager
+from sift.db.base import Base
+from sift.db.models import Article, Feed, User
+from sift.db.session import get_db_session
+from sift.domain.schemas import FeedLifecycleUpdate
+from sift.main import app
+from sift.services.feed_service import feed_service
+from sift.services.ingestion_service import ingestion_service
+from sift.services.websub_service import compute_signature
+
+_FEED_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Hub feed</title>
+  <link rel="hub" href="https://hub.example.com/" />
+  <link rel="self" href="https://websub-api.example.com/atom.xml" />
+</feed>
+"""
+
+_PUSHED_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Hub feed</title>
+  <entry>
+    <id>urn:websub:1</id>
+    <title>Pushed article</title>
+    <link href="https://websub-api.example.com/posts/1" />
+    <summary>Delivered by the hub.</summary>
+  </entry>
+</feed>
+"""
+
+
+_FEED_WITH_ENTRY_XML = _PUSHED_XML.replace(
+    b"<title>Hub feed</title>",
+    b'<title>Hub feed</title>\n  <link rel="hub" href="https://hub.example.com/" />',
+)
+
+
+class _StandInHub:
+    def __init__(self, feed_xml: bytes = _FEED_XML, on_subscribe: Callable[[], Awaitable[None]] | None = None) -> None:
+        self.subscriptions: list[dict[str, str]] = []
+        self.feed_xml = feed_xml
+        self.on_subscribe = on_subscribe
+
+    def client_factory(self):  # type: ignore[no-untyped-def]
+        hub = self
+
+        class _Response:
+            def __init__(self, status_code: int, content: bytes = b"") -> None:
+                self.status_code = status_code
+                self.content = content
+                self.headers: dict[str, str] = {}
+                self.url = "https://websub-api.example.com/atom.xml"
+                self.charset_encoding = None
+                self.history: list[_Response] = []
+                self.num_bytes_downloaded = len(content)
+
+            async def aiter_bytes(self) -> AsyncIterator[bytes]:
+                yield self.content
+
+        class _Client:
+            def __init__(self, **_kwargs) -> None:
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+                return None
+
+            @asynccontextmanager
+            async def stream(
+                self, _method: str, _url: str, headers: dict[str, str] | None = None
+            ) -> AsyncIterator[_Response]:
+                yield _Response(status_code=200, content=hub.feed_xml)
+
+            async def post(self, url: str, data: dict[str, str] | None = None) -> _Response:
+                assert url == "https://hub.example.com/"
+                hub.subscriptions.append(dict(data or {}))
+                if hub.on_subscribe is not None:
+                    await hub.on_subscribe()
+                return _Response(status_code=202)
+
+        return _Client
+
+
+def test_websub_subscribe_verify_and_signed_push_flow(monkeypatch) -> None:
+    db_path = Path("test_websub_api.db")
+    if db_path.exists():
+        db_path.unlink()
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "websub_enabled", True)
+    monkeypatch.setattr(settings, "websub_callback_base_url", "https://sift.example.com")
+
+    hub = _StandInHub()
+    monkeypatch.setattr(httpx, "AsyncClient", hub.client_factory())
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def prepare() -> Feed:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with session_maker() as session:
+            user = User(email="websub-api@example.com")
+            session.add(user)
+            await session.flush()
+            feed = Feed(owner_id=user.id, title="Hub feed", url="https://websub-api.example.com/atom.xml")
+            session.add(feed)
+            await session.commit()
+
+            await ingestion_service.ingest_feed(session, feed_id=feed.id, plugin_manager=get_plugin_manager())
+            return feed
+
+    async def load_feed(feed: Feed) -> tuple[Feed, int]:
+        async with session_maker() as session:
+            refreshed = await session.scalar(select(Feed).where(Feed.id == feed.id))
+            article_count = await session.scalar(select(func.count(Article.id)).where(Article.feed_id == feed.id))
+            assert refreshed is not None
+            return refreshed, int(article_count or 0)
+
+    async def archive(feed: Feed) -> None:
+        async with session_maker() as session:
+            stored = await session.scalar(select(Feed).where(Feed.id == feed.id))
+            assert stored is not None and stored.owner_id is not None
+            await feed_service.transition_lifecycle(
+                session,
+                feed=stored,
+                user_id=stored.owner_id,
+                payload=FeedLifecycleUpdate(action="archive"),
+            )
+
+    feed = asyncio.run(prepare())
+    assert len(hub.subscriptions) == 1
+    subscription = hub.subscriptions[0]
+    assert subscription["hub.mode"] == "subscribe"
+    assert subscription["hub.topic"] == "https://websub-api.example.com/atom.xml"
+    callback_url, _, nonce_query = subscription["hub.callback"].partition("?nonce=")
+    assert callback_url == f"https://sift.example.com/api/v1/websub/{feed.id}"
+    assert nonce_query
+
+    async def override_db_session():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = override_db_session
+
+    try:
+        with TestClient(app) as client:
+            wrong_topic = client.get(
+                f"/api/v1/websub/{feed.id}",
+                params={
+                    "hub.mode": "subscribe",
+                    "hub.topic": "https://other.example.com/",
+                    "hub.challenge": "x",
+                    "nonce": nonce_query,
+                },
+            )
+            assert wrong_topic.status_code == 404
+
+            # Verifications that do not carry the pending request's nonce are rejected, whatever the mode.
+            for mode in ("subscribe", "unsubscribe", "denied"):
+                unsolicited = client.get(
+                    f"/api/v1/websub/{feed.id}",
+                    params={"hub.mode": mode, "hub.topic": subscription["hub.topic"], "hub.challenge": "x"},
+                )
+                assert unsolicited.status_code == 404
+            denied_other_topic = client.get(
+                f"/api/v1/websub/{feed.id}",
+                params={"hub.mode": "denied", "hub.topic": "https://other.example.com/", "nonce": nonce_query},
+            )
+            assert denied_other_topic.status_code == 404
+            wrong_mode = client.get(
+                f"/api/v1/websub/{feed.id}",
+                params={"hub.mode": "unsubscribe", "hub.topic": subscription["hub.topic"], "nonce": nonce_query},
+            )
+            assert wrong_mode.status_code == 404
+            assert asyncio.run(load_feed(feed))[0].websub_secret is None
+
+            verify = client.get(
+                f"/api/v1/websub/{feed.id}",
+                params={
+                    "hub.mode": "subscribe",
+                    "hub.topic": subscription["hub.topic"],
+                    "hub.challenge": "challenge-123",
+                    "hub.lease_seconds": str(10**12),
+                    "nonce": nonce_query,
+                },
+            )
+            assert verify.status_code == 200
+            assert verify.text == "challenge-123"
+
+            refreshed, article_count = asyncio.run(load_feed(feed))
+            assert refreshed.websub_lease_expires_at is not None
+            assert refreshed.websub_lease_expires_at.year <= datetime.now(UTC).year + 1
+            assert refreshed.websub_secret == subscription["hub.secret"]
+            assert article_count == 0
+
+            replayed = client.get(
+                f"/api/v1/websub/{feed.id}",
+                params={"hub.mode": "subscribe", "hub.topic": subscription["hub.topic"], "nonce": nonce_query},
+            )
+            assert replayed.status_code == 404
+
+            monkeypatch.setattr(settings, "ingest_fetch_max_bytes", 64)
+            oversized = client.post(
+                f"/api/v1/websub/{feed.id}",
+                content=_PUSHED_XML,
+                headers={"X-Hub-Signature": compute_signature(subscription["hub.secret"], _PUSHED_XML)},
+            )
+            assert oversized.status_code == 413
+            monkeypatch.setattr(settings, "ingest_fetch_max_bytes", 1024 * 1024)
+
+            forged = client.post(
+                f"/api/v1/websub/{feed.id}",
+                content=_PUSHED_XML,
+                headers={"X-Hub-Signature": compute_signature("not-the-secret", _PUSHED_XML)},
+            )
+            assert forged.status_code == 202
+            assert asyncio.run(load_feed(feed))[1] == 0
+
+            pushed = client.post(
+                f"/api/v1/websub/{feed.id}",
+                content=_PUSHED_XML,
+                headers={"X-Hub-Signature": compute_signature(subscription["hub.secret"], _PUSHED_XML)},
+            )
+            assert pushed.status_code == 202
+            assert asyncio.run(load_feed(feed))[1] == 1
+
+            asyncio.run(archive(feed))
+            unsubscription = hub.subscriptions[-1]
+            assert unsubscription["hub.mode"] == "unsubscribe"
+            assert "hub.secret" not in unsubscription
+            assert asyncio.run(load_feed(feed))[0].websub_hub_url == "https://hub.example.com/"
+            unsubscribe_nonce = unsubscription["hub.callback"].partition("?nonce=")[2]
+            assert unsubscribe_nonce != nonce_query
+            unsubscribed = client.get(
+                f"/api/v1/websub/{feed.id}",
+                params={
+                    "hub.mode": "unsubscribe",
+                    "hub.topic": subscription["hub.topic"],
+                    "hub.challenge": "bye",
+                    "nonce": unsubscribe_nonce,
+                },
+            )
+            assert unsubscribed.status_code == 200
+            assert unsubscribed.text == "bye"
+            refreshed = asyncio.run(load_feed(feed))[0]
+            assert refreshed.websub_hub_url is None
+            assert refreshed.websub_secret is None
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(engine.dispose())
+        if db_path.exists():
+            db_path.unlink()
+
+
+def test_websub_subscribe_runs_after_fetched_entries_are_committed(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "websub_enabled", True)
+    monkeypatch.setattr(settings, "websub_callback_base_url", "https://sift.example.com")
+
+    db_path = Path("test_websub_subscribe_order.db")
+    if db_path.exists():
+        db_path.unlink()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    committed_articles_at_subscribe: list[int] = []
+
+    async def count_committed_articles() -> None:
+        # A separate session only sees what the ingest has already committed.
+        async with session_maker() as other_session:
+            committed_articles_at_subscribe.append(int(await other_session.scalar(select(func.count(Article.id))) or 0))
+
+    hub = _StandInHub(feed_xml=_FEED_WITH_ENTRY_XML, on_subscribe=count_committed_articles)
+    monkeypatch.setattr(httpx, "AsyncClient", hub.client_factory())
+
+    async def run() -> Feed:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_maker() as session:
+            user = User(email="websub-order@example.com")
+            session.add(user)
+            await session.flush()
+            feed = Feed(owner_id=user.id, title="Hub feed", url="https://websub-api.example.com/atom.xml")
+            session.add(feed)
+            await session.commit()
+            await ingestion_service.ingest_feed(session, feed_id=feed.id, plugin_manager=get_plugin_manager())
+        async with session_maker() as session:
+            stored = await session.scalar(select(Feed).where(Feed.id == feed.id))
+            assert stored is not None
+            return stored
+
+    try:
+        stored = asyncio.run(run())
+        assert len(hub.subscriptions) == 1
+        assert committed_articles_at_subscribe == [1]
+        assert stored.websub_hub_url == "https://hub.example.com/"
+        assert stored.last_body_hash is not None
+    finally:
+        asyncio.run(engine.dispose())
+        if db_path.exists():
+            db_path.unlink()
@@ -0,0 +1,27 @@
+from sift.services.websub_service import compute_signature, discover_websub_links, verify_signature
+
+
+def test_discover_websub_links_prefers_link_header_over_document_links() -> None:
+    feed_meta = {
+        "links": [
+            {"rel": "hub", "href": "https://document-hub.example.com/"},
+            {"rel": "self", "href": "https://example.com/feed.xml"},
+        ]
+    }
+    headers = {"Link": '<https://header-hub.example.com/>; rel="hub", <https://example.com/canonical.xml>; rel="self"'}
+
+    assert discover_websub_links(feed_meta, headers) == (
+        "https://header-hub.example.com/",
+        "https://example.com/canonical.xml",
+    )
+    assert discover_websub_links(feed_meta, {}) == ("https://document-hub.example.com/", "https://example.com/feed.xml")
+    assert discover_websub_links({"links": []}, {}) == (None, None)
+
+
+def test_verify_signature_accepts_supported_algorithms_and_rejects_tampering() -> None:
+    body = b"<feed/>"
+    assert verify_signature("secret", body, compute_signature("secret", body, "sha1")) is True
+    assert verify_signature("secret", body, compute_signature("secret", body, "sha512")) is True
+    assert verify_signature("secret", b"<feed>tampered</feed>", compute_signature("secret", body)) is False
+    assert verify_signature("secret", body, "md5=abc") is False
+    assert verify_signature("secret", body, None) is False
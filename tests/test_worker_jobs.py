@@ -1,9 +1,12 @@
+import logging
+import os
 from uuid import uuid4
 
 import pytest
 
 import sift.tasks.jobs as jobs_module
-from sift.observability.metrics import MetricSample, get_observability_metrics
+from sift.observability.metrics import MetricSample, ObservabilityMetrics, get_observability_metrics
+from sift.observability.multiprocess import MetricsSpool, collect_metrics_spool
 
 
 def _sample_map(samples: list[MetricSample], *, label_keys: tuple[str, ...]) -> dict[tuple[str, ...], float]:
@@ -41,3 +44,67 @@ def test_ingest_feed_job_records_success_metrics(monkeypatch: pytest.MonkeyPatch
     snapshot = metrics.snapshot()
     results = _sample_map(snapshot["sift_worker_jobs_total"], label_keys=("result",))
     assert results[("success",)] == 1.0
+
+
+def test_ingest_feed_job_metrics_from_forked_job_processes_reach_the_parent(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    metrics = get_observability_metrics()
+    metrics.reset()
+    monkeypatch.setattr("sift.observability.multiprocess._ACTIVE_SPOOL", MetricsSpool(tmp_path))
+    metrics.record_worker_job(result="success", duration_seconds=0.5)
+
+    for _ in range(2):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                jobs_module.ingest_feed_job("not-a-uuid")
+            finally:
+                os._exit(0)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+    collect_metrics_spool()
+
+    assert list(tmp_path.iterdir()) == []
+    results = _sample_map(metrics.snapshot()["sift_worker_jobs_total"], label_keys=("result",))
+    # Each forked child starts from zero, so the parent's own sample is not re-counted.
+    assert results == {("success",): 1.0, ("failure",): 2.0}
+    durations = {
+        sample.labels["result"]: sample for sample in metrics.histogram_snapshot()["sift_worker_job_duration_seconds"]
+    }
+    assert durations["failure"].count == 2
+    assert durations["success"].count == 1
+
+
+def test_spool_merge_keeps_parent_gauges_and_reports_histograms_with_other_buckets(
+    tmp_path, caplog: pytest.LogCaptureFixture
+) -> None:
+    parent = ObservabilityMetrics(duration_buckets=[0.1, 1.0])
+    parent.set_db_pool_checked_out(role="primary", count=1)
+    child = ObservabilityMetrics(duration_buckets=[0.5, 5.0])
+    child.set_db_pool_checked_out(role="primary", count=4)
+    child.record_worker_job(result="success", duration_seconds=0.2)
+    spool = MetricsSpool(tmp_path)
+    assert spool.write(child) is not None
+
+    with caplog.at_level(logging.WARNING, logger="sift.observability.multiprocess"):
+        assert spool.collect(parent) == 1
+
+    snapshot = parent.snapshot()
+    assert _sample_map(snapshot["sift_db_pool_checked_out"], label_keys=("role",)) == {("primary",): 1.0}
+    assert _sample_map(snapshot["sift_worker_jobs_total"], label_keys=("result",)) == {("success",): 1.0}
+    assert parent.histogram_snapshot()["sift_worker_job_duration_seconds"] == []
+    dropped = [record for record in caplog.records if record.msg == "metrics.spool.histograms_dropped"]
+    assert len(dropped) == 1
+    assert dropped[0].series_count == 1
+
+
+def test_probe_feed_job_reports_missing_feeds(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_run_probe(_feed_id):  # type: ignore[no-untyped-def]
+        return None
+
+    monkeypatch.setattr(jobs_module, "_run_probe", fake_run_probe)
+
+    feed_id = str(uuid4())
+    assert jobs_module.probe_feed_job(feed_id) == {"feed_id": feed_id, "status": "missing"}